@@ -8,6 +8,7 @@ contract satisfaction per Goal Hierarchy §3 (steer operator formal spec):
 - No contract violations introduced by steering
 - Pre/post-topology validity confirmed
 - Capability coverage preserved
+- Incremental re-verification: only contracts and goals a steer touches
 
 References:
   - Goal Hierarchy Formal Spec, §3 (steer operator verification)
@@ -18,9 +19,13 @@ References:
 from __future__ import annotations
 
 import dataclasses
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from holly.agents.topology_manager import Agent, AgentContract, TeamTopology
 
 
 # ──────────────────────────────────────────────────────────
@@ -183,45 +188,7 @@ class ContractVerifier:
 
         # Check each contract
         for contract in contracts:
-            # Verify agent exists
-            if not hasattr(topology, "agents") or contract.agent_id not in topology.agents:
-                violations.append(
-                    ContractViolation(
-                        violation_type=ContractViolationType.COMMUNICATION_BREAK,
-                        contract_id=f"{contract.agent_id}",
-                        agent_id=contract.agent_id,
-                        description=f"Contract agent {contract.agent_id} not in topology",
-                        severity="critical",
-                    )
-                )
-                continue
-
-            # If contract specifies a peer, verify peer exists
-            if contract.peer_agent_id is not None:
-                if contract.peer_agent_id not in topology.agents:
-                    violations.append(
-                        ContractViolation(
-                            violation_type=ContractViolationType.COMMUNICATION_BREAK,
-                            contract_id=f"{contract.agent_id}-{contract.peer_agent_id}",
-                            agent_id=contract.agent_id,
-                            description=f"Peer agent {contract.peer_agent_id} not in topology",
-                            severity="critical",
-                        )
-                    )
-
-            # Check responsibility domain coverage
-            if contract.responsibility_domain:
-                agent = topology.agents[contract.agent_id]
-                if not hasattr(agent, "assigned_goals"):
-                    violations.append(
-                        ContractViolation(
-                            violation_type=ContractViolationType.OBLIGATION_UNMET,
-                            contract_id=f"{contract.agent_id}",
-                            agent_id=contract.agent_id,
-                            description=f"Agent {contract.agent_id} has no assigned goals",
-                            severity="warning",
-                        )
-                    )
+            violations.extend(self._pre_steer_violations(topology, contract))
 
         return violations
 
@@ -257,40 +224,7 @@ class ContractVerifier:
 
         # Verify each contract is still satisfiable
         for contract in contracts:
-            # If agent was preserved in steering
-            if (
-                hasattr(new_topology, "agents")
-                and contract.agent_id in new_topology.agents
-            ):
-                # If peer was also preserved, communication should be intact
-                if contract.peer_agent_id is not None:
-                    if contract.peer_agent_id not in new_topology.agents:
-                        violations.append(
-                            ContractViolation(
-                                violation_type=ContractViolationType.COMMUNICATION_BREAK,
-                                contract_id=f"{contract.agent_id}-{contract.peer_agent_id}",
-                                agent_id=contract.agent_id,
-                                description=f"Communication broken: peer {contract.peer_agent_id} removed during steering",
-                                severity="critical",
-                            )
-                        )
-
-                # Check responsibility is still assigned
-                if contract.responsibility_domain:
-                    new_agent = new_topology.agents[contract.agent_id]
-                    if (
-                        hasattr(new_agent, "assigned_goals")
-                        and not new_agent.assigned_goals
-                    ):
-                        violations.append(
-                            ContractViolation(
-                                violation_type=ContractViolationType.OBLIGATION_UNMET,
-                                contract_id=f"{contract.agent_id}",
-                                agent_id=contract.agent_id,
-                                description=f"Agent {contract.agent_id} has no responsibilities after steering",
-                                severity="warning",
-                            )
-                        )
+            violations.extend(self._post_steer_violations(new_topology, contract))
 
         return violations
 
@@ -320,16 +254,11 @@ class ContractVerifier:
         ContractVerificationResult
             Complete verification result with violation list and flags.
         """
-        self._operation_counter += 1
-        operation_id = f"steer-op-{self._operation_counter}"
-
         # Phase 1: Verify pre-steer
         pre_violations = self.verify_pre_steer(old_topology, contracts)
-        pre_valid = len(pre_violations) == 0
 
         # Phase 2: Verify post-steer
         post_violations = self.verify_post_steer(old_topology, new_topology, contracts)
-        post_valid = len(post_violations) == 0
 
         # Phase 3: Check capability coverage
         capability_violations = self._check_capability_coverage(new_topology, contracts)
@@ -337,6 +266,24 @@ class ContractVerifier:
         # Phase 4: Check communication patterns
         communication_violations = self._check_communication_patterns(new_topology, contracts)
 
+        return self._build_result(
+            pre_violations, post_violations, capability_violations, communication_violations
+        )
+
+    def _build_result(
+        self,
+        pre_violations: list[ContractViolation],
+        post_violations: list[ContractViolation],
+        capability_violations: list[ContractViolation],
+        communication_violations: list[ContractViolation],
+    ) -> ContractVerificationResult:
+        """Combine the phase results of one steer operation."""
+        self._operation_counter += 1
+        operation_id = f"steer-op-{self._operation_counter}"
+
+        pre_valid = len(pre_violations) == 0
+        post_valid = len(post_violations) == 0
+
         # Combine all violations
         all_violations = (
             pre_violations + post_violations + capability_violations + communication_violations
@@ -373,58 +320,14 @@ class ContractVerifier:
         list[ContractViolation]
             List of structural violations.
         """
-        violations: list[ContractViolation] = []
-
-        if not hasattr(topology, "agents"):
-            violations.append(
-                ContractViolation(
-                    violation_type=ContractViolationType.TOPOLOGY_INVALID,
-                    contract_id="topology",
-                    agent_id="topology",
-                    description="Topology has no agents attribute",
-                    severity="critical",
-                )
-            )
-            return violations
-
-        if not topology.agents:
-            violations.append(
-                ContractViolation(
-                    violation_type=ContractViolationType.TOPOLOGY_INVALID,
-                    contract_id="topology",
-                    agent_id="topology",
-                    description="Topology is empty (no agents)",
-                    severity="critical",
-                )
-            )
+        violations = self._structure_violations(topology)
+        if violations:
             return violations
 
         # Check goal assignments
         if hasattr(topology, "goal_assignments"):
             for goal_id, agent_ids in topology.goal_assignments.items():
-                if not agent_ids:
-                    violations.append(
-                        ContractViolation(
-                            violation_type=ContractViolationType.OBLIGATION_UNMET,
-                            contract_id=f"goal-{goal_id}",
-                            agent_id="topology",
-                            description=f"Goal {goal_id} has no assigned agents",
-                            severity="warning",
-                        )
-                    )
-                else:
-                    # Verify all assigned agents exist
-                    for agent_id in agent_ids:
-                        if agent_id not in topology.agents:
-                            violations.append(
-                                ContractViolation(
-                                    violation_type=ContractViolationType.COMMUNICATION_BREAK,
-                                    contract_id=f"goal-{goal_id}",
-                                    agent_id=agent_id,
-                                    description=f"Goal {goal_id} assigned to non-existent agent {agent_id}",
-                                    severity="critical",
-                                )
-                            )
+                violations.extend(self._goal_violations(topology, goal_id, agent_ids))
 
         return violations
 
@@ -454,33 +357,7 @@ class ContractVerifier:
             return violations
 
         for contract in contracts:
-            if contract.agent_id not in topology.agents:
-                continue
-
-            if contract.peer_agent_id is None:
-                # Broadcast contract — check agent exists
-                if contract.agent_id not in topology.agents:
-                    violations.append(
-                        ContractViolation(
-                            violation_type=ContractViolationType.COMMUNICATION_BREAK,
-                            contract_id=f"{contract.agent_id}-broadcast",
-                            agent_id=contract.agent_id,
-                            description=f"Broadcast agent {contract.agent_id} not in topology",
-                            severity="warning",
-                        )
-                    )
-            else:
-                # Point-to-point contract — check both agents exist
-                if contract.peer_agent_id not in topology.agents:
-                    violations.append(
-                        ContractViolation(
-                            violation_type=ContractViolationType.COMMUNICATION_BREAK,
-                            contract_id=f"{contract.agent_id}-{contract.peer_agent_id}",
-                            agent_id=contract.agent_id,
-                            description=f"Peer agent {contract.peer_agent_id} missing for contract",
-                            severity="critical",
-                        )
-                    )
+            violations.extend(self._communication_violations(topology, contract))
 
         return violations
 
@@ -511,43 +388,481 @@ class ContractVerifier:
             return violations
 
         for contract in contracts:
-            # For each contract, verify the responsible agent exists
-            if contract.agent_id in topology.agents:
-                agent = topology.agents[contract.agent_id]
+            violations.extend(self._capability_violations(topology, contract))
+
+        return violations
+
+    # Per-contract and per-goal checks, shared with IncrementalContractVerifier.
+    # Each depends only on the presence and identity of the agents named.
+
+    def _pre_steer_violations(
+        self, topology: TeamTopology, contract: AgentContract
+    ) -> list[ContractViolation]:
+        """Pre-steer violations of a single contract."""
+        violations: list[ContractViolation] = []
+
+        # Verify agent exists
+        if not hasattr(topology, "agents") or contract.agent_id not in topology.agents:
+            violations.append(
+                ContractViolation(
+                    violation_type=ContractViolationType.COMMUNICATION_BREAK,
+                    contract_id=f"{contract.agent_id}",
+                    agent_id=contract.agent_id,
+                    description=f"Contract agent {contract.agent_id} not in topology",
+                    severity="critical",
+                )
+            )
+            return violations
+
+        # If contract specifies a peer, verify peer exists
+        if contract.peer_agent_id is not None:
+            if contract.peer_agent_id not in topology.agents:
+                violations.append(
+                    ContractViolation(
+                        violation_type=ContractViolationType.COMMUNICATION_BREAK,
+                        contract_id=f"{contract.agent_id}-{contract.peer_agent_id}",
+                        agent_id=contract.agent_id,
+                        description=f"Peer agent {contract.peer_agent_id} not in topology",
+                        severity="critical",
+                    )
+                )
 
-                # If agent has capability requirements (via permissions)
-                if hasattr(agent, "permissions") and hasattr(
-                    agent.permissions, "capability_level"
+        # Check responsibility domain coverage
+        if contract.responsibility_domain:
+            agent = topology.agents[contract.agent_id]
+            if not hasattr(agent, "assigned_goals"):
+                violations.append(
+                    ContractViolation(
+                        violation_type=ContractViolationType.OBLIGATION_UNMET,
+                        contract_id=f"{contract.agent_id}",
+                        agent_id=contract.agent_id,
+                        description=f"Agent {contract.agent_id} has no assigned goals",
+                        severity="warning",
+                    )
+                )
+
+        return violations
+
+    def _post_steer_violations(
+        self, topology: TeamTopology, contract: AgentContract
+    ) -> list[ContractViolation]:
+        """Post-steer violations of a single contract."""
+        violations: list[ContractViolation] = []
+
+        # If agent was preserved in steering
+        if hasattr(topology, "agents") and contract.agent_id in topology.agents:
+            # If peer was also preserved, communication should be intact
+            if contract.peer_agent_id is not None:
+                if contract.peer_agent_id not in topology.agents:
+                    violations.append(
+                        ContractViolation(
+                            violation_type=ContractViolationType.COMMUNICATION_BREAK,
+                            contract_id=f"{contract.agent_id}-{contract.peer_agent_id}",
+                            agent_id=contract.agent_id,
+                            description=f"Communication broken: peer {contract.peer_agent_id} removed during steering",
+                            severity="critical",
+                        )
+                    )
+
+            # Check responsibility is still assigned
+            if contract.responsibility_domain:
+                new_agent = topology.agents[contract.agent_id]
+                if (
+                    hasattr(new_agent, "assigned_goals")
+                    and not new_agent.assigned_goals
                 ):
-                    capability = agent.permissions.capability_level
-                    if capability is None:
-                        violations.append(
-                            ContractViolation(
-                                violation_type=ContractViolationType.CAPABILITY_MISMATCH,
-                                contract_id=f"{contract.agent_id}",
-                                agent_id=contract.agent_id,
-                                description=f"Agent {contract.agent_id} lost capability after steering",
-                                severity="warning",
-                            )
+                    violations.append(
+                        ContractViolation(
+                            violation_type=ContractViolationType.OBLIGATION_UNMET,
+                            contract_id=f"{contract.agent_id}",
+                            agent_id=contract.agent_id,
+                            description=f"Agent {contract.agent_id} has no responsibilities after steering",
+                            severity="warning",
                         )
-            else:
-                # Agent was dissolved - check if responsibilities were transferred
-                if contract.responsibility_domain:
+                    )
+
+        return violations
+
+    def _communication_violations(
+        self, topology: TeamTopology, contract: AgentContract
+    ) -> list[ContractViolation]:
+        """Communication violations of a single contract."""
+        violations: list[ContractViolation] = []
+
+        if contract.agent_id not in topology.agents:
+            return violations
+
+        if contract.peer_agent_id is None:
+            # Broadcast contract — check agent exists
+            if contract.agent_id not in topology.agents:
+                violations.append(
+                    ContractViolation(
+                        violation_type=ContractViolationType.COMMUNICATION_BREAK,
+                        contract_id=f"{contract.agent_id}-broadcast",
+                        agent_id=contract.agent_id,
+                        description=f"Broadcast agent {contract.agent_id} not in topology",
+                        severity="warning",
+                    )
+                )
+        else:
+            # Point-to-point contract — check both agents exist
+            if contract.peer_agent_id not in topology.agents:
+                violations.append(
+                    ContractViolation(
+                        violation_type=ContractViolationType.COMMUNICATION_BREAK,
+                        contract_id=f"{contract.agent_id}-{contract.peer_agent_id}",
+                        agent_id=contract.agent_id,
+                        description=f"Peer agent {contract.peer_agent_id} missing for contract",
+                        severity="critical",
+                    )
+                )
+
+        return violations
+
+    def _capability_violations(
+        self, topology: TeamTopology, contract: AgentContract
+    ) -> list[ContractViolation]:
+        """Capability violations of a single contract."""
+        violations: list[ContractViolation] = []
+
+        # For each contract, verify the responsible agent exists
+        if contract.agent_id in topology.agents:
+            agent = topology.agents[contract.agent_id]
+
+            # If agent has capability requirements (via permissions)
+            if hasattr(agent, "permissions") and hasattr(
+                agent.permissions, "capability_level"
+            ):
+                capability = agent.permissions.capability_level
+                if capability is None:
                     violations.append(
                         ContractViolation(
                             violation_type=ContractViolationType.CAPABILITY_MISMATCH,
                             contract_id=f"{contract.agent_id}",
                             agent_id=contract.agent_id,
-                            description=f"Capability owner {contract.agent_id} removed; responsibilities unclear",
+                            description=f"Agent {contract.agent_id} lost capability after steering",
                             severity="warning",
                         )
                     )
+        else:
+            # Agent was dissolved - check if responsibilities were transferred
+            if contract.responsibility_domain:
+                violations.append(
+                    ContractViolation(
+                        violation_type=ContractViolationType.CAPABILITY_MISMATCH,
+                        contract_id=f"{contract.agent_id}",
+                        agent_id=contract.agent_id,
+                        description=f"Capability owner {contract.agent_id} removed; responsibilities unclear",
+                        severity="warning",
+                    )
+                )
 
         return violations
 
+    @staticmethod
+    def _structure_violations(topology: TeamTopology) -> list[ContractViolation]:
+        """Violations of a topology with no agents (goals are then not checked)."""
+        if not hasattr(topology, "agents"):
+            return [
+                ContractViolation(
+                    violation_type=ContractViolationType.TOPOLOGY_INVALID,
+                    contract_id="topology",
+                    agent_id="topology",
+                    description="Topology has no agents attribute",
+                    severity="critical",
+                )
+            ]
+
+        if not topology.agents:
+            return [
+                ContractViolation(
+                    violation_type=ContractViolationType.TOPOLOGY_INVALID,
+                    contract_id="topology",
+                    agent_id="topology",
+                    description="Topology is empty (no agents)",
+                    severity="critical",
+                )
+            ]
+
+        return []
+
+    @staticmethod
+    def _goal_violations(
+        topology: TeamTopology, goal_id: str, agent_ids: set[str]
+    ) -> list[ContractViolation]:
+        """Assignment violations of a single goal."""
+        violations: list[ContractViolation] = []
+
+        if not agent_ids:
+            violations.append(
+                ContractViolation(
+                    violation_type=ContractViolationType.OBLIGATION_UNMET,
+                    contract_id=f"goal-{goal_id}",
+                    agent_id="topology",
+                    description=f"Goal {goal_id} has no assigned agents",
+                    severity="warning",
+                )
+            )
+        else:
+            # Verify all assigned agents exist
+            for agent_id in agent_ids:
+                if agent_id not in topology.agents:
+                    violations.append(
+                        ContractViolation(
+                            violation_type=ContractViolationType.COMMUNICATION_BREAK,
+                            contract_id=f"goal-{goal_id}",
+                            agent_id=agent_id,
+                            description=f"Goal {goal_id} assigned to non-existent agent {agent_id}",
+                            severity="critical",
+                        )
+                    )
+
+        return violations
+
+
+# ──────────────────────────────────────────────────────────
+# §4 Incremental Verification
+# ──────────────────────────────────────────────────────────
+
+
+@dataclass(slots=True)
+class _VerificationState:
+    """Per-contract and per-goal check results for one topology.
+
+    Contract-keyed maps hold only contracts with violations, keyed by
+    their position in the verified contract list.  ``goals`` is None when
+    goal assignments were not checked (empty topology).
+    """
+
+    topology: TeamTopology
+    structure: list[ContractViolation]
+    goals: dict[str, list[ContractViolation]] | None
+    pre: dict[int, list[ContractViolation]]
+    post: dict[int, list[ContractViolation]]
+    capability: dict[int, list[ContractViolation]]
+    communication: dict[int, list[ContractViolation]]
+    coverage: Counter[Any]
+
+
+def _in_order(results: dict[int, list[ContractViolation]]) -> list[ContractViolation]:
+    """Flatten per-contract results in contract-list order."""
+    return [violation for index in sorted(results) for violation in results[index]]
+
+
+def _capability_of(agent: Agent) -> Any:
+    """Capability level of an agent, or None if it declares none."""
+    permissions = getattr(agent, "permissions", None)
+    return getattr(permissions, "capability_level", None)
+
+
+class IncrementalContractVerifier(ContractVerifier):
+    """Contract verifier that re-checks only what a steer changed.
+
+    Gives exactly the results of ``ContractVerifier`` (same violations in
+    the same order) but keeps the per-contract and per-goal results of
+    the last topology verified, plus indexes of the contract list by
+    agent and by peer.  Verifying the next steer diffs the topologies:
+    agents that were added, removed or replaced (compared by identity),
+    and goals whose assignment set was replaced or names such an agent.
+    Only contracts naming a changed agent and only those goals are
+    re-checked, so a steer touching two agents costs a scan of the
+    agent and goal maps plus O(affected contracts), instead of four
+    passes over every contract.
+
+    Topologies are treated as immutable versions, as produced by
+    ``TopologyManager.steer``: an agent object or assignment set mutated
+    in place after being verified is not noticed.  A different contract
+    list rebuilds the indexes and the next verification runs in full.
+    """
+
+    def __init__(self) -> None:
+        """Initialize incremental contract verifier."""
+        super().__init__()
+        self._contracts: list[AgentContract] = []
+        self._by_agent: dict[str, list[int]] = {}
+        self._by_peer: dict[str, list[int]] = {}
+        self._state: _VerificationState | None = None
+
+    @property
+    def capability_coverage(self) -> dict[Any, int]:
+        """Contract-holding agents per capability level in the last new topology."""
+        if self._state is None:
+            return {}
+        return dict(self._state.coverage)
+
+    def verify_steer_operation(
+        self,
+        old_topology: TeamTopology,
+        new_topology: TeamTopology,
+        contracts: list[AgentContract],
+    ) -> ContractVerificationResult:
+        """Steer verification reusing results for unchanged agents and goals.
+
+        Parameters
+        ----------
+        old_topology
+            Original TeamTopology.
+        new_topology
+            New TeamTopology after steering.
+        contracts
+            List of AgentContract to verify.
+
+        Returns
+        -------
+        ContractVerificationResult
+            Same result as ``ContractVerifier.verify_steer_operation``.
+        """
+        self._index(contracts)
+        old_state = self._state_for(old_topology)
+        new_state = self._state_for(new_topology, base=old_state)
+        self._state = new_state
+
+        post_violations = list(new_state.structure)
+        if new_state.goals is not None:
+            for goal_violations in new_state.goals.values():
+                post_violations.extend(goal_violations)
+        post_violations.extend(_in_order(new_state.post))
+
+        return self._build_result(
+            _in_order(old_state.pre),
+            post_violations,
+            _in_order(new_state.capability),
+            _in_order(new_state.communication),
+        )
+
+    def _index(self, contracts: list[AgentContract]) -> None:
+        """Index contracts by agent and peer, unless already indexed."""
+        if contracts == self._contracts:
+            return
+        self._contracts = list(contracts)
+        self._by_agent = {}
+        self._by_peer = {}
+        for index, contract in enumerate(self._contracts):
+            self._by_agent.setdefault(contract.agent_id, []).append(index)
+            if contract.peer_agent_id is not None:
+                self._by_peer.setdefault(contract.peer_agent_id, []).append(index)
+        self._state = None
+
+    def _state_for(
+        self, topology: TeamTopology, base: _VerificationState | None = None
+    ) -> _VerificationState:
+        """Return check results for ``topology``, derived from a known state."""
+        if base is None:
+            base = self._state
+        if base is None:
+            return self._full_state(topology)
+        if base.topology is topology:
+            return base
+        if not (hasattr(base.topology, "agents") and hasattr(topology, "agents")):
+            return self._full_state(topology)
+        return self._derived_state(base, topology)
+
+    def _check_contract(
+        self, state: _VerificationState, topology: TeamTopology, index: int
+    ) -> None:
+        """Record the four per-contract checks of contract ``index`` in ``state``."""
+        contract = self._contracts[index]
+        for results, check in (
+            (state.pre, self._pre_steer_violations),
+            (state.post, self._post_steer_violations),
+            (state.capability, self._capability_violations),
+            (state.communication, self._communication_violations),
+        ):
+            violations = check(topology, contract)
+            if violations:
+                results[index] = violations
+            else:
+                results.pop(index, None)
+
+    def _full_state(self, topology: TeamTopology) -> _VerificationState:
+        """Check every contract and goal of ``topology``."""
+        structure = self._structure_violations(topology)
+        goals = None
+        if not structure:
+            goals = {}
+            for goal_id, agent_ids in getattr(topology, "goal_assignments", {}).items():
+                violations = self._goal_violations(topology, goal_id, agent_ids)
+                if violations:
+                    goals[goal_id] = violations
+
+        state = _VerificationState(topology, structure, goals, {}, {}, {}, {}, Counter())
+        if not hasattr(topology, "agents"):
+            # Only the pre-steer check applies; the others skip such topologies.
+            for index, contract in enumerate(self._contracts):
+                state.pre[index] = self._pre_steer_violations(topology, contract)
+            return state
+
+        for index in range(len(self._contracts)):
+            self._check_contract(state, topology, index)
+        for agent_id in self._by_agent:
+            if agent_id in topology.agents:
+                capability = _capability_of(topology.agents[agent_id])
+                if capability is not None:
+                    state.coverage[capability] += 1
+        return state
+
+    def _derived_state(
+        self, base: _VerificationState, topology: TeamTopology
+    ) -> _VerificationState:
+        """Update ``base``'s results for the agents and goals that differ in ``topology``."""
+        old_agents = base.topology.agents
+        agents = topology.agents
+        # Copy so the result is compact: the xor's table is sized for both maps.
+        membership = set(old_agents.keys() ^ agents.keys())
+        changed = membership | {
+            agent_id for agent_id, agent in agents.items() if old_agents.get(agent_id) is not agent
+        }
+
+        state = _VerificationState(
+            topology,
+            self._structure_violations(topology),
+            None,
+            dict(base.pre),
+            dict(base.post),
+            dict(base.capability),
+            dict(base.communication),
+            base.coverage.copy(),
+        )
+
+        affected: set[int] = set()
+        for agent_id in changed:
+            affected.update(self._by_agent.get(agent_id, ()))
+            affected.update(self._by_peer.get(agent_id, ()))
+        for index in affected:
+            self._check_contract(state, topology, index)
+
+        for agent_id in changed:
+            if agent_id not in self._by_agent:
+                continue
+            before = _capability_of(old_agents[agent_id]) if agent_id in old_agents else None
+            after = _capability_of(agents[agent_id]) if agent_id in agents else None
+            if before is not None:
+                state.coverage[before] -= 1
+            if after is not None:
+                state.coverage[after] += 1
+        state.coverage = +state.coverage
+
+        if not state.structure:
+            old_goals: dict[str, set[str]] = getattr(base.topology, "goal_assignments", {})
+            goals: dict[str, set[str]] = getattr(topology, "goal_assignments", {})
+            old_results = base.goals
+            state.goals = {}
+            for goal_id, agent_ids in goals.items():
+                if (
+                    old_results is None
+                    or old_goals.get(goal_id) is not agent_ids
+                    or (membership and not membership.isdisjoint(agent_ids))
+                ):
+                    violations = self._goal_violations(topology, goal_id, agent_ids)
+                else:
+                    violations = old_results.get(goal_id, [])
+                if violations:
+                    state.goals[goal_id] = violations
+        return state
+
 
 # ──────────────────────────────────────────────────────────
-# §4 Main Entry Point
+# §5 Main Entry Point
 # ──────────────────────────────────────────────────────────
 
 
@@ -0,0 +1,255 @@
+"""Streaming communication-metrics collector for live topologies (Goal Hierarchy §6.2).
+
+Agents and lanes call ``CommunicationCollector.record(src, dst)`` for every
+message; divergence checks call ``snapshot()`` to obtain a
+``CommunicationMetrics`` over the trailing window whenever they like.
+
+Writers never take a lock.  Each thread owns a shard holding the sparse
+``(src, dst) -> count`` map of the time bucket it is currently writing.
+When the thread moves on to a new bucket it swaps in a fresh map and hands
+the finished one over through a deque.  ``snapshot()`` folds handed-over
+buckets into a ring of ``window_seconds / bucket_seconds`` buckets plus a
+running per-edge window total, expiring old buckets by subtraction, and
+adds a copy of each shard's live bucket.  A snapshot therefore costs
+O(edges active in the window), never an n x n matrix.
+
+Memory is bounded by the edges active in the window: buckets and edges
+that leave the window are dropped, and shards of exited threads are
+reaped.  This holds even if ``snapshot()`` is never called: once the
+handoff outgrows the ring, or the shard list passes a high-water mark, the
+writer doing the swap drains it, but only if the lock is free (a
+snapshot holding it drains anyway), so writers never wait.  A bucket in
+the middle of being handed over is missed by at most one concurrent
+snapshot.
+
+This module provides:
+- CommunicationCollector: lock-free ingest, sliding-window snapshots
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from holly.agents.spectral import SparseCommunicationMatrix
+from holly.agents.topology_manager import CommunicationMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+__all__ = [
+    "CommunicationCollector",
+]
+
+Edge = tuple[str, str]
+
+# Shard count at which a registering writer first tries to reap.
+_REAP_THRESHOLD = 64
+
+
+class _Shard:
+    """One thread's live bucket: ``(bucket_id, counts)`` swapped atomically."""
+
+    __slots__ = ("current", "thread")
+
+    def __init__(self, bucket: int, thread: threading.Thread) -> None:
+        self.current: tuple[int, dict[Edge, int]] = (bucket, {})
+        self.thread = thread
+
+
+class CommunicationCollector:
+    """Sliding-window message counts fed by concurrent writers.
+
+    Parameters
+    ----------
+    window_seconds : float
+        Length of the trailing window reported by ``snapshot``.
+    bucket_seconds : float
+        Granularity at which the window slides.
+    clock : Callable[[], float]
+        Wall-clock time source in seconds since the epoch.
+
+    Raises
+    ------
+    ValueError
+        If ``bucket_seconds`` is not positive or does not divide into
+        ``window_seconds`` at least once.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_clock",
+        "_handoff",
+        "_local",
+        "_lock",
+        "_reap_at",
+        "_shards",
+        "_started",
+        "_window",
+        "bucket_seconds",
+        "window_seconds",
+    )
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        bucket_seconds: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if bucket_seconds <= 0 or window_seconds < bucket_seconds:
+            raise ValueError(
+                f"need 0 < bucket_seconds <= window_seconds, got "
+                f"{bucket_seconds} and {window_seconds}"
+            )
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self._clock = clock
+        self._started = clock()
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._handoff: deque[tuple[int, dict[Edge, int]]] = deque()
+        self._buckets: dict[int, dict[Edge, int]] = {}
+        self._window: dict[Edge, int] = {}
+        self._lock = threading.Lock()
+        self._reap_at = _REAP_THRESHOLD
+
+    @property
+    def _bucket_count(self) -> int:
+        return max(1, round(self.window_seconds / self.bucket_seconds))
+
+    def record(self, src: str, dst: str, count: int = 1) -> None:
+        """Count ``count`` messages from ``src`` to ``dst`` now.
+
+        Lock-free: touches only the calling thread's shard, and drains
+        shared state only when the lock is free.
+        """
+        now_bucket = int(self._clock() // self.bucket_seconds)
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard(now_bucket, threading.current_thread())
+            self._shards.append(shard)
+            if len(self._shards) > self._reap_at:
+                self._try_advance(now_bucket)
+                self._reap_at = max(_REAP_THRESHOLD, 2 * len(self._shards))
+        bucket, counts = shard.current
+        if now_bucket != bucket:
+            # Swap first, then hand over: a snapshot may miss the old bucket
+            # for one call but can never count it twice.
+            fresh: dict[Edge, int] = {}
+            shard.current = (now_bucket, fresh)
+            self._handoff.append((bucket, counts))
+            counts = fresh
+            if len(self._handoff) > self._bucket_count:
+                self._try_advance(now_bucket)
+        key = (src, dst)
+        counts[key] = counts.get(key, 0) + count
+
+    def _bucket_of(self, t: float) -> int:
+        return int(t // self.bucket_seconds)
+
+    def _merge(self, bucket: int, counts: dict[Edge, int], oldest: int) -> None:
+        """Fold a finished bucket into the ring (caller holds the lock)."""
+        if bucket < oldest or not counts:
+            return
+        stored = self._buckets.setdefault(bucket, {})
+        window = self._window
+        for key, n in counts.items():
+            stored[key] = stored.get(key, 0) + n
+            window[key] = window.get(key, 0) + n
+
+    def _advance(self, current: int) -> int:
+        """Drain handed-over buckets, reap dead shards and expire the ring.
+
+        Returns the oldest bucket id inside the window.
+        """
+        oldest = current - self._bucket_count + 1
+        for bucket in [b for b in self._buckets if b < oldest]:
+            window = self._window
+            for key, n in self._buckets.pop(bucket).items():
+                left = window[key] - n
+                if left:
+                    window[key] = left
+                else:
+                    del window[key]
+
+        handoff = self._handoff
+        while handoff:
+            self._merge(*handoff.popleft(), oldest)
+        for shard in list(self._shards):
+            if not shard.thread.is_alive():
+                self._shards.remove(shard)
+                self._merge(*shard.current, oldest)
+        return oldest
+
+    def _try_advance(self, current: int) -> None:
+        """Run ``_advance`` from a writer unless someone holds the lock."""
+        if self._lock.acquire(blocking=False):
+            try:
+                self._advance(current)
+            finally:
+                self._lock.release()
+
+    def snapshot(self, agent_ids: Sequence[str] | None = None) -> CommunicationMetrics:
+        """Return message counts over the trailing window.
+
+        Parameters
+        ----------
+        agent_ids : Sequence[str] | None
+            Matrix index order, e.g. ``sorted(topology.agents)`` to align
+            with the expected matrix; edges touching other agents are
+            left out.  None indexes every agent seen, in sorted order.
+
+        Returns
+        -------
+        CommunicationMetrics
+            Sparse ``message_counts``; the window starts at the oldest
+            bucket kept (or when the collector was created, if later).
+        """
+        with self._lock:
+            now = self._clock()
+            oldest = self._advance(self._bucket_of(now))
+            merged = dict(self._window)
+            for shard in list(self._shards):
+                bucket, counts = shard.current
+                if bucket >= oldest:
+                    for key, n in counts.copy().items():
+                        merged[key] = merged.get(key, 0) + n
+
+        if agent_ids is None:
+            agent_ids = sorted({agent for edge in merged for agent in edge})
+        index = {agent: i for i, agent in enumerate(agent_ids)}
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[int] = []
+        for (src, dst), n in merged.items():
+            i = index.get(src)
+            j = index.get(dst)
+            if i is not None and j is not None:
+                rows.append(i)
+                cols.append(j)
+                values.append(n)
+
+        start = max(self._started, oldest * self.bucket_seconds)
+        return CommunicationMetrics(
+            window_start=datetime.datetime.fromtimestamp(start, datetime.timezone.utc),
+            window_end=datetime.datetime.fromtimestamp(now, datetime.timezone.utc),
+            message_counts=SparseCommunicationMatrix(
+                len(index),
+                np.array(rows, dtype=np.int64),
+                np.array(cols, dtype=np.int64),
+                np.array(values, dtype=np.float64),
+            ),
+            total_messages=sum(values),
+        )
+
+    def active_edges(self) -> int:
+        """Number of distinct edges in the window's closed buckets."""
+        with self._lock:
+            self._advance(self._bucket_of(self._clock()))
+            return len(self._window)
@@ -0,0 +1,287 @@
+"""Sparse communication matrices and top-k singular spectra (Goal Hierarchy §6).
+
+Communication matrices are directed: ``C[i, j]`` is the rate at which
+agent ``i`` messages agent ``j``, and ``C`` is generally not symmetric.
+Eigenvalues of a non-symmetric matrix are complex and ill-conditioned,
+and ``eigvalsh`` silently reads only one triangle, so the spectrum used
+for divergence monitoring is the singular-value spectrum.  For a
+symmetric matrix the singular values are exactly the absolute
+eigenvalues, so undirected teams see the same spectrum as before.
+
+Contract-derived and measured matrices have O(agents) non-zeros, so they
+are stored as ``SparseCommunicationMatrix`` (row-sorted COO).  The
+largest ``k`` singular values are computed by block Lanczos (randomised
+block Krylov iteration on ``A Aᵀ`` with full reorthogonalisation and a
+Rayleigh-Ritz step), using only sparse products: O(nnz·b + n·D²) for a
+basis of ``D`` columns built ``b`` at a time, instead of O(n³) for a
+dense decomposition.  A block of ``b > k`` vectors finds repeated
+singular values, which are common when many contracts share a rate.
+Small matrices use a dense SVD.
+
+This module provides:
+- SparseCommunicationMatrix: square sparse matrix with mat-vec products
+- top_singular_values: largest k singular values of a sparse matrix
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = [
+    "DEFAULT_TOP_K",
+    "SparseCommunicationMatrix",
+    "top_singular_values",
+]
+
+# Singular values compared by divergence checks unless a caller asks for more.
+DEFAULT_TOP_K = 32
+
+# Matrices up to this size are decomposed densely (exact, and about as fast).
+DENSE_CUTOFF = 256
+
+
+class SparseCommunicationMatrix:
+    """Square sparse matrix in row-sorted coordinate form.
+
+    Duplicate ``(row, col)`` entries are summed and explicit zeros are
+    dropped on construction.
+
+    Parameters
+    ----------
+    n : int
+        Matrix dimension (number of agents).
+    rows, cols : np.ndarray
+        Integer coordinates of the non-zero entries.
+    data : np.ndarray
+        Values of the non-zero entries.
+
+    Raises
+    ------
+    ValueError
+        If ``n`` is negative, the arrays differ in length, or a
+        coordinate lies outside ``[0, n)``.
+    """
+
+    __slots__ = ("cols", "data", "n", "rows")
+
+    def __init__(self, n: int, rows: np.ndarray, cols: np.ndarray, data: np.ndarray) -> None:
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        data = np.asarray(data, dtype=np.float64)
+        if not rows.shape == cols.shape == data.shape or rows.ndim != 1:
+            raise ValueError("rows, cols and data must be 1-d arrays of equal length")
+        if rows.size and (
+            min(rows.min(), cols.min()) < 0 or max(rows.max(), cols.max()) >= n
+        ):
+            raise ValueError(f"coordinates must lie in [0, {n})")
+        if rows.size:
+            keys, inverse = np.unique(rows * n + cols, return_inverse=True)
+            data = np.bincount(inverse, weights=data, minlength=keys.size)
+            keep = data != 0
+            keys, data = keys[keep], data[keep]
+            rows, cols = np.divmod(keys, n) if n else (keys, keys)
+        self.n = n
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+
+    @classmethod
+    def _canonical(
+        cls, n: int, rows: np.ndarray, cols: np.ndarray, data: np.ndarray
+    ) -> SparseCommunicationMatrix:
+        """Wrap arrays that are already row-sorted, unique and non-zero."""
+        matrix = cls.__new__(cls)
+        matrix.n = n
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix.data = data
+        return matrix
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray) -> SparseCommunicationMatrix:
+        """Build from a dense square array."""
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError(f"expected a square matrix, got shape {matrix.shape}")
+        rows, cols = np.nonzero(matrix)
+        return cls(matrix.shape[0], rows, cols, matrix[rows, cols])
+
+    @classmethod
+    def from_edges(
+        cls, n: int, edges: Iterable[tuple[int, int, float]]
+    ) -> SparseCommunicationMatrix:
+        """Build from ``(row, col, value)`` triples."""
+        triples = np.array(list(edges), dtype=np.float64).reshape(-1, 3)
+        return cls(n, triples[:, 0], triples[:, 1], triples[:, 2])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(n, n)``."""
+        return self.n, self.n
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored non-zero entries."""
+        return int(self.data.size)
+
+    def resized(self, n: int) -> SparseCommunicationMatrix:
+        """Return the matrix zero-padded to dimension ``n`` (>= current)."""
+        if n < self.n:
+            raise ValueError(f"cannot shrink a {self.n}x{self.n} matrix to {n}")
+        return self._canonical(n, self.rows, self.cols, self.data)
+
+    def scaled(self, factor: float) -> SparseCommunicationMatrix:
+        """Return ``factor * self``."""
+        if factor == 0:
+            return SparseCommunicationMatrix(self.n, self.rows[:0], self.cols[:0], self.data[:0])
+        return self._canonical(self.n, self.rows, self.cols, self.data * factor)
+
+    def _product(self, x: np.ndarray, gather: np.ndarray, scatter: np.ndarray) -> np.ndarray:
+        """Sum ``data * x[gather]`` into ``scatter`` rows, one column at a time."""
+        if x.ndim == 1:
+            return np.bincount(scatter, weights=self.data * x[gather], minlength=self.n)
+        columns = np.ascontiguousarray(x.T)
+        return np.stack(
+            [
+                np.bincount(scatter, weights=self.data * column[gather], minlength=self.n)
+                for column in columns
+            ],
+            axis=1,
+        )
+
+    def matmat(self, x: np.ndarray) -> np.ndarray:
+        """Return ``self @ x`` for a vector or ``(n, b)`` array."""
+        return self._product(x, self.cols, self.rows)
+
+    def rmatmat(self, x: np.ndarray) -> np.ndarray:
+        """Return ``self.T @ x`` for a vector or ``(n, b)`` array."""
+        return self._product(x, self.rows, self.cols)
+
+    def to_dense(self) -> np.ndarray:
+        """Return the dense ``(n, n)`` array."""
+        dense = np.zeros((self.n, self.n), dtype=np.float64)
+        dense[self.rows, self.cols] = self.data
+        return dense
+
+
+
+
+def _project_out(block: np.ndarray, basis: np.ndarray) -> np.ndarray:
+    """Remove ``block``'s components along the orthonormal ``basis`` (two passes)."""
+    if basis.shape[1]:
+        block = block - basis @ (basis.T @ block)
+        block = block - basis @ (basis.T @ block)
+    return block
+
+
+def _orthonormal_block(
+    block: np.ndarray, basis: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Orthonormalise ``block`` against ``basis`` and itself.
+
+    Columns that all but vanish after projection (the Krylov space is
+    exhausted, e.g. for low-rank matrices) are replaced by random
+    directions, so the returned block always has full rank.  When a
+    column loses most of its norm, normalising the remainder amplifies
+    rounding error, so one more projection pass is made.
+    """
+    norms = np.maximum(np.linalg.norm(block, axis=0), np.finfo(np.float64).tiny)
+    q, r = np.linalg.qr(_project_out(block, basis))
+    kept = np.abs(np.diag(r)) / norms
+    weak = kept <= 1e-8
+    if weak.any():
+        q[:, weak] = rng.standard_normal((block.shape[0], int(weak.sum())))
+        q[:, weak] = _project_out(q[:, weak], np.concatenate([basis, q[:, ~weak]], axis=1))
+    if (kept <= 1e-3).any():
+        q, _ = np.linalg.qr(q - basis @ (basis.T @ q))
+    return q
+
+
+def _ritz_values(gram: np.ndarray, k: int) -> np.ndarray:
+    """Largest ``k`` singular values from the Gram matrix ``Wᵀ W``."""
+    return np.sqrt(np.clip(np.linalg.eigvalsh(gram)[::-1][:k], 0.0, None))
+
+
+def top_singular_values(
+    matrix: SparseCommunicationMatrix,
+    k: int = DEFAULT_TOP_K,
+    *,
+    oversample: int = 8,
+    max_blocks: int = 16,
+    tol: float = 1e-8,
+    seed: int = 0,
+    dense_cutoff: int = DENSE_CUTOFF,
+) -> np.ndarray:
+    """Return the ``min(k, n)`` largest singular values, in descending order.
+
+    Parameters
+    ----------
+    matrix : SparseCommunicationMatrix
+        Matrix to analyse.
+    k : int
+        Number of singular values wanted.
+    oversample : int
+        Extra vectors per block beyond ``k``; larger blocks converge in
+        fewer iterations on flat spectra.
+    max_blocks : int
+        Upper bound on Krylov blocks built before returning.
+    tol : float
+        Iteration stops once no wanted value moved by more than
+        ``tol * sigma_max`` between blocks.
+    seed : int
+        Seed for the starting block, so results are reproducible.
+    dense_cutoff : int
+        Matrices of at most this dimension use a dense SVD instead.
+
+    Returns
+    -------
+    np.ndarray
+        Singular values, largest first (length ``min(k, n)``).
+
+    Raises
+    ------
+    ValueError
+        If ``k`` < 1.
+    """
+    if k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+    n = matrix.n
+    k = min(k, n)
+    if k == 0 or matrix.nnz == 0:
+        return np.zeros(k)
+    b = k + oversample
+    if n <= max(dense_cutoff, 2 * b):
+        return np.linalg.svd(matrix.to_dense(), compute_uv=False)[:k]
+
+    # The basis Q spans A Ω, (A Aᵀ) A Ω, ...; Ritz values are the singular
+    # values of Qᵀ A, taken from the Gram matrix of W = Aᵀ Q, which is
+    # extended by one block of rows and columns per iteration.
+    rng = np.random.default_rng(seed)
+    basis = _orthonormal_block(
+        matrix.matmat(rng.standard_normal((n, b))), np.empty((n, 0)), rng
+    )
+    w = matrix.rmatmat(basis)
+    gram = w.T @ w
+    ritz = _ritz_values(gram, k)
+    for _ in range(max_blocks - 1):
+        if basis.shape[1] + b > n:
+            break
+        block = _orthonormal_block(matrix.matmat(w[:, -b:]), basis, rng)
+        w_block = matrix.rmatmat(block)
+        cross = w.T @ w_block
+        gram = np.block([[gram, cross], [cross.T, w_block.T @ w_block]])
+        basis = np.concatenate([basis, block], axis=1)
+        w = np.concatenate([w, w_block], axis=1)
+        updated = _ritz_values(gram, k)
+        converged = np.max(np.abs(updated - ritz)) <= tol * updated[0]
+        ritz = updated
+        if converged:
+            break
+    return ritz
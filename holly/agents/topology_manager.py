@@ -18,14 +18,22 @@ References:
 
 from __future__ import annotations
 
+import bisect
 import dataclasses
 import datetime
 import enum
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Callable, Protocol, runtime_checkable
 
 import numpy as np
 
+from holly.agents.spectral import (
+    DEFAULT_TOP_K,
+    SparseCommunicationMatrix,
+    top_singular_values,
+)
+
 
 # ──────────────────────────────────────────────────────────
 # §1 Agent & Contract Models
@@ -187,6 +195,14 @@ class TeamTopology:
         When this topology was created.
     is_active
         Whether topology is currently active.
+
+    Expected spectra are cached per ``k`` until an agent is added or
+    ``communication_matrix`` is replaced.
+
+    Versions produced by ``TopologyManager.steer`` share unchanged agents,
+    contract sets and goal-assignment sets with their predecessor, and
+    rebuild only the changed agents' rows of the expected matrix.
+    ``assign_goal`` therefore replaces a goal's set instead of mutating it.
     """
 
     topology_id: str
@@ -197,6 +213,21 @@ class TeamTopology:
         default_factory=lambda: datetime.datetime.now(datetime.timezone.utc)
     )
     is_active: bool = True
+    _spectra: dict[int, np.ndarray] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _spectra_source: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sparse: SparseCommunicationMatrix | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sparse_base: tuple[SparseCommunicationMatrix, frozenset[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _contract_matrix: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate topology."""
@@ -208,14 +239,62 @@ class TeamTopology:
         if agent.agent_id in self.agents:
             raise ValueError(f"Agent {agent.agent_id} already exists in topology")
         self.agents[agent.agent_id] = agent
+        self._spectra.clear()
+        self._sparse = None
+        self._sparse_base = None
+        self._contract_matrix = None
 
     def assign_goal(self, goal_id: str, agent_id: str) -> None:
         """Assign a goal to an agent."""
         if agent_id not in self.agents:
             raise ValueError(f"Agent {agent_id} not in topology")
-        if goal_id not in self.goal_assignments:
-            self.goal_assignments[goal_id] = set()
-        self.goal_assignments[goal_id].add(agent_id)
+        self.goal_assignments[goal_id] = self.goal_assignments.get(goal_id, set()) | {agent_id}
+
+    def _successor(
+        self,
+        topology_id: str,
+        agents: dict[str, Agent],
+        goal_assignments: dict[str, set[str]],
+        changed: frozenset[str] | None,
+    ) -> TeamTopology:
+        """Create the next version of this topology, inheriting matrix caches.
+
+        Parameters
+        ----------
+        topology_id
+            ID of the new version.
+        agents
+            Agents of the new version; unchanged ``Agent`` objects are shared.
+        goal_assignments
+            Goal assignments of the new version.
+        changed
+            Agents whose contracts differ from this version, or None if the
+            agent set itself changed (caches are then not inherited).
+
+        Returns
+        -------
+        TeamTopology
+            New version whose expected matrix is derived from this one's by
+            rebuilding the ``changed`` rows on first use.
+        """
+        successor = TeamTopology(
+            topology_id=topology_id, agents=agents, goal_assignments=goal_assignments
+        )
+        if changed is None:
+            return successor
+        if self._sparse is not None:
+            if not changed:
+                successor._sparse = self._sparse
+                if self._spectra_source is self.communication_matrix and (
+                    self.communication_matrix is self._contract_matrix
+                ):
+                    successor._spectra = dict(self._spectra)
+            else:
+                successor._sparse_base = (self._sparse, changed)
+        elif self._sparse_base is not None:
+            base, stale = self._sparse_base
+            successor._sparse_base = (base, stale | changed)
+        return successor
 
     def get_expected_communication_matrix(self) -> np.ndarray:
         """Build expected communication pattern matrix from contracts.
@@ -228,21 +307,90 @@ class TeamTopology:
         if self.communication_matrix is not None:
             return self.communication_matrix
 
-        agent_ids = sorted(self.agents.keys())
-        n = len(agent_ids)
-        matrix = np.zeros((n, n), dtype=np.float64)
+        matrix = self.get_expected_sparse_matrix().to_dense()
+        self._contract_matrix = matrix
+        if self._spectra_source is None:
+            self._spectra_source = matrix  # same rates the cached spectra used
+        self.communication_matrix = matrix
+        return matrix
 
-        id_to_idx = {aid: i for i, aid in enumerate(agent_ids)}
+    def get_expected_sparse_matrix(self) -> SparseCommunicationMatrix:
+        """Build the expected communication matrix in sparse form.
 
-        for agent_id, agent in self.agents.items():
-            for contract in agent.contracts:
-                if contract.peer_agent_id in id_to_idx:
-                    i = id_to_idx[agent_id]
-                    j = id_to_idx[contract.peer_agent_id]
-                    matrix[i, j] = contract.expected_message_rate
+        Same entries as ``get_expected_communication_matrix`` but built in
+        O(contracts) without materialising an n x n array.  A version
+        produced by steering rebuilds only the rows of agents whose
+        contracts changed.
 
-        self.communication_matrix = matrix
-        return matrix
+        Returns
+        -------
+        SparseCommunicationMatrix
+            Expected message rates, agents indexed in sorted-id order.
+        """
+        if self.communication_matrix is not None and (
+            self.communication_matrix is not self._contract_matrix
+        ):
+            return SparseCommunicationMatrix.from_dense(self.communication_matrix)
+        if self._sparse is None:
+            self._sparse = self._build_sparse_matrix()
+            self._sparse_base = None
+        return self._sparse
+
+    def _build_sparse_matrix(self) -> SparseCommunicationMatrix:
+        """Build contract rows, reusing the unchanged rows of a base matrix."""
+        agent_ids = sorted(self.agents)
+        if self._sparse_base is None:
+            sources = agent_ids
+        else:
+            base, stale = self._sparse_base
+            sources = sorted(stale)
+
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[float] = []
+        for agent_id in sources:
+            rates: dict[int, float] = {}
+            for contract in self.agents[agent_id].contracts:
+                peer = contract.peer_agent_id
+                if peer is not None and peer in self.agents:
+                    rates[bisect.bisect_left(agent_ids, peer)] = contract.expected_message_rate
+            rows.extend([bisect.bisect_left(agent_ids, agent_id)] * len(rates))
+            cols.extend(rates)
+            values.extend(rates.values())
+
+        row_array = np.array(rows, dtype=np.int64)
+        col_array = np.array(cols, dtype=np.int64)
+        value_array = np.array(values, dtype=np.float64)
+        if self._sparse_base is not None:
+            stale_rows = [bisect.bisect_left(agent_ids, agent_id) for agent_id in sources]
+            keep = ~np.isin(base.rows, np.array(stale_rows, dtype=np.int64))
+            row_array = np.concatenate([base.rows[keep], row_array])
+            col_array = np.concatenate([base.cols[keep], col_array])
+            value_array = np.concatenate([base.data[keep], value_array])
+        return SparseCommunicationMatrix(len(agent_ids), row_array, col_array, value_array)
+
+    def expected_spectrum(self, k: int = DEFAULT_TOP_K) -> np.ndarray:
+        """Return the top-``k`` singular values of the expected matrix (cached).
+
+        Parameters
+        ----------
+        k
+            Number of singular values.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only array of ``min(k, n_agents)`` values, largest first.
+        """
+        if self._spectra_source is not self.communication_matrix:
+            self._spectra.clear()
+            self._spectra_source = self.communication_matrix
+        spectrum = self._spectra.get(k)
+        if spectrum is None:
+            spectrum = top_singular_values(self.get_expected_sparse_matrix(), k)
+            spectrum.flags.writeable = False
+            self._spectra[k] = spectrum
+        return spectrum
 
 
 @runtime_checkable
@@ -280,14 +428,15 @@ class CommunicationMetrics:
     window_end
         End of measurement window.
     message_counts
-        [n_agents x n_agents] matrix of actual message counts.
+        [n_agents x n_agents] matrix of actual message counts, dense or
+        sparse.
     total_messages
         Total messages exchanged.
     """
 
     window_start: datetime.datetime
     window_end: datetime.datetime
-    message_counts: np.ndarray
+    message_counts: np.ndarray | SparseCommunicationMatrix
     total_messages: int
 
     @property
@@ -297,10 +446,12 @@ class CommunicationMetrics:
         return delta.total_seconds()
 
     @property
-    def message_rates(self) -> np.ndarray:
+    def message_rates(self) -> np.ndarray | SparseCommunicationMatrix:
         """Convert message counts to message rates (msgs/sec)."""
         if self.window_duration_sec <= 0:
             return self.message_counts
+        if isinstance(self.message_counts, SparseCommunicationMatrix):
+            return self.message_counts.scaled(1.0 / self.window_duration_sec)
         return self.message_counts / self.window_duration_sec
 
 
@@ -308,14 +459,17 @@ class CommunicationMetrics:
 class EigenspectrumAnalysis:
     """Result of eigenspectrum divergence analysis.
     
+    The spectra are singular values, which equal the absolute eigenvalues
+    when the communication matrix is symmetric.
+
     Attributes
     ----------
     actual_eigenvalues
-        Eigenvalues of actual communication matrix.
+        Largest singular values of actual communication matrix.
     expected_eigenvalues
-        Eigenvalues of expected communication matrix.
+        Largest singular values of expected communication matrix.
     divergence
-        L2 distance between eigenvalue vectors.
+        L2 distance between the two spectra.
     is_divergent
         Whether divergence exceeds threshold.
     threshold
@@ -338,6 +492,7 @@ def compute_eigenspectrum_divergence(
     topology: TeamTopology,
     actual_metrics: CommunicationMetrics,
     threshold: float = 2.0,
+    top_k: int = DEFAULT_TOP_K,
 ) -> EigenspectrumAnalysis:
     """Compute spectral divergence between actual and expected communication.
     
@@ -346,6 +501,12 @@ def compute_eigenspectrum_divergence(
     - Actual pattern measured from message logs
     - Eigenvalues capture network "shape"
     - Divergence indicates topology drift
+
+    Communication is directed, so the spectrum compared is the singular
+    values (|eigenvalues| for symmetric patterns).  Only the ``top_k``
+    largest are computed, from sparse matrices; teams of at most
+    ``top_k`` agents are compared on their full spectrum.  The expected
+    spectrum is cached on the topology.
     
     Parameters
     ----------
@@ -355,45 +516,35 @@ def compute_eigenspectrum_divergence(
         Actual communication metrics over measurement window.
     threshold
         Divergence threshold for flagging divergence.
+    top_k
+        Number of leading singular values compared.
         
     Returns
     -------
     EigenspectrumAnalysis
         Eigenvalues, divergence, and status.
     """
-    # Get expected communication pattern from contracts
-    c_expected = topology.get_expected_communication_matrix()
-
     # Use actual message rates
     c_actual = actual_metrics.message_rates
+    if not isinstance(c_actual, SparseCommunicationMatrix):
+        c_actual = SparseCommunicationMatrix.from_dense(c_actual)
 
-    # Pad to same size if needed
-    max_size = max(c_expected.shape[0], c_actual.shape[0])
-    if c_expected.shape[0] < max_size:
-        pad_width = ((0, max_size - c_expected.shape[0]), (0, max_size - c_expected.shape[0]))
-        c_expected = np.pad(c_expected, pad_width, constant_values=0)
-    if c_actual.shape[0] < max_size:
-        pad_width = ((0, max_size - c_actual.shape[0]), (0, max_size - c_actual.shape[0]))
-        c_actual = np.pad(c_actual, pad_width, constant_values=0)
-
-    # Compute eigenvalues
+    # Zero padding to a common size only appends zero singular values.
     try:
-        lambda_actual = np.linalg.eigvalsh(c_actual)
-        lambda_expected = np.linalg.eigvalsh(c_expected)
+        lambda_expected = topology.expected_spectrum(top_k)
+        lambda_actual = top_singular_values(c_actual, top_k)
     except np.linalg.LinAlgError:
-        # If eigenvalue computation fails, use identity eigenvalues
-        n = max_size
-        lambda_actual = np.ones(n)
-        lambda_expected = np.ones(n)
-
-    # Sort by absolute value
-    lambda_actual = np.sort(np.abs(lambda_actual))[::-1]
-    lambda_expected = np.sort(np.abs(lambda_expected))[::-1]
+        # If the decomposition fails, report no divergence
+        lambda_expected = lambda_actual = np.ones(0)
 
-    # Pad to same length if needed
-    max_len = max(len(lambda_actual), len(lambda_expected))
-    lambda_actual = np.pad(lambda_actual, (0, max_len - len(lambda_actual)), constant_values=0)
-    lambda_expected = np.pad(lambda_expected, (0, max_len - len(lambda_expected)), constant_values=0)
+    n_expected = (
+        topology.communication_matrix.shape[0]
+        if topology.communication_matrix is not None
+        else len(topology.agents)
+    )
+    length = min(top_k, max(n_expected, c_actual.n))
+    lambda_actual = np.pad(lambda_actual, (0, length - len(lambda_actual)))
+    lambda_expected = np.pad(lambda_expected, (0, length - len(lambda_expected)))
 
     # Compute L2 divergence
     divergence = float(np.linalg.norm(lambda_actual - lambda_expected))
@@ -485,6 +636,10 @@ class DissolveSpec:
 # ──────────────────────────────────────────────────────────
 
 
+# Superseded or dissolved topologies kept for lookup before the oldest is evicted.
+DEFAULT_RETAINED_VERSIONS = 32
+
+
 class TopologyManager:
     """Master topology manager: spawn, steer, dissolve operations.
     
@@ -495,13 +650,41 @@ class TopologyManager:
     - Communication contract validation
     
     Implements ICD-012 (Engine dispatch) and ICD-015 (Subagent lane spawning).
+
+    Parameters
+    ----------
+    max_retained_versions
+        How many inactive (steered-away or dissolved) topologies stay
+        retrievable via ``get_topology``; the oldest are evicted first.
+        None retains every version.
+
+    Raises
+    ------
+    ValueError
+        If ``max_retained_versions`` is negative.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_retained_versions: int | None = DEFAULT_RETAINED_VERSIONS) -> None:
         """Initialize topology manager."""
+        if max_retained_versions is not None and max_retained_versions < 0:
+            raise ValueError(
+                f"max_retained_versions must be >= 0, got {max_retained_versions}"
+            )
         self._topologies: dict[str, TeamTopology] = {}
         self._topology_counter: int = 0
         self._observers: list[TopologyObserver] = []
+        self._max_retained_versions = max_retained_versions
+        self._retired: deque[str] = deque()
+
+    def _retire(self, topology: TeamTopology) -> None:
+        """Deactivate a topology and evict the oldest inactive versions over the limit."""
+        if not topology.is_active:
+            return
+        topology.is_active = False
+        self._retired.append(topology.topology_id)
+        limit = self._max_retained_versions
+        while limit is not None and len(self._retired) > limit:
+            self._topologies.pop(self._retired.popleft(), None)
 
     def register_observer(self, observer: TopologyObserver) -> None:
         """Register an observer for topology changes."""
@@ -578,6 +761,10 @@ class TopologyManager:
         - Modify team structure while preserving progress
         - Change assignments, add/remove agents
         - Keep original goals
+
+        The new version shares unchanged agents, contract sets and goal
+        assignments with the old one, so the work done is proportional to
+        the agents and goals that change; the old version is retired.
         
         Parameters
         ----------
@@ -602,53 +789,60 @@ class TopologyManager:
         # Create new topology as copy of old
         self._topology_counter += 1
         new_topology_id = f"topo-{self._topology_counter}"
-        new_topology = TeamTopology(topology_id=new_topology_id)
 
-        # Copy preserved agents
+        # Share the old agent map and drop agents not preserved
+        agents = dict(old_topology.agents)
+        dropped: set[str] = set()
         if spec.preserve_agents is not None:
-            agents_to_keep = spec.preserve_agents
-        else:
-            agents_to_keep = frozenset(old_topology.agents.keys())
-
-        for agent_id in agents_to_keep:
-            if agent_id in old_topology.agents:
-                old_agent = old_topology.agents[agent_id]
-
-                # Update contracts if specified
-                contracts = old_agent.contracts
-                for contract in spec.new_contracts:
-                    if contract.agent_id == agent_id:
-                        contracts = frozenset(
-                            c for c in contracts if c.peer_agent_id != contract.peer_agent_id
-                        ) | frozenset([contract])
-
-                new_agent = Agent(
-                    agent_id=agent_id,
-                    permissions=old_agent.permissions,
-                    contracts=contracts,
-                    assigned_goals=old_agent.assigned_goals,
-                    parent_agent_id=old_agent.parent_agent_id,
-                )
-                new_topology.add_agent(new_agent)
+            dropped = agents.keys() - spec.preserve_agents
+            for agent_id in dropped:
+                del agents[agent_id]
+
+        # Index contract updates by agent, then by peer (last one wins)
+        updates: dict[str, dict[str | None, AgentContract]] = {}
+        for contract in spec.new_contracts:
+            if contract.agent_id in agents:
+                updates.setdefault(contract.agent_id, {})[contract.peer_agent_id] = contract
+
+        changed: set[str] = set()
+        for agent_id, by_peer in updates.items():
+            old_agent = agents[agent_id]
+            contracts = frozenset(
+                c for c in old_agent.contracts if c.peer_agent_id not in by_peer
+            ) | frozenset(by_peer.values())
+            if contracts != old_agent.contracts:
+                agents[agent_id] = dataclasses.replace(old_agent, contracts=contracts)
+                changed.add(agent_id)
+
+        # Keep old assignments for goals not reassigned, minus dropped agents
+        goal_assignments = dict(old_topology.goal_assignments)
+        if dropped:
+            for goal_id, agent_ids in old_topology.goal_assignments.items():
+                if not agent_ids.isdisjoint(dropped):
+                    kept = agent_ids - dropped
+                    if kept:
+                        goal_assignments[goal_id] = kept
+                    else:
+                        del goal_assignments[goal_id]
 
         # Apply reassignments
         for goal_id, new_agents in spec.agent_reassignments.items():
+            goal_assignments.pop(goal_id, None)
             for agent_id in new_agents:
-                if agent_id not in new_topology.agents:
+                if agent_id not in agents:
                     raise TopologyOperationError(
                         f"Cannot assign goal {goal_id} to agent {agent_id}: agent not in steered topology"
                     )
-                new_topology.assign_goal(goal_id, agent_id)
-
-        # If goals not reassigned, keep old assignments for preserved agents
-        for goal_id, agent_ids in old_topology.goal_assignments.items():
-            if goal_id not in spec.agent_reassignments:
-                for agent_id in agent_ids:
-                    if agent_id in new_topology.agents:
-                        new_topology.assign_goal(goal_id, agent_id)
+            if new_agents:
+                goal_assignments[goal_id] = set(new_agents)
 
-        new_topology.is_active = True
-        old_topology.is_active = False
+        new_topology = old_topology._successor(
+            new_topology_id,
+            agents,
+            goal_assignments,
+            None if dropped else frozenset(changed),
+        )
+        self._retire(old_topology)
 
         # Store new topology
         self._topologies[new_topology_id] = new_topology
@@ -686,7 +880,7 @@ class TopologyManager:
         topology = self._topologies[spec.topology_id]
 
         # Mark as inactive
-        topology.is_active = False
+        self._retire(topology)
 
         # Notify observers of agent dissolution
         for agent_id in topology.agents.keys():
@@ -5,6 +5,7 @@ Provides lane-based task routing and execution infrastructure.
 
 from __future__ import annotations
 
+from .cron import CronExpression
 from .goal_dispatch import (
     CelestialComplianceEvaluator,
     CelestialComplianceError,
@@ -15,6 +16,8 @@ from .goal_dispatch import (
     K2PermissionGate,
     dispatch_goal,
 )
+from .idempotency import IdempotencyCache, IdempotencyStats
+from .lane_dispatch import LaneDispatcher, TenantDispatchMetrics
 from .lanes import (
     AgentSpawnError,
     InvalidScheduleError,
@@ -24,6 +27,7 @@ from .lanes import (
     LanePolicy,
     LaneType,
     MainLane,
+    PriorityLaneQueue,
     QueueFullError,
     ScheduledTask,
     ScheduledTaskRequest,
@@ -34,31 +38,41 @@ from .lanes import (
     Task,
     TaskEnqueueRequest,
 )
+from .subagent_pool import SubagentContext, SubagentPool, SubagentPoolStats
 
 __all__ = [
     "AgentSpawnError",
     "CelestialComplianceEvaluator",
     "CelestialComplianceError",
+    "CronExpression",
     "CronLane",
     "GoalDispatchContext",
     "GoalDispatchDecision",
     "GoalDispatcher",
+    "IdempotencyCache",
+    "IdempotencyStats",
     "InvalidScheduleError",
     "K2PermissionError",
     "K2PermissionGate",
     "Lane",
+    "LaneDispatcher",
     "LaneError",
     "LaneManager",
     "LanePolicy",
     "LaneType",
     "MainLane",
+    "PriorityLaneQueue",
     "QueueFullError",
     "ScheduledTask",
     "ScheduledTaskRequest",
+    "SubagentContext",
     "SubagentLane",
+    "SubagentPool",
+    "SubagentPoolStats",
     "SubagentSpawnRequest",
     "SubagentTask",
     "Task",
     "TaskEnqueueRequest",
+    "TenantDispatchMetrics",
     "dispatch_goal",
 ]
@@ -0,0 +1,104 @@
+"""Blob stores for spilled workflow task results (ICD-021).
+
+``WorkflowEngine`` JSON-encodes task results at or above its
+``spill_threshold_bytes`` into a ``BlobStore`` and keeps only a
+``SpilledResult`` reference in memory and in checkpoints.
+
+This module provides:
+- InMemoryBlobStore: process-local store (tests, accounting)
+- LocalBlobStore: one file per blob under a local directory
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+__all__ = [
+    "InMemoryBlobStore",
+    "LocalBlobStore",
+]
+
+
+class InMemoryBlobStore:
+    """Process-local blob store.
+
+    Moves spilled bytes out of the execution but not out of the process;
+    mainly useful for tests and for measuring spill volume.
+    """
+
+    def __init__(self) -> None:
+        self._blobs: dict[str, bytes] = {}
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``."""
+        self._blobs[key] = data
+
+    async def get(self, key: str) -> bytes:
+        """Return the data stored under ``key``."""
+        return self._blobs[key]
+
+    async def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        self._blobs.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+
+class LocalBlobStore:
+    """Blob store writing one file per key under a local directory.
+
+    Blobs written with ``fsync`` survive a crash, so spilled results
+    referenced from a checkpoint chain remain loadable after
+    ``WorkflowEngine.resume``.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding blob files (created if missing).
+    fsync : bool
+        Flush each blob to stable storage before returning.
+    """
+
+    def __init__(self, directory: str | Path, *, fsync: bool = False) -> None:
+        self.directory = Path(directory)
+        self.fsync = fsync
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        if not key or "/" in key or key.startswith("."):
+            raise ValueError(f"invalid blob key: {key!r}")
+        return self.directory / key
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Write ``data`` to ``<directory>/<key>`` atomically."""
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as fh:
+            fh.write(data)
+            if self.fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, path)
+
+    async def get(self, key: str) -> bytes:
+        """Read the blob for ``key``.
+
+        Raises
+        ------
+        KeyError
+            If no blob exists for ``key``.
+        """
+        path = self._path(key)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    async def delete(self, key: str) -> None:
+        """Remove the blob for ``key`` if present."""
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
@@ -0,0 +1,270 @@
+"""Durable checkpoint stores for the workflow engine (ICD-021 / ICD-039).
+
+``WorkflowEngine`` emits delta ``ExecutionCheckpoint``s: each one carries
+only the task states and results that changed since the previous
+checkpoint of the same execution.  A store persists that chain so that
+``WorkflowEngine.resume`` can rebuild the execution after a crash.
+
+This module provides:
+- checkpoint_to_dict / checkpoint_from_dict: JSON-safe (de)serialisation
+- InMemoryCheckpointStore: process-local store (tests, single process)
+- FileCheckpointStore: append-only JSON-lines file per execution
+- RepoCheckpointStore: ``CheckpointsRepo`` (``workflow_checkpoints``) backed
+
+Task results must be JSON-serialisable to be persisted by the file and
+repository stores; non-serialisable results raise ``TypeError`` at save
+time rather than being silently coerced and corrupted on resume.
+``SpilledResult`` references are persisted as references; the blobs they
+point at must outlive the checkpoint chain.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from holly.engine.workflow_engine import (
+    ExecutionCheckpoint,
+    SagaPhase,
+    SpilledResult,
+    WorkflowTaskState,
+)
+
+if TYPE_CHECKING:
+    from holly.storage.postgres import CheckpointsRepo
+
+__all__ = [
+    "FileCheckpointStore",
+    "InMemoryCheckpointStore",
+    "RepoCheckpointStore",
+    "checkpoint_from_dict",
+    "checkpoint_to_dict",
+]
+
+# Namespace for deriving deterministic node ids from (execution, sequence).
+_CHECKPOINT_NAMESPACE = uuid.UUID("6f1d2c3e-9b7a-4c1e-8f2d-5a4b3c2d1e0f")
+
+# Marker key distinguishing an encoded SpilledResult from a plain result.
+_SPILLED_MARKER = "__spilled_result__"
+
+
+# ---------------------------------------------------------------------------
+# Serialisation
+# ---------------------------------------------------------------------------
+
+
+def _encode_result(result: Any) -> Any:
+    if isinstance(result, SpilledResult):
+        return {_SPILLED_MARKER: result.key, "size_bytes": result.size_bytes}
+    return result
+
+
+def _decode_result(result: Any) -> Any:
+    if isinstance(result, dict) and _SPILLED_MARKER in result:
+        return SpilledResult(
+            key=result[_SPILLED_MARKER], size_bytes=int(result["size_bytes"])
+        )
+    return result
+
+
+def checkpoint_to_dict(checkpoint: ExecutionCheckpoint) -> dict[str, Any]:
+    """Serialise a checkpoint to a JSON-compatible dict."""
+    return {
+        "workflow_id": checkpoint.workflow_id,
+        "execution_id": checkpoint.execution_id,
+        "checkpoint_id": checkpoint.checkpoint_id,
+        "sequence": checkpoint.sequence,
+        "timestamp": checkpoint.timestamp.isoformat(),
+        "completed_tasks": sorted(checkpoint.completed_tasks),
+        "results": {
+            task_id: _encode_result(result)
+            for task_id, result in checkpoint.results.items()
+        },
+        "task_states": {
+            task_id: state.value
+            for task_id, state in checkpoint.task_states.items()
+        },
+        "phase": checkpoint.phase.value,
+        "failed_task": checkpoint.failed_task,
+    }
+
+
+def checkpoint_from_dict(data: dict[str, Any]) -> ExecutionCheckpoint:
+    """Rebuild a checkpoint from ``checkpoint_to_dict`` output."""
+    return ExecutionCheckpoint(
+        workflow_id=data["workflow_id"],
+        checkpoint_id=data["checkpoint_id"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        completed_tasks=set(data["completed_tasks"]),
+        results={
+            task_id: _decode_result(result)
+            for task_id, result in data["results"].items()
+        },
+        phase=SagaPhase(data["phase"]),
+        execution_id=data["execution_id"],
+        sequence=int(data["sequence"]),
+        task_states={
+            task_id: WorkflowTaskState(state)
+            for task_id, state in data["task_states"].items()
+        },
+        failed_task=data.get("failed_task"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Stores
+# ---------------------------------------------------------------------------
+
+
+class InMemoryCheckpointStore:
+    """Process-local checkpoint store.
+
+    Survives engine instances but not the process; useful for tests and
+    for single-process deployments that only need ``resume`` after an
+    in-process failure.
+    """
+
+    def __init__(self) -> None:
+        self._chains: dict[str, list[ExecutionCheckpoint]] = {}
+        self._lock = asyncio.Lock()
+
+    async def save(self, checkpoint: ExecutionCheckpoint) -> None:
+        """Append checkpoint to its execution's chain."""
+        async with self._lock:
+            self._chains.setdefault(checkpoint.execution_id, []).append(
+                checkpoint
+            )
+
+    async def load(self, execution_id: str) -> list[ExecutionCheckpoint]:
+        """Return the chain for ``execution_id`` in sequence order."""
+        async with self._lock:
+            chain = list(self._chains.get(execution_id, ()))
+        return sorted(chain, key=lambda c: c.sequence)
+
+
+class FileCheckpointStore:
+    """Append-only JSON-lines checkpoint store on the local filesystem.
+
+    One file per execution (``<directory>/<execution_id>.jsonl``); each
+    checkpoint is a single line, so a save costs one append proportional
+    to the delta.  A torn final line left by a crash mid-write is ignored
+    on load.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding checkpoint files (created if missing).
+    fsync : bool
+        Flush each append to stable storage before returning.
+    """
+
+    def __init__(self, directory: str | Path, *, fsync: bool = True) -> None:
+        self.directory = Path(directory)
+        self.fsync = fsync
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, execution_id: str) -> Path:
+        if not execution_id or "/" in execution_id or execution_id.startswith("."):
+            raise ValueError(f"invalid execution_id: {execution_id!r}")
+        return self.directory / f"{execution_id}.jsonl"
+
+    async def save(self, checkpoint: ExecutionCheckpoint) -> None:
+        """Append checkpoint as one JSON line."""
+        line = json.dumps(checkpoint_to_dict(checkpoint), separators=(",", ":"))
+        await asyncio.to_thread(self._append, self._path(checkpoint.execution_id), line)
+
+    def _append(self, path: Path, line: str) -> None:
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+            if self.fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+
+    async def load(self, execution_id: str) -> list[ExecutionCheckpoint]:
+        """Read the chain for ``execution_id`` in sequence order."""
+        return await asyncio.to_thread(self._read, self._path(execution_id))
+
+    @staticmethod
+    def _read(path: Path) -> list[ExecutionCheckpoint]:
+        if not path.exists():
+            return []
+        chain: list[ExecutionCheckpoint] = []
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if not line.endswith("\n"):
+                    break  # torn write at crash time
+                chain.append(checkpoint_from_dict(json.loads(line)))
+        return sorted(chain, key=lambda c: c.sequence)
+
+
+class RepoCheckpointStore:
+    """Checkpoint store backed by ``CheckpointsRepo`` (ICD-039).
+
+    Each delta checkpoint becomes one ``workflow_checkpoints`` row keyed by
+    ``(workflow_id, node_id)`` where ``workflow_id`` is the execution UUID
+    and ``node_id`` is derived deterministically from the sequence number,
+    so re-saving a checkpoint is an idempotent UPSERT.  ``parent_node_ids``
+    links each row to its predecessor in the chain.
+
+    Parameters
+    ----------
+    repo : CheckpointsRepo
+        Tenant-scoped checkpoint repository.
+    tenant_id : uuid.UUID
+        Tenant owning the executions.
+    """
+
+    def __init__(self, repo: CheckpointsRepo, tenant_id: uuid.UUID) -> None:
+        self._repo = repo
+        self._tenant_id = tenant_id
+
+    @staticmethod
+    def _execution_uuid(execution_id: str) -> uuid.UUID:
+        try:
+            return uuid.UUID(execution_id)
+        except ValueError:
+            return uuid.uuid5(_CHECKPOINT_NAMESPACE, execution_id)
+
+    @staticmethod
+    def _node_id(execution_uuid: uuid.UUID, sequence: int) -> uuid.UUID:
+        return uuid.uuid5(execution_uuid, f"checkpoint:{sequence}")
+
+    async def save(self, checkpoint: ExecutionCheckpoint) -> None:
+        """UPSERT checkpoint as one ``workflow_checkpoints`` row."""
+        from holly.storage.postgres import CheckpointRow
+
+        execution_uuid = self._execution_uuid(checkpoint.execution_id)
+        parents = (
+            [self._node_id(execution_uuid, checkpoint.sequence - 1)]
+            if checkpoint.sequence > 0
+            else []
+        )
+        await self._repo.upsert(
+            CheckpointRow(
+                workflow_id=execution_uuid,
+                node_id=self._node_id(execution_uuid, checkpoint.sequence),
+                tenant_id=self._tenant_id,
+                checkpoint_timestamp=int(checkpoint.timestamp.timestamp() * 1000),
+                output_state=checkpoint_to_dict(checkpoint),
+                idempotency_key=checkpoint.checkpoint_id,
+                parent_node_ids=parents,
+            )
+        )
+
+    async def load(self, execution_id: str) -> list[ExecutionCheckpoint]:
+        """Fetch all rows for the execution and rebuild the chain."""
+        rows = await self._repo.list_workflow(self._execution_uuid(execution_id))
+        chain: list[ExecutionCheckpoint] = []
+        for row in rows:
+            state = row["output_state"]
+            if state is None:
+                continue
+            if isinstance(state, str | bytes):
+                state = json.loads(state)  # asyncpg returns JSONB as text
+            chain.append(checkpoint_from_dict(state))
+        return sorted(chain, key=lambda c: c.sequence)
@@ -0,0 +1,216 @@
+"""Cron expression parsing and next-fire computation for the Cron lane (ICD-014).
+
+Supports the five-field Vixie cron dialect (``minute hour day-of-month
+month day-of-week``) with ``*``, lists, ranges, steps, month and weekday
+names, and the ``@hourly``/``@daily``/``@weekly``/``@monthly``/``@yearly``
+macros.  As in Vixie cron, when both day fields are restricted a time
+matches if *either* matches.  All computation is in UTC.
+
+This module provides:
+- CronExpression: parsed expression with ``next_after`` computation
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+
+__all__ = [
+    "CronExpression",
+]
+
+_MACROS: dict[str, str] = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = {
+    name: i + 1
+    for i, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"]
+    )
+}
+_DAY_NAMES = {
+    name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+# Longest gap between fires of a satisfiable expression is "29 Feb"
+# across a skipped century leap year (8 years).
+_SEARCH_YEARS = 9
+
+
+def _parse_value(token: str, names: dict[str, int]) -> int:
+    lowered = token.lower()
+    if lowered in names:
+        return names[lowered]
+    if not token.isdigit():
+        raise ValueError(f"invalid cron value: {token!r}")
+    return int(token)
+
+
+def _parse_field(
+    field: str, lo: int, hi: int, names: dict[str, int] | None = None
+) -> tuple[int, ...]:
+    """Expand one cron field into its sorted tuple of allowed values."""
+    names = names or {}
+    values: set[int] = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = 1
+        if step_text:
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise ValueError(f"invalid cron step: {part!r}")
+            step = int(step_text)
+        if base == "*":
+            start, end = lo, hi
+        elif "-" in base:
+            first, _, last = base.partition("-")
+            start, end = _parse_value(first, names), _parse_value(last, names)
+        else:
+            start = _parse_value(base, names)
+            end = hi if step_text else start
+        if not (lo <= start <= hi and lo <= end <= hi) or start > end:
+            raise ValueError(f"cron field {part!r} out of range {lo}-{hi}")
+        values.update(range(start, end + 1, step))
+    return tuple(sorted(values))
+
+
+class CronExpression:
+    """Parsed five-field cron expression.
+
+    Parameters
+    ----------
+    expression : str
+        Cron expression or ``@`` macro.
+
+    Raises
+    ------
+    ValueError
+        If the expression is malformed or can never fire.
+    """
+
+    __slots__ = (
+        "_day_set",
+        "_dom_any",
+        "_dow_any",
+        "_hour_set",
+        "_minute_set",
+        "_month_set",
+        "_weekday_set",
+        "days",
+        "expression",
+        "hours",
+        "minutes",
+        "months",
+        "weekdays",
+    )
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        text = _MACROS.get(expression.strip().lower(), expression)
+        fields = text.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"cron expression must have 5 fields, got {len(fields)}: {expression!r}"
+            )
+        minute, hour, dom, month, dow = fields
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = _parse_field(dom, 1, 31)
+        self.months = _parse_field(month, 1, 12, _MONTH_NAMES)
+        # 7 is an alias for Sunday.
+        self.weekdays = tuple(
+            sorted({d % 7 for d in _parse_field(dow, 0, 7, _DAY_NAMES)})
+        )
+        self._minute_set = frozenset(self.minutes)
+        self._hour_set = frozenset(self.hours)
+        self._day_set = frozenset(self.days)
+        self._month_set = frozenset(self.months)
+        self._weekday_set = frozenset(self.weekdays)
+        self._dom_any = dom.startswith("*")
+        self._dow_any = dow.startswith("*")
+        longest = max(_days_in_month(2000, m) for m in self.months)
+        if self._dow_any and longest < self.days[0]:
+            raise ValueError(f"cron expression never fires: {expression!r}")
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, t: datetime) -> bool:
+        dom_ok = t.day in self._day_set
+        dow_ok = (t.weekday() + 1) % 7 in self._weekday_set
+        if self._dom_any and self._dow_any:
+            return True
+        if self._dom_any:
+            return dow_ok
+        if self._dow_any:
+            return dom_ok
+        return dom_ok or dow_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """Return the first fire time strictly after ``after``.
+
+        Skips whole months, days and hours that cannot match, so the
+        cost is bounded by the number of field transitions rather than
+        the number of minutes searched.
+
+        Parameters
+        ----------
+        after : datetime
+            Reference time (naive values are taken as UTC).
+
+        Returns
+        -------
+        datetime
+            Next fire time, timezone-aware UTC, whole minute.
+
+        Raises
+        ------
+        ValueError
+            If no fire time exists within the search horizon.
+        """
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=timezone.utc)
+        t = after.astimezone(timezone.utc).replace(second=0, microsecond=0)
+        t += timedelta(minutes=1)
+        limit = t.year + _SEARCH_YEARS
+        while t.year <= limit:
+            if t.month not in self._month_set:
+                i = bisect_left(self.months, t.month)
+                if i == len(self.months):
+                    t = t.replace(year=t.year + 1, month=self.months[0], day=1, hour=0, minute=0)
+                else:
+                    t = t.replace(month=self.months[i], day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if t.hour not in self._hour_set:
+                i = bisect_left(self.hours, t.hour)
+                if i == len(self.hours):
+                    t = t.replace(hour=0, minute=0) + timedelta(days=1)
+                else:
+                    t = t.replace(hour=self.hours[i], minute=0)
+                continue
+            if t.minute not in self._minute_set:
+                i = bisect_left(self.minutes, t.minute)
+                if i == len(self.minutes):
+                    t = t.replace(minute=0) + timedelta(hours=1)
+                else:
+                    t = t.replace(minute=self.minutes[i])
+                continue
+            return t
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 12:
+        return 31
+    first = datetime(year, month, 1)
+    return (first.replace(month=month + 1) - first).days
@@ -0,0 +1,295 @@
+"""Durable backends for the workflow dead-letter queue (ICD-021).
+
+``DeadLetterQueue`` keeps its indexes in memory and writes every mutation
+through to a ``DeadLetterBackend``.  Both backends here are append-only
+logs of ``put``/``del`` records, so a write costs one append regardless of
+queue size; replaying the log on ``load`` yields the live events.
+
+This module provides:
+- event_to_dict / event_from_dict: JSON-safe (de)serialisation
+- FileDeadLetterBackend: local JSON-lines segment with compaction
+- StreamDeadLetterBackend: Redis stream via ``StreamClient`` (ICD-035/037)
+
+Event payloads and execution contexts must be JSON-serialisable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from holly.engine.workflow_engine import DeadLetterEvent
+from holly.storage.redis.client import stream_key
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from holly.storage.redis.client import StreamClient
+
+__all__ = [
+    "FileDeadLetterBackend",
+    "StreamDeadLetterBackend",
+    "event_from_dict",
+    "event_to_dict",
+]
+
+
+# ---------------------------------------------------------------------------
+# Serialisation
+# ---------------------------------------------------------------------------
+
+
+def event_to_dict(event: DeadLetterEvent) -> dict[str, Any]:
+    """Serialise a dead-letter event to a JSON-compatible dict."""
+    return {
+        "event_id": event.event_id,
+        "workflow_id": event.workflow_id,
+        "task_id": event.task_id,
+        "timestamp": event.timestamp.isoformat(),
+        "error_message": event.error_message,
+        "payload": event.payload,
+        "execution_context": event.execution_context,
+    }
+
+
+def event_from_dict(data: dict[str, Any]) -> DeadLetterEvent:
+    """Rebuild a dead-letter event from ``event_to_dict`` output."""
+    return DeadLetterEvent(
+        event_id=data["event_id"],
+        workflow_id=data["workflow_id"],
+        task_id=data["task_id"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        error_message=data["error_message"],
+        payload=data["payload"],
+        execution_context=dict(data["execution_context"]),
+    )
+
+
+def _replay(records: list[dict[str, Any]]) -> dict[str, DeadLetterEvent]:
+    """Fold put/del records into the live event set (insertion-ordered)."""
+    live: dict[str, DeadLetterEvent] = {}
+    for record in records:
+        if record["op"] == "put":
+            event = event_from_dict(record["event"])
+            live[event.event_id] = event
+        elif record["op"] == "del":
+            for event_id in record["ids"]:
+                live.pop(event_id, None)
+    return live
+
+
+# ---------------------------------------------------------------------------
+# File segment backend
+# ---------------------------------------------------------------------------
+
+
+class FileDeadLetterBackend:
+    """Dead-letter log in a single local JSON-lines segment.
+
+    Deletions are tombstone records.  When tombstoned records outnumber
+    live ones (and exceed ``compact_threshold``), the segment is rewritten
+    with only live events and atomically swapped in.
+
+    Parameters
+    ----------
+    path : str | Path
+        Segment file path (parent directory created if missing).
+    fsync : bool
+        Flush each append to stable storage before returning.
+    compact_threshold : int
+        Minimum dead record count before compaction is considered.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fsync: bool = True,
+        compact_threshold: int = 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self.compact_threshold = compact_threshold
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._live = 0
+        self._dead = 0
+        self._lock = asyncio.Lock()
+
+    async def put(self, event: DeadLetterEvent) -> None:
+        """Append a ``put`` record."""
+        async with self._lock:
+            await asyncio.to_thread(
+                self._append, [{"op": "put", "event": event_to_dict(event)}]
+            )
+            self._live += 1
+
+    async def remove(self, event_ids: list[str]) -> None:
+        """Append a ``del`` tombstone, compacting when tombstones dominate."""
+        if not event_ids:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._append, [{"op": "del", "ids": event_ids}])
+            self._live = max(0, self._live - len(event_ids))
+            # Each removed event leaves its put record plus a share of a tombstone.
+            self._dead += len(event_ids) + 1
+            if self._dead > max(self.compact_threshold, self._live):
+                await asyncio.to_thread(self._compact)
+
+    async def load(self) -> list[DeadLetterEvent]:
+        """Replay the segment and return live events in enqueue order."""
+        async with self._lock:
+            live = await asyncio.to_thread(self._load)
+            self._live = len(live)
+            return live
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        with self.path.open("a", encoding="utf-8") as fh:
+            for record in records:
+                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            if self.fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+
+    def _read_records(self) -> list[dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        records: list[dict[str, Any]] = []
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if not line.endswith("\n"):
+                    break  # torn write at crash time
+                records.append(json.loads(line))
+        return records
+
+    def _load(self) -> list[DeadLetterEvent]:
+        records = self._read_records()
+        live = list(_replay(records).values())
+        self._dead = len(records) - len(live)
+        return live
+
+    def _compact(self) -> None:
+        live = _replay(self._read_records())
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for event in live.values():
+                record = {"op": "put", "event": event_to_dict(event)}
+                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+        self._live = len(live)
+        self._dead = 0
+
+
+# ---------------------------------------------------------------------------
+# Redis stream backend
+# ---------------------------------------------------------------------------
+
+
+class StreamDeadLetterBackend:
+    """Dead-letter log in a tenant-scoped Redis stream.
+
+    Each mutation is one ``XADD`` with an ``op`` field; ``load`` reads the
+    stream with ``XRANGE`` and replays it.  Appends do not use the
+    ``StreamClient``'s ``maxlen`` trimming, which could drop live events.
+    Instead, when tombstoned records outnumber live ones (and exceed
+    ``compact_threshold``), the live events are appended again and the
+    stream is trimmed to just those copies.  The backend must be the
+    stream's only writer.
+
+    Parameters
+    ----------
+    stream : StreamClient
+        Redis stream client.
+    tenant_id : UUID
+        Tenant scope for the stream key.
+    stream_name : str
+        Logical stream name.
+    compact_threshold : int
+        Minimum dead record count before compaction is considered.
+    """
+
+    def __init__(
+        self,
+        stream: StreamClient,
+        tenant_id: UUID,
+        stream_name: str = "workflow_dead_letter",
+        *,
+        compact_threshold: int = 1024,
+    ) -> None:
+        self._stream = stream
+        self._tenant_id = tenant_id
+        self._stream_name = stream_name
+        self.compact_threshold = compact_threshold
+        self._live = 0
+        self._dead = 0
+        self._lock = asyncio.Lock()
+
+    async def put(self, event: DeadLetterEvent) -> None:
+        """``XADD`` a ``put`` record."""
+        async with self._lock:
+            await self._append(_put_fields(event))
+            self._live += 1
+
+    async def remove(self, event_ids: list[str]) -> None:
+        """``XADD`` a ``del`` tombstone, compacting when tombstones dominate."""
+        if not event_ids:
+            return
+        async with self._lock:
+            await self._append({"op": "del", "ids": json.dumps(event_ids)})
+            self._live = max(0, self._live - len(event_ids))
+            self._dead += len(event_ids) + 1
+            if self._dead > max(self.compact_threshold, self._live):
+                await self._compact()
+
+    async def load(self) -> list[DeadLetterEvent]:
+        """Replay the stream and return live events in enqueue order."""
+        async with self._lock:
+            records = await self._read_records()
+            live = list(_replay(records).values())
+            self._live = len(live)
+            self._dead = len(records) - len(live)
+            return live
+
+    async def _append(
+        self, fields: dict[str, str | bytes], maxlen: int | None = None
+    ) -> None:
+        key = stream_key(self._tenant_id, self._stream_name)
+        await self._stream.client.xadd(key, fields, maxlen=maxlen)
+
+    async def _read_records(self) -> list[dict[str, Any]]:
+        entries = await self._stream.read_range(self._tenant_id, self._stream_name)
+        records: list[dict[str, Any]] = []
+        for _, fields in entries:
+            op = _text(fields["op"])
+            if op == "put":
+                records.append({"op": "put", "event": json.loads(_text(fields["event"]))})
+            elif op == "del":
+                records.append({"op": "del", "ids": json.loads(_text(fields["ids"]))})
+        return records
+
+    async def _compact(self) -> None:
+        live = list(_replay(await self._read_records()).values())
+        if not live:
+            # An empty tombstone marks the stream as compacted.
+            await self._append({"op": "del", "ids": "[]"}, maxlen=1)
+        for i, event in enumerate(live, 1):
+            # Trimming keeps at least maxlen entries, so only the final
+            # append trims, and it keeps every re-appended live event.
+            await self._append(
+                _put_fields(event), maxlen=len(live) if i == len(live) else None
+            )
+        self._live = len(live)
+        self._dead = 0
+
+
+def _put_fields(event: DeadLetterEvent) -> dict[str, str | bytes]:
+    return {"op": "put", "event": json.dumps(event_to_dict(event))}
+
+
+def _text(value: str | bytes) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
@@ -12,8 +12,13 @@ Provides:
 - K2PermissionGate: enforces per-agent tool permission checks per ICD-019/020
 - CelestialComplianceEvaluator: evaluates Celestial L0-L4 predicate chain
 - GoalDispatcher: main orchestrator coordinating compliance → lane routing
+- GoalDispatcher.dispatch_many(): async, bounded-concurrency batch dispatch
 - dispatch_goal(): synchronous entry point for goal dispatch
 
+Compliance results are memoized per canonical CelestialState content
+(timestamp excluded), so retried goals with identical state skip the
+L0-L4 chain; replacing a predicate via set_predicate() clears the cache.
+
 Per ICD-013/014/015 (lane-based routing) and ICD-019/020 (MCP permissions):
 - Dispatch enforces lexicographic Celestial gating (L0 must pass before L1 eval)
 - Any Celestial failure blocks dispatch (raises GoalDispatchError)
@@ -38,8 +43,14 @@ Per ICD compliance:
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import dataclasses
+import hashlib
+import inspect
+import json
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -47,6 +58,8 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import uuid4
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from holly.engine.lanes import LaneManager
     from holly.engine.mcp_registry import MCPRegistry
     from holly.goals.classification import TaskClassification
@@ -253,7 +266,11 @@ class TaskClassifierProtocol(Protocol):
         task_id: str,
         context: dict[str, Any],
     ) -> TaskClassification:
-        """Classify task into T0-T3 based on context."""
+        """Classify task into T0-T3 based on context.
+
+        I/O-backed classifiers may return an awaitable instead; it is
+        awaited by GoalDispatcher.dispatch_many().
+        """
         ...
 
 
@@ -266,6 +283,23 @@ class PredicateChainProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class PermissionIndexProtocol(Protocol):
+    """Protocol for registries with an indexed (tool, agent) permission lookup."""
+
+    def has_permission(self, tool_name: str, agent_id: str) -> bool:
+        """Return True if agent holds a live grant for tool."""
+        ...
+
+    def authorize_many(self, pairs: Iterable[tuple[str, str]]) -> list[bool]:
+        """Check (tool_name, agent_id) pairs; one flag per pair."""
+        ...
+
+    def get_authorized_agents(self, tool_name: str) -> frozenset[str]:
+        """Return agents holding a live grant for tool."""
+        ...
+
+
 # ---------------------------------------------------------------------------
 # K2 Permission Gate
 # ---------------------------------------------------------------------------
@@ -290,7 +324,7 @@ class K2PermissionGate:
     - Post-condition: either permission granted or K2PermissionError raised
     """
 
-    __slots__ = ("_permissions", "_registry")
+    __slots__ = ("_index", "_permissions", "_registry")
 
     def __init__(
         self,
@@ -302,6 +336,11 @@ class K2PermissionGate:
             mcp_registry: MCPRegistry instance for tool permission lookups.
         """
         self._registry = mcp_registry
+        # Indexed lookups when the registry provides them; otherwise fall
+        # back to scanning get_tool_permissions().
+        self._index = (
+            mcp_registry if isinstance(mcp_registry, PermissionIndexProtocol) else None
+        )
         # Cached permission map: {tool_name: frozenset[agent_id]}
         self._permissions: dict[str, frozenset[str]] = {}
 
@@ -325,10 +364,10 @@ class K2PermissionGate:
             # No registry → deny all (fail-safe)
             return False
 
-        # Get tool permissions from registry
         try:
-            granted = self._registry.get_tool_permissions(tool_name)
-            return agent_id in granted
+            if self._index is not None:
+                return self._index.has_permission(tool_name, agent_id)
+            return agent_id in self._granted_agents(self._registry, tool_name)
         except Exception:
             # Any registry error → deny (fail-safe)
             return False
@@ -352,12 +391,23 @@ class K2PermissionGate:
         """
         if not self.check_permission(agent_id, tool_name):
             # Get granted permissions for error context
-            granted = frozenset()
-            if self._registry:
+            granted: frozenset[str] = frozenset()
+            if self._index is not None:
+                with contextlib.suppress(Exception):
+                    granted = self._index.get_authorized_agents(tool_name)
+            elif self._registry:
                 with contextlib.suppress(Exception):
-                    granted = self._registry.get_tool_permissions(tool_name)
+                    granted = self._granted_agents(self._registry, tool_name)
             raise K2PermissionError(agent_id, tool_name, granted)
 
+    @staticmethod
+    def _granted_agents(registry: MCPRegistry, tool_name: str) -> frozenset[str]:
+        """Agent IDs holding a valid grant for ``tool_name`` (registry scan)."""
+        return frozenset(
+            permission.agent_id
+            for permission in registry.get_tool_permissions(tool_name)
+        )
+
     def filter_tools(
         self,
         agent_id: str,
@@ -372,6 +422,16 @@ class K2PermissionGate:
         Returns:
             Subset of requested_tools authorized for agent.
         """
+        if self._index is not None:
+            try:
+                allowed = self._index.authorize_many(
+                    (tool, agent_id) for tool in requested_tools
+                )
+            except Exception:
+                return []  # fail-safe deny
+            return [
+                tool for tool, ok in zip(requested_tools, allowed, strict=True) if ok
+            ]
         return [
             tool for tool in requested_tools
             if self.check_permission(agent_id, tool)
@@ -398,21 +458,34 @@ class CelestialComplianceEvaluator:
 
     Lexicographic ordering ensures fail-safe: a single failed Celestial
     level prevents any higher-level evaluation.
+
+    Results are memoized in an LRU keyed by a canonical hash of the state's
+    content (level, context, actor, action, payload; not the timestamp).
+    States holding values that cannot be canonicalized are never cached.
+    set_predicate() clears the cache.
     """
 
-    __slots__ = ("_predicates",)
+    __slots__ = ("_cache", "_cache_size", "_hits", "_misses", "_predicates")
 
     def __init__(
         self,
         predicates: dict[int, PredicateChainProtocol] | None = None,
+        cache_size: int = 1024,
     ) -> None:
         """Initialize evaluator with L0-L4 predicates.
 
         Args:
             predicates: Dict mapping level (0-4) to predicate callable.
                 If None, predicates must be injected before evaluate() calls.
+            cache_size: Compliance results memoized (0 disables caching).
         """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
         self._predicates = predicates or {}
+        self._cache: OrderedDict[str, CelestialComplianceResult] = OrderedDict()
+        self._cache_size = cache_size
+        self._hits = 0
+        self._misses = 0
 
     def set_predicate(self, level: int, predicate: PredicateChainProtocol) -> None:
         """Register a Celestial predicate for a level.
@@ -424,6 +497,15 @@ class CelestialComplianceEvaluator:
         if not 0 <= level <= 4:
             raise ValueError(f"Invalid Celestial level: {level}")
         self._predicates[level] = predicate
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized compliance results."""
+        self._cache.clear()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return compliance cache entries, hits and misses."""
+        return {"entries": len(self._cache), "hits": self._hits, "misses": self._misses}
 
     def evaluate(
         self,
@@ -444,6 +526,25 @@ class CelestialComplianceEvaluator:
             CelestialComplianceError: If evaluation cannot proceed
                 (e.g., missing predicates).
         """
+        key = _state_key(celestial_state) if self._cache_size else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return _copy_result(cached)
+            self._misses += 1
+
+        result = self._evaluate_chain(celestial_state)
+
+        if key is not None:
+            self._cache[key] = _copy_result(result)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _evaluate_chain(self, celestial_state: Any) -> CelestialComplianceResult:
+        """Run the L0-L4 chain without the cache."""
         result = CelestialComplianceResult(
             status=CelestialComplianceStatus.PASSED,
             explanation="",
@@ -477,6 +578,57 @@ class CelestialComplianceEvaluator:
         return result
 
 
+def _canonical(value: Any) -> Any:
+    """Convert a state value to a JSON-encodable form preserving its type.
+
+    Raises:
+        TypeError: If the value has no stable canonical form.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_canonical(v) for v in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_canonical(v) for v in value]}
+    if isinstance(value, (set, frozenset)):
+        items = sorted(json.dumps(_canonical(v), sort_keys=True) for v in value)
+        return {"__set__": items}
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError("non-string dict keys")
+        return {"__dict__": {k: _canonical(v) for k, v in value.items()}}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"cannot canonicalize {type(value).__name__}")
+
+
+def _state_key(state: Any) -> str | None:
+    """Return a content hash of a CelestialState, or None if uncacheable."""
+    if not dataclasses.is_dataclass(state) or isinstance(state, type):
+        return None
+    try:
+        content = {
+            f.name: _canonical(getattr(state, f.name))
+            for f in dataclasses.fields(state)
+            if f.name != "timestamp"
+        }
+    except TypeError:
+        return None
+    encoded = json.dumps(
+        [type(state).__qualname__, content], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _copy_result(result: CelestialComplianceResult) -> CelestialComplianceResult:
+    """Copy a compliance result so callers cannot mutate the cached one."""
+    return dataclasses.replace(
+        result,
+        level_results=dict(result.level_results),
+        violations=list(result.violations),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Goal Dispatcher
 # ---------------------------------------------------------------------------
@@ -554,6 +706,78 @@ class GoalDispatcher:
             K2PermissionError: If tool authorization check fails.
             GoalDispatchError: Other dispatch errors.
         """
+        compliance_result = self._check_compliance(context)
+
+        # Step 2: Classify task level (T0-T3)
+        task_level = "T0"  # Default to safety-critical
+        if self._classifier:
+            try:
+                classification = self._classifier.classify(
+                    context.task_id, self._classification_input(context)
+                )
+                if inspect.isawaitable(classification):
+                    if inspect.iscoroutine(classification):
+                        classification.close()
+                    raise TypeError(
+                        "asynchronous classifier requires dispatch_many()"
+                    )
+                task_level = classification.level.name  # "T0", "T1", etc.
+            except Exception as e:
+                log.warning("Task classification failed, defaulting to T0: %s", e)
+
+        return self._route_and_authorize(context, compliance_result, task_level)
+
+    async def dispatch_many(
+        self,
+        contexts: Iterable[GoalDispatchContext],
+        max_concurrency: int = 64,
+    ) -> list[GoalDispatchDecision | GoalDispatchError]:
+        """Dispatch a batch of goals, overlapping their pipeline stages.
+
+        Each goal runs the same compliance → classification → routing → K2
+        sequence as dispatch(), with up to `max_concurrency` goals in
+        flight, so classifiers that return awaitables (I/O-backed) overlap.
+        Identical Celestial states within and across batches hit the
+        evaluator's compliance cache.
+
+        Args:
+            contexts: Goal dispatch contexts.
+            max_concurrency: Goals in flight at once (1+).
+
+        Returns:
+            One entry per context, in input order: the decision, or the
+            GoalDispatchError (e.g. CelestialComplianceError) that blocked it.
+
+        Raises:
+            ValueError: If max_concurrency < 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def dispatch_one(
+            context: GoalDispatchContext,
+        ) -> GoalDispatchDecision | GoalDispatchError:
+            async with semaphore:
+                try:
+                    compliance_result = self._check_compliance(context)
+                    task_level = await self._classify_async(context)
+                    return self._route_and_authorize(
+                        context, compliance_result, task_level
+                    )
+                except GoalDispatchError as e:
+                    return e
+
+        return list(await asyncio.gather(*(dispatch_one(c) for c in contexts)))
+
+    def _check_compliance(
+        self, context: GoalDispatchContext
+    ) -> CelestialComplianceResult:
+        """Evaluate Celestial L0-L4 for a goal (pipeline step 1).
+
+        Raises:
+            CelestialComplianceError: If any level fails or cannot be evaluated.
+        """
         log.info(
             "Dispatching goal %s for agent %s (trace: %s)",
             context.goal_id,
@@ -561,7 +785,6 @@ class GoalDispatcher:
             context.trace_id,
         )
 
-        # Step 1: Evaluate Celestial L0-L4 compliance chain
         try:
             compliance_result = self._celestial_evaluator.evaluate(
                 context.celestial_state
@@ -580,29 +803,49 @@ class GoalDispatcher:
             raise error
 
         log.debug("Goal passed Celestial compliance (all L0-L4 checks)")
+        return compliance_result
+
+    @staticmethod
+    def _classification_input(context: GoalDispatchContext) -> dict[str, Any]:
+        """Build the classifier input from goal metadata."""
+        return {
+            "codimension": context.metadata.get("codimension", 1),
+            "agency_rank": context.metadata.get("agency_rank", 1),
+            "num_agents": context.metadata.get("num_agents", 1),
+            "eigenspectrum_divergence": context.metadata.get(
+                "eigenspectrum_divergence", 0.0
+            ),
+            "is_safety_critical": context.metadata.get(
+                "is_safety_critical", False
+            ),
+        }
 
-        # Step 2: Classify task level (T0-T3)
-        task_level = "T0"  # Default to safety-critical
-        if self._classifier:
-            try:
-                classification = self._classifier.classify(
-                    context.task_id,
-                    {
-                        "codimension": context.metadata.get("codimension", 1),
-                        "agency_rank": context.metadata.get("agency_rank", 1),
-                        "num_agents": context.metadata.get("num_agents", 1),
-                        "eigenspectrum_divergence": context.metadata.get(
-                            "eigenspectrum_divergence", 0.0
-                        ),
-                        "is_safety_critical": context.metadata.get(
-                            "is_safety_critical", False
-                        ),
-                    },
-                )
-                task_level = classification.level.name  # "T0", "T1", etc.
-            except Exception as e:
-                log.warning("Task classification failed, defaulting to T0: %s", e)
+    async def _classify_async(self, context: GoalDispatchContext) -> str:
+        """Classify a goal, awaiting asynchronous classifiers (step 2)."""
+        if not self._classifier:
+            return "T0"
+        try:
+            classification = self._classifier.classify(
+                context.task_id, self._classification_input(context)
+            )
+            if inspect.isawaitable(classification):
+                classification = await classification
+            return str(classification.level.name)
+        except Exception as e:
+            log.warning("Task classification failed, defaulting to T0: %s", e)
+            return "T0"
+
+    def _route_and_authorize(
+        self,
+        context: GoalDispatchContext,
+        compliance_result: CelestialComplianceResult,
+        task_level: str,
+    ) -> GoalDispatchDecision:
+        """Route to a lane, apply the K2 gate and build the decision (steps 3-5).
 
+        Raises:
+            K2PermissionError: If the tool authorization check fails.
+        """
         # Step 3: Determine lane routing based on task level
         lane_name = self._route_to_lane(task_level)
 
@@ -0,0 +1,303 @@
+"""Sliding-window idempotency cache for lanes (ICD-013, ICD-015).
+
+Entries are grouped into time buckets, each ``window / buckets`` wide, so
+expiring a whole bucket is a single deque pop rather than a scan.  A key
+is remembered for at least ``window`` and at most ``window`` plus one
+bucket.  Each tenant is capped at ``max_entries``; beyond that the oldest
+entries are evicted first.
+
+Tenants switched to approximate mode keep no per-key entries at all:
+membership is tracked by a pair of Bloom filters rotated once per
+window, giving fixed memory at the cost of a small false-positive rate
+(a fresh key occasionally reported as a duplicate).  Because no value is
+stored, a hit is reported as ``PROBABLE_DUPLICATE`` rather than a value.
+
+This module provides:
+- IdempotencyStats: dedupe hit and eviction counters
+- PROBABLE_DUPLICATE: lookup result for an approximate-mode hit
+- BloomFilter: fixed-size Bloom filter over string keys
+- IdempotencyCache: per-tenant time-bucketed dedupe cache
+"""
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import timedelta
+
+    from holly.engine.lanes import LanePolicy
+
+__all__ = [
+    "PROBABLE_DUPLICATE",
+    "BloomFilter",
+    "IdempotencyCache",
+    "IdempotencyStats",
+    "ProbableDuplicate",
+]
+
+
+class ProbableDuplicate(enum.Enum):
+    """Marker type for a Bloom-filter hit, whose original value is unknown."""
+
+    PROBABLE_DUPLICATE = "probable_duplicate"
+
+
+PROBABLE_DUPLICATE = ProbableDuplicate.PROBABLE_DUPLICATE
+
+
+@dataclass(slots=True)
+class IdempotencyStats:
+    """Counters for an ``IdempotencyCache``.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups that found a duplicate.
+    misses : int
+        Lookups for unseen keys.
+    expired : int
+        Entries dropped because their bucket left the window.
+    evicted : int
+        Entries dropped to respect the per-tenant cap.
+    rotations : int
+        Bloom filter rotations (approximate mode).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evicted: int = 0
+    rotations: int = 0
+
+
+class BloomFilter:
+    """Bloom filter sized for ``capacity`` keys at ``error_rate``.
+
+    Parameters
+    ----------
+    capacity : int
+        Expected number of distinct keys.
+    error_rate : float
+        Target false-positive probability at ``capacity``.
+    """
+
+    __slots__ = ("bits", "count", "hashes", "size")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0 or not 0.0 < error_rate < 1.0:
+            raise ValueError("capacity must be positive and 0 < error_rate < 1")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        """Insert ``key``."""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class _TenantEntries[V]:
+    """Exact entries for one tenant, oldest bucket first."""
+
+    __slots__ = ("buckets", "size")
+
+    def __init__(self) -> None:
+        self.buckets: deque[tuple[int, dict[str, V]]] = deque()
+        self.size = 0
+
+
+class _BloomPair:
+    """Current and previous Bloom filters for one approximate tenant."""
+
+    __slots__ = ("current", "epoch", "previous")
+
+    def __init__(self, current: BloomFilter, epoch: int) -> None:
+        self.current = current
+        self.previous: BloomFilter | None = None
+        self.epoch = epoch
+
+
+class IdempotencyCache[V]:
+    """Per-tenant idempotency cache honouring ``LanePolicy.idempotency_window``.
+
+    Parameters
+    ----------
+    window : timedelta
+        How long a key must be remembered.
+    buckets : int
+        Number of time buckets per window (expiry granularity).
+    max_entries : int
+        Maximum exact entries per tenant.
+    approximate_tenants : Iterable[str]
+        Tenants tracked with rotating Bloom filters instead of entries.
+    bloom_capacity : int
+        Keys per window each approximate tenant's filter is sized for.
+    bloom_error_rate : float
+        Target false-positive rate of each filter at ``bloom_capacity``.
+    clock : Callable[[], float]
+        Monotonic time source in seconds.
+    """
+
+    def __init__(
+        self,
+        window: timedelta,
+        *,
+        buckets: int = 12,
+        max_entries: int = 100_000,
+        approximate_tenants: Iterable[str] = (),
+        bloom_capacity: int = 1_000_000,
+        bloom_error_rate: float = 0.001,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        seconds = window.total_seconds()
+        if seconds <= 0 or buckets <= 0 or max_entries <= 0:
+            raise ValueError("window, buckets and max_entries must be positive")
+        self.window = seconds
+        self.buckets = buckets
+        self.max_entries = max_entries
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.stats = IdempotencyStats()
+        self._width = seconds / buckets
+        self._clock = clock
+        self._entries: dict[str, _TenantEntries[V]] = {}
+        self._blooms: dict[str, _BloomPair] = {}
+        for tenant_id in approximate_tenants:
+            self.set_approximate(tenant_id, True)
+
+    @classmethod
+    def from_policy(cls, policy: LanePolicy) -> IdempotencyCache[V]:
+        """Create a cache using the policy's window and per-tenant cap."""
+        return cls(policy.idempotency_window, max_entries=policy.idempotency_max_entries)
+
+    def set_approximate(self, tenant_id: str, enabled: bool) -> None:
+        """Switch a tenant between exact and approximate tracking.
+
+        Switching drops the tenant's existing dedupe state.
+        """
+        if enabled:
+            self._entries.pop(tenant_id, None)
+            if tenant_id not in self._blooms:
+                self._blooms[tenant_id] = _BloomPair(self._new_filter(), self._epoch())
+        else:
+            self._blooms.pop(tenant_id, None)
+
+    def is_approximate(self, tenant_id: str) -> bool:
+        """Return whether ``tenant_id`` uses Bloom-filter tracking."""
+        return tenant_id in self._blooms
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+
+    def _epoch(self) -> int:
+        return int(self._clock() // self.window)
+
+    def _expire(self, entries: _TenantEntries[V], current: int) -> None:
+        buckets = entries.buckets
+        while buckets and buckets[0][0] < current - self.buckets:
+            _, dropped = buckets.popleft()
+            entries.size -= len(dropped)
+            self.stats.expired += len(dropped)
+
+    def _rotate(self, pair: _BloomPair) -> None:
+        epoch = self._epoch()
+        if epoch == pair.epoch:
+            return
+        pair.previous = pair.current if epoch == pair.epoch + 1 else None
+        pair.current = self._new_filter()
+        pair.epoch = epoch
+        self.stats.rotations += 1
+
+    def get(self, tenant_id: str, key: str) -> V | ProbableDuplicate | None:
+        """Look up ``key`` for ``tenant_id``.
+
+        Parameters
+        ----------
+        tenant_id : str
+            Tenant scope.
+        key : str
+            Idempotency key.
+
+        Returns
+        -------
+        V | ProbableDuplicate | None
+            The value recorded with ``put``; ``PROBABLE_DUPLICATE`` for a
+            hit in approximate mode, where the value is not stored (and
+            the hit may be a false positive); or None if ``key`` was not
+            seen within the window.
+        """
+        pair = self._blooms.get(tenant_id)
+        if pair is not None:
+            self._rotate(pair)
+            if key in pair.current or (pair.previous is not None and key in pair.previous):
+                self.stats.hits += 1
+                return PROBABLE_DUPLICATE
+            self.stats.misses += 1
+            return None
+
+        entries = self._entries.get(tenant_id)
+        if entries is not None:
+            self._expire(entries, int(self._clock() // self._width))
+            for _, bucket in reversed(entries.buckets):
+                if key in bucket:
+                    self.stats.hits += 1
+                    return bucket[key]
+        self.stats.misses += 1
+        return None
+
+    def put(self, tenant_id: str, key: str, value: V) -> None:
+        """Record ``key`` -> ``value`` for ``tenant_id``."""
+        pair = self._blooms.get(tenant_id)
+        if pair is not None:
+            self._rotate(pair)
+            pair.current.add(key)
+            return
+
+        entries = self._entries.get(tenant_id)
+        if entries is None:
+            entries = self._entries[tenant_id] = _TenantEntries()
+        current = int(self._clock() // self._width)
+        self._expire(entries, current)
+        buckets = entries.buckets
+        if not buckets or buckets[-1][0] != current:
+            buckets.append((current, {}))
+        bucket = buckets[-1][1]
+        if key not in bucket:
+            entries.size += 1
+        bucket[key] = value
+        while entries.size > self.max_entries:
+            oldest = buckets[0][1]
+            del oldest[next(iter(oldest))]
+            entries.size -= 1
+            self.stats.evicted += 1
+            if not oldest:
+                buckets.popleft()
+
+    def entry_count(self, tenant_id: str) -> int:
+        """Return the number of exact entries held for ``tenant_id``."""
+        entries = self._entries.get(tenant_id)
+        if entries is None:
+            return 0
+        self._expire(entries, int(self._clock() // self._width))
+        return entries.size
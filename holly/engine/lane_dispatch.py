@@ -0,0 +1,502 @@
+"""Weighted-fair cross-tenant dispatch on top of ``LaneManager``.
+
+Implements the dispatch loop for lane-based routing per ICD-013/015.
+``LaneManager`` keeps one lane per ``(tenant_id, LaneType)``; this module
+drains those lanes with a worker pool per lane type, sharing workers
+between tenants by deficit round robin (DRR) so a noisy tenant cannot
+monopolise them.
+
+This module provides:
+- TenantDispatchMetrics: per-tenant queue-wait / service-time metrics
+- LaneDispatcher: worker pools, DRR tenant scheduling, admission control
+
+Scheduling (per lane type):
+- Tenants with pending work form a ring.  When a tenant reaches the head
+  of the ring it is granted ``quantum * weight`` credit; each dispatched
+  task costs one credit.  Once the tenant's credit drops below one task
+  it moves to the tail, keeping any fractional credit while backlogged.
+- Within a tenant, tasks leave its lane in priority order.
+
+Admission control (per ``LanePolicy``):
+- A submission waits while the tenant's lane is at or above
+  ``admission_threshold_percent`` of ``max_queue_depth`` (per
+  ``Lane.get_queue_depth_percentage``), for at most
+  ``backpressure_timeout`` seconds, then fails with ``QueueFullError``.
+  Waiters are woken only by dispatches from their own tenant's lane.
+
+Tasks submitted through the dispatcher but drained from their lane by
+other means are forgotten once the tenant's lane is found empty or gone,
+so they neither leak bookkeeping nor block ``join``.
+
+Only the Main and Subagent lanes are dispatched; due Cron lane tasks are
+expected to be resubmitted to the Main lane.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from holly.engine.lanes import (
+    LaneType,
+    MainLane,
+    QueueFullError,
+    SubagentLane,
+    SubagentTask,
+    Task,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+    from uuid import UUID
+
+    from holly.engine.lanes import (
+        LaneManager,
+        SubagentSpawnRequest,
+        TaskEnqueueRequest,
+    )
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "LaneDispatcher",
+    "TenantDispatchMetrics",
+]
+
+_DISPATCHED_LANES = (LaneType.MAIN, LaneType.SUBAGENT)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples (0.0 when empty)."""
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, int(q * len(samples) + 0.5) - 1))
+    return samples[index]
+
+
+@dataclass(slots=True)
+class TenantDispatchMetrics:
+    """Dispatch metrics for one tenant on one lane type.
+
+    Wait and service times are kept in bounded reservoirs of the most
+    recent ``sample_size`` tasks.
+
+    Attributes
+    ----------
+    submitted : int
+        Tasks admitted through the dispatcher.
+    rejected : int
+        Submissions refused by admission control.
+    dispatched : int
+        Tasks handed to a worker.
+    completed : int
+        Tasks whose handler returned normally.
+    failed : int
+        Tasks whose handler raised.
+    wait_seconds : deque[float]
+        Queue wait (submission to dispatch) of recent tasks.
+    service_seconds : deque[float]
+        Handler run time of recent tasks.
+    """
+
+    sample_size: int = 1024
+    submitted: int = 0
+    rejected: int = 0
+    dispatched: int = 0
+    completed: int = 0
+    failed: int = 0
+    wait_seconds: deque[float] = field(init=False)
+    service_seconds: deque[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create bounded reservoirs."""
+        self.wait_seconds = deque(maxlen=self.sample_size)
+        self.service_seconds = deque(maxlen=self.sample_size)
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Return counters plus p50/p99 wait and service times in seconds."""
+        waits = sorted(self.wait_seconds)
+        services = sorted(self.service_seconds)
+        return {
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "dispatched": self.dispatched,
+            "completed": self.completed,
+            "failed": self.failed,
+            "wait_p50": _percentile(waits, 0.50),
+            "wait_p99": _percentile(waits, 0.99),
+            "service_p50": _percentile(services, 0.50),
+            "service_p99": _percentile(services, 0.99),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Dispatcher
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class _TenantRing:
+    """DRR state for one lane type."""
+
+    active: deque[str] = field(default_factory=deque)
+    members: set[str] = field(default_factory=set)
+    deficit: dict[str, float] = field(default_factory=dict)
+    # Whether the head tenant still has to be granted its quantum.
+    fresh: bool = True
+    work_available: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class LaneDispatcher:
+    """Dispatches lane tasks to per-lane-type worker pools, fairly across tenants.
+
+    Parameters
+    ----------
+    manager : LaneManager
+        Lanes to drain; its policy supplies admission thresholds.
+    handlers : Mapping[LaneType, Callable[[object], Awaitable[object]]]
+        Coroutine run by a worker for each task of a lane type.  Only lane
+        types with a handler get a worker pool.
+    workers : Mapping[LaneType, int] | None
+        Pool size per lane type.  Defaults to 4 for Main and the policy's
+        ``max_concurrency`` for Subagent.
+    weights : Mapping[str, float] | None
+        Tenant weights (default 1.0); a tenant with weight 2 receives
+        twice the service of a weight-1 tenant when both are backlogged.
+    quantum : float
+        Credit granted per round to a weight-1 tenant, in tasks.
+    sample_size : int
+        Size of each tenant's wait/service-time reservoir.
+    """
+
+    __slots__ = (
+        "_enqueued_at",
+        "_idle",
+        "_metrics",
+        "_outstanding",
+        "_rings",
+        "_space_available",
+        "_worker_tasks",
+        "handlers",
+        "manager",
+        "quantum",
+        "sample_size",
+        "weights",
+        "workers",
+    )
+
+    def __init__(
+        self,
+        manager: LaneManager,
+        handlers: Mapping[LaneType, Callable[[object], Awaitable[object]]],
+        *,
+        workers: Mapping[LaneType, int] | None = None,
+        weights: Mapping[str, float] | None = None,
+        quantum: float = 1.0,
+        sample_size: int = 1024,
+    ) -> None:
+        """Initialize lane dispatcher.
+
+        Raises
+        ------
+        ValueError
+            If a handler targets an undispatched lane type, or a pool
+            size, weight or the quantum is not positive.
+        """
+        for lane_type in handlers:
+            if lane_type not in _DISPATCHED_LANES:
+                raise ValueError(f"lane type {lane_type.value!r} is not dispatched")
+        if quantum <= 0:
+            raise ValueError("quantum must be positive")
+        self.manager = manager
+        self.handlers = dict(handlers)
+        defaults = {
+            LaneType.MAIN: 4,
+            LaneType.SUBAGENT: manager.policy.max_concurrency,
+        }
+        self.workers = {
+            lane_type: (workers or {}).get(lane_type, defaults[lane_type])
+            for lane_type in self.handlers
+        }
+        if any(n <= 0 for n in self.workers.values()):
+            raise ValueError("worker pool sizes must be positive")
+        self.weights: dict[str, float] = {}
+        for tenant_id, weight in (weights or {}).items():
+            self.set_weight(tenant_id, weight)
+        self.quantum = quantum
+        self.sample_size = sample_size
+        self._rings = {lane_type: _TenantRing() for lane_type in _DISPATCHED_LANES}
+        self._metrics: dict[tuple[str, LaneType], TenantDispatchMetrics] = {}
+        # Submission times of admitted, not yet dispatched tasks.
+        self._enqueued_at: dict[tuple[str, LaneType], dict[UUID, float]] = {}
+        # One event per blocked (tenant, lane type); set and dropped on dispatch.
+        self._space_available: dict[tuple[str, LaneType], asyncio.Event] = {}
+        self._outstanding = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker_tasks: list[asyncio.Task[None]] = []
+
+    # -- configuration ----------------------------------------------------
+
+    def set_weight(self, tenant_id: str, weight: float) -> None:
+        """Set a tenant's scheduling weight.
+
+        Raises
+        ------
+        ValueError
+            If ``weight`` is not positive.
+        """
+        if weight <= 0:
+            raise ValueError("tenant weight must be positive")
+        self.weights[tenant_id] = weight
+
+    def get_tenant_metrics(
+        self, tenant_id: str, lane_type: LaneType = LaneType.MAIN
+    ) -> dict[str, float | int]:
+        """Return a metrics snapshot for one tenant and lane type."""
+        return self._tenant_metrics(tenant_id, lane_type).snapshot()
+
+    def get_metrics(
+        self, lane_type: LaneType = LaneType.MAIN
+    ) -> dict[str, dict[str, float | int]]:
+        """Return metrics snapshots for every tenant seen on a lane type."""
+        return {
+            tenant_id: metrics.snapshot()
+            for (tenant_id, lt), metrics in self._metrics.items()
+            if lt == lane_type
+        }
+
+    def _tenant_metrics(
+        self, tenant_id: str, lane_type: LaneType
+    ) -> TenantDispatchMetrics:
+        key = (tenant_id, lane_type)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = TenantDispatchMetrics(sample_size=self.sample_size)
+            self._metrics[key] = metrics
+        return metrics
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the worker pools (idempotent)."""
+        if self._worker_tasks:
+            return
+        for lane_type, count in self.workers.items():
+            for _ in range(count):
+                self._worker_tasks.append(
+                    asyncio.create_task(self._worker(lane_type))
+                )
+
+    async def stop(self) -> None:
+        """Cancel the worker pools; queued tasks stay in their lanes."""
+        tasks, self._worker_tasks = self._worker_tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def join(self) -> None:
+        """Wait until every task submitted through the dispatcher has run."""
+        await self._idle.wait()
+
+    # -- submission -------------------------------------------------------
+
+    async def enqueue_main_task(self, request: TaskEnqueueRequest) -> UUID:
+        """Admit and enqueue a Main lane task.
+
+        Raises
+        ------
+        QueueFullError
+            If the lane stays above the admission threshold for
+            ``backpressure_timeout`` seconds.
+        """
+        tenant_id = request.task.tenant_id
+        await self._admit(tenant_id, LaneType.MAIN)
+        task_id = await self.manager.enqueue_main_task(request)
+        if task_id == request.task.task_id:
+            self._accepted(tenant_id, LaneType.MAIN, task_id)
+        return task_id
+
+    async def spawn_subagent(self, request: SubagentSpawnRequest) -> UUID:
+        """Admit and enqueue a Subagent lane task.
+
+        Raises
+        ------
+        QueueFullError
+            If the lane stays above the admission threshold for
+            ``backpressure_timeout`` seconds.
+        """
+        tenant_id = request.subagent_task.tenant_id
+        await self._admit(tenant_id, LaneType.SUBAGENT)
+        execution_id = await self.manager.spawn_subagent(request)
+        if execution_id == request.subagent_task.subagent_execution_id:
+            self._accepted(tenant_id, LaneType.SUBAGENT, execution_id)
+        return execution_id
+
+    def notify(self, tenant_id: str, lane_type: LaneType) -> None:
+        """Make a tenant schedulable after enqueuing to its lane directly."""
+        ring = self._rings[lane_type]
+        if tenant_id not in ring.members:
+            ring.members.add(tenant_id)
+            ring.active.append(tenant_id)
+            ring.deficit.setdefault(tenant_id, 0.0)
+        ring.work_available.set()
+
+    async def _admit(self, tenant_id: str, lane_type: LaneType) -> None:
+        """Wait for the tenant's lane to drop below the admission threshold."""
+        policy = self.manager.policy
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + policy.backpressure_timeout
+        while True:
+            lane = self.manager.get_lane(tenant_id, lane_type)
+            if (
+                lane is None
+                or lane.get_queue_depth_percentage()
+                < policy.admission_threshold_percent
+            ):
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._tenant_metrics(tenant_id, lane_type).rejected += 1
+                raise QueueFullError(
+                    f"{lane_type.value} lane for tenant {tenant_id} above "
+                    f"admission threshold "
+                    f"({lane.get_queue_depth_percentage():.0f}% >= "
+                    f"{policy.admission_threshold_percent:.0f}%)"
+                )
+            space = self._space_available.setdefault(
+                (tenant_id, lane_type), asyncio.Event()
+            )
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(space.wait(), remaining)
+
+    def _accepted(self, tenant_id: str, lane_type: LaneType, key: UUID) -> None:
+        self._tenant_metrics(tenant_id, lane_type).submitted += 1
+        self._enqueued_at.setdefault((tenant_id, lane_type), {})[key] = (
+            time.perf_counter()
+        )
+        self._outstanding += 1
+        self._idle.clear()
+        self.notify(tenant_id, lane_type)
+
+    def _take_enqueued_at(
+        self, tenant_id: str, lane_type: LaneType, key: UUID | None
+    ) -> float | None:
+        """Pop a dispatched task's submission time (``None`` if not admitted here)."""
+        pending = self._enqueued_at.get((tenant_id, lane_type))
+        if pending is None or key is None:
+            return None
+        enqueued_at = pending.pop(key, None)
+        if not pending:
+            del self._enqueued_at[(tenant_id, lane_type)]
+        return enqueued_at
+
+    def _forget_pending(self, tenant_id: str, lane_type: LaneType) -> None:
+        """Drop submissions that left an empty or removed lane undispatched."""
+        pending = self._enqueued_at.pop((tenant_id, lane_type), None)
+        if pending:
+            self._finished(len(pending))
+
+    def _finished(self, count: int) -> None:
+        self._outstanding -= count
+        if not self._outstanding:
+            self._idle.set()
+
+    # -- scheduling -------------------------------------------------------
+
+    def _pick(self, lane_type: LaneType) -> tuple[str, object] | None:
+        """Take the next task by deficit round robin, or ``None`` if idle."""
+        ring = self._rings[lane_type]
+        while ring.active:
+            tenant_id = ring.active[0]
+            lane = self.manager.get_lane(tenant_id, lane_type)
+            if not isinstance(lane, MainLane | SubagentLane) or not lane.get_queue_size():
+                ring.active.popleft()
+                ring.members.discard(tenant_id)
+                ring.deficit.pop(tenant_id, None)
+                ring.fresh = True
+                self._forget_pending(tenant_id, lane_type)
+                continue
+            if ring.fresh:
+                ring.deficit[tenant_id] += self.quantum * self.weights.get(
+                    tenant_id, 1.0
+                )
+                ring.fresh = False
+            if ring.deficit[tenant_id] >= 1.0:
+                ring.deficit[tenant_id] -= 1.0
+                return tenant_id, lane.priority_queue.get_nowait()
+            ring.active.rotate(-1)
+            ring.fresh = True
+        return None
+
+    async def _worker(self, lane_type: LaneType) -> None:
+        handler = self.handlers[lane_type]
+        ring = self._rings[lane_type]
+        while True:
+            picked = self._pick(lane_type)
+            if picked is None:
+                ring.work_available.clear()
+                await ring.work_available.wait()
+                continue
+            tenant_id, item = picked
+            space = self._space_available.pop((tenant_id, lane_type), None)
+            if space is not None:
+                space.set()
+            await self._run(lane_type, tenant_id, item, handler)
+
+    async def _run(
+        self,
+        lane_type: LaneType,
+        tenant_id: str,
+        item: object,
+        handler: Callable[[object], Awaitable[object]],
+    ) -> None:
+        metrics = self._tenant_metrics(tenant_id, lane_type)
+        metrics.dispatched += 1
+        key = (
+            item.subagent_execution_id
+            if isinstance(item, SubagentTask)
+            else item.task_id
+            if isinstance(item, Task)
+            else None
+        )
+        # Claim before the first await, so a concurrent empty-lane check
+        # cannot forget this task while it is being started.
+        enqueued_at = self._take_enqueued_at(tenant_id, lane_type, key)
+        subagent_lane = (
+            self.manager.get_lane(tenant_id, lane_type)
+            if lane_type == LaneType.SUBAGENT and key is not None
+            else None
+        )
+        if isinstance(subagent_lane, SubagentLane) and key is not None:
+            await subagent_lane.mark_started(key)
+        started = time.perf_counter()
+        if enqueued_at is not None:
+            metrics.wait_seconds.append(started - enqueued_at)
+        try:
+            await handler(item)
+        except Exception:
+            metrics.failed += 1
+            log.exception(
+                "%s task for tenant %s failed", lane_type.value, tenant_id
+            )
+        else:
+            metrics.completed += 1
+        finally:
+            metrics.service_seconds.append(time.perf_counter() - started)
+            if isinstance(subagent_lane, SubagentLane) and key is not None:
+                await subagent_lane.mark_complete(key)
+            if enqueued_at is not None:
+                self._finished(1)
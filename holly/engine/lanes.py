@@ -8,6 +8,7 @@ This module provides:
 - MainLane: user-initiated task execution lane
 - CronLane: time-triggered scheduled task lane
 - SubagentLane: team-parallel agent execution lane
+- PriorityLaneQueue: heap-ordered priority queue shared by Main/Subagent lanes
 - LanePolicy: per-tenant queue depth and backpressure enforcement
 - LaneManager: unified lane dispatcher and policy enforcer
 """
@@ -15,15 +16,23 @@ This module provides:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
+import itertools
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol
 from uuid import UUID, uuid4
 
+from holly.engine.cron import CronExpression
+from holly.engine.idempotency import PROBABLE_DUPLICATE, IdempotencyCache
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +41,7 @@ __all__ = [
     "MainLane",
     "CronLane",
     "SubagentLane",
+    "PriorityLaneQueue",
     "LanePolicy",
     "LaneManager",
     "LaneError",
@@ -40,8 +50,14 @@ __all__ = [
     "TaskEnqueueRequest",
     "ScheduledTaskRequest",
     "SubagentSpawnRequest",
+    "PROBABLE_DUPLICATE_ID",
 ]
 
+# Returned by enqueue/spawn when an approximate-mode idempotency cache
+# reports a probable duplicate: the task was not enqueued and its original
+# id is unknown.  It never equals a caller's own id.
+PROBABLE_DUPLICATE_ID = UUID(int=0)
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -275,10 +291,14 @@ class SubagentSpawnRequest:
         The subagent task.
     priority : int
         Priority level (0-10).
+    idempotency_key : str
+        Optional key deduplicating repeated spawns within
+        ``LanePolicy.idempotency_window`` (empty disables dedupe).
     """
 
     subagent_task: SubagentTask
     priority: int = 5
+    idempotency_key: str = ""
 
 
 @dataclass(slots=True)
@@ -295,6 +315,15 @@ class LanePolicy:
         Timeout for backpressure in seconds.
     idempotency_window : timedelta
         Time window for idempotency deduplication.
+    idempotency_max_entries : int
+        Maximum remembered idempotency keys per tenant.
+    priority_aging_seconds : float | None
+        Seconds a queued task must wait to rank one priority level higher
+        (``None`` disables aging).
+    admission_threshold_percent : float
+        Queue depth (percent of ``max_queue_depth``) at or above which
+        ``LaneDispatcher`` holds new submissions back, for up to
+        ``backpressure_timeout`` seconds.
     """
 
     max_queue_depth: int = 500
@@ -303,6 +332,161 @@ class LanePolicy:
     idempotency_window: timedelta = field(
         default_factory=lambda: timedelta(hours=24)
     )
+    idempotency_max_entries: int = 100_000
+    priority_aging_seconds: float | None = None
+    admission_threshold_percent: float = 100.0
+
+
+# ---------------------------------------------------------------------------
+# Priority Queue
+# ---------------------------------------------------------------------------
+
+
+class PriorityLaneQueue[T]:
+    """Priority queue shared by ``MainLane`` and ``SubagentLane``.
+
+    Items live in a single heap ordered by ``(rank, sequence)``.  Without
+    aging the rank is ``-priority``, so higher priorities dequeue first and
+    equal priorities dequeue FIFO.  Consumers blocked on an empty queue
+    wait on one FIFO of waiter futures, so any enqueue wakes a consumer
+    whatever its priority.
+
+    With ``aging_interval`` set, the rank is
+    ``enqueue_time - priority * aging_interval``: every ``aging_interval``
+    seconds spent waiting is worth one priority level, so low-priority
+    work cannot starve behind a steady stream of higher-priority work.
+    The rank is fixed at enqueue time, keeping every operation O(log n).
+
+    The queue itself is unbounded; lanes enforce ``max_queue_depth``.
+
+    Parameters
+    ----------
+    levels : int
+        Number of priority levels; priorities are clamped to
+        ``0..levels-1``.
+    aging_interval : float | None
+        Seconds of waiting worth one priority level (``None`` disables
+        aging).
+    """
+
+    __slots__ = (
+        "_counts",
+        "_getters",
+        "_heap",
+        "_sequence",
+        "aging_interval",
+        "levels",
+    )
+
+    def __init__(
+        self, levels: int = 11, aging_interval: float | None = None
+    ) -> None:
+        """Initialize priority lane queue.
+
+        Raises
+        ------
+        ValueError
+            If ``levels`` or ``aging_interval`` is not positive.
+        """
+        if levels <= 0:
+            raise ValueError("levels must be positive")
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError("aging_interval must be positive")
+        self.levels = levels
+        self.aging_interval = aging_interval
+        self._heap: list[tuple[float, int, int, T]] = []
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._sequence = itertools.count()
+        self._counts = [0] * levels
+
+    def clamp(self, priority: int) -> int:
+        """Clamp ``priority`` to the queue's levels."""
+        return min(self.levels - 1, max(0, priority))
+
+    def _wakeup_next(self) -> None:
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                return
+
+    def put_nowait(self, item: T, priority: int = 5) -> None:
+        """Enqueue ``item`` and wake one waiting consumer."""
+        priority = self.clamp(priority)
+        if self.aging_interval is None:
+            rank = float(-priority)
+        else:
+            rank = time.monotonic() - priority * self.aging_interval
+        heapq.heappush(self._heap, (rank, next(self._sequence), priority, item))
+        self._counts[priority] += 1
+        if self._getters:
+            self._wakeup_next()
+
+    async def put(self, item: T, priority: int = 5) -> None:
+        """Enqueue ``item`` (never blocks; the queue is unbounded)."""
+        self.put_nowait(item, priority)
+
+    def get_nowait(self) -> T:
+        """Dequeue the highest-ranked item.
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            If the queue is empty.
+        """
+        if not self._heap:
+            raise asyncio.QueueEmpty
+        _, _, priority, item = heapq.heappop(self._heap)
+        self._counts[priority] -= 1
+        return item
+
+    async def get(self) -> T:
+        """Dequeue the highest-ranked item, waiting until one is available."""
+        while not self._heap:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._getters.remove(getter)
+                # Pass on a wake-up this cancelled consumer absorbed.
+                if self._heap and not getter.cancelled():
+                    self._wakeup_next()
+                raise
+        return self.get_nowait()
+
+    async def get_many(self, n: int) -> list[T]:
+        """Wait for one item, then take up to ``n`` in rank order without waiting.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is not positive.
+        """
+        if n <= 0:
+            raise ValueError("n must be positive")
+        items = [await self.get()]
+        while len(items) < n and self._heap:
+            items.append(self.get_nowait())
+        return items
+
+    def qsize(self) -> int:
+        """Number of queued items."""
+        return len(self._heap)
+
+    def empty(self) -> bool:
+        """Whether the queue is empty."""
+        return not self._heap
+
+    def qsize_by_priority(self) -> dict[int, int]:
+        """Number of queued items per priority level (as enqueued)."""
+        return dict(enumerate(self._counts))
+
+    def __len__(self) -> int:
+        """Return number of queued items."""
+        return len(self._heap)
 
 
 # ---------------------------------------------------------------------------
@@ -366,7 +550,7 @@ class Lane:
             f"<{self.__class__.__name__} "
             f"type={self.lane_type.value} "
             f"tenant={self.tenant_id} "
-            f"queue_size={self.queue.qsize()}>"
+            f"queue_size={self.get_queue_size()}>"
         )
 
     async def is_full(self) -> bool:
@@ -377,7 +561,7 @@ class Lane:
         bool
             True if queue size >= max_queue_depth.
         """
-        return self.queue.qsize() >= self.policy.max_queue_depth
+        return self.get_queue_size() >= self.policy.max_queue_depth
 
     async def enqueue(self, item: object) -> None:
         """Enqueue an item to the lane.
@@ -428,7 +612,7 @@ class Lane:
         float
             Queue size / max_queue_depth * 100.
         """
-        return (self.queue.qsize() / self.policy.max_queue_depth) * 100.0
+        return (self.get_queue_size() / self.policy.max_queue_depth) * 100.0
 
 
 # ---------------------------------------------------------------------------
@@ -444,16 +628,20 @@ class MainLane(Lane):
 
     Attributes
     ----------
-    priority_queue : dict[int, asyncio.Queue]
-        Priority-based sub-queues (0-10).
-    idempotency_cache : dict[str, UUID]
-        Cache of idempotency_key -> task_id for deduplication.
+    priority_queue : PriorityLaneQueue[Task]
+        Pending tasks ordered by priority (0-10), FIFO within a priority.
+    idempotency_cache : IdempotencyCache[UUID]
+        idempotency_key -> task_id within ``policy.idempotency_window``
+        (may be shared with other lanes).
     """
 
     __slots__ = ("priority_queue", "idempotency_cache")
 
     def __init__(
-        self, tenant_id: str, policy: LanePolicy | None = None
+        self,
+        tenant_id: str,
+        policy: LanePolicy | None = None,
+        idempotency_cache: IdempotencyCache[UUID] | None = None,
     ) -> None:
         """Initialize main lane.
 
@@ -463,12 +651,20 @@ class MainLane(Lane):
             Tenant identifier.
         policy : LanePolicy | None
             Queue policy.
+        idempotency_cache : IdempotencyCache[UUID] | None
+            Shared dedupe cache (default: a private one from ``policy``).
         """
         super().__init__(LaneType.MAIN, tenant_id, policy)
-        self.priority_queue: dict[int, asyncio.Queue[Task]] = {
-            i: asyncio.Queue() for i in range(11)
-        }
-        self.idempotency_cache: dict[str, UUID] = {}
+        self.priority_queue: PriorityLaneQueue[Task] = PriorityLaneQueue(
+            aging_interval=self.policy.priority_aging_seconds
+        )
+        self.idempotency_cache: IdempotencyCache[UUID] = (
+            idempotency_cache or IdempotencyCache.from_policy(self.policy)
+        )
+
+    def get_queue_size(self) -> int:
+        """Get number of pending tasks across all priorities."""
+        return self.priority_queue.qsize()
 
     async def enqueue_task(
         self, request: TaskEnqueueRequest
@@ -483,7 +679,9 @@ class MainLane(Lane):
         Returns
         -------
         UUID
-            The task_id.
+            The task_id; the original task_id for a resubmission; or
+            ``PROBABLE_DUPLICATE_ID`` if the tenant's approximate dedupe
+            reports a probable duplicate (the task is not enqueued).
 
         Raises
         ------
@@ -496,27 +694,34 @@ class MainLane(Lane):
             raise LaneError("Task deadline has passed")
 
         # Check idempotency cache
-        if request.task.idempotency_key in self.idempotency_cache:
+        dedupe_key = f"main:{request.task.idempotency_key}"
+        existing = self.idempotency_cache.get(self.tenant_id, dedupe_key)
+        if existing is PROBABLE_DUPLICATE:
+            log.debug(
+                f"Probable duplicate task dropped: "
+                f"{request.task.idempotency_key}"
+            )
+            return PROBABLE_DUPLICATE_ID
+        if existing is not None:
             log.debug(
                 f"Idempotent task resubmitted: "
                 f"{request.task.idempotency_key}"
             )
-            return self.idempotency_cache[request.task.idempotency_key]
+            return existing
 
         # Enqueue to priority queue
-        priority = min(10, max(0, request.priority))
-        pq = self.priority_queue[priority]
+        pq = self.priority_queue
+        priority = pq.clamp(request.priority)
         if pq.qsize() >= self.policy.max_queue_depth:
             raise QueueFullError(
                 f"Main lane full (priority {priority}, "
                 f"size={pq.qsize()}, max={self.policy.max_queue_depth})"
             )
 
-        await pq.put(request.task)
-        self.idempotency_cache[request.task.idempotency_key] = (
-            request.task.task_id
+        pq.put_nowait(request.task, priority)
+        self.idempotency_cache.put(
+            self.tenant_id, dedupe_key, request.task.task_id
         )
-        self.queue.qsize()  # Update base queue (for interface compatibility)
         log.info(
             f"Enqueued task {request.task.task_id} "
             f"(priority={priority}, trace={request.task.trace_id})"
@@ -526,36 +731,71 @@ class MainLane(Lane):
     async def dequeue_next_task(self) -> Task:
         """Dequeue next task by priority (highest first).
 
+        Waits until a task of any priority is enqueued if the lane is
+        empty.
+
         Returns
         -------
         Task
             Next task to process.
         """
-        for priority in range(10, -1, -1):
-            pq = self.priority_queue[priority]
-            if not pq.empty():
-                task = await pq.get()
-                log.debug(f"Dequeued task {task.task_id} (priority={priority})")
-                return task
-        # If all queues empty, wait on priority 5 (medium)
-        return await self.priority_queue[5].get()
+        task = await self.priority_queue.get()
+        log.debug(f"Dequeued task {task.task_id}")
+        return task
+
+    async def dequeue_many(self, n: int) -> list[Task]:
+        """Dequeue up to ``n`` tasks in priority order.
+
+        Waits for the first task, then takes whatever else is queued
+        without waiting.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of tasks to return.
+
+        Returns
+        -------
+        list[Task]
+            Between 1 and ``n`` tasks.
+        """
+        return await self.priority_queue.get_many(n)
 
 
 class CronLane(Lane):
     """Cron lane for time-triggered scheduled tasks (ICD-014).
 
-    Scheduled tasks are stored in a priority queue sorted by scheduled_time.
-    Evaluation cycle checks due tasks periodically.
+    Pending fires live in a min-heap keyed by unix timestamp, so
+    scheduling is O(log n) and extracting ``k`` due fires is
+    O(k log n).  Cancelled or rescheduled entries are left in the heap
+    and discarded when they surface.  Recurring tasks are rescheduled
+    from their ``recurrence`` cron expression; fires missed while the
+    lane was not evaluated (e.g. downtime) are coalesced into a single
+    fire.  ``run`` sleeps until the next fire instead of relying on
+    external polling.
 
     Attributes
     ----------
     schedule_map : dict[UUID, ScheduledTask]
         Map of schedule_id -> ScheduledTask.
     scheduled_times : list[tuple[float, UUID]]
-        Sorted list of (unix_timestamp, schedule_id).
+        Heap of (unix_timestamp, schedule_id); may hold stale entries.
+    fired_count : int
+        Total fires returned by ``evaluate_due_tasks``.
+    coalesced_count : int
+        Recurring fires that absorbed one or more missed fires.
     """
 
-    __slots__ = ("schedule_map", "scheduled_times")
+    __slots__ = (
+        "_expressions",
+        "_next_fire",
+        "_running",
+        "_wakeup",
+        "coalesced_count",
+        "fired_count",
+        "schedule_map",
+        "scheduled_times",
+    )
 
     def __init__(
         self, tenant_id: str, policy: LanePolicy | None = None
@@ -572,6 +812,34 @@ class CronLane(Lane):
         super().__init__(LaneType.CRON, tenant_id, policy)
         self.schedule_map: dict[UUID, ScheduledTask] = {}
         self.scheduled_times: list[tuple[float, UUID]] = []
+        self.fired_count = 0
+        self.coalesced_count = 0
+        self._next_fire: dict[UUID, float] = {}
+        self._expressions: dict[str, CronExpression] = {}
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    def _expression(self, recurrence: str) -> CronExpression:
+        expression = self._expressions.get(recurrence)
+        if expression is None:
+            try:
+                expression = CronExpression(recurrence)
+            except ValueError as exc:
+                raise InvalidScheduleError(str(exc)) from exc
+            self._expressions[recurrence] = expression
+        return expression
+
+    def _push(self, sched_task: ScheduledTask, when: datetime) -> None:
+        ts = when.timestamp()
+        sched_task.next_execution_time = when
+        self._next_fire[sched_task.schedule_id] = ts
+        heapq.heappush(self.scheduled_times, (ts, sched_task.schedule_id))
+
+    def _prune(self) -> None:
+        """Drop stale entries from the top of the heap."""
+        heap = self.scheduled_times
+        while heap and self._next_fire.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
 
     async def schedule_task(
         self, request: ScheduledTaskRequest
@@ -591,7 +859,8 @@ class CronLane(Lane):
         Raises
         ------
         InvalidScheduleError
-            If scheduled_time is in the past.
+            If scheduled_time is not in the future, or the recurrence is
+            not a valid cron expression.
         QueueFullError
             If queue is full.
         """
@@ -603,23 +872,24 @@ class CronLane(Lane):
                 f"Scheduled time must be in future "
                 f"(requested {sched_task.scheduled_time}, now {now})"
             )
+        if sched_task.recurrence:
+            self._expression(sched_task.recurrence)
 
-        if len(self.schedule_map) >= self.policy.max_queue_depth:
+        if (
+            sched_task.schedule_id not in self.schedule_map
+            and len(self.schedule_map) >= self.policy.max_queue_depth
+        ):
             raise QueueFullError(
                 f"Cron lane full "
                 f"(size={len(self.schedule_map)}, "
                 f"max={self.policy.max_queue_depth})"
             )
 
-        # Store in schedule map
         self.schedule_map[sched_task.schedule_id] = sched_task
+        self._push(sched_task, sched_task.scheduled_time)
+        if self.scheduled_times[0][1] == sched_task.schedule_id:
+            self._wakeup.set()
 
-        # Add to sorted times
-        unix_ts = sched_task.scheduled_time.timestamp()
-        self.scheduled_times.append((unix_ts, sched_task.schedule_id))
-        self.scheduled_times.sort(key=lambda x: x[0])
-
-        sched_task.next_execution_time = sched_task.scheduled_time
         log.info(
             f"Scheduled task {sched_task.schedule_id} "
             f"for {sched_task.scheduled_time} "
@@ -627,39 +897,65 @@ class CronLane(Lane):
         )
         return sched_task.schedule_id
 
-    async def evaluate_due_tasks(self) -> list[ScheduledTask]:
+    def cancel(self, schedule_id: UUID) -> bool:
+        """Cancel a scheduled task.
+
+        Parameters
+        ----------
+        schedule_id : UUID
+            Schedule to cancel.
+
+        Returns
+        -------
+        bool
+            True if the schedule existed.
+        """
+        self._next_fire.pop(schedule_id, None)
+        return self.schedule_map.pop(schedule_id, None) is not None
+
+    async def evaluate_due_tasks(
+        self, now: datetime | None = None
+    ) -> list[ScheduledTask]:
         """Evaluate and return due tasks.
 
+        One-time tasks are removed; recurring tasks are rescheduled to
+        the first cron fire after ``now``.
+
+        Parameters
+        ----------
+        now : datetime | None
+            Evaluation time (defaults to now in UTC).
+
         Returns
         -------
         list[ScheduledTask]
-            List of tasks that are due for execution.
+            Tasks due for execution, in fire-time order.
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        now_ts = now.timestamp()
+        heap = self.scheduled_times
         due: list[ScheduledTask] = []
 
-        for unix_ts, schedule_id in self.scheduled_times:
-            sched_task = self.schedule_map.get(schedule_id)
-            if sched_task and sched_task.scheduled_time <= now:
-                due.append(sched_task)
-                # Update next execution if recurring
-                if sched_task.recurrence:
-                    # Placeholder: actual cron parsing would go here
-                    sched_task.next_execution_time = (
-                        now + timedelta(hours=1)
-                    )
-                else:
-                    # One-time task, remove from map
-                    del self.schedule_map[schedule_id]
-
-        # Remove processed due tasks from sorted list
-        self.scheduled_times = [
-            (ts, sid)
-            for ts, sid in self.scheduled_times
-            if sid not in [s.schedule_id for s in due]
-            or self.schedule_map[sid].recurrence
-        ]
+        while heap and heap[0][0] <= now_ts:
+            ts, schedule_id = heapq.heappop(heap)
+            if self._next_fire.get(schedule_id) != ts:
+                continue  # cancelled or rescheduled
+            sched_task = self.schedule_map[schedule_id]
+            due.append(sched_task)
+            if sched_task.recurrence:
+                expression = self._expression(sched_task.recurrence)
+                fired_at = datetime.fromtimestamp(ts, tz=timezone.utc)
+                following = expression.next_after(fired_at)
+                if following <= now:
+                    self.coalesced_count += 1
+                    following = expression.next_after(now)
+                self._push(sched_task, following)
+            else:
+                del self.schedule_map[schedule_id]
+                del self._next_fire[schedule_id]
 
+        self.fired_count += len(due)
         log.debug(f"Cron lane evaluated: {len(due)} tasks due")
         return due
 
@@ -671,32 +967,84 @@ class CronLane(Lane):
         datetime | None
             Next scheduled time, or None if no tasks scheduled.
         """
+        self._prune()
         if not self.scheduled_times:
             return None
         unix_ts = self.scheduled_times[0][0]
         return datetime.fromtimestamp(unix_ts, tz=timezone.utc)
 
+    async def run(
+        self, on_due: Callable[[list[ScheduledTask]], Awaitable[None]]
+    ) -> None:
+        """Fire due tasks until ``stop`` is called.
+
+        Sleeps until the earliest pending fire, waking early when a
+        sooner task is scheduled, and passes each non-empty due batch
+        to ``on_due``.
+
+        Parameters
+        ----------
+        on_due : Callable[[list[ScheduledTask]], Awaitable[None]]
+            Receives each batch of due tasks.
+        """
+        self._running = True
+        while self._running:
+            self._wakeup.clear()
+            due = await self.evaluate_due_tasks()
+            if due:
+                await on_due(due)
+                continue
+            next_time = self.get_next_execution_time()
+            timeout = (
+                None
+                if next_time is None
+                else max(0.0, next_time.timestamp() - time.time())
+            )
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+    def stop(self) -> None:
+        """Stop a running ``run`` loop after its current iteration."""
+        self._running = False
+        self._wakeup.set()
+
 
 class SubagentLane(Lane):
     """Subagent lane for team-parallel agent execution (ICD-015).
 
     Subagent tasks are enqueued for parallel execution in an agent pool.
-    Concurrency limits are enforced per tenant.
+    Concurrency limits are enforced per tenant.  A task counts towards
+    ``concurrent_count`` only between ``mark_started`` and
+    ``mark_complete``, i.e. while an executor is actually running it.
 
     Attributes
     ----------
-    priority_queue : dict[int, asyncio.Queue]
-        Priority-based sub-queues.
+    priority_queue : PriorityLaneQueue[SubagentTask]
+        Pending subagent tasks ordered by priority (0-10).
     concurrent_count : int
-        Current number of concurrent subagent tasks.
+        Number of subagent tasks currently running.
     active_executions : dict[UUID, SubagentTask]
-        Map of execution_id -> SubagentTask.
+        Map of execution_id -> SubagentTask, queued or running.
+    running_executions : set[UUID]
+        Execution ids currently running.
+    idempotency_cache : IdempotencyCache[UUID]
+        Spawn idempotency_key -> execution_id within
+        ``policy.idempotency_window`` (may be shared with other lanes).
     """
 
-    __slots__ = ("priority_queue", "concurrent_count", "active_executions")
+    __slots__ = (
+        "priority_queue",
+        "concurrent_count",
+        "active_executions",
+        "running_executions",
+        "idempotency_cache",
+    )
 
     def __init__(
-        self, tenant_id: str, policy: LanePolicy | None = None
+        self,
+        tenant_id: str,
+        policy: LanePolicy | None = None,
+        idempotency_cache: IdempotencyCache[UUID] | None = None,
     ) -> None:
         """Initialize subagent lane.
 
@@ -706,13 +1054,23 @@ class SubagentLane(Lane):
             Tenant identifier.
         policy : LanePolicy | None
             Queue policy.
+        idempotency_cache : IdempotencyCache[UUID] | None
+            Shared dedupe cache (default: a private one from ``policy``).
         """
         super().__init__(LaneType.SUBAGENT, tenant_id, policy)
-        self.priority_queue: dict[int, asyncio.Queue[SubagentTask]] = {
-            i: asyncio.Queue() for i in range(11)
-        }
+        self.priority_queue: PriorityLaneQueue[SubagentTask] = (
+            PriorityLaneQueue(aging_interval=self.policy.priority_aging_seconds)
+        )
         self.concurrent_count = 0
         self.active_executions: dict[UUID, SubagentTask] = {}
+        self.running_executions: set[UUID] = set()
+        self.idempotency_cache: IdempotencyCache[UUID] = (
+            idempotency_cache or IdempotencyCache.from_policy(self.policy)
+        )
+
+    def get_queue_size(self) -> int:
+        """Get number of pending subagent tasks across all priorities."""
+        return self.priority_queue.qsize()
 
     async def spawn_subagent(
         self, request: SubagentSpawnRequest
@@ -727,7 +1085,10 @@ class SubagentLane(Lane):
         Returns
         -------
         UUID
-            The subagent_execution_id.
+            The subagent_execution_id; the original id for a
+            resubmission; or ``PROBABLE_DUPLICATE_ID`` if the tenant's
+            approximate dedupe reports a probable duplicate (the task is
+            not enqueued).
 
         Raises
         ------
@@ -739,8 +1100,22 @@ class SubagentLane(Lane):
         if request.subagent_task.is_expired():
             raise LaneError("Subagent task deadline has passed")
 
-        priority = min(10, max(0, request.priority))
-        pq = self.priority_queue[priority]
+        dedupe_key = f"subagent:{request.idempotency_key}"
+        if request.idempotency_key:
+            existing = self.idempotency_cache.get(self.tenant_id, dedupe_key)
+            if existing is PROBABLE_DUPLICATE:
+                log.debug(
+                    f"Probable duplicate spawn dropped: {request.idempotency_key}"
+                )
+                return PROBABLE_DUPLICATE_ID
+            if existing is not None:
+                log.debug(
+                    f"Idempotent spawn resubmitted: {request.idempotency_key}"
+                )
+                return existing
+
+        pq = self.priority_queue
+        priority = pq.clamp(request.priority)
 
         if pq.qsize() >= self.policy.max_queue_depth:
             raise QueueFullError(
@@ -750,17 +1125,22 @@ class SubagentLane(Lane):
                 f"max={self.policy.max_queue_depth})"
             )
 
-        await pq.put(request.subagent_task)
+        pq.put_nowait(request.subagent_task, priority)
         self.active_executions[request.subagent_task.subagent_execution_id] = (
             request.subagent_task
         )
-        self.concurrent_count += 1
+        if request.idempotency_key:
+            self.idempotency_cache.put(
+                self.tenant_id,
+                dedupe_key,
+                request.subagent_task.subagent_execution_id,
+            )
 
         log.info(
             f"Spawned subagent {request.subagent_task.subagent_execution_id} "
             f"(priority={priority}, "
             f"parent={request.subagent_task.parent_execution_id}, "
-            f"concurrent={self.concurrent_count}/{self.policy.max_concurrency})"
+            f"queued={pq.qsize()})"
         )
         return request.subagent_task.subagent_execution_id
 
@@ -772,29 +1152,52 @@ class SubagentLane(Lane):
         SubagentTask
             Next subagent task to execute.
         """
-        for priority in range(10, -1, -1):
-            pq = self.priority_queue[priority]
-            if not pq.empty():
-                task = await pq.get()
-                log.debug(
-                    f"Dequeued subagent {task.subagent_execution_id} "
-                    f"(priority={priority})"
-                )
-                return task
-        # Wait on priority 5 if all empty
-        return await self.priority_queue[5].get()
+        task = await self.priority_queue.get()
+        log.debug(f"Dequeued subagent {task.subagent_execution_id}")
+        return task
+
+    async def dequeue_many(self, n: int) -> list[SubagentTask]:
+        """Dequeue up to ``n`` subagent tasks in priority order.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of tasks to return.
+
+        Returns
+        -------
+        list[SubagentTask]
+            Between 1 and ``n`` tasks.
+        """
+        return await self.priority_queue.get_many(n)
+
+    async def mark_started(self, execution_id: UUID) -> None:
+        """Mark a dequeued subagent execution as running.
+
+        Parameters
+        ----------
+        execution_id : UUID
+            The subagent_execution_id.
+        """
+        if execution_id not in self.running_executions:
+            self.running_executions.add(execution_id)
+            self.concurrent_count = len(self.running_executions)
+
+    def has_capacity(self) -> bool:
+        """Return whether another subagent may start under max_concurrency."""
+        return self.concurrent_count < self.policy.max_concurrency
 
     async def mark_complete(self, execution_id: UUID) -> None:
-        """Mark a subagent execution as complete.
+        """Mark a subagent execution as complete (or discarded unrun).
 
         Parameters
         ----------
         execution_id : UUID
             The subagent_execution_id.
         """
-        if execution_id in self.active_executions:
-            del self.active_executions[execution_id]
-        self.concurrent_count = max(0, self.concurrent_count - 1)
+        self.active_executions.pop(execution_id, None)
+        self.running_executions.discard(execution_id)
+        self.concurrent_count = len(self.running_executions)
         log.debug(
             f"Subagent {execution_id} marked complete "
             f"(concurrent={self.concurrent_count})"
@@ -830,9 +1233,11 @@ class LaneManager:
         Map of (tenant_id, lane_type) -> Lane instance.
     policy : LanePolicy
         Global policy for all lanes.
+    idempotency_cache : IdempotencyCache[UUID]
+        Dedupe cache shared by the tenants' main and subagent lanes.
     """
 
-    __slots__ = ("lanes", "policy")
+    __slots__ = ("idempotency_cache", "lanes", "policy")
 
     def __init__(self, policy: LanePolicy | None = None) -> None:
         """Initialize lane manager.
@@ -844,6 +1249,9 @@ class LaneManager:
         """
         self.policy = policy or LanePolicy()
         self.lanes: dict[tuple[str, LaneType], Lane] = {}
+        self.idempotency_cache: IdempotencyCache[UUID] = (
+            IdempotencyCache.from_policy(self.policy)
+        )
 
     def _get_or_create_lane(
         self, tenant_id: str, lane_type: LaneType
@@ -865,11 +1273,15 @@ class LaneManager:
         key = (tenant_id, lane_type)
         if key not in self.lanes:
             if lane_type == LaneType.MAIN:
-                self.lanes[key] = MainLane(tenant_id, self.policy)
+                self.lanes[key] = MainLane(
+                    tenant_id, self.policy, self.idempotency_cache
+                )
             elif lane_type == LaneType.CRON:
                 self.lanes[key] = CronLane(tenant_id, self.policy)
             elif lane_type == LaneType.SUBAGENT:
-                self.lanes[key] = SubagentLane(tenant_id, self.policy)
+                self.lanes[key] = SubagentLane(
+                    tenant_id, self.policy, self.idempotency_cache
+                )
             else:
                 raise ValueError(f"Unknown lane type: {lane_type}")
         return self.lanes[key]
@@ -992,9 +1404,7 @@ class LaneManager:
             lane = self.get_lane(tenant_id, lane_type)
             if lane:
                 if isinstance(lane, MainLane):
-                    total_size = sum(
-                        pq.qsize() for pq in lane.priority_queue.values()
-                    )
+                    total_size = lane.get_queue_size()
                     stats[lane_type.value] = {
                         "queue_size": total_size,
                         "queue_depth_percent": (
@@ -1014,10 +1424,7 @@ class LaneManager:
                     }
                 elif isinstance(lane, SubagentLane):
                     stats[lane_type.value] = {
-                        "queue_size": sum(
-                            pq.qsize()
-                            for pq in lane.priority_queue.values()
-                        ),
+                        "queue_size": lane.get_queue_size(),
                         "concurrent_count": lane.concurrent_count,
                         "concurrency_percent": (
                             lane.get_concurrency_percentage()
@@ -0,0 +1,307 @@
+"""Latency histograms and adaptive timeouts for MCP tool invocations (ICD-019/020).
+
+``LatencyHistogram`` is an HDR-style log-linear histogram over integer
+nanoseconds: values below ``2 * 2**precision`` get exact buckets, and
+every power-of-two range above is split into ``2**precision`` linear
+sub-buckets, so any recorded value is reproduced within a relative error
+of ``2**-precision`` (about 3% by default) in a few hundred counters.
+Recording is O(1) and allocation-free once the bucket array has grown.
+
+``LatencyRecorder`` keeps one histogram plus outcome counters per
+``(tool, tenant)`` and per tool, and ``TimeoutPolicy`` turns a tool's
+observed percentile into an invocation timeout clamped to a floor and
+ceiling, with an optional hedging delay for idempotent tools.
+
+This module provides:
+- LatencyHistogram: log-linear nanosecond histogram with percentiles
+- LatencyStats: histogram plus call/error/timeout/hedge counters
+- TimeoutPolicy: percentile-based timeout and hedge-delay policy
+- LatencyRecorder: per-(tool, tenant) and per-tool latency statistics
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+__all__ = [
+    "LatencyHistogram",
+    "LatencyRecorder",
+    "LatencyStats",
+    "TimeoutPolicy",
+]
+
+
+class LatencyHistogram:
+    """Log-linear histogram of non-negative integer nanoseconds.
+
+    Parameters
+    ----------
+    precision : int
+        Sub-bucket bits per power of two (relative error ``2**-precision``).
+
+    Raises
+    ------
+    ValueError
+        If ``precision`` is not in 1..10.
+    """
+
+    __slots__ = ("_counts", "_sub", "count", "max", "min", "precision", "total")
+
+    def __init__(self, precision: int = 5) -> None:
+        if not 1 <= precision <= 10:
+            raise ValueError(f"precision must be in 1..10, got {precision}")
+        self.precision = precision
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self._sub = 1 << precision
+        self._counts: list[int] = []
+
+    def _index(self, value: int) -> int:
+        sub = self._sub
+        if value < 2 * sub:
+            return value
+        shift = value.bit_length() - self.precision - 1
+        return (shift + 1) * sub + (value >> shift) - sub
+
+    def _value(self, index: int) -> int:
+        """Midpoint of the values mapped to bucket ``index``."""
+        sub = self._sub
+        if index < 2 * sub:
+            return index
+        shift = index // sub - 1
+        low = (index % sub + sub) << shift
+        return low + (1 << shift) // 2
+
+    def record(self, value: int) -> None:
+        """Record one value (negative values count as 0)."""
+        value = max(0, value)
+        index = self._index(value)
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, p: float) -> int:
+        """Return the value at percentile ``p`` (0-100); 0 if empty."""
+        if self.count == 0:
+            return 0
+        rank = max(1, round(self.count * min(100.0, max(0.0, p)) / 100))
+        seen = 0
+        for index, n in enumerate(self._counts):
+            seen += n
+            if seen >= rank:
+                return min(self.max, max(self.min, self._value(index)))
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean recorded value; 0.0 if empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add ``other``'s samples (must have the same precision)."""
+        if other.precision != self.precision:
+            raise ValueError("cannot merge histograms of different precision")
+        if other.count == 0:
+            return
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for index, n in enumerate(other._counts):
+            self._counts[index] += n
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+
+@dataclass(slots=True)
+class LatencyStats:
+    """Latency histogram and outcome counters for one tool or (tool, tenant).
+
+    Attributes
+    ----------
+    histogram : LatencyHistogram
+        Latency of handler runs in ns: completed runs (success or error)
+        and timed-out runs, the latter censored at the time they ran.
+    calls : int
+        Handler runs started.
+    errors : int
+        Runs that raised.
+    timeouts : int
+        Runs stopped by the invocation timeout.
+    hedged : int
+        Hedge (second) attempts launched.
+    hedge_wins : int
+        Invocations answered by the hedge attempt.
+    """
+
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of runs that raised or timed out."""
+        return (self.errors + self.timeouts) / self.calls if self.calls else 0.0
+
+    def percentiles_ms(self) -> dict[str, float]:
+        """Return p50/p95/p99 latency in milliseconds."""
+        h = self.histogram
+        return {
+            "p50": h.percentile(50) / 1e6,
+            "p95": h.percentile(95) / 1e6,
+            "p99": h.percentile(99) / 1e6,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class TimeoutPolicy:
+    """Percentile-based invocation timeout and hedge delay for a tool.
+
+    The timeout is ``multiplier`` times the tool's observed
+    ``percentile`` latency, clamped to ``[floor_seconds, ceiling_seconds]``.
+    Until ``min_samples`` runs have completed the ceiling is used.  A
+    ``ceiling_seconds`` of None means the tool's static timeout.
+
+    Attributes
+    ----------
+    percentile : float
+        Latency percentile the timeout is derived from.
+    multiplier : float
+        Headroom factor applied to that percentile.
+    floor_seconds : float
+        Smallest timeout ever applied.
+    ceiling_seconds : float | None
+        Largest timeout ever applied and the cold-start timeout (None:
+        the caller's default).
+    min_samples : int
+        Completed runs needed before adapting.
+    hedge_percentile : float | None
+        For idempotent tools, launch a second attempt once the first has
+        run this long (as a latency percentile); None disables hedging.
+    """
+
+    percentile: float = 99.0
+    multiplier: float = 3.0
+    floor_seconds: float = 0.1
+    ceiling_seconds: float | None = None
+    min_samples: int = 50
+    hedge_percentile: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate bounds."""
+        if self.floor_seconds <= 0:
+            raise ValueError("floor_seconds must be positive")
+        if self.ceiling_seconds is not None and self.ceiling_seconds < self.floor_seconds:
+            raise ValueError("ceiling_seconds must be >= floor_seconds")
+        if self.multiplier <= 0 or self.min_samples < 1:
+            raise ValueError("multiplier and min_samples must be positive")
+
+    def timeout(self, stats: LatencyStats | None, default: float) -> float:
+        """Return the timeout in seconds given the tool's statistics.
+
+        Parameters
+        ----------
+        stats : LatencyStats | None
+            The tool's recorded latency (None if never run).
+        default : float
+            Ceiling used when ``ceiling_seconds`` is None.
+        """
+        ceiling = self.ceiling_seconds if self.ceiling_seconds is not None else default
+        if stats is None or stats.histogram.count < self.min_samples:
+            return ceiling
+        observed = stats.histogram.percentile(self.percentile) / 1e9 * self.multiplier
+        return min(ceiling, max(self.floor_seconds, observed))
+
+    def hedge_delay(self, stats: LatencyStats | None) -> float | None:
+        """Return seconds before hedging, or None if hedging is not warranted."""
+        if (
+            self.hedge_percentile is None
+            or stats is None
+            or stats.histogram.count < self.min_samples
+        ):
+            return None
+        return stats.histogram.percentile(self.hedge_percentile) / 1e9
+
+
+class LatencyRecorder:
+    """Per-(tool, tenant) and per-tool latency statistics.
+
+    Parameters
+    ----------
+    precision : int
+        Histogram sub-bucket bits.
+    """
+
+    __slots__ = ("_by_key", "_by_tool", "precision")
+
+    def __init__(self, precision: int = 5) -> None:
+        self.precision = precision
+        self._by_key: dict[tuple[str, str], LatencyStats] = {}
+        self._by_tool: dict[str, LatencyStats] = {}
+
+    def _new(self) -> LatencyStats:
+        return LatencyStats(histogram=LatencyHistogram(self.precision))
+
+    def _pair(self, tool_name: str, tenant_id: str) -> tuple[LatencyStats, LatencyStats]:
+        key = (tool_name, tenant_id)
+        keyed = self._by_key.get(key)
+        if keyed is None:
+            keyed = self._by_key[key] = self._new()
+        tool = self._by_tool.get(tool_name)
+        if tool is None:
+            tool = self._by_tool[tool_name] = self._new()
+        return keyed, tool
+
+    def record(
+        self,
+        tool_name: str,
+        tenant_id: str,
+        elapsed_ns: int,
+        *,
+        error: bool = False,
+        timeout: bool = False,
+    ) -> None:
+        """Record one handler run.
+
+        A timed-out run is recorded at ``elapsed_ns``, a lower bound on
+        its true latency.  Once such runs reach the policy percentile the
+        adaptive timeout grows by about its multiplier per round, so a
+        tool whose latency stepped up is not timed out for good.
+        """
+        for stats in self._pair(tool_name, tenant_id):
+            stats.calls += 1
+            if timeout:
+                stats.timeouts += 1
+            elif error:
+                stats.errors += 1
+            stats.histogram.record(elapsed_ns)
+
+    def record_hedge(self, tool_name: str, tenant_id: str, *, won: bool) -> None:
+        """Count a launched hedge attempt and whether it answered first."""
+        for stats in self._pair(tool_name, tenant_id):
+            stats.hedged += 1
+            stats.hedge_wins += won
+
+    def for_tool(self, tool_name: str) -> LatencyStats | None:
+        """Statistics aggregated over every tenant of ``tool_name``."""
+        return self._by_tool.get(tool_name)
+
+    def for_key(self, tool_name: str, tenant_id: str) -> LatencyStats | None:
+        """Statistics for one ``(tool_name, tenant_id)``."""
+        return self._by_key.get((tool_name, tenant_id))
+
+    def tenants(self, tool_name: str) -> list[str]:
+        """Tenants with recorded runs of ``tool_name``."""
+        return [tenant for tool, tenant in self._by_key if tool == tool_name]
@@ -27,7 +27,8 @@ Per ICD-019/020 latency budget:
 
 Per ICD-019/020 backpressure:
 - Per-tool concurrency limit (default 10 per tool per tenant)
-- Excess invocations queued with 30s timeout
+- Excess invocations queued (by priority, then FIFO) with 30s timeout
+- Waiters still queued at the timeout get ConcurrencyLimitError
 
 Per ICD-019/020 tenant isolation:
 - tenant_id immutable
@@ -44,6 +45,21 @@ Per ICD-019/020 redaction:
 - Output redacted if contains PII
 - Applied before returning to caller
 
+Result caching (tools registered with cache_ttl):
+- Results cached per tenant by (tool, canonical input hash) for cache_ttl
+- Concurrent identical invocations share one handler call (single-flight)
+- Output PII redaction applied once, when the cache is filled
+- Permission checks (K2) still run on every invocation
+
+Latency telemetry and adaptive timeouts:
+- Handler runs timed with perf_counter_ns into per-(tool, tenant) and
+  per-tool log-linear histograms (queue wait excluded)
+- get_registry_stats reports p50/p95/p99, error rate and saturation
+- With a TimeoutPolicy the execution timeout follows the tool's observed
+  percentile, clamped to a floor and a ceiling (default: the static 5s/30s)
+- Idempotent tools may be hedged: a second attempt starts once the first
+  has run past the policy's hedge percentile; the first to succeed wins
+
 Per ICD-019/020 traceability:
 - trace_id propagated
 - tool_invoked event to Event Bus
@@ -53,6 +69,8 @@ Per ICD-019/020 traceability:
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
 import logging
 import time
 from dataclasses import dataclass, field
@@ -61,8 +79,12 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID, uuid4
 
+from holly.engine.latency import LatencyRecorder, TimeoutPolicy
+from holly.engine.semaphores import KeyedSemaphores
+from holly.engine.tool_cache import ToolResultCache, canonical_input_hash
+
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
 log = logging.getLogger(__name__)
 
@@ -77,6 +99,7 @@ __all__ = [
     "PermissionDeniedError",
     "ToolExecutionError",
     "LLMToolError",
+    "ConcurrencyLimitError",
     "tool_invocation_handler",
     "mcp_tool",
 ]
@@ -155,6 +178,27 @@ class LLMToolError(ToolInvocationError):
         )
 
 
+class ConcurrencyLimitError(ToolInvocationError):
+    """Raised when no concurrency slot frees up within the queue timeout."""
+
+    def __init__(
+        self,
+        tool_name: str,
+        tenant_id: str,
+        limit: int,
+        queue_depth: int,
+    ) -> None:
+        self.tool_name = tool_name
+        self.tenant_id = tenant_id
+        self.limit = limit
+        self.queue_depth = queue_depth
+        self.error_code = "concurrency_limit"
+        super().__init__(
+            f"tool {tool_name!r} at capacity for tenant {tenant_id!r} "
+            f"(limit={limit}, queued={queue_depth})"
+        )
+
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
@@ -204,6 +248,11 @@ class MCPTool:
         Tenant isolation scope.
     created_at : datetime
         Tool registration timestamp.
+    cache_ttl : float | None
+        Seconds results of identical input are reused (None: not cacheable).
+    idempotent : bool
+        Whether the handler may safely run twice for one invocation
+        (allows hedged attempts).
     """
 
     tool_id: UUID
@@ -218,6 +267,8 @@ class MCPTool:
     returns_pii: bool = False
     tenant_id: str = ""
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    cache_ttl: float | None = None
+    idempotent: bool = False
 
     def __repr__(self) -> str:
         return (
@@ -284,6 +335,9 @@ class ToolInvocationRequest:
         Deduplication key for K5.
     trace_id : str
         Request tracing ID.
+    priority : int
+        Queue priority when the tool is at its concurrency limit
+        (higher is served first).
     """
 
     tool_name: str
@@ -293,6 +347,7 @@ class ToolInvocationRequest:
     input: dict[str, Any] = field(default_factory=dict)
     idempotency_key: str = ""
     trace_id: str = ""
+    priority: int = 0
 
     def __repr__(self) -> str:
         return (
@@ -321,6 +376,9 @@ class ToolInvocationResponse:
         Request tracing ID (propagated).
     idempotency_key : str
         Deduplication key (propagated).
+    cached : bool
+        Whether the result was served from the result cache or shared
+        with a concurrent identical invocation.
     """
 
     tool_result: Any = None
@@ -330,6 +388,7 @@ class ToolInvocationResponse:
     error_code: str | None = None
     trace_id: str = ""
     idempotency_key: str = ""
+    cached: bool = False
 
     def is_error(self) -> bool:
         """Return True if response indicates error."""
@@ -417,7 +476,7 @@ class MCPRegistry:
     - Per-tenant, per-tool concurrency limiting
     - Input/output redaction
     - Introspection API
-    - Latency tracking per ICD-019/020
+    - Latency histograms, adaptive timeouts and hedging per ICD-019/020
 
     Latency SLAs (per ICD-019/020):
     - Tool lookup: p99 < 1ms
@@ -430,10 +489,24 @@ class MCPRegistry:
         Tool registry by tool_name.
     _permissions : dict[UUID, list[ToolPermission]]
         Permissions by tool_id.
+    _grant_index : dict[tuple[str, str], datetime | None]
+        Latest expiry per (tool_name, agent_id) grant (None = never).
+    _grant_expiry : list[tuple[datetime, str, str]]
+        Min-heap of (expires_at, tool_name, agent_id) for lazy purging.
     _concurrency_limits : dict[tuple[str, str], int]
         Per-tool per-tenant concurrency limits (tool_name, tenant_id) → limit.
     _active_invocations : dict[tuple[str, str, str], int]
         Active invocations counter (tool_name, tenant_id, agent_id) → count.
+    _semaphores : KeyedSemaphores
+        Waiting semaphore per (tool_name, tenant_id), sharded by tool.
+    _result_cache : ToolResultCache
+        Results of cacheable tools, partitioned by tenant.
+    _latency : LatencyRecorder
+        Handler latency and outcomes per (tool_name, tenant_id) and tool.
+    _timeout_policy : TimeoutPolicy | None
+        Default adaptive timeout policy (None: static timeouts).
+    _timeout_policies : dict[str, TimeoutPolicy]
+        Per-tool timeout policy overrides.
     _secret_redactor : SecretRedactor
         Input redaction (secrets).
     _pii_redactor : PIIRedactor
@@ -445,6 +518,9 @@ class MCPRegistry:
         secret_redactor: SecretRedactor | None = None,
         pii_redactor: PIIRedactor | None = None,
         default_concurrency_limit: int = 10,
+        queue_timeout: float | None = 30.0,
+        cache_max_entries_per_tenant: int = 1024,
+        timeout_policy: TimeoutPolicy | None = None,
     ) -> None:
         """Initialize MCPRegistry.
 
@@ -456,15 +532,30 @@ class MCPRegistry:
             Output redaction handler (defaults to NullRedactor).
         default_concurrency_limit : int
             Default per-tool per-tenant concurrency (default: 10).
+        queue_timeout : float | None
+            Seconds an invocation may wait for a concurrency slot
+            (default: 30; 0 rejects immediately; None waits forever).
+        cache_max_entries_per_tenant : int
+            LRU capacity of each tenant's result cache (default: 1024).
+        timeout_policy : TimeoutPolicy | None
+            Adaptive timeout policy for every tool without its own
+            (default: None, static 5s / 30s for LLM tools).
         """
         self._tools: dict[str, MCPTool] = {}
         self._permissions: dict[UUID, list[ToolPermission]] = {}
+        self._grant_index: dict[tuple[str, str], datetime | None] = {}
+        self._grant_expiry: list[tuple[datetime, str, str]] = []
         self._concurrency_limits: dict[tuple[str, str], int] = {}
         self._active_invocations: dict[tuple[str, str, str], int] = {}
         self._secret_redactor = secret_redactor or NullRedactor()
         self._pii_redactor = pii_redactor or NullRedactor()
         self._default_concurrency_limit = default_concurrency_limit
-        self._invocation_lock = asyncio.Lock()
+        self._queue_timeout = queue_timeout
+        self._semaphores = KeyedSemaphores(default_concurrency_limit)
+        self._result_cache = ToolResultCache(cache_max_entries_per_tenant)
+        self._latency = LatencyRecorder()
+        self._timeout_policy = timeout_policy
+        self._timeout_policies: dict[str, TimeoutPolicy] = {}
 
     def register_tool(
         self,
@@ -478,6 +569,8 @@ class MCPRegistry:
         requires_secrets: bool = False,
         returns_pii: bool = False,
         tenant_id: str = "",
+        cache_ttl: float | None = None,
+        idempotent: bool = False,
     ) -> MCPTool:
         """Register tool with registry.
 
@@ -503,6 +596,12 @@ class MCPRegistry:
             Whether output needs PII redaction.
         tenant_id : str
             Tenant isolation scope.
+        cache_ttl : float | None
+            Declare the tool pure and reuse results of identical input
+            for this many seconds (None: never cache).
+        idempotent : bool
+            Declare the handler safe to run more than once per invocation
+            (enables hedging under a TimeoutPolicy with hedge_percentile).
 
         Returns
         -------
@@ -512,10 +611,12 @@ class MCPRegistry:
         Raises
         ------
         ValueError
-            If tool_name already registered.
+            If tool_name already registered or cache_ttl is not positive.
         """
         if tool_name in self._tools:
             raise ValueError(f"tool {tool_name!r} already registered")
+        if cache_ttl is not None and cache_ttl <= 0:
+            raise ValueError(f"cache_ttl must be positive, got {cache_ttl}")
 
         tool = MCPTool(
             tool_id=uuid4(),
@@ -529,6 +630,8 @@ class MCPRegistry:
             requires_secrets=requires_secrets,
             returns_pii=returns_pii,
             tenant_id=tenant_id,
+            cache_ttl=cache_ttl,
+            idempotent=idempotent,
         )
         self._tools[tool_name] = tool
         self._permissions[tool.tool_id] = []
@@ -578,11 +681,132 @@ class MCPRegistry:
             expires_at=expires_at,
         )
         self._permissions[tool.tool_id].append(perm)
+        self._index_grant(tool_name, agent_id, expires_at)
         log.debug(
             f"granted permission to {agent_id!r} for tool {tool_name!r}"
         )
         return perm
 
+    def revoke_permission(self, tool_name: str, agent_id: str) -> int:
+        """Revoke every grant of tool_name to agent_id.
+
+        Parameters
+        ----------
+        tool_name : str
+            Tool to revoke.
+        agent_id : str
+            Agent losing access.
+
+        Returns
+        -------
+        int
+            Number of grants removed (0 if the agent had none).
+
+        Raises
+        ------
+        ToolNotFoundError
+            If tool_name not in registry.
+        """
+        if tool_name not in self._tools:
+            raise ToolNotFoundError(tool_name)
+
+        tool = self._tools[tool_name]
+        perms = self._permissions[tool.tool_id]
+        kept = [p for p in perms if p.agent_id != agent_id]
+        removed = len(perms) - len(kept)
+        self._permissions[tool.tool_id] = kept
+        # Heap entries for the pair become stale and are skipped on purge.
+        self._grant_index.pop((tool_name, agent_id), None)
+        log.debug(
+            f"revoked {removed} permission(s) of {agent_id!r} for tool {tool_name!r}"
+        )
+        return removed
+
+    def _index_grant(
+        self,
+        tool_name: str,
+        agent_id: str,
+        expires_at: datetime | None,
+    ) -> None:
+        """Record a grant in the (tool_name, agent_id) index.
+
+        Overlapping grants collapse to the latest expiry; a grant without
+        expiry never expires.
+        """
+        key = (tool_name, agent_id)
+        if key in self._grant_index:
+            current = self._grant_index[key]
+            if current is None:
+                return
+            if expires_at is not None and expires_at <= current:
+                return
+        self._grant_index[key] = expires_at
+        if expires_at is not None:
+            heapq.heappush(self._grant_expiry, (expires_at, tool_name, agent_id))
+
+    def _purge_expired(self, now: datetime) -> None:
+        """Drop index entries whose grants have expired (amortised O(log n))."""
+        heap = self._grant_expiry
+        while heap and heap[0][0] < now:
+            expires_at, tool_name, agent_id = heapq.heappop(heap)
+            key = (tool_name, agent_id)
+            # Skip entries superseded by a later grant or a revocation.
+            if key in self._grant_index and self._grant_index[key] == expires_at:
+                del self._grant_index[key]
+
+    def _is_authorized(self, tool_name: str, agent_id: str, now: datetime) -> bool:
+        """Index lookup: True if a live grant exists (caller purges first)."""
+        key = (tool_name, agent_id)
+        if key not in self._grant_index:
+            return False
+        expires_at = self._grant_index[key]
+        return expires_at is None or now <= expires_at
+
+    def authorize_many(self, pairs: Iterable[tuple[str, str]]) -> list[bool]:
+        """Check many (tool_name, agent_id) pairs against one clock reading.
+
+        Unknown tools are denied (K2 fail-safe).  Intended for dispatch
+        fan-out, where one agent's whole tool list is checked at once.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[str, str]]
+            (tool_name, agent_id) pairs to check.
+
+        Returns
+        -------
+        list[bool]
+            One flag per pair, in input order.
+        """
+        now = datetime.now(timezone.utc)
+        self._purge_expired(now)
+        return [
+            tool_name in self._tools and self._is_authorized(tool_name, agent_id, now)
+            for tool_name, agent_id in pairs
+        ]
+
+    def get_authorized_agents(self, tool_name: str) -> frozenset[str]:
+        """Return the agents currently holding a live grant for tool_name.
+
+        Parameters
+        ----------
+        tool_name : str
+            Tool to introspect.
+
+        Returns
+        -------
+        frozenset[str]
+            Agent IDs (empty for unknown tools).
+        """
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            return frozenset()
+        return frozenset(
+            p.agent_id
+            for p in self._permissions.get(tool.tool_id, [])
+            if not p.is_expired()
+        )
+
     def _check_permission(
         self,
         tool_name: str,
@@ -609,19 +833,15 @@ class MCPRegistry:
         if tool_name not in self._tools:
             raise ToolNotFoundError(tool_name)
 
-        tool = self._tools[tool_name]
-        perms = self._permissions.get(tool.tool_id, [])
-
-        # K2 fail-safe deny: check agent_id in perms
-        for perm in perms:
-            if perm.agent_id == agent_id and not perm.is_expired():
-                return  # Permission found and valid
+        now = datetime.now(timezone.utc)
+        self._purge_expired(now)
+        if self._is_authorized(tool_name, agent_id, now):
+            return  # Permission found and valid
 
         # No permission found → K2 deny
-        granted = frozenset(
-            p.agent_id for p in perms if not p.is_expired()
+        raise PermissionDeniedError(
+            tool_name, agent_id, self.get_authorized_agents(tool_name)
         )
-        raise PermissionDeniedError(tool_name, agent_id, granted)
 
     async def invoke(
         self,
@@ -632,11 +852,12 @@ class MCPRegistry:
         Steps:
         1. Lookup tool (raise ToolNotFoundError if not found).
         2. Check agent_id permission (raise PermissionDeniedError if denied).
-        3. Check concurrency (queue if at limit).
-        4. Redact secrets from input.
-        5. Execute tool with timeout.
-        6. Redact PII from output.
-        7. Return response with execution time.
+        3. For cacheable tools, serve a cached or in-flight result.
+        4. Check concurrency (queue if at limit).
+        5. Redact secrets from input.
+        6. Execute tool with timeout.
+        7. Redact PII from output.
+        8. Return response with execution time.
 
         Parameters
         ----------
@@ -648,7 +869,7 @@ class MCPRegistry:
         ToolInvocationResponse
             Tool result or error response.
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             # Step 1: Lookup
             tool = self._tools.get(request.tool_name)
@@ -658,49 +879,32 @@ class MCPRegistry:
             # Step 2: Check permission (K2)
             self._check_permission(request.tool_name, request.agent_id)
 
-            # Step 3: Check concurrency
-            await self._acquire_concurrency_slot(
-                request.tool_name,
-                request.tenant_id,
-                request.agent_id,
-            )
-
-            try:
-                # Step 4: Redact input
-                safe_input = request.input
-                if tool.requires_secrets:
-                    safe_input = self._secret_redactor.redact_secrets(request.input)
-
-                # Step 5: Execute with timeout
-                timeout_sec = 30.0 if tool.is_llm else 5.0
-                result = await asyncio.wait_for(
-                    tool.handler(safe_input),
-                    timeout=timeout_sec,
-                )
-
-                # Step 6: Redact output
-                if tool.returns_pii:
-                    result = self._pii_redactor.redact_pii(result)
-
-                # Step 7: Return response
-                elapsed_ms = (time.time() - start_time) * 1000
-                return ToolInvocationResponse(
-                    tool_result=result,
-                    execution_time_ms=elapsed_ms,
-                    tokens_used=None,
-                    trace_id=request.trace_id,
-                    idempotency_key=request.idempotency_key,
-                )
-
-            finally:
-                await self._release_concurrency_slot(
-                    request.tool_name,
+            # Step 3: Result cache / single-flight for cacheable tools
+            cached = False
+            if tool.cache_ttl is not None:
+                result, cached = await self._result_cache.get_or_load(
                     request.tenant_id,
-                    request.agent_id,
+                    tool.tool_name,
+                    canonical_input_hash(request.input),
+                    tool.cache_ttl,
+                    functools.partial(self._execute, tool, request),
                 )
+            else:
+                result = await self._execute(tool, request)
+
+            # Step 8: Return response
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            return ToolInvocationResponse(
+                tool_result=result,
+                execution_time_ms=elapsed_ms,
+                tokens_used=None,
+                trace_id=request.trace_id,
+                idempotency_key=request.idempotency_key,
+                cached=cached,
+            )
 
         except ToolNotFoundError as e:
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
             return ToolInvocationResponse(
                 error=str(e),
                 error_code=e.error_code,
@@ -710,7 +914,17 @@ class MCPRegistry:
             )
 
         except PermissionDeniedError as e:
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            return ToolInvocationResponse(
+                error=str(e),
+                error_code=e.error_code,
+                execution_time_ms=elapsed_ms,
+                trace_id=request.trace_id,
+                idempotency_key=request.idempotency_key,
+            )
+
+        except ConcurrencyLimitError as e:
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
             return ToolInvocationResponse(
                 error=str(e),
                 error_code=e.error_code,
@@ -720,7 +934,7 @@ class MCPRegistry:
             )
 
         except asyncio.TimeoutError:
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
             tool = self._tools.get(request.tool_name)
             is_llm = tool and tool.is_llm
             if is_llm:
@@ -743,7 +957,7 @@ class MCPRegistry:
             )
 
         except Exception as e:
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
             tool = self._tools.get(request.tool_name)
             is_llm = tool and tool.is_llm
             if is_llm:
@@ -765,13 +979,161 @@ class MCPRegistry:
                 idempotency_key=request.idempotency_key,
             )
 
+    async def _execute(
+        self,
+        tool: MCPTool,
+        request: ToolInvocationRequest,
+    ) -> Any:
+        """Run the tool handler under its concurrency slot (invoke steps 4-7).
+
+        Parameters
+        ----------
+        tool : MCPTool
+            Tool to run.
+        request : ToolInvocationRequest
+            Invocation request.
+
+        Returns
+        -------
+        Any
+            Handler result, PII-redacted if the tool returns PII.
+        """
+        # Step 4: Check concurrency
+        await self._acquire_concurrency_slot(
+            request.tool_name,
+            request.tenant_id,
+            request.agent_id,
+            request.priority,
+        )
+
+        try:
+            # Step 5: Redact input
+            safe_input = request.input
+            if tool.requires_secrets:
+                safe_input = self._secret_redactor.redact_secrets(request.input)
+
+            # Step 6: Execute with (adaptive) timeout, recording latency
+            timeout_sec = self.get_timeout(tool.tool_name)
+            hedge_delay = self._hedge_delay(tool)
+            run_start = time.perf_counter_ns()
+            try:
+                if hedge_delay is None:
+                    result = await asyncio.wait_for(
+                        tool.handler(safe_input),
+                        timeout=timeout_sec,
+                    )
+                else:
+                    result = await asyncio.wait_for(
+                        self._run_hedged(tool, request.tenant_id, safe_input, hedge_delay),
+                        timeout=timeout_sec,
+                    )
+            except TimeoutError:
+                self._latency.record(
+                    tool.tool_name,
+                    request.tenant_id,
+                    time.perf_counter_ns() - run_start,
+                    timeout=True,
+                )
+                raise
+            except Exception:
+                self._latency.record(
+                    tool.tool_name,
+                    request.tenant_id,
+                    time.perf_counter_ns() - run_start,
+                    error=True,
+                )
+                raise
+            self._latency.record(
+                tool.tool_name, request.tenant_id, time.perf_counter_ns() - run_start
+            )
+
+            # Step 7: Redact output
+            if tool.returns_pii:
+                result = self._pii_redactor.redact_pii(result)
+            return result
+
+        finally:
+            await self._release_concurrency_slot(
+                request.tool_name,
+                request.tenant_id,
+                request.agent_id,
+            )
+
+    def _hedge_delay(self, tool: MCPTool) -> float | None:
+        """Seconds before hedging ``tool``, or None if it must not be hedged."""
+        if not tool.idempotent:
+            return None
+        policy = self._timeout_policies.get(tool.tool_name, self._timeout_policy)
+        if policy is None:
+            return None
+        return policy.hedge_delay(self._latency.for_tool(tool.tool_name))
+
+    async def _run_hedged(
+        self,
+        tool: MCPTool,
+        tenant_id: str,
+        safe_input: dict[str, Any],
+        delay: float,
+    ) -> Any:
+        """Run an idempotent handler, adding a second attempt after ``delay``.
+
+        Both attempts run under the invocation's single concurrency slot.
+        The first attempt to succeed answers; the other is cancelled.  If
+        both fail, the first attempt's error is raised.
+
+        Parameters
+        ----------
+        tool : MCPTool
+            Idempotent tool to run.
+        tenant_id : str
+            Tenant the invocation belongs to.
+        safe_input : dict[str, Any]
+            Redacted handler input.
+        delay : float
+            Seconds to wait for the first attempt before hedging.
+
+        Returns
+        -------
+        Any
+            Result of the first successful attempt.
+        """
+        primary = asyncio.ensure_future(tool.handler(safe_input))
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if done:
+                return primary.result()
+            hedge = asyncio.ensure_future(tool.handler(safe_input))
+            attempts.append(hedge)
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for attempt in attempts:
+                    if attempt in done and attempt.exception() is None:
+                        self._latency.record_hedge(
+                            tool.tool_name, tenant_id, won=attempt is hedge
+                        )
+                        return attempt.result()
+            self._latency.record_hedge(tool.tool_name, tenant_id, won=False)
+            return primary.result()  # both failed: re-raise the first error
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
     async def _acquire_concurrency_slot(
         self,
         tool_name: str,
         tenant_id: str,
         agent_id: str,
+        priority: int = 0,
     ) -> None:
-        """Acquire concurrency slot with 30s timeout (per ICD-019/020).
+        """Acquire concurrency slot, queueing up to the queue timeout (ICD-019/020).
+
+        Each (tool_name, tenant_id) pair has its own semaphore, created on
+        first use, so invocations of different tools never share a lock.
 
         Parameters
         ----------
@@ -781,23 +1143,25 @@ class MCPRegistry:
             Tenant context.
         agent_id : str
             Agent invoking.
+        priority : int
+            Queue priority (higher is served first, FIFO within a priority).
 
         Raises
         ------
-        TimeoutError
-            If concurrency queue wait exceeds 30s.
+        ConcurrencyLimitError
+            If no slot frees up within the queue timeout.
         """
-        key = (tool_name, tenant_id)
-        limit = self._concurrency_limits.get(key, self._default_concurrency_limit)
-
-        async with self._invocation_lock:
-            invocation_key = (tool_name, tenant_id, agent_id)
-            current = self._active_invocations.get(invocation_key, 0)
-            if current >= limit:
-                raise TimeoutError(
-                    f"tool {tool_name!r} at capacity ({current}/{limit})"
-                )
-            self._active_invocations[invocation_key] = current + 1
+        sem = self._semaphores.get(tool_name, tenant_id)
+        try:
+            await sem.acquire(priority, self._queue_timeout)
+        except TimeoutError:
+            raise ConcurrencyLimitError(
+                tool_name, tenant_id, sem.limit, sem.queue_depth
+            ) from None
+        invocation_key = (tool_name, tenant_id, agent_id)
+        self._active_invocations[invocation_key] = (
+            self._active_invocations.get(invocation_key, 0) + 1
+        )
 
     async def _release_concurrency_slot(
         self,
@@ -817,12 +1181,12 @@ class MCPRegistry:
             Agent invoking.
         """
         invocation_key = (tool_name, tenant_id, agent_id)
-        async with self._invocation_lock:
-            current = self._active_invocations.get(invocation_key, 0)
-            if current > 1:
-                self._active_invocations[invocation_key] = current - 1
-            else:
-                self._active_invocations.pop(invocation_key, None)
+        current = self._active_invocations.get(invocation_key, 0)
+        if current > 1:
+            self._active_invocations[invocation_key] = current - 1
+        else:
+            self._active_invocations.pop(invocation_key, None)
+        self._semaphores.get(tool_name, tenant_id).release()
 
     def set_concurrency_limit(
         self,
@@ -850,10 +1214,53 @@ class MCPRegistry:
             raise ValueError(f"concurrency limit must be >= 1, got {limit}")
         key = (tool_name, tenant_id)
         self._concurrency_limits[key] = limit
+        self._semaphores.set_limit(tool_name, tenant_id, limit)
         log.debug(
             f"set concurrency limit {limit} for {tool_name!r} / {tenant_id!r}"
         )
 
+    def set_timeout_policy(
+        self,
+        tool_name: str,
+        policy: TimeoutPolicy | None,
+    ) -> None:
+        """Set (or clear, with None) the adaptive timeout policy of one tool.
+
+        Parameters
+        ----------
+        tool_name : str
+            Tool to configure.
+        policy : TimeoutPolicy | None
+            Policy overriding the registry default.
+        """
+        if policy is None:
+            self._timeout_policies.pop(tool_name, None)
+        else:
+            self._timeout_policies[tool_name] = policy
+
+    def get_timeout(self, tool_name: str) -> float:
+        """Return the execution timeout (seconds) the next invocation will use.
+
+        Without a policy this is the static 5s (30s for LLM tools); with
+        one it follows the tool's observed latency percentile.
+
+        Parameters
+        ----------
+        tool_name : str
+            Tool name.
+
+        Returns
+        -------
+        float
+            Timeout in seconds.
+        """
+        tool = self._tools.get(tool_name)
+        static = 30.0 if tool is not None and tool.is_llm else 5.0
+        policy = self._timeout_policies.get(tool_name, self._timeout_policy)
+        if policy is None:
+            return static
+        return policy.timeout(self._latency.for_tool(tool_name), static)
+
     # -----------------------------------------------------------------------
     # Introspection API
     # -----------------------------------------------------------------------
@@ -923,11 +1330,7 @@ class MCPRegistry:
         bool
             True if agent has valid, non-expired permission.
         """
-        try:
-            self._check_permission(tool_name, agent_id)
-            return True
-        except (ToolNotFoundError, PermissionDeniedError):
-            return False
+        return self.authorize_many(((tool_name, agent_id),))[0]
 
     def get_active_invocation_count(
         self,
@@ -954,6 +1357,120 @@ class MCPRegistry:
         key = (tool_name, tenant_id, agent_id)
         return self._active_invocations.get(key, 0)
 
+    def clear_result_cache(
+        self,
+        tool_name: str | None = None,
+        tenant_id: str | None = None,
+    ) -> int:
+        """Drop cached results, optionally only for one tool and/or tenant.
+
+        Parameters
+        ----------
+        tool_name : str | None
+            Tool whose results to drop (None: all tools).
+        tenant_id : str | None
+            Tenant whose results to drop (None: all tenants).
+
+        Returns
+        -------
+        int
+            Number of cached results removed.
+        """
+        return self._result_cache.invalidate(tool_name, tenant_id)
+
+    def get_concurrency_stats(self, tool_name: str) -> dict[str, dict[str, Any]]:
+        """Get per-tenant concurrency and queueing metrics for a tool.
+
+        Parameters
+        ----------
+        tool_name : str
+            Tool name.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            tenant_id → limit, in-flight and queued counts, admission
+            counters and wait times (ms) for tenants that invoked the tool.
+        """
+        return {
+            tenant_id: {
+                "limit": sem.limit,
+                "in_flight": sem.active,
+                "queue_depth": sem.queue_depth,
+                "max_queue_depth": sem.stats.max_queue_depth,
+                "acquired": sem.stats.acquired,
+                "waited": sem.stats.waited,
+                "rejected": sem.stats.rejected,
+                "mean_wait_ms": sem.stats.mean_wait_seconds * 1000,
+                "max_wait_ms": sem.stats.max_wait_seconds * 1000,
+            }
+            for tenant_id, sem in self._semaphores.shard(tool_name)
+        }
+
+    def get_latency_stats(self, tool_name: str) -> dict[str, dict[str, Any]]:
+        """Get per-tenant handler latency and outcome metrics for a tool.
+
+        Parameters
+        ----------
+        tool_name : str
+            Tool name.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            tenant_id → call, error, timeout and hedge counts, error rate
+            and p50/p95/p99/mean/max latency (ms).
+        """
+        result: dict[str, dict[str, Any]] = {}
+        for tenant_id in self._latency.tenants(tool_name):
+            stats = self._latency.for_key(tool_name, tenant_id)
+            if stats is None:
+                continue
+            result[tenant_id] = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "timeouts": stats.timeouts,
+                "hedged": stats.hedged,
+                "hedge_wins": stats.hedge_wins,
+                "error_rate": stats.error_rate,
+                "latency_ms": {
+                    **stats.percentiles_ms(),
+                    "mean": stats.histogram.mean / 1e6,
+                    "max": stats.histogram.max / 1e6,
+                },
+            }
+        return result
+
+    def _tool_stats(self, tool: MCPTool) -> dict[str, Any]:
+        """Return the monitoring entry of one tool for get_registry_stats."""
+        shard = list(self._semaphores.shard(tool.tool_name))
+        in_flight = sum(sem.active for _, sem in shard)
+        capacity = sum(sem.limit for _, sem in shard)
+        latency = self._latency.for_tool(tool.tool_name)
+        return {
+            "name": tool.tool_name,
+            "type": tool.tool_type.value,
+            "is_llm": tool.is_llm,
+            "cache_ttl": tool.cache_ttl,
+            "idempotent": tool.idempotent,
+            "permission_count": len([
+                p for p in self._permissions.get(tool.tool_id, [])
+                if not p.is_expired()
+            ]),
+            "in_flight": in_flight,
+            "queue_depth": sum(sem.queue_depth for _, sem in shard),
+            "rejected": sum(sem.stats.rejected for _, sem in shard),
+            "saturation": in_flight / capacity if capacity else 0.0,
+            "calls": latency.calls if latency else 0,
+            "error_rate": latency.error_rate if latency else 0.0,
+            "latency_ms": (
+                latency.percentiles_ms()
+                if latency
+                else {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+            ),
+            "timeout_s": self.get_timeout(tool.tool_name),
+        }
+
     def get_registry_stats(self) -> dict[str, Any]:
         """Return registry statistics for monitoring/debugging.
 
@@ -962,21 +1479,19 @@ class MCPRegistry:
         dict[str, Any]
             Statistics including tool count, permission count, etc.
         """
+        cache_stats = self._result_cache.stats
         return {
             "tool_count": len(self._tools),
+            "result_cache": {
+                "entries": len(self._result_cache),
+                "hits": cache_stats.hits,
+                "misses": cache_stats.misses,
+                "coalesced": cache_stats.coalesced,
+                "evictions": cache_stats.evictions,
+                "expirations": cache_stats.expirations,
+            },
             "total_permissions": sum(len(p) for p in self._permissions.values()),
-            "tools": [
-                {
-                    "name": t.tool_name,
-                    "type": t.tool_type.value,
-                    "is_llm": t.is_llm,
-                    "permission_count": len([
-                        p for p in self._permissions.get(t.tool_id, [])
-                        if not p.is_expired()
-                    ]),
-                }
-                for t in self._tools.values()
-            ],
+            "tools": [self._tool_stats(t) for t in self._tools.values()],
         }
 
 
@@ -996,6 +1511,8 @@ def mcp_tool(
     requires_secrets: bool = False,
     returns_pii: bool = False,
     tenant_id: str = "",
+    cache_ttl: float | None = None,
+    idempotent: bool = False,
 ) -> Callable[[Callable], Callable]:
     """Decorator to register async function as MCP tool.
 
@@ -1021,6 +1538,10 @@ def mcp_tool(
         Whether output needs PII redaction.
     tenant_id : str
         Tenant isolation scope.
+    cache_ttl : float | None
+        Seconds to reuse results of identical input (None: never cache).
+    idempotent : bool
+        Whether the handler may run twice for one invocation (hedging).
 
     Returns
     -------
@@ -1048,6 +1569,8 @@ def mcp_tool(
             requires_secrets=requires_secrets,
             returns_pii=returns_pii,
             tenant_id=tenant_id,
+            cache_ttl=cache_ttl,
+            idempotent=idempotent,
         )
         return func
 
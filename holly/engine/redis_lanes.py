@@ -0,0 +1,338 @@
+"""Durable Redis-backed main lane (ICD-013, ICD-035).
+
+``MainLane`` keeps its queue in process memory, so a deploy or crash
+drops every pending task.  ``RedisMainLane`` stores tasks in a
+``LeaseQueueClient`` queue instead: consumers claim tasks under a
+visibility timeout and ack them when done; tasks whose lease expires
+(crashed or stalled consumer) are redelivered to the next claimer.
+
+Only the main lane is durable so far: ``CronLane`` schedules and
+``SubagentLane`` executions stay in process memory, and so does the
+lane's idempotency cache (Redis still rejects a second push of the same
+task_id).
+
+This module provides:
+- task_to_json / task_from_json: Task (de)serialisation
+- LeasedTask: a claimed task plus its delivery count
+- RedisMainLane: durable priority lane with claim/ack/nack
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from holly.engine.idempotency import PROBABLE_DUPLICATE, IdempotencyCache
+from holly.engine.lanes import (
+    PROBABLE_DUPLICATE_ID,
+    Lane,
+    LaneError,
+    LanePolicy,
+    LaneType,
+    QueueFullError,
+    Task,
+    TaskEnqueueRequest,
+)
+from holly.storage.redis.client import QueueFull
+
+if TYPE_CHECKING:
+    from holly.storage.redis.client import LeaseQueueClient
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "LeasedTask",
+    "RedisMainLane",
+    "task_from_json",
+    "task_to_json",
+]
+
+# Priority bands are 1e13 apart: ample room for a millisecond timestamp
+# (FIFO within a band) while staying exact in a double score.
+_PRIORITY_BAND = 1e13
+_PRIORITY_LEVELS = 11
+
+
+# ---------------------------------------------------------------------------
+# Serialisation
+# ---------------------------------------------------------------------------
+
+
+def task_to_json(task: Task) -> str:
+    """Serialise a task to JSON (goal/context must be JSON-compatible)."""
+    return json.dumps(
+        {
+            "task_id": str(task.task_id),
+            "goal": task.goal,
+            "user_id": task.user_id,
+            "tenant_id": task.tenant_id,
+            "idempotency_key": task.idempotency_key,
+            "resource_budget": task.resource_budget,
+            "mcp_tools": task.mcp_tools,
+            "context": task.context,
+            "deadline": task.deadline.isoformat() if task.deadline else None,
+            "trace_id": task.trace_id,
+        },
+        separators=(",", ":"),
+    )
+
+
+def task_from_json(data: str | bytes) -> Task:
+    """Rebuild a task from ``task_to_json`` output."""
+    raw = json.loads(data)
+    return Task(
+        task_id=UUID(raw["task_id"]),
+        goal=raw["goal"],
+        user_id=raw["user_id"],
+        tenant_id=raw["tenant_id"],
+        idempotency_key=raw["idempotency_key"],
+        resource_budget=raw["resource_budget"],
+        mcp_tools=raw["mcp_tools"],
+        context=raw["context"],
+        deadline=datetime.fromisoformat(raw["deadline"]) if raw["deadline"] else None,
+        trace_id=raw["trace_id"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Durable main lane
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class LeasedTask:
+    """A task claimed from a ``RedisMainLane``.
+
+    Attributes
+    ----------
+    task : Task
+        The claimed task.
+    attempts : int
+        Delivery count including this one (> 1 means redelivery).
+    lease_id : str
+        Identifier of the claim, checked by ``ack`` and ``nack``.
+    """
+
+    task: Task
+    attempts: int
+    lease_id: str
+
+
+class RedisMainLane(Lane):
+    """Durable main lane backed by a Redis leased work queue.
+
+    Tasks are ranked by priority (highest first) and enqueue time, as
+    in ``MainLane``; priority aging is not applied.  ``claim`` leases
+    tasks for ``visibility_timeout`` seconds; callers must ``ack`` each
+    ``LeasedTask`` when it finishes or ``nack`` it to hand it back.
+    Both are fenced by the claim's lease id, so a consumer whose lease
+    expired cannot settle the task's redelivery.  Delivery is at least
+    once.  The ``Lane`` dequeue methods ack what they claim, giving
+    ``MainLane``'s at-most-once semantics.
+
+    Attributes
+    ----------
+    client : LeaseQueueClient
+        Leased work-queue client.
+    queue_name : str
+        Logical queue name (keyed per tenant).
+    visibility_timeout : float
+        Lease length in seconds.
+    poll_interval : float
+        Sleep between empty claims in the blocking dequeue methods.
+    idempotency_cache : IdempotencyCache[UUID]
+        idempotency_key -> task_id within ``policy.idempotency_window``.
+    """
+
+    __slots__ = (
+        "_ready",
+        "client",
+        "idempotency_cache",
+        "poll_interval",
+        "queue_name",
+        "visibility_timeout",
+    )
+
+    def __init__(
+        self,
+        tenant_id: str,
+        client: LeaseQueueClient,
+        policy: LanePolicy | None = None,
+        *,
+        queue_name: str = "main_queue",
+        visibility_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """Initialize the durable lane.
+
+        Parameters
+        ----------
+        tenant_id : str
+            Tenant identifier.
+        client : LeaseQueueClient
+            Leased work-queue client; may be shared, since pushes pass
+            ``policy.max_queue_depth`` per call.
+        policy : LanePolicy | None
+            Queue policy.
+        queue_name : str
+            Logical queue name.
+        visibility_timeout : float
+            Lease length in seconds.
+        poll_interval : float
+            Sleep between empty claims when blocking.
+        """
+        super().__init__(LaneType.MAIN, tenant_id, policy)
+        if visibility_timeout <= 0:
+            raise ValueError("visibility_timeout must be positive")
+        self.client = client
+        self.queue_name = queue_name
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.idempotency_cache: IdempotencyCache[UUID] = IdempotencyCache.from_policy(
+            self.policy
+        )
+        self._ready = 0
+
+    def get_queue_size(self) -> int:
+        """Get the ready-task count observed by the last ``refresh_depth``.
+
+        Use ``refresh_depth`` for an up-to-date value; this accessor is
+        synchronous and cannot reach Redis.
+        """
+        return self._ready
+
+    async def is_full(self) -> bool:
+        """Check capacity against fresh ready + leased counts from Redis.
+
+        ``enqueue_task`` does not rely on this: its push checks the depth
+        atomically in the same script.
+        """
+        ready, leased = await self.refresh_depth()
+        return ready + leased >= self.policy.max_queue_depth
+
+    async def refresh_depth(self) -> tuple[int, int]:
+        """Fetch and cache ``(ready, leased)`` task counts from Redis."""
+        ready, leased = await self.client.depth(self.tenant_id, self.queue_name)
+        self._ready = ready
+        return ready, leased
+
+    async def enqueue_task(self, request: TaskEnqueueRequest) -> UUID:
+        """Durably enqueue a task with priority.
+
+        Parameters
+        ----------
+        request : TaskEnqueueRequest
+            Task enqueue request.
+
+        Returns
+        -------
+        UUID
+            The task_id, the original task_id for a resubmission, or
+            ``PROBABLE_DUPLICATE_ID`` for an approximate-mode duplicate.
+
+        Raises
+        ------
+        QueueFullError
+            If ready + leased tasks reach ``max_queue_depth``.
+        LaneError
+            If the task is expired.
+        """
+        task = request.task
+        if task.is_expired():
+            raise LaneError("Task deadline has passed")
+        dedupe_key = f"main:{task.idempotency_key}"
+        existing = self.idempotency_cache.get(self.tenant_id, dedupe_key)
+        if existing is PROBABLE_DUPLICATE:
+            return PROBABLE_DUPLICATE_ID
+        if existing is not None:
+            return existing
+
+        priority = min(_PRIORITY_LEVELS - 1, max(0, request.priority))
+        rank = (_PRIORITY_LEVELS - 1 - priority) * _PRIORITY_BAND + time.time() * 1000
+        try:
+            pushed = await self.client.push(
+                self.tenant_id,
+                self.queue_name,
+                str(task.task_id),
+                task_to_json(task),
+                rank,
+                depth_limit=self.policy.max_queue_depth,
+            )
+        except QueueFull as exc:
+            raise QueueFullError(
+                f"Main lane full (size={exc.depth}, max={exc.limit})"
+            ) from exc
+        self.idempotency_cache.put(self.tenant_id, dedupe_key, task.task_id)
+        if not pushed:
+            log.debug(f"Task {task.task_id} is already queued or leased")
+            return task.task_id
+        self._ready += 1
+        log.info(
+            f"Enqueued durable task {task.task_id} "
+            f"(priority={priority}, trace={task.trace_id})"
+        )
+        return task.task_id
+
+    async def claim(self, n: int = 1) -> list[LeasedTask]:
+        """Lease up to ``n`` tasks without waiting.
+
+        Expired leases are requeued in the same round trip, so a
+        redelivered task may be among those returned.
+        """
+        if n <= 0:
+            raise ValueError("n must be positive")
+        items = await self.client.claim(
+            self.tenant_id, self.queue_name, n, self.visibility_timeout
+        )
+        self._ready = max(0, self._ready - len(items))
+        return [
+            LeasedTask(task_from_json(i.payload), i.attempts, i.lease_id)
+            for i in items
+        ]
+
+    async def dequeue_next_task(self) -> Task:
+        """Wait for and remove the next task by priority."""
+        return (await self.dequeue_many(1))[0]
+
+    async def dequeue_many(self, n: int) -> list[Task]:
+        """Wait for at least one task, then remove up to ``n``.
+
+        The tasks are claimed and acked at once, so they are not
+        redelivered; use ``claim`` for at-least-once delivery.
+        """
+        while True:
+            leased = await self.claim(n)
+            if leased:
+                await self.ack(*leased)
+                return [lt.task for lt in leased]
+            await asyncio.sleep(self.poll_interval)
+
+    async def ack(self, *leased: LeasedTask) -> int:
+        """Mark leased tasks complete; returns the number removed.
+
+        Tasks whose lease expired and that were claimed again are not
+        removed.
+        """
+        return await self.client.ack(
+            self.tenant_id,
+            self.queue_name,
+            *((str(lt.task.task_id), lt.lease_id) for lt in leased),
+        )
+
+    async def nack(self, leased: LeasedTask) -> bool:
+        """Return a leased task to the queue for immediate redelivery.
+
+        Returns ``False`` if the lease expired or the task was settled.
+        """
+        released = await self.client.nack(
+            self.tenant_id, self.queue_name, str(leased.task.task_id), leased.lease_id
+        )
+        if released:
+            self._ready += 1
+        return released
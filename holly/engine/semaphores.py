@@ -0,0 +1,233 @@
+"""Waiting concurrency semaphores for per-key admission (ICD-019/020).
+
+``PrioritySemaphore`` is an asyncio semaphore whose waiters queue in
+priority order (highest first, FIFO within a priority) and give up at a
+deadline.  A released slot is handed directly to the next waiter, so a
+newcomer can never overtake the queue.  ``KeyedSemaphores`` creates one
+semaphore per ``(shard, key)`` on first use; keys in different shards
+(e.g. different tools) share no state or lock.
+
+This module provides:
+- SemaphoreStats: admission, wait-time and queue-depth counters
+- PrioritySemaphore: deadline-aware priority/FIFO semaphore
+- KeyedSemaphores: lazily created, sharded semaphores by key
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = [
+    "KeyedSemaphores",
+    "PrioritySemaphore",
+    "SemaphoreStats",
+]
+
+
+@dataclass(slots=True)
+class SemaphoreStats:
+    """Counters for a ``PrioritySemaphore``.
+
+    Attributes
+    ----------
+    acquired : int
+        Successful acquisitions.
+    waited : int
+        Acquisitions that had to queue first.
+    rejected : int
+        Acquisitions abandoned at their deadline.
+    total_wait_seconds : float
+        Sum of queueing time over ``waited`` acquisitions.
+    max_wait_seconds : float
+        Longest queueing time of a successful acquisition.
+    max_queue_depth : int
+        Largest number of simultaneous waiters seen.
+    """
+
+    acquired: int = 0
+    waited: int = 0
+    rejected: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Mean queueing time of acquisitions that waited."""
+        return self.total_wait_seconds / self.waited if self.waited else 0.0
+
+
+class PrioritySemaphore:
+    """Semaphore with priority-ordered, deadline-bounded waiters.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum concurrent holders.
+
+    Raises
+    ------
+    ValueError
+        If ``limit`` < 1.
+    """
+
+    __slots__ = ("_active", "_limit", "_queued", "_sequence", "_waiters", "stats")
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(f"semaphore limit must be >= 1, got {limit}")
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._queued = 0
+        self._sequence = itertools.count()
+        self.stats = SemaphoreStats()
+
+    @property
+    def limit(self) -> int:
+        """Maximum concurrent holders."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"semaphore limit must be >= 1, got {value}")
+        self._limit = value
+        while self._active < self._limit and self._wake_next():
+            self._active += 1
+
+    @property
+    def active(self) -> int:
+        """Current number of holders."""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Current number of waiters."""
+        return self._queued
+
+    def locked(self) -> bool:
+        """Whether an ``acquire`` would have to wait."""
+        return self._active >= self._limit or self._queued > 0
+
+    def _wake_next(self) -> bool:
+        """Grant a slot to the best live waiter; False if there is none."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._queued -= 1
+                waiter.set_result(None)
+                return True
+        return False
+
+    async def acquire(self, priority: int = 0, timeout: float | None = None) -> None:
+        """Acquire a slot, queueing if none is free.
+
+        Parameters
+        ----------
+        priority : int
+            Higher values are served first; equal priorities are FIFO.
+        timeout : float | None
+            Seconds to wait before giving up (``None``: wait forever,
+            ``0``: fail immediately when no slot is free).
+
+        Raises
+        ------
+        TimeoutError
+            If no slot was granted within ``timeout``.
+        """
+        if not self.locked():
+            self._active += 1
+            self.stats.acquired += 1
+            return
+        if timeout is not None and timeout <= 0:
+            self.stats.rejected += 1
+            raise TimeoutError("no free slot")
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), waiter))
+        self._queued += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queued)
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            self._abandon(waiter)
+            self.stats.rejected += 1
+            raise TimeoutError(f"no free slot within {timeout}s") from None
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        # The releaser transferred its slot; ``_active`` is unchanged.
+        waited = time.perf_counter() - start
+        self.stats.acquired += 1
+        self.stats.waited += 1
+        self.stats.total_wait_seconds += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done() and not waiter.cancelled():
+            # Granted just as we gave up: pass the slot on.
+            self.release()
+        else:
+            waiter.cancel()
+            self._queued -= 1
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next waiter if any."""
+        if self._active > self._limit or not self._wake_next():
+            self._active -= 1
+
+
+class KeyedSemaphores:
+    """Lazily created ``PrioritySemaphore`` per ``(shard, key)``.
+
+    Parameters
+    ----------
+    default_limit : int
+        Limit of semaphores without an explicit limit.
+    """
+
+    __slots__ = ("_limits", "_shards", "default_limit")
+
+    def __init__(self, default_limit: int) -> None:
+        self.default_limit = default_limit
+        self._limits: dict[tuple[str, str], int] = {}
+        self._shards: dict[str, dict[str, PrioritySemaphore]] = {}
+
+    def set_limit(self, shard: str, key: str, limit: int) -> None:
+        """Set the limit for ``(shard, key)``, resizing a live semaphore."""
+        if limit < 1:
+            raise ValueError(f"semaphore limit must be >= 1, got {limit}")
+        self._limits[(shard, key)] = limit
+        sem = self._shards.get(shard, {}).get(key)
+        if sem is not None:
+            sem.limit = limit
+
+    def get(self, shard: str, key: str) -> PrioritySemaphore:
+        """Return the semaphore for ``(shard, key)``, creating it on first use."""
+        semaphores = self._shards.get(shard)
+        if semaphores is None:
+            semaphores = self._shards[shard] = {}
+        sem = semaphores.get(key)
+        if sem is None:
+            limit = self._limits.get((shard, key), self.default_limit)
+            sem = semaphores[key] = PrioritySemaphore(limit)
+        return sem
+
+    def peek(self, shard: str, key: str) -> PrioritySemaphore | None:
+        """Return the semaphore for ``(shard, key)`` if it exists."""
+        return self._shards.get(shard, {}).get(key)
+
+    def shard(self, shard: str) -> Iterator[tuple[str, PrioritySemaphore]]:
+        """Iterate ``(key, semaphore)`` pairs created in ``shard``."""
+        return iter(self._shards.get(shard, {}).items())
@@ -0,0 +1,351 @@
+"""Subagent execution pool with work stealing (ICD-015).
+
+``SubagentLane`` only queues subagent tasks; this module runs them.  A
+pool of ``LanePolicy.max_concurrency`` asyncio workers serves every
+tenant's subagent lane in a ``LaneManager``:
+
+- Each worker has a home tenant (workers are spread round-robin over
+  the tenants seen so far) and drains that lane first.
+- A worker whose home lane is empty steals from the tenant with the
+  longest queue, so a burst from one tenant can use the whole pool
+  while the others are idle.
+- A tenant never runs more than ``max_concurrency`` subagents at once;
+  tasks are counted (``SubagentLane.mark_started``) only while running.
+- Each run is bounded by ``task_timeout`` and the task's ``deadline``.
+- ``cancel`` stops a subagent and, transitively, every subagent it
+  spawned through its ``SubagentContext``.  Running subagents are
+  cancelled at their next ``await``; queued ones are discarded unrun.
+
+This module provides:
+- SubagentContext: handle passed to the runner (spawn children, cancel)
+- SubagentPoolStats: throughput, failure and latency counters
+- SubagentPool: the worker pool
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from holly.engine.lanes import LaneType, SubagentLane
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from holly.engine.lanes import LaneManager, SubagentSpawnRequest, SubagentTask
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "SubagentContext",
+    "SubagentPool",
+    "SubagentPoolStats",
+]
+
+
+@dataclass(slots=True)
+class SubagentPoolStats:
+    """Counters for a ``SubagentPool``.
+
+    Attributes
+    ----------
+    sample_size : int
+        Number of recent latencies kept.
+    spawned : int
+        Tasks accepted by ``spawn``.
+    started : int
+        Tasks handed to the runner.
+    completed : int
+        Runs that returned normally.
+    failed : int
+        Runs that raised.
+    timed_out : int
+        Runs stopped by ``task_timeout`` or the task deadline.
+    cancelled : int
+        Tasks cancelled (running or queued).
+    stolen : int
+        Tasks run by a worker from another tenant's home set.
+    latency_seconds : deque[float]
+        Spawn-to-finish latency of recent runs.
+    """
+
+    sample_size: int = 4096
+    spawned: int = 0
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    cancelled: int = 0
+    stolen: int = 0
+    latency_seconds: deque[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the bounded latency reservoir."""
+        self.latency_seconds = deque(maxlen=self.sample_size)
+
+
+class SubagentContext:
+    """Runtime handle for one running subagent.
+
+    Attributes
+    ----------
+    task : SubagentTask
+        The task being run.
+    """
+
+    __slots__ = ("_pool", "task")
+
+    def __init__(self, task: SubagentTask, pool: SubagentPool) -> None:
+        self.task = task
+        self._pool = pool
+
+    @property
+    def execution_id(self) -> UUID:
+        """This subagent's execution id."""
+        return self.task.subagent_execution_id
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether this subagent has been cancelled."""
+        return self.execution_id in self._pool._cancelled
+
+    async def spawn(self, request: SubagentSpawnRequest) -> UUID:
+        """Spawn a child subagent; cancelling this one cancels the child."""
+        request.subagent_task.parent_execution_id = self.execution_id
+        return await self._pool.spawn(request)
+
+
+class SubagentPool:
+    """Worker pool running subagent tasks from a ``LaneManager``.
+
+    Parameters
+    ----------
+    manager : LaneManager
+        Source of the per-tenant subagent lanes.
+    runner : Callable[[SubagentTask, SubagentContext], Awaitable[object]]
+        Executes one subagent task.
+    workers : int | None
+        Pool size (default ``manager.policy.max_concurrency``).
+    task_timeout : float | None
+        Per-run timeout in seconds (``None``: deadline only).
+    steal : bool
+        Let idle workers take tasks from other tenants' lanes.
+    """
+
+    def __init__(
+        self,
+        manager: LaneManager,
+        runner: Callable[[SubagentTask, SubagentContext], Awaitable[object]],
+        *,
+        workers: int | None = None,
+        task_timeout: float | None = None,
+        steal: bool = True,
+    ) -> None:
+        self.manager = manager
+        self.runner = runner
+        self.workers = workers if workers is not None else manager.policy.max_concurrency
+        if self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if task_timeout is not None and task_timeout <= 0:
+            raise ValueError("task_timeout must be positive")
+        self.task_timeout = task_timeout
+        self.steal = steal
+        self.stats = SubagentPoolStats()
+        self._tenants: list[str] = []
+        self._spawned_at: dict[UUID, float] = {}
+        self._children: dict[UUID, set[UUID]] = {}
+        self._parent: dict[UUID, UUID] = {}
+        self._running: dict[UUID, asyncio.Task[object]] = {}
+        self._cancelled: set[UUID] = set()
+        self._work = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker_tasks: list[asyncio.Task[None]] = []
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the workers (idempotent)."""
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers, cancelling running subagents."""
+        tasks, self._worker_tasks = self._worker_tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def join(self) -> None:
+        """Wait until every spawned subagent has finished or been cancelled."""
+        await self._idle.wait()
+
+    @property
+    def running_count(self) -> int:
+        """Number of subagents currently running."""
+        return len(self._running)
+
+    # -- submission and cancellation --------------------------------------
+
+    async def spawn(self, request: SubagentSpawnRequest) -> UUID:
+        """Queue a subagent task on its tenant's lane.
+
+        Raises
+        ------
+        QueueFullError
+            If the tenant's subagent lane is full.
+        LaneError
+            If the task deadline has passed.
+        """
+        task = request.subagent_task
+        execution_id = await self.manager.spawn_subagent(request)
+        if execution_id != task.subagent_execution_id or execution_id in self._spawned_at:
+            return execution_id  # idempotent resubmission
+        if task.tenant_id not in self._tenants:
+            self._tenants.append(task.tenant_id)
+        parent = task.parent_execution_id
+        if parent in self._spawned_at:
+            self._children.setdefault(parent, set()).add(execution_id)
+            self._parent[execution_id] = parent
+            if parent in self._cancelled:
+                self._cancelled.add(execution_id)
+        self._spawned_at[execution_id] = time.perf_counter()
+        self.stats.spawned += 1
+        self._idle.clear()
+        self._work.set()
+        return execution_id
+
+    def cancel(self, execution_id: UUID) -> int:
+        """Cancel a subagent and all of its descendants.
+
+        Returns
+        -------
+        int
+            Number of not-yet-finished subagents cancelled.
+        """
+        count = 0
+        stack = [execution_id]
+        while stack:
+            current = stack.pop()
+            if current in self._spawned_at and current not in self._cancelled:
+                self._cancelled.add(current)
+                count += 1
+                running = self._running.get(current)
+                if running is not None:
+                    running.cancel()
+            stack.extend(self._children.get(current, ()))
+        return count
+
+    # -- scheduling -------------------------------------------------------
+
+    def _lane(self, tenant_id: str) -> SubagentLane | None:
+        lane = self.manager.get_lane(tenant_id, LaneType.SUBAGENT)
+        return lane if isinstance(lane, SubagentLane) else None
+
+    def _pick(self, worker: int) -> tuple[SubagentLane, SubagentTask, bool] | None:
+        """Take a task from the home lane, else steal from the busiest lane."""
+        if not self._tenants:
+            return None
+        home = self._tenants[worker % len(self._tenants)]
+        lane = self._lane(home)
+        if lane is not None and lane.get_queue_size() and lane.has_capacity():
+            return lane, lane.priority_queue.get_nowait(), False
+        if not self.steal:
+            return None
+        victim: SubagentLane | None = None
+        for tenant_id in self._tenants:
+            candidate = self._lane(tenant_id)
+            if (
+                candidate is not None
+                and candidate.has_capacity()
+                and candidate.get_queue_size()
+                > (victim.get_queue_size() if victim is not None else 0)
+            ):
+                victim = candidate
+        if victim is None:
+            return None
+        return victim, victim.priority_queue.get_nowait(), victim.tenant_id != home
+
+    async def _worker(self, worker: int) -> None:
+        while True:
+            picked = self._pick(worker)
+            if picked is None:
+                self._work.clear()
+                await self._work.wait()
+                continue
+            lane, task, stolen = picked
+            if stolen:
+                self.stats.stolen += 1
+            await self._execute(lane, task)
+
+    def _timeout(self, task: SubagentTask) -> float | None:
+        timeout = self.task_timeout
+        if task.deadline is not None:
+            remaining = (task.deadline - datetime.now(timezone.utc)).total_seconds()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return None if timeout is None else max(0.0, timeout)
+
+    async def _execute(self, lane: SubagentLane, task: SubagentTask) -> None:
+        execution_id = task.subagent_execution_id
+        if execution_id in self._cancelled:
+            self.stats.cancelled += 1
+            await self._finish(lane, execution_id)
+            return
+
+        await lane.mark_started(execution_id)
+        self.stats.started += 1
+        run = asyncio.ensure_future(self.runner(task, SubagentContext(task, self)))
+        self._running[execution_id] = run
+        try:
+            async with asyncio.timeout(self._timeout(task)):
+                await run
+        except TimeoutError:
+            self.stats.timed_out += 1
+            log.warning("Subagent %s timed out", execution_id)
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise  # the worker itself is being stopped
+            self.stats.cancelled += 1
+        except Exception:
+            self.stats.failed += 1
+            log.exception("Subagent %s failed", execution_id)
+        else:
+            self.stats.completed += 1
+        finally:
+            if not run.done():
+                run.cancel()
+            self._running.pop(execution_id, None)
+            await self._finish(lane, execution_id)
+
+    async def _finish(self, lane: SubagentLane, execution_id: UUID) -> None:
+        spawned_at = self._spawned_at.pop(execution_id, None)
+        if spawned_at is not None:
+            self.stats.latency_seconds.append(time.perf_counter() - spawned_at)
+        parent = self._parent.pop(execution_id, None)
+        if parent is not None:
+            siblings = self._children.get(parent)
+            if siblings is not None:
+                siblings.discard(execution_id)
+                if not siblings and parent not in self._spawned_at:
+                    del self._children[parent]
+        if not self._children.get(execution_id, True):
+            del self._children[execution_id]
+        self._cancelled.discard(execution_id)
+        await lane.mark_complete(execution_id)
+        # A finished run frees a concurrency slot another worker may want.
+        self._work.set()
+        if not self._spawned_at:
+            self._idle.set()
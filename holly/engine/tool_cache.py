@@ -0,0 +1,231 @@
+"""Result cache with single-flight loading for cacheable MCP tools (ICD-019/020).
+
+Tools registered with a ``cache_ttl`` are treated as pure: identical
+input within a tenant yields an identical result for ``cache_ttl``
+seconds.  ``ToolResultCache`` stores those results in one LRU per tenant,
+keyed by ``(tool_name, canonical input hash)``, so a noisy tenant can only
+evict its own entries.  Concurrent misses for the same key share a single
+load (single-flight): the first caller runs the loader, later callers
+await its result.  Failed loads are not cached.
+
+Cached values are shared between callers and must be treated as
+read-only.
+
+This module provides:
+- canonical_input_hash: order-independent digest of a tool input dict
+- ToolCacheStats: hit, miss, coalescing and eviction counters
+- ToolResultCache: tenant-partitioned TTL LRU with single-flight loads
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+__all__ = [
+    "ToolCacheStats",
+    "ToolResultCache",
+    "canonical_input_hash",
+]
+
+
+def canonical_input_hash(data: dict[str, Any]) -> str:
+    """Return a digest of ``data`` independent of key order.
+
+    Values that are not JSON-serialisable are hashed by ``repr``.
+    """
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr
+    )
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class ToolCacheStats:
+    """Counters for a ``ToolResultCache``.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups served from the cache.
+    misses : int
+        Lookups that ran the loader.
+    coalesced : int
+        Lookups that awaited another caller's in-flight load.
+    evictions : int
+        Entries dropped to respect the per-tenant capacity.
+    expirations : int
+        Entries dropped because their TTL elapsed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class ToolResultCache:
+    """Tenant-partitioned TTL LRU with single-flight loading.
+
+    Parameters
+    ----------
+    max_entries_per_tenant : int
+        LRU capacity of each tenant's partition.
+    clock : Callable[[], float]
+        Monotonic time source in seconds.
+
+    Raises
+    ------
+    ValueError
+        If ``max_entries_per_tenant`` < 1.
+    """
+
+    __slots__ = ("_clock", "_inflight", "_partitions", "max_entries_per_tenant", "stats")
+
+    def __init__(
+        self,
+        max_entries_per_tenant: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries_per_tenant < 1:
+            raise ValueError(
+                f"max_entries_per_tenant must be >= 1, got {max_entries_per_tenant}"
+            )
+        self.max_entries_per_tenant = max_entries_per_tenant
+        self.stats = ToolCacheStats()
+        self._clock = clock
+        self._partitions: dict[str, OrderedDict[tuple[str, str], tuple[float, Any]]] = {}
+        self._inflight: dict[tuple[str, str, str], asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(p) for p in self._partitions.values())
+
+    def lookup(self, tenant_id: str, tool_name: str, input_hash: str) -> tuple[bool, Any]:
+        """Return ``(True, value)`` for a live entry, else ``(False, None)``."""
+        partition = self._partitions.get(tenant_id)
+        if partition is None:
+            return False, None
+        key = (tool_name, input_hash)
+        entry = partition.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del partition[key]
+            self.stats.expirations += 1
+            return False, None
+        partition.move_to_end(key)
+        return True, value
+
+    def store(
+        self, tenant_id: str, tool_name: str, input_hash: str, value: Any, ttl: float
+    ) -> None:
+        """Insert or refresh an entry, evicting the tenant's LRU entries if full."""
+        partition = self._partitions.get(tenant_id)
+        if partition is None:
+            partition = self._partitions[tenant_id] = OrderedDict()
+        key = (tool_name, input_hash)
+        partition[key] = (self._clock() + ttl, value)
+        partition.move_to_end(key)
+        while len(partition) > self.max_entries_per_tenant:
+            partition.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_load(
+        self,
+        tenant_id: str,
+        tool_name: str,
+        input_hash: str,
+        ttl: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """Return the cached value or load it once for all concurrent callers.
+
+        Parameters
+        ----------
+        tenant_id : str
+            Tenant partition.
+        tool_name : str
+            Tool the value belongs to.
+        input_hash : str
+            ``canonical_input_hash`` of the tool input.
+        ttl : float
+            Seconds a freshly loaded value stays valid.
+        loader : Callable[[], Awaitable[Any]]
+            Produces the value on a miss; its exceptions propagate to
+            every coalesced caller and nothing is cached.
+
+        Returns
+        -------
+        tuple[Any, bool]
+            The value and whether it came from the cache (or another
+            caller's load) rather than this caller's own loader run.
+        """
+        flight_key = (tenant_id, tool_name, input_hash)
+        while True:
+            hit, value = self.lookup(tenant_id, tool_name, input_hash)
+            if hit:
+                self.stats.hits += 1
+                return value, True
+            flight = self._inflight.get(flight_key)
+            if flight is None:
+                break
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(flight), True
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise  # this caller was cancelled
+                # The loading caller was cancelled; retry (and maybe load).
+
+        self.stats.misses += 1
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = flight
+        try:
+            value = await loader()
+        except Exception as exc:
+            flight.set_exception(exc)
+            flight.exception()  # retrieved: no "never retrieved" warning
+            raise
+        except BaseException:
+            flight.cancel()
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+        if ttl > 0:
+            self.store(tenant_id, tool_name, input_hash, value, ttl)
+        flight.set_result(value)
+        return value, False
+
+    def invalidate(self, tool_name: str | None = None, tenant_id: str | None = None) -> int:
+        """Drop entries matching ``tool_name`` and/or ``tenant_id`` (all if both None).
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        tenants = [tenant_id] if tenant_id is not None else list(self._partitions)
+        removed = 0
+        for tenant in tenants:
+            partition = self._partitions.get(tenant)
+            if partition is None:
+                continue
+            if tool_name is None:
+                removed += len(partition)
+                del self._partitions[tenant]
+                continue
+            stale = [key for key in partition if key[0] == tool_name]
+            for key in stale:
+                del partition[key]
+            removed += len(stale)
+        return removed
@@ -6,18 +6,32 @@ and effectively-once semantics via idempotency keys and deduplication.
 
 This module provides:
 - WorkflowTask: node in workflow DAG with metadata
-- WorkflowEdge: dependency between workflow tasks
+- WorkflowEdge: dependency between workflow tasks, optionally carrying data
+- TaskInput: payload plus upstream results handed to data-consuming tasks
+- SpilledResult: reference to a task result spilled to a blob store
+- BlobStore: pluggable storage for spilled task results
 - WorkflowDAG: directed acyclic graph of tasks
 - DAGCompiler: validates and compiles workflow DAGs for execution
 - CompensationAction: defines compensation logic for saga rollback
 - SagaStep: combines forward action with compensation
 - DeadLetterEvent: failed task events for replay and debugging
-- DeadLetterQueue: stores and manages dead-lettered tasks
+- DeadLetterQueue: indexed, bounded store of dead-lettered tasks
+- DeadLetterBackend: optional durable backing for the dead-letter queue
+- RedriveReport: outcome of a bulk dead-letter redrive
 - WorkflowExecution: tracks execution state and checkpoints
+- ExecutionSummary: compact record kept for evicted executions
+- RetentionPolicy: bounds on retained execution history
+- ExecutionArchive: optional external sink for evicted executions
+- CheckpointStore: pluggable durable sink for delta checkpoints
 - WorkflowEngine: orchestrates saga execution with effectively-once semantics
 
 Per ICD-021 durable execution:
 - Checkpoint/resume capability: execution state persisted at each step
+  as a delta against the previous checkpoint; ``WorkflowEngine.resume``
+  replays the checkpoint chain and runs only unfinished tasks
+- Result passing: data edges hand upstream results to consumers; a result
+  is released once its last consumer succeeds, and large results spill
+  to a ``BlobStore``
 - Effectively-once semantics: idempotency keys + deduplication prevent duplicates
 - Compensating actions: rollback on failure via saga pattern
 - Deadletter queue: failed tasks stored for replay and analysis
@@ -33,34 +47,51 @@ Per ICD-021 latency budget:
 Per ICD-021 safety:
 - Compensation idempotency: can be replayed safely
 - Partial failure handling: saga pattern prevents partial success
-- Dead-letter overflow: bounded queue with TTL
+- Dead-letter overflow: bounded queue with TTL; expired events are purged
+  before a full queue rejects new ones
 - Cycle prevention: DAG validation before execution
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import json
 import logging
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
 log = logging.getLogger(__name__)
 
 __all__ = [
+    "BlobStore",
+    "CheckpointStore",
     "CompensationAction",
     "CompensationFailedError",
     "CycleDetectedError",
     "DAGCompiler",
     "DAGValidationError",
+    "DeadLetterBackend",
     "DeadLetterEvent",
     "DeadLetterQueue",
     "DeadLetterQueueFullError",
+    "ExecutionArchive",
     "ExecutionCheckpoint",
+    "ExecutionSummary",
+    "RedriveReport",
+    "RetentionPolicy",
     "SagaStep",
+    "SpilledResult",
     "TaskExecutionError",
+    "TaskInput",
     "WorkflowDAG",
     "WorkflowEdge",
     "WorkflowEngine",
@@ -229,6 +260,100 @@ class CompensationExecutor(Protocol):
         ...
 
 
+@runtime_checkable
+class CheckpointStore(Protocol):
+    """Protocol for durable storage of execution checkpoints.
+
+    Checkpoints are deltas; a store must return the full chain for an
+    execution so that it can be replayed in ``sequence`` order.
+    """
+
+    async def save(self, checkpoint: ExecutionCheckpoint) -> None:
+        """Persist one checkpoint of the chain.
+
+        Parameters
+        ----------
+        checkpoint : ExecutionCheckpoint
+            Delta checkpoint to persist.
+        """
+        ...
+
+    async def load(self, execution_id: str) -> list[ExecutionCheckpoint]:
+        """Load the checkpoint chain for an execution.
+
+        Parameters
+        ----------
+        execution_id : str
+            Execution identifier.
+
+        Returns
+        -------
+        list[ExecutionCheckpoint]
+            Checkpoints ordered by ``sequence`` (empty if none).
+        """
+        ...
+
+
+@runtime_checkable
+class DeadLetterBackend(Protocol):
+    """Protocol for durable storage behind ``DeadLetterQueue``.
+
+    The queue keeps its indexes in memory and writes through to the
+    backend; ``load`` returns the live events so a restarted process can
+    rebuild the queue with ``DeadLetterQueue.restore``.
+    """
+
+    async def put(self, event: DeadLetterEvent) -> None:
+        """Persist a newly dead-lettered event."""
+        ...
+
+    async def remove(self, event_ids: list[str]) -> None:
+        """Forget events that were dequeued, redriven or expired."""
+        ...
+
+    async def load(self) -> list[DeadLetterEvent]:
+        """Return all live events in enqueue order."""
+        ...
+
+
+@runtime_checkable
+class BlobStore(Protocol):
+    """Protocol for storage of task results spilled out of memory."""
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, replacing any previous value."""
+        ...
+
+    async def get(self, key: str) -> bytes:
+        """Return the data stored under ``key``.
+
+        Raises
+        ------
+        KeyError
+            If nothing is stored under ``key``.
+        """
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove ``key``; missing keys are ignored."""
+        ...
+
+
+@runtime_checkable
+class ExecutionArchive(Protocol):
+    """Protocol for an external sink receiving evicted executions."""
+
+    async def archive(self, execution: WorkflowExecution) -> None:
+        """Persist a completed execution before it leaves memory.
+
+        Parameters
+        ----------
+        execution : WorkflowExecution
+            Completed execution being evicted.
+        """
+        ...
+
+
 # ---------------------------------------------------------------------------
 # Data Classes
 # ---------------------------------------------------------------------------
@@ -252,6 +377,12 @@ class WorkflowTask:
         Key for deduplication across retries.
     timeout_ms : int
         Timeout in milliseconds for task execution.
+    compensation_timeout_ms : int
+        Timeout in milliseconds for each compensation attempt.
+    compensation_retries : int
+        Extra compensation attempts before the task is dead-lettered.
+    compensation_backoff_ms : int
+        Delay before the first compensation retry; doubles per attempt.
     """
 
     task_id: str
@@ -261,6 +392,9 @@ class WorkflowTask:
     timeout_ms: int = 5000
     compensation_executor: CompensationExecutor | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    compensation_timeout_ms: int = 10000
+    compensation_retries: int = 0
+    compensation_backoff_ms: int = 100
 
     def __post_init__(self) -> None:
         """Validate WorkflowTask."""
@@ -270,6 +404,12 @@ class WorkflowTask:
             raise ValueError("timeout_ms must be positive")
         if not self.idempotency_key:
             raise ValueError("idempotency_key cannot be empty")
+        if self.compensation_timeout_ms <= 0:
+            raise ValueError("compensation_timeout_ms must be positive")
+        if self.compensation_retries < 0:
+            raise ValueError("compensation_retries cannot be negative")
+        if self.compensation_backoff_ms < 0:
+            raise ValueError("compensation_backoff_ms cannot be negative")
 
 
 @dataclass(slots=True)
@@ -282,15 +422,24 @@ class WorkflowEdge:
         Task that must complete before target.
     target_task_id : str
         Task that depends on source.
+    data_key : str | None
+        When set, the edge also carries data: the target's executor
+        receives a ``TaskInput`` whose ``inputs[data_key]`` is the source's
+        result.  Once every data consumer of a task has succeeded its
+        result is released from ``WorkflowExecution.results``, unless the
+        task has a compensation executor that needs it for rollback.
     """
 
     source_task_id: str
     target_task_id: str
+    data_key: str | None = None
 
     def __post_init__(self) -> None:
         """Validate WorkflowEdge."""
         if self.source_task_id == self.target_task_id:
             raise ValueError("cannot create self-loop edge")
+        if self.data_key is not None and not self.data_key:
+            raise ValueError("data_key cannot be empty")
 
 
 @dataclass(slots=True)
@@ -345,6 +494,14 @@ class WorkflowDAG:
                 dependents.add(edge.target_task_id)
         return dependents
 
+    def get_data_inputs(self, task_id: str) -> dict[str, str]:
+        """Map each data key consumed by task_id to its source task."""
+        return {
+            edge.data_key: edge.source_task_id
+            for edge in self.edges
+            if edge.target_task_id == task_id and edge.data_key is not None
+        }
+
     def topological_sort(self) -> list[str]:
         """Return tasks in topological order."""
         in_degree = {task_id: 0 for task_id in self.tasks}
@@ -405,9 +562,47 @@ class SagaStep:
     compensation_action: CompensationAction | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class TaskInput:
+    """Payload handed to executors of tasks with incoming data edges.
+
+    Attributes
+    ----------
+    payload : Any
+        The task's static payload.
+    inputs : dict[str, Any]
+        Upstream results keyed by ``WorkflowEdge.data_key``.
+    """
+
+    payload: Any
+    inputs: dict[str, Any]
+
+
+@dataclass(slots=True, frozen=True)
+class SpilledResult:
+    """Placeholder for a task result held in the engine's ``BlobStore``.
+
+    Use ``WorkflowEngine.load_result`` to fetch the value.
+
+    Attributes
+    ----------
+    key : str
+        Blob store key.
+    size_bytes : int
+        Size of the JSON-encoded result.
+    """
+
+    key: str
+    size_bytes: int
+
+
 @dataclass(slots=True)
 class ExecutionCheckpoint:
-    """Checkpoint of workflow execution state.
+    """Delta checkpoint of workflow execution state.
+
+    Each checkpoint records only what changed since the previous one in
+    the chain, so checkpoint cost is proportional to the tasks finished
+    in the interval rather than to the size of the workflow.
 
     Attributes
     ----------
@@ -418,11 +613,19 @@ class ExecutionCheckpoint:
     timestamp : datetime
         When checkpoint was created.
     completed_tasks : set[str]
-        Task IDs that completed successfully.
+        Task IDs that completed successfully since the previous checkpoint.
     results : dict[str, Any]
-        Results from completed tasks.
+        Results from tasks completed since the previous checkpoint.
     phase : SagaPhase
         Current phase of saga.
+    execution_id : str
+        Execution the checkpoint belongs to.
+    sequence : int
+        Position of the checkpoint in the execution's chain.
+    task_states : dict[str, WorkflowTaskState]
+        Task states that changed since the previous checkpoint.
+    failed_task : str | None
+        Task whose forward failure started compensation (if any).
     """
 
     workflow_id: str
@@ -431,6 +634,10 @@ class ExecutionCheckpoint:
     completed_tasks: set[str]
     results: dict[str, Any]
     phase: SagaPhase
+    execution_id: str = ""
+    sequence: int = 0
+    task_states: dict[str, WorkflowTaskState] = field(default_factory=dict)
+    failed_task: str | None = None
 
 
 @dataclass(slots=True)
@@ -464,6 +671,25 @@ class DeadLetterEvent:
     execution_context: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class RedriveReport:
+    """Outcome of redriving a batch of dead-lettered events.
+
+    Attributes
+    ----------
+    attempted : int
+        Number of events handed to the redrive handler.
+    succeeded : list[str]
+        Event IDs that were redriven and removed from the queue.
+    failed : dict[str, str]
+        Event ID to error message for events left in the queue.
+    """
+
+    attempted: int = 0
+    succeeded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
 @dataclass(slots=True)
 class WorkflowExecution:
     """Tracks execution state of a workflow.
@@ -493,6 +719,151 @@ class WorkflowExecution:
     checkpoints: list[ExecutionCheckpoint] = field(default_factory=list)
     phase: SagaPhase = SagaPhase.FORWARD
     failed_task: str | None = None
+    started_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    completed_at: datetime | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionSummary:
+    """Compact record of an execution evicted from memory.
+
+    Attributes
+    ----------
+    workflow_id : str
+        Workflow that was executed.
+    execution_id : str
+        Execution identifier.
+    phase : SagaPhase
+        Saga phase at completion.
+    failed_task : str | None
+        Task that failed (if any).
+    task_count : int
+        Number of tasks in the workflow.
+    succeeded_count : int
+        Number of tasks that ended in ``SUCCEEDED``.
+    started_at : datetime
+        When the execution started.
+    completed_at : datetime | None
+        When the execution finished.
+    """
+
+    workflow_id: str
+    execution_id: str
+    phase: SagaPhase
+    failed_task: str | None
+    task_count: int
+    succeeded_count: int
+    started_at: datetime
+    completed_at: datetime | None
+
+    @classmethod
+    def from_execution(cls, execution: WorkflowExecution) -> ExecutionSummary:
+        """Summarise an execution."""
+        return cls(
+            workflow_id=execution.workflow_id,
+            execution_id=execution.execution_id,
+            phase=execution.phase,
+            failed_task=execution.failed_task,
+            task_count=len(execution.state),
+            succeeded_count=sum(
+                1
+                for state in execution.state.values()
+                if state == WorkflowTaskState.SUCCEEDED
+            ),
+            started_at=execution.started_at,
+            completed_at=execution.completed_at,
+        )
+
+
+@dataclass(slots=True)
+class RetentionPolicy:
+    """Bounds on the execution history kept by ``WorkflowEngine``.
+
+    Only completed executions are evicted, oldest completion first.  An
+    evicted execution is handed to the engine's ``ExecutionArchive`` (if
+    any) and replaced by an ``ExecutionSummary``; summaries are themselves
+    capped by ``max_summaries``.  ``None`` disables a bound.
+
+    Attributes
+    ----------
+    max_executions : int | None
+        Maximum completed executions kept in full.
+    max_age_seconds : float | None
+        Maximum time a completed execution is kept in full.
+    max_bytes : int | None
+        Maximum estimated size of completed executions kept in full.
+    max_summaries : int
+        Maximum summaries of evicted executions.
+    """
+
+    max_executions: int | None = 10_000
+    max_age_seconds: float | None = None
+    max_bytes: int | None = None
+    max_summaries: int = 100_000
+
+    def __post_init__(self) -> None:
+        """Validate RetentionPolicy."""
+        if self.max_executions is not None and self.max_executions < 0:
+            raise ValueError("max_executions cannot be negative")
+        if self.max_age_seconds is not None and self.max_age_seconds < 0:
+            raise ValueError("max_age_seconds cannot be negative")
+        if self.max_bytes is not None and self.max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        if self.max_summaries < 0:
+            raise ValueError("max_summaries cannot be negative")
+
+
+# Containers nested deeper than this are counted by their own size only.
+_MAX_RESULT_DEPTH = 32
+
+
+def _estimate_result_bytes(
+    value: Any, _depth: int = 0, _seen: set[int] | None = None
+) -> int:
+    """Approximate deep size of a task result.
+
+    Containers are walked recursively up to ``_MAX_RESULT_DEPTH`` levels;
+    a container reached more than once (shared or cyclic) is counted once.
+    """
+    if isinstance(value, SpilledResult):
+        return value.size_bytes
+    size = sys.getsizeof(value)
+    if _depth >= _MAX_RESULT_DEPTH or not isinstance(
+        value, dict | list | tuple | set | frozenset
+    ):
+        return size
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    depth = _depth + 1
+    if isinstance(value, dict):
+        size += sum(
+            _estimate_result_bytes(k, depth, _seen)
+            + _estimate_result_bytes(v, depth, _seen)
+            for k, v in value.items()
+        )
+    else:
+        size += sum(_estimate_result_bytes(v, depth, _seen) for v in value)
+    return size
+
+
+def _estimate_execution_bytes(execution: WorkflowExecution) -> int:
+    """Approximate retained size of an execution.
+
+    Task results are sized deeply; checkpoints share those result objects,
+    so only their own containers are counted.
+    """
+    size = sys.getsizeof(execution.state) + sys.getsizeof(execution.results)
+    size += sum(_estimate_result_bytes(v) for v in execution.results.values())
+    for checkpoint in execution.checkpoints:
+        size += sys.getsizeof(checkpoint.results) + sys.getsizeof(
+            checkpoint.task_states
+        )
+    return size
 
 
 # ---------------------------------------------------------------------------
@@ -534,6 +905,18 @@ class DAGCompiler:
                     f"{edge.target_task_id!r}"
                 )
 
+        data_keys: set[tuple[str, str]] = set()
+        for edge in dag.edges:
+            if edge.data_key is None:
+                continue
+            slot = (edge.target_task_id, edge.data_key)
+            if slot in data_keys:
+                raise DAGValidationError(
+                    f"task {edge.target_task_id!r} consumes data key "
+                    f"{edge.data_key!r} more than once"
+                )
+            data_keys.add(slot)
+
         try:
             dag.topological_sort()
         except CycleDetectedError as e:
@@ -577,12 +960,19 @@ class DeadLetterQueue:
     - TTL for dead-lettered events (default 24h)
     - Query interface for analysis
     - Replay capability for idempotent retries
+
+    Events are indexed by workflow ID and by ``(workflow_id, task_id)`` so
+    queries cost O(k) in the result size, and expiry times are kept in a
+    min-heap so ``clear_expired`` costs O(log n) per expired event.  Heap
+    entries for dequeued events are discarded lazily.  An optional
+    ``DeadLetterBackend`` makes the queue durable across restarts.
     """
 
     def __init__(
         self,
         max_size: int = 10000,
         ttl_hours: int = 24,
+        backend: DeadLetterBackend | None = None,
     ) -> None:
         """Initialize dead-letter queue.
 
@@ -592,15 +982,84 @@ class DeadLetterQueue:
             Maximum number of events in queue.
         ttl_hours : int
             Time-to-live in hours for events.
+        backend : DeadLetterBackend | None
+            Durable store written through on every mutation.
         """
         self.max_size = max_size
         self.ttl_hours = ttl_hours
+        self.backend = backend
         self._events: dict[str, DeadLetterEvent] = {}
+        # Insertion-ordered ID sets (dict keys) for O(1) removal.
+        self._by_workflow: dict[str, dict[str, None]] = {}
+        self._by_task: dict[tuple[str, str], dict[str, None]] = {}
+        self._expiry: list[tuple[datetime, str]] = []
         self._lock = asyncio.Lock()
 
+    def _index(self, event: DeadLetterEvent) -> None:
+        self._events[event.event_id] = event
+        self._by_workflow.setdefault(event.workflow_id, {})[event.event_id] = None
+        self._by_task.setdefault((event.workflow_id, event.task_id), {})[
+            event.event_id
+        ] = None
+        heapq.heappush(
+            self._expiry,
+            (event.timestamp + timedelta(hours=self.ttl_hours), event.event_id),
+        )
+
+    def _unindex(self, event_id: str) -> DeadLetterEvent | None:
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return None
+        by_workflow = self._by_workflow[event.workflow_id]
+        del by_workflow[event_id]
+        if not by_workflow:
+            del self._by_workflow[event.workflow_id]
+        task_key = (event.workflow_id, event.task_id)
+        by_task = self._by_task[task_key]
+        del by_task[event_id]
+        if not by_task:
+            del self._by_task[task_key]
+        # Rebuild the heap once stale entries dominate it.
+        if len(self._expiry) > 2 * len(self._events) + 64:
+            self._expiry = [e for e in self._expiry if e[1] in self._events]
+            heapq.heapify(self._expiry)
+        return event
+
+    def _pop_expired(self, now: datetime) -> list[str]:
+        expired: list[str] = []
+        while self._expiry and self._expiry[0][0] < now:
+            _, event_id = heapq.heappop(self._expiry)
+            if self._unindex(event_id) is not None:
+                expired.append(event_id)
+        return expired
+
+    async def restore(self) -> int:
+        """Rebuild the in-memory indexes from the backend.
+
+        Returns
+        -------
+        int
+            Number of events restored.
+        """
+        if self.backend is None:
+            return 0
+        events = await self.backend.load()
+        async with self._lock:
+            self._events.clear()
+            self._by_workflow.clear()
+            self._by_task.clear()
+            self._expiry.clear()
+            for event in events:
+                self._index(event)
+            return len(self._events)
+
     async def enqueue(self, event: DeadLetterEvent) -> None:
         """Enqueue failed task event.
 
+        Expired events are purged first when the queue is at capacity.
+        The event is indexed only after the backend accepts it, so a failed
+        write leaves it out of both.
+
         Parameters
         ----------
         event : DeadLetterEvent
@@ -612,11 +1071,18 @@ class DeadLetterQueue:
             If queue is at capacity.
         """
         async with self._lock:
+            expired: list[str] = []
+            if len(self._events) >= self.max_size:
+                expired = self._pop_expired(datetime.now(timezone.utc))
             if len(self._events) >= self.max_size:
                 raise DeadLetterQueueFullError(
                     len(self._events), self.max_size
                 )
-            self._events[event.event_id] = event
+            if self.backend is not None:
+                if expired:
+                    await self.backend.remove(expired)
+                await self.backend.put(event)
+            self._index(event)
 
     async def dequeue(self, event_id: str) -> DeadLetterEvent | None:
         """Retrieve and remove event from queue.
@@ -632,7 +1098,10 @@ class DeadLetterQueue:
             Event if found, None otherwise.
         """
         async with self._lock:
-            return self._events.pop(event_id, None)
+            event = self._unindex(event_id)
+            if event is not None and self.backend is not None:
+                await self.backend.remove([event_id])
+            return event
 
     async def peek(self, event_id: str) -> DeadLetterEvent | None:
         """Retrieve event without removing from queue.
@@ -667,9 +1136,8 @@ class DeadLetterQueue:
         """
         async with self._lock:
             return [
-                event
-                for event in self._events.values()
-                if event.workflow_id == workflow_id
+                self._events[event_id]
+                for event_id in self._by_workflow.get(workflow_id, ())
             ]
 
     async def query_by_task(
@@ -691,9 +1159,8 @@ class DeadLetterQueue:
         """
         async with self._lock:
             return [
-                event
-                for event in self._events.values()
-                if event.workflow_id == workflow_id and event.task_id == task_id
+                self._events[event_id]
+                for event_id in self._by_task.get((workflow_id, task_id), ())
             ]
 
     async def size(self) -> int:
@@ -710,16 +1177,84 @@ class DeadLetterQueue:
             Number of events removed.
         """
         async with self._lock:
-            now = datetime.now(timezone.utc)
-            expired = [
+            expired = self._pop_expired(datetime.now(timezone.utc))
+            if expired and self.backend is not None:
+                await self.backend.remove(expired)
+            return len(expired)
+
+    async def redrive(
+        self,
+        handler: Callable[[DeadLetterEvent], Awaitable[Any]],
+        *,
+        workflow_id: str | None = None,
+        task_id: str | None = None,
+        limit: int | None = None,
+        max_concurrency: int = 10,
+    ) -> RedriveReport:
+        """Re-execute dead-lettered events in bulk.
+
+        Matching events are handed to ``handler`` concurrently, bounded by
+        ``max_concurrency``.  Events whose handler returns are removed from
+        the queue; events whose handler raises stay queued for analysis.
+        The lock is not held while handlers run.
+
+        Parameters
+        ----------
+        handler : Callable[[DeadLetterEvent], Awaitable[Any]]
+            Coroutine that replays one event.
+        workflow_id : str | None
+            Restrict to one workflow.
+        task_id : str | None
+            Restrict to one task (requires ``workflow_id``).
+        limit : int | None
+            Maximum number of events to redrive.
+        max_concurrency : int
+            Maximum handlers running at once.
+
+        Returns
+        -------
+        RedriveReport
+            Per-event outcome.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if task_id is not None and workflow_id is None:
+            raise ValueError("task_id filter requires workflow_id")
+
+        async with self._lock:
+            if task_id is not None and workflow_id is not None:
+                ids = list(self._by_task.get((workflow_id, task_id), ()))
+            elif workflow_id is not None:
+                ids = list(self._by_workflow.get(workflow_id, ()))
+            else:
+                ids = list(self._events)
+            if limit is not None:
+                ids = ids[:limit]
+            batch = [self._events[event_id] for event_id in ids]
+
+        report = RedriveReport(attempted=len(batch))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def replay(event: DeadLetterEvent) -> None:
+            async with semaphore:
+                try:
+                    await handler(event)
+                except Exception as e:
+                    report.failed[event.event_id] = str(e)
+                else:
+                    report.succeeded.append(event.event_id)
+
+        await asyncio.gather(*(replay(event) for event in batch))
+
+        async with self._lock:
+            removed = [
                 event_id
-                for event_id, event in self._events.items()
-                if (now - event.timestamp)
-                > timedelta(hours=self.ttl_hours)
+                for event_id in report.succeeded
+                if self._unindex(event_id) is not None
             ]
-            for event_id in expired:
-                del self._events[event_id]
-            return len(expired)
+            if removed and self.backend is not None:
+                await self.backend.remove(removed)
+        return report
 
 
 # ---------------------------------------------------------------------------
@@ -741,7 +1276,9 @@ class WorkflowEngine:
     Saga execution flow:
     1. Forward phase: execute tasks in topological order
     2. On task failure: enter compensation phase
-    3. Compensation phase: execute compensations in reverse order
+    3. Compensation phase: execute compensations over the reversed DAG;
+       a task is compensated once all of its succeeded dependents are, so
+       independent branches roll back concurrently
     4. Dead-letter failed task on unrecoverable error
     """
 
@@ -749,6 +1286,13 @@ class WorkflowEngine:
         self,
         max_concurrent_tasks: int = 10,
         checkpoint_interval: int = 1,
+        checkpoint_store: CheckpointStore | None = None,
+        max_concurrent_compensations: int = 10,
+        dead_letter_queue: DeadLetterQueue | None = None,
+        retention: RetentionPolicy | None = None,
+        archive: ExecutionArchive | None = None,
+        blob_store: BlobStore | None = None,
+        spill_threshold_bytes: int = 1 << 20,
     ) -> None:
         """Initialize workflow engine.
 
@@ -758,11 +1302,53 @@ class WorkflowEngine:
             Maximum tasks executing concurrently.
         checkpoint_interval : int
             Create checkpoint every N tasks.
+        checkpoint_store : CheckpointStore | None
+            Durable sink for delta checkpoints.  Without one, checkpoints
+            are kept only in ``WorkflowExecution.checkpoints`` and
+            ``resume`` is unavailable.
+        max_concurrent_compensations : int
+            Maximum compensations executing concurrently.
+        dead_letter_queue : DeadLetterQueue | None
+            Dead-letter queue to use (e.g. one with a durable backend);
+            defaults to an in-memory queue.
+        retention : RetentionPolicy | None
+            Bounds on retained execution history; defaults to
+            ``RetentionPolicy()``.
+        archive : ExecutionArchive | None
+            External sink for executions evicted by the retention policy.
+        blob_store : BlobStore | None
+            Storage for large task results.  Without one, results always
+            stay in memory.
+        spill_threshold_bytes : int
+            Results estimated at or above this size are JSON-encoded into
+            ``blob_store`` and replaced by a ``SpilledResult``.
         """
+        if max_concurrent_compensations <= 0:
+            raise ValueError("max_concurrent_compensations must be positive")
+        if spill_threshold_bytes <= 0:
+            raise ValueError("spill_threshold_bytes must be positive")
         self.max_concurrent_tasks = max_concurrent_tasks
+        self.max_concurrent_compensations = max_concurrent_compensations
         self.checkpoint_interval = checkpoint_interval
-        self.dead_letter_queue = DeadLetterQueue()
+        self.checkpoint_store = checkpoint_store
+        self.dead_letter_queue = (
+            dead_letter_queue if dead_letter_queue is not None else DeadLetterQueue()
+        )
+        self.retention = retention if retention is not None else RetentionPolicy()
+        self.archive = archive
+        self.blob_store = blob_store
+        self.spill_threshold_bytes = spill_threshold_bytes
         self._executions: dict[str, WorkflowExecution] = {}
+        self._dags: dict[str, WorkflowDAG] = {}
+        # Completed executions in completion order -> estimated bytes.
+        self._completed: OrderedDict[str, int] = OrderedDict()
+        self._completed_bytes = 0
+        self._summaries: OrderedDict[str, ExecutionSummary] = OrderedDict()
+        # Insertion-ordered ID sets covering live executions and summaries.
+        self._by_workflow: dict[str, dict[str, None]] = {}
+        self._by_phase: dict[SagaPhase, dict[str, None]] = {
+            phase: {} for phase in SagaPhase
+        }
         self._lock = asyncio.Lock()
 
     async def execute(self, dag: WorkflowDAG) -> WorkflowExecution:
@@ -803,40 +1389,432 @@ class WorkflowEngine:
             },
         )
 
+        return await self._run_saga(dag, execution)
+
+    async def resume(
+        self, execution_id: str, dag: WorkflowDAG | None = None
+    ) -> WorkflowExecution:
+        """Resume an execution from its persisted checkpoint chain.
+
+        Replays the delta checkpoints in ``sequence`` order to rebuild task
+        states, results and the saga phase, then continues from that phase:
+
+        - ``FORWARD``: runs only the tasks that had not succeeded.  Tasks
+          that were running when the process died are re-executed; their
+          idempotency keys make this effectively-once.
+        - ``COMPENSATION``: compensates the succeeded tasks not yet
+          compensated (a compensation interrupted mid-flight runs again)
+          and never re-runs the forward chain.
+        - ``COMPLETE``: nothing is run.
+
+        A resumed compensation returns the execution rather than raising;
+        ``failed_task`` names the forward failure.
+
+        Parameters
+        ----------
+        execution_id : str
+            Execution to resume.
+        dag : WorkflowDAG | None
+            Workflow DAG for the execution.  Executors are code, so after
+            a crash the caller must supply the DAG; within the same process
+            the DAG registered by ``execute`` is used.
+
+        Returns
+        -------
+        WorkflowExecution
+            Execution state and results.
+
+        Raises
+        ------
+        WorkflowError
+            If no checkpoint store is configured, no checkpoints exist for
+            the execution, or the DAG does not match the checkpoints.
+        TaskExecutionError
+            If a resumed task fails and cannot compensate.
+        """
+        if self.checkpoint_store is None:
+            raise WorkflowError("resume requires a checkpoint store")
+
+        chain = await self.checkpoint_store.load(execution_id)
+        if not chain:
+            raise WorkflowError(
+                f"no checkpoints for execution {execution_id!r}"
+            )
+
+        if dag is None:
+            async with self._lock:
+                dag = self._dags.get(execution_id)
+            if dag is None:
+                raise WorkflowError(
+                    f"no DAG available to resume execution {execution_id!r}"
+                )
+        dag = DAGCompiler.compile(dag)
+
+        if chain[0].workflow_id != dag.workflow_id:
+            raise WorkflowError(
+                f"execution {execution_id!r} belongs to workflow "
+                f"{chain[0].workflow_id!r}, not {dag.workflow_id!r}"
+            )
+
+        execution = WorkflowExecution(
+            workflow_id=dag.workflow_id,
+            execution_id=execution_id,
+            state={
+                task_id: WorkflowTaskState.PENDING
+                for task_id in dag.tasks
+            },
+        )
+        for checkpoint in sorted(chain, key=lambda c: c.sequence):
+            for task_id, state in checkpoint.task_states.items():
+                if task_id in execution.state:
+                    execution.state[task_id] = state
+            for task_id in checkpoint.completed_tasks:
+                if task_id in execution.state:
+                    execution.state[task_id] = WorkflowTaskState.SUCCEEDED
+            execution.results.update(checkpoint.results)
+            execution.phase = checkpoint.phase
+            if checkpoint.failed_task is not None:
+                execution.failed_task = checkpoint.failed_task
+            execution.checkpoints.append(checkpoint)
+
+        if execution.phase == SagaPhase.COMPLETE:
+            async with self._lock:
+                self._register(execution, dag)
+            await self._finish(execution)
+            return execution
+
+        if execution.phase == SagaPhase.COMPENSATION:
+            # A compensation cut short by the crash is attempted again.
+            for task_id, state in execution.state.items():
+                if state == WorkflowTaskState.COMPENSATING:
+                    execution.state[task_id] = WorkflowTaskState.SUCCEEDED
+            async with self._lock:
+                self._register(execution, dag)
+            try:
+                await self._execute_compensation_phase(dag, execution)
+            finally:
+                await self._finish(execution)
+            return execution
+
+        # Anything that had not succeeded is re-run from scratch.
+        for task_id, state in execution.state.items():
+            if state != WorkflowTaskState.SUCCEEDED:
+                execution.state[task_id] = WorkflowTaskState.PENDING
+        execution.phase = SagaPhase.FORWARD
+
+        return await self._run_saga(dag, execution)
+
+    async def _run_saga(
+        self, dag: WorkflowDAG, execution: WorkflowExecution
+    ) -> WorkflowExecution:
+        """Register execution and run forward phase, compensating on failure."""
         async with self._lock:
-            self._executions[execution.execution_id] = execution
+            self._register(execution, dag)
 
         try:
-            await self._execute_forward_phase(dag, execution)
+            unflushed, released = await self._execute_forward_phase(
+                dag, execution
+            )
+            self._set_phase(execution, SagaPhase.COMPLETE)
+            await self._write_checkpoint(execution, unflushed)
+            for result in released:
+                await self._delete_spilled(result)
             return execution
         except Exception:
-            execution.phase = SagaPhase.COMPENSATION
+            self._set_phase(execution, SagaPhase.COMPENSATION)
+            await self._write_checkpoint(execution, [])
             await self._execute_compensation_phase(dag, execution)
             raise
+        finally:
+            await self._finish(execution)
+
+    # -- execution history ------------------------------------------------
+
+    def _register(self, execution: WorkflowExecution, dag: WorkflowDAG) -> None:
+        """Index a live execution (caller holds the lock)."""
+        execution_id = execution.execution_id
+        self._forget(execution_id)
+        self._executions[execution_id] = execution
+        self._dags[execution_id] = dag
+        self._by_workflow.setdefault(execution.workflow_id, {})[execution_id] = None
+        self._by_phase[execution.phase][execution_id] = None
+
+    def _forget(self, execution_id: str) -> None:
+        """Drop every trace of an execution or summary (caller holds the lock)."""
+        record: WorkflowExecution | ExecutionSummary | None = self._executions.pop(
+            execution_id, None
+        )
+        if record is None:
+            record = self._summaries.pop(execution_id, None)
+        if record is None:
+            return
+        self._dags.pop(execution_id, None)
+        self._completed_bytes -= self._completed.pop(execution_id, 0)
+        self._by_phase[record.phase].pop(execution_id, None)
+        by_workflow = self._by_workflow.get(record.workflow_id)
+        if by_workflow is not None:
+            by_workflow.pop(execution_id, None)
+            if not by_workflow:
+                del self._by_workflow[record.workflow_id]
+
+    def _set_phase(self, execution: WorkflowExecution, phase: SagaPhase) -> None:
+        """Move an execution between saga phases, keeping the index current."""
+        execution_id = execution.execution_id
+        if execution_id in self._by_phase[execution.phase]:
+            del self._by_phase[execution.phase][execution_id]
+            self._by_phase[phase][execution_id] = None
+        execution.phase = phase
+
+    async def _finish(self, execution: WorkflowExecution) -> None:
+        """Mark an execution completed and apply the retention policy."""
+        execution.completed_at = datetime.now(timezone.utc)
+        async with self._lock:
+            if self._executions.get(execution.execution_id) is not execution:
+                return
+            size = _estimate_execution_bytes(execution)
+            self._completed[execution.execution_id] = size
+            self._completed_bytes += size
+            evicted = self._evict(execution.completed_at)
+        await self._archive(evicted)
+
+    async def enforce_retention(self) -> int:
+        """Apply the retention policy now (e.g. from a periodic task).
+
+        Age-based eviction otherwise happens only when an execution
+        completes.
+
+        Returns
+        -------
+        int
+            Number of executions evicted.
+        """
+        async with self._lock:
+            evicted = self._evict(datetime.now(timezone.utc))
+        await self._archive(evicted)
+        return len(evicted)
+
+    def _evict(self, now: datetime) -> list[WorkflowExecution]:
+        """Evict completed executions beyond the policy (caller holds the lock)."""
+        policy = self.retention
+        evicted: list[WorkflowExecution] = []
+        while self._completed:
+            oldest_id = next(iter(self._completed))
+            oldest = self._executions[oldest_id]
+            over_count = (
+                policy.max_executions is not None
+                and len(self._completed) > policy.max_executions
+            )
+            over_bytes = (
+                policy.max_bytes is not None
+                and self._completed_bytes > policy.max_bytes
+            )
+            over_age = (
+                policy.max_age_seconds is not None
+                and oldest.completed_at is not None
+                and (now - oldest.completed_at).total_seconds()
+                > policy.max_age_seconds
+            )
+            if not (over_count or over_bytes or over_age):
+                break
+            self._forget(oldest_id)
+            evicted.append(oldest)
+            if policy.max_summaries:
+                summary = ExecutionSummary.from_execution(oldest)
+                self._summaries[oldest_id] = summary
+                self._by_workflow.setdefault(summary.workflow_id, {})[oldest_id] = None
+                self._by_phase[summary.phase][oldest_id] = None
+                while len(self._summaries) > policy.max_summaries:
+                    self._forget(next(iter(self._summaries)))
+        return evicted
+
+    async def _archive(self, evicted: list[WorkflowExecution]) -> None:
+        """Hand evicted executions to the archive, then drop their blobs.
+
+        Spilled results stay loadable until ``archive`` returns.  Failures
+        are logged, not raised.
+        """
+        for execution in evicted:
+            if self.archive is not None:
+                try:
+                    await self.archive.archive(execution)
+                except Exception:
+                    log.exception(
+                        "archiving execution %s failed", execution.execution_id
+                    )
+            if self.blob_store is None:
+                continue
+            for result in execution.results.values():
+                if isinstance(result, SpilledResult):
+                    await self._delete_spilled(result)
+
+    # -- task results -----------------------------------------------------
+
+    async def _store_result(
+        self,
+        execution: WorkflowExecution,
+        task_id: str,
+        result: Any,
+        measure: bool,
+    ) -> int:
+        """Record a task result, spilling it when large; return its size.
+
+        Sizing walks the result, so it is skipped (size 0) unless the
+        result may spill or ``measure`` asks for it.
+        """
+        if self.blob_store is None and not measure:
+            execution.results[task_id] = result
+            return 0
+        size = _estimate_result_bytes(result)
+        if self.blob_store is not None and size >= self.spill_threshold_bytes:
+            try:
+                data = json.dumps(result, separators=(",", ":")).encode("utf-8")
+            except (TypeError, ValueError):
+                log.debug("result of %s is not JSON-encodable; kept in memory", task_id)
+            else:
+                key = f"{execution.execution_id}-{uuid4().hex}"
+                await self.blob_store.put(key, data)
+                result = SpilledResult(key=key, size_bytes=len(data))
+                size = len(data)
+        execution.results[task_id] = result
+        return size
+
+    async def _release_result(
+        self, execution: WorkflowExecution, task_id: str
+    ) -> None:
+        """Drop a task result from memory and from the blob store."""
+        result = execution.results.pop(task_id, None)
+        if isinstance(result, SpilledResult):
+            await self._delete_spilled(result)
+
+    async def _delete_spilled(self, result: SpilledResult) -> None:
+        """Delete a spilled result's blob; failures are logged, not raised."""
+        if self.blob_store is None:
+            return
+        try:
+            await self.blob_store.delete(result.key)
+        except Exception:
+            log.exception("deleting spilled result %s failed", result.key)
+
+    async def load_result(self, execution: WorkflowExecution, task_id: str) -> Any:
+        """Return a task's result, fetching it from the blob store if spilled.
+
+        Raises
+        ------
+        KeyError
+            If the task has no result (not run, or released after its
+            last data consumer succeeded).
+        """
+        result = execution.results[task_id]
+        if isinstance(result, SpilledResult):
+            if self.blob_store is None:
+                raise WorkflowError(
+                    f"result of {task_id!r} was spilled but no blob store is configured"
+                )
+            return json.loads(await self.blob_store.get(result.key))
+        return result
 
     async def _execute_forward_phase(
         self, dag: WorkflowDAG, execution: WorkflowExecution
-    ) -> None:
-        """Execute forward phase of saga."""
-        sorted_tasks = dag.topological_sort()
+    ) -> tuple[list[str], list[SpilledResult]]:
+        """Execute forward phase of saga.
+
+        Tasks run one at a time in dependency order.  Among ready tasks the
+        scheduler prefers the one whose success releases the most result
+        bytes (it is the last pending consumer of those results), breaking
+        ties by topological position; without data edges the order is
+        exactly ``dag.topological_sort()``.
+
+        A released result leaves memory at once, but a spilled one keeps
+        its blob until a checkpoint records the success of its last
+        consumer, so ``resume`` never re-runs a consumer whose input is
+        gone.
+
+        Returns the tasks finished since the last checkpoint and the
+        released results whose blobs wait on that checkpoint; the caller
+        records the tasks together with the ``COMPLETE`` phase, then
+        deletes the blobs.
+        """
+        position = {
+            task_id: i for i, task_id in enumerate(dag.topological_sort())
+        }
         semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+        # Tasks whose state changed since the last checkpoint.
+        dirty: list[str] = []
+        # Spilled results released since the last checkpoint.
+        released: list[SpilledResult] = []
+
+        dependents: dict[str, set[str]] = {t: set() for t in dag.tasks}
+        blockers: dict[str, set[str]] = {t: set() for t in dag.tasks}
+        data_inputs: dict[str, dict[str, str]] = {t: {} for t in dag.tasks}
+        # Producer -> consumers that still need its result.
+        pending_consumers: dict[str, set[str]] = {}
+        for edge in dag.edges:
+            source, target = edge.source_task_id, edge.target_task_id
+            dependents[source].add(target)
+            blockers[target].add(source)
+            if edge.data_key is not None:
+                data_inputs[target][edge.data_key] = source
+                if execution.state[target] != WorkflowTaskState.SUCCEEDED:
+                    pending_consumers.setdefault(source, set()).add(target)
+        result_bytes = {
+            task_id: _estimate_result_bytes(execution.results[task_id])
+            for task_id in pending_consumers
+            if task_id in execution.results
+        }
+
+        def releasable(producer: str) -> bool:
+            return dag.tasks[producer].compensation_executor is None
+
+        # On resume, results restored from checkpoints whose consumers have
+        # all succeeded are no longer needed.
+        for edge in dag.edges:
+            producer = edge.source_task_id
+            if (
+                edge.data_key is not None
+                and producer not in pending_consumers
+                and producer in execution.results
+                and releasable(producer)
+            ):
+                await self._release_result(execution, producer)
+
+        def released_by(task_id: str) -> int:
+            return sum(
+                result_bytes.get(producer, 0)
+                for producer in set(data_inputs[task_id].values())
+                if pending_consumers.get(producer) == {task_id}
+                and releasable(producer)
+            )
 
         async def execute_task_with_semaphore(task_id: str) -> None:
             async with semaphore:
                 task = dag.tasks[task_id]
                 execution.state[task_id] = WorkflowTaskState.RUNNING
                 try:
+                    payload = task.payload
+                    if data_inputs[task_id]:
+                        payload = TaskInput(
+                            payload=task.payload,
+                            inputs={
+                                key: await self.load_result(execution, source)
+                                for key, source in data_inputs[task_id].items()
+                            },
+                        )
                     result = await asyncio.wait_for(
-                        task.executor.execute(
-                            task.task_id, task.payload
-                        ),
+                        task.executor.execute(task.task_id, payload),
                         timeout=task.timeout_ms / 1000.0,
                     )
-                    execution.results[task_id] = result
+                    result_bytes[task_id] = await self._store_result(
+                        execution,
+                        task_id,
+                        result,
+                        measure=task_id in pending_consumers,
+                    )
                     execution.state[task_id] = WorkflowTaskState.SUCCEEDED
+                    dirty.append(task_id)
                 except TimeoutError as e:
                     execution.state[task_id] = WorkflowTaskState.FAILED
                     execution.failed_task = task_id
+                    dirty.append(task_id)
                     raise TaskExecutionError(
                         task_id,
                         f"task timeout after {task.timeout_ms}ms",
@@ -845,83 +1823,178 @@ class WorkflowEngine:
                 except Exception as e:
                     execution.state[task_id] = WorkflowTaskState.FAILED
                     execution.failed_task = task_id
+                    dirty.append(task_id)
                     raise TaskExecutionError(
                         task_id, str(e), e
                     ) from e
 
-        for i, task_id in enumerate(sorted_tasks):
-            dependencies = dag.get_dependencies(task_id)
-            if dependencies:
-                await asyncio.gather(
-                    *[
-                        asyncio.create_task(
-                            execute_task_with_semaphore(dep_id)
-                        )
-                        for dep_id in dependencies
-                        if execution.state[dep_id] == WorkflowTaskState.PENDING
-                    ]
-                )
+        async def flush() -> None:
+            nonlocal dirty, released
+            await self._write_checkpoint(execution, dirty)
+            for result in released:
+                await self._delete_spilled(result)
+            dirty, released = [], []
+
+        # Heap of (-bytes released, topological position, task).  A ready
+        # task's priority only grows, when another consumer of one of its
+        # producers succeeds; it is then pushed again and the superseded
+        # entry is skipped when popped.
+        ready: list[tuple[int, int, str]] = []
+        queued: dict[str, int] = {}
+
+        def enqueue(task_id: str) -> None:
+            freed = released_by(task_id) if pending_consumers else 0
+            if queued.get(task_id) != freed:
+                queued[task_id] = freed
+                heapq.heappush(ready, (-freed, position[task_id], task_id))
+
+        for task_id in dag.tasks:
+            if not blockers[task_id]:
+                enqueue(task_id)
+        step = 0
+        while ready:
+            priority, _, task_id = heapq.heappop(ready)
+            if queued.get(task_id) != -priority:
+                continue
+            del queued[task_id]
 
-            await execute_task_with_semaphore(task_id)
+            if execution.state[task_id] != WorkflowTaskState.SUCCEEDED:
+                try:
+                    await execute_task_with_semaphore(task_id)
+                except Exception:
+                    # Persist the failure and any unflushed successes before
+                    # compensation starts rolling them back.
+                    await flush()
+                    raise
+
+                for producer in set(data_inputs[task_id].values()):
+                    consumers = pending_consumers.get(producer)
+                    if consumers is None:
+                        continue
+                    consumers.discard(task_id)
+                    if not consumers:
+                        del pending_consumers[producer]
+                        if releasable(producer):
+                            result = execution.results.pop(producer, None)
+                            if isinstance(result, SpilledResult):
+                                released.append(result)
+                    elif len(consumers) == 1:
+                        (last,) = consumers
+                        if last in queued:
+                            enqueue(last)
+
+                if (step + 1) % self.checkpoint_interval == 0:
+                    await flush()
+            step += 1
+
+            for dependent in dependents[task_id]:
+                blockers[dependent].discard(task_id)
+                if not blockers[dependent]:
+                    enqueue(dependent)
+
+        return dirty, released
+
+    async def _write_checkpoint(
+        self, execution: WorkflowExecution, changed: list[str]
+    ) -> None:
+        """Record a delta checkpoint covering ``changed`` tasks.
 
-            if (i + 1) % self.checkpoint_interval == 0:
-                checkpoint = ExecutionCheckpoint(
-                    workflow_id=dag.workflow_id,
-                    checkpoint_id=str(uuid4()),
-                    timestamp=datetime.now(timezone.utc),
-                    completed_tasks=set(
-                        task_id
-                        for task_id, state in execution.state.items()
-                        if state == WorkflowTaskState.SUCCEEDED
-                    ),
-                    results=execution.results.copy(),
-                    phase=execution.phase,
-                )
-                execution.checkpoints.append(checkpoint)
+        The checkpoint carries the current phase, so an empty ``changed``
+        records a phase transition.  It is appended to the execution and,
+        when a store is configured, persisted before execution continues.
+        Results are included only for tasks that have succeeded.
+        """
+        sequence = (
+            execution.checkpoints[-1].sequence + 1
+            if execution.checkpoints
+            else 0
+        )
+        checkpoint = ExecutionCheckpoint(
+            workflow_id=execution.workflow_id,
+            checkpoint_id=str(uuid4()),
+            timestamp=datetime.now(timezone.utc),
+            completed_tasks={
+                task_id
+                for task_id in changed
+                if execution.state[task_id] == WorkflowTaskState.SUCCEEDED
+            },
+            results={
+                task_id: execution.results[task_id]
+                for task_id in changed
+                if task_id in execution.results
+                and execution.state[task_id] == WorkflowTaskState.SUCCEEDED
+            },
+            phase=execution.phase,
+            execution_id=execution.execution_id,
+            sequence=sequence,
+            task_states={
+                task_id: execution.state[task_id] for task_id in changed
+            },
+            failed_task=execution.failed_task,
+        )
+        execution.checkpoints.append(checkpoint)
+        if self.checkpoint_store is not None:
+            await self.checkpoint_store.save(checkpoint)
 
     async def _execute_compensation_phase(
         self, dag: WorkflowDAG, execution: WorkflowExecution
     ) -> None:
-        """Execute compensation phase for failed tasks."""
+        """Execute compensation phase for failed tasks.
+
+        Succeeded tasks are compensated over the reversed DAG: a task
+        becomes ready once every succeeded task depending on it has been
+        compensated.  Ready tasks run concurrently, bounded by
+        ``max_concurrent_compensations``, so rollback time tracks the
+        longest dependency chain rather than the sum of all compensations.
+        Each compensated task and the final ``COMPLETE`` phase are
+        checkpointed, so ``resume`` continues rather than repeats a rollback.
+        """
         sorted_tasks = dag.topological_sort()
         compensation_tasks = [
             task_id
             for task_id in reversed(sorted_tasks)
             if execution.state[task_id] == WorkflowTaskState.SUCCEEDED
         ]
+        to_compensate = set(compensation_tasks)
 
-        for task_id in compensation_tasks:
-            task = dag.tasks[task_id]
-            if task.compensation_executor is None:
-                continue
-
-            execution.state[task_id] = WorkflowTaskState.COMPENSATING
-            try:
-                forward_result = execution.results.get(task_id)
-                await asyncio.wait_for(
-                    task.compensation_executor.compensate(
-                        task_id, forward_result
-                    ),
-                    timeout=10.0,
-                )
-                execution.state[task_id] = WorkflowTaskState.COMPENSATED
-            except Exception as e:
-                execution.state[task_id] = WorkflowTaskState.FAILED
-                error_msg = str(e)
-                await self.dead_letter_queue.enqueue(
-                    DeadLetterEvent(
-                        event_id=str(uuid4()),
-                        workflow_id=dag.workflow_id,
-                        task_id=task_id,
-                        timestamp=datetime.now(timezone.utc),
-                        error_message=error_msg,
-                        payload=task.payload,
-                        execution_context={
-                            "phase": "compensation",
-                            "compensation_failure": True,
-                        },
+        dependencies: dict[str, set[str]] = {t: set() for t in to_compensate}
+        blockers: dict[str, int] = dict.fromkeys(to_compensate, 0)
+        for edge in dag.edges:
+            source, target = edge.source_task_id, edge.target_task_id
+            if source in to_compensate and target in to_compensate:
+                dependencies[target].add(source)
+                blockers[source] += 1
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_compensations)
+        running: dict[asyncio.Task[None], str] = {}
+        errors: list[BaseException] = []
+        # Seed in reverse topological order so the serial case is unchanged.
+        ready = [t for t in compensation_tasks if blockers[t] == 0]
+
+        while ready or running:
+            for task_id in ready:
+                running[
+                    asyncio.create_task(
+                        self._compensate_task(dag, execution, task_id, semaphore)
                     )
-                )
+                ] = task_id
+            ready = []
+
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for fut in done:
+                task_id = running.pop(fut)
+                exc = fut.exception()
+                if exc is not None:
+                    errors.append(exc)
+                for dep_id in sorted(dependencies[task_id]):
+                    blockers[dep_id] -= 1
+                    if blockers[dep_id] == 0:
+                        ready.append(dep_id)
+
+        if errors:
+            raise errors[0]
 
         if execution.failed_task:
             await self.dead_letter_queue.enqueue(
@@ -935,26 +2008,274 @@ class WorkflowEngine:
                     execution_context={
                         "phase": "forward",
                         "compensation_chain": compensation_tasks,
+                        "execution_id": execution.execution_id,
                     },
                 )
             )
 
-        execution.phase = SagaPhase.COMPLETE
+        self._set_phase(execution, SagaPhase.COMPLETE)
+        await self._write_checkpoint(execution, [])
+
+    async def _compensate_task(
+        self,
+        dag: WorkflowDAG,
+        execution: WorkflowExecution,
+        task_id: str,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Compensate one task with retry/backoff, dead-lettering on failure.
+
+        The concurrency slot is held only while an attempt is running, not
+        during backoff.
+        """
+        task = dag.tasks[task_id]
+        if task.compensation_executor is None:
+            return
+
+        execution.state[task_id] = WorkflowTaskState.COMPENSATING
+        forward_result = (
+            await self.load_result(execution, task_id)
+            if task_id in execution.results
+            else None
+        )
+        attempts = task.compensation_retries + 1
+        last_error: Exception | None = None
+
+        for attempt in range(attempts):
+            if attempt:
+                delay_ms = task.compensation_backoff_ms * 2 ** (attempt - 1)
+                await asyncio.sleep(delay_ms / 1000.0)
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(
+                        task.compensation_executor.compensate(
+                            task_id, forward_result
+                        ),
+                        timeout=task.compensation_timeout_ms / 1000.0,
+                    )
+                except TimeoutError as e:
+                    last_error = CompensationFailedError(
+                        task_id,
+                        f"compensation timeout after "
+                        f"{task.compensation_timeout_ms}ms",
+                        e,
+                    )
+                except Exception as e:
+                    last_error = e
+                else:
+                    execution.state[task_id] = WorkflowTaskState.COMPENSATED
+                    await self._write_checkpoint(execution, [task_id])
+                    return
+
+        execution.state[task_id] = WorkflowTaskState.FAILED
+        await self._write_checkpoint(execution, [task_id])
+        context: dict[str, Any] = {
+            "phase": "compensation",
+            "compensation_failure": True,
+            "attempts": attempts,
+            "execution_id": execution.execution_id,
+        }
+        try:
+            json.dumps(forward_result)
+        except (TypeError, ValueError):
+            # Durable backends serialise the context; keep a reference to
+            # the retained result instead of the object itself.
+            context["forward_result_ref"] = {
+                "execution_id": execution.execution_id,
+                "task_id": task_id,
+            }
+        else:
+            context["forward_result"] = forward_result
+        await self.dead_letter_queue.enqueue(
+            DeadLetterEvent(
+                event_id=str(uuid4()),
+                workflow_id=dag.workflow_id,
+                task_id=task_id,
+                timestamp=datetime.now(timezone.utc),
+                error_message=str(last_error),
+                payload=task.payload,
+                execution_context=context,
+            )
+        )
+
+    async def _dead_letter_forward_result(self, event: DeadLetterEvent) -> Any:
+        """Return the forward result recorded in a compensation dead letter.
+
+        Raises
+        ------
+        WorkflowError
+            If the event references a result that is no longer retained.
+        """
+        ref = event.execution_context.get("forward_result_ref")
+        if ref is None:
+            return event.execution_context.get("forward_result")
+        execution = await self.get_execution(ref["execution_id"])
+        if execution is None or ref["task_id"] not in execution.results:
+            raise WorkflowError(
+                f"forward result of {ref['task_id']!r} in execution "
+                f"{ref['execution_id']!r} is no longer retained"
+            )
+        return await self.load_result(execution, ref["task_id"])
+
+    async def redrive_dead_letters(
+        self,
+        dag: WorkflowDAG,
+        *,
+        task_id: str | None = None,
+        limit: int | None = None,
+        max_concurrency: int = 10,
+    ) -> RedriveReport:
+        """Re-execute dead-lettered tasks of ``dag`` in bulk.
+
+        Forward-phase events re-run the task executor with the stored
+        payload; compensation-phase events re-run the compensation executor
+        with the recorded forward result (a result that was not
+        JSON-encodable is recorded by reference and must still be retained
+        by the engine).  Each replay honours the task's
+        own timeout.  Idempotency keys make forward replays safe.
+
+        Parameters
+        ----------
+        dag : WorkflowDAG
+            Workflow whose dead letters are redriven.
+        task_id : str | None
+            Restrict to one task.
+        limit : int | None
+            Maximum number of events to redrive.
+        max_concurrency : int
+            Maximum replays running at once.
+
+        Returns
+        -------
+        RedriveReport
+            Per-event outcome.
+        """
+
+        async def replay(event: DeadLetterEvent) -> Any:
+            task = dag.tasks.get(event.task_id)
+            if task is None:
+                raise WorkflowError(
+                    f"task {event.task_id!r} not in workflow {dag.workflow_id!r}"
+                )
+            if event.execution_context.get("phase") != "compensation" and any(
+                edge.target_task_id == task.task_id and edge.data_key is not None
+                for edge in dag.edges
+            ):
+                raise WorkflowError(
+                    f"task {event.task_id!r} consumes upstream results; "
+                    f"use resume to re-run it"
+                )
+            if event.execution_context.get("phase") == "compensation":
+                if task.compensation_executor is None:
+                    raise WorkflowError(
+                        f"task {event.task_id!r} has no compensation executor"
+                    )
+                forward_result = await self._dead_letter_forward_result(event)
+                return await asyncio.wait_for(
+                    task.compensation_executor.compensate(
+                        task.task_id, forward_result
+                    ),
+                    timeout=task.compensation_timeout_ms / 1000.0,
+                )
+            return await asyncio.wait_for(
+                task.executor.execute(task.task_id, event.payload),
+                timeout=task.timeout_ms / 1000.0,
+            )
+
+        return await self.dead_letter_queue.redrive(
+            replay,
+            workflow_id=dag.workflow_id,
+            task_id=task_id,
+            limit=limit,
+            max_concurrency=max_concurrency,
+        )
 
     async def get_execution(
         self, execution_id: str
     ) -> WorkflowExecution | None:
-        """Retrieve execution state by ID."""
+        """Retrieve execution state by ID (``None`` once evicted)."""
         async with self._lock:
             return self._executions.get(execution_id)
 
+    async def get_execution_summary(
+        self, execution_id: str
+    ) -> ExecutionSummary | None:
+        """Retrieve the summary of an execution, live or evicted."""
+        async with self._lock:
+            execution = self._executions.get(execution_id)
+            if execution is not None:
+                return ExecutionSummary.from_execution(execution)
+            return self._summaries.get(execution_id)
+
     async def list_executions(
         self, workflow_id: str
     ) -> list[WorkflowExecution]:
-        """List all executions for a workflow."""
+        """List all retained executions for a workflow."""
         async with self._lock:
             return [
-                exec_
-                for exec_ in self._executions.values()
-                if exec_.workflow_id == workflow_id
+                self._executions[execution_id]
+                for execution_id in self._by_workflow.get(workflow_id, ())
+                if execution_id in self._executions
             ]
+
+    async def iter_executions(
+        self,
+        workflow_id: str | None = None,
+        phase: SagaPhase | None = None,
+        *,
+        include_evicted: bool = False,
+        page_size: int = 256,
+    ) -> AsyncIterator[WorkflowExecution | ExecutionSummary]:
+        """Stream executions matching the filters, one page at a time.
+
+        The candidate ID list comes from the workflow or phase index;
+        records are then resolved ``page_size`` at a time under the lock,
+        so the lock is never held while the caller consumes results.
+        Executions evicted mid-iteration are yielded as summaries (when
+        ``include_evicted``) or skipped.
+
+        Parameters
+        ----------
+        workflow_id : str | None
+            Restrict to one workflow.
+        phase : SagaPhase | None
+            Restrict to one saga phase.
+        include_evicted : bool
+            Also yield ``ExecutionSummary`` records of evicted executions.
+        page_size : int
+            Records resolved per lock acquisition.
+
+        Yields
+        ------
+        WorkflowExecution | ExecutionSummary
+            Matching records in registration order.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        async with self._lock:
+            if workflow_id is not None:
+                ids = list(self._by_workflow.get(workflow_id, ()))
+            elif phase is not None:
+                ids = list(self._by_phase[phase])
+            else:
+                ids = list(self._executions)
+                if include_evicted:
+                    ids.extend(self._summaries)
+
+        for offset in range(0, len(ids), page_size):
+            page: list[WorkflowExecution | ExecutionSummary] = []
+            async with self._lock:
+                for execution_id in ids[offset : offset + page_size]:
+                    record: WorkflowExecution | ExecutionSummary | None = (
+                        self._executions.get(execution_id)
+                    )
+                    if record is None and include_evicted:
+                        record = self._summaries.get(execution_id)
+                    if record is None:
+                        continue
+                    if phase is not None and record.phase != phase:
+                        continue
+                    page.append(record)
+            for record in page:
+                yield record
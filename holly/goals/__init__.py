@@ -7,6 +7,12 @@ Assembly Index computation per Assembly Theory.
 
 from __future__ import annotations
 
+from .assembly_engine import (
+    AssemblyDAG,
+    AssemblyIndexEngine,
+    MemoizedGoalDecomposer,
+    context_key,
+)
 from .assembly_index import (
     AssemblyIndexResult,
     AssemblyStep,
@@ -56,4 +62,8 @@ __all__ = [
     "compute_assembly_index",
     "classify_complexity",
     "GoalDecomposer",
+    "MemoizedGoalDecomposer",
+    "AssemblyDAG",
+    "AssemblyIndexEngine",
+    "context_key",
 ]
@@ -438,6 +438,141 @@ class APSValidator:
         )
 
 
+class IncrementalAPSValidator:
+    """Maintains an APS validation report as decomposition results arrive.
+
+    Results are grouped by a content key (see
+    ``holly.goals.assembly_engine.context_key``): goals whose contexts
+    share a key share their decomposition structure.  Bounds and
+    completeness are therefore checked once per key, consistency is a
+    comparison against the key's first AI, and monotonicity is derived
+    from per-level minimum and maximum body AI when the report is built.
+    The body AI leaves out a goal's dependency-resolve steps, so a T0
+    goal with several dependencies is not ranked above a dependency-free
+    T1 goal.  Adding a goal costs O(1) after its key's first result.
+
+    Attributes:
+        validator: APSValidator supplying the individual checks.
+        goals_added: Number of results added so far.
+    """
+
+    def __init__(self, validator: APSValidator | None = None) -> None:
+        """Initialize with an optional APSValidator (a default one otherwise)."""
+        self.validator = validator or APSValidator()
+        self.goals_added = 0
+        self._ai_by_key: dict[str, int] = {}
+        self._dependencies_by_key: dict[str, int] = {}
+        self._inconsistent: set[str] = set()
+        self._body_ai_range: dict[str, tuple[int, int]] = {}
+        self._violations: list[APSValidationViolation] = []
+
+    def add(
+        self,
+        key: str,
+        task_level: str,
+        result: AssemblyIndexResult,
+        *,
+        dependencies: int = 0,
+    ) -> list[APSValidationViolation]:
+        """Record one goal's result and check it against its key.
+
+        Args:
+            key: Content key of the goal's decomposition context.
+            task_level: Task level of the goal ("T0"–"T3").
+            result: The goal's AssemblyIndexResult.
+            dependencies: Number of dependency-resolve steps in result,
+                left out of the body AI used for monotonicity.
+
+        Returns:
+            Violations newly found by this result (empty if none).
+        """
+        ai = result.assembly_index
+        if key in self._ai_by_key:
+            return self.add_known(key, task_level, ai, result.pattern_id)
+
+        self.goals_added += 1
+        self._record_level(task_level, ai - dependencies)
+        self._ai_by_key[key] = ai
+        self._dependencies_by_key[key] = dependencies
+        found = self.validator.validate_bounds({task_level: ai})
+        found.extend(self.validator.validate_completeness(result))
+        self._violations.extend(found)
+        return found
+
+    def add_known(
+        self, key: str, task_level: str, assembly_index: int, pattern_id: str
+    ) -> list[APSValidationViolation]:
+        """Record a goal whose key was added before, without its steps.
+
+        Args:
+            key: Content key already passed to add().
+            task_level: Task level of the goal ("T0"–"T3").
+            assembly_index: The goal's AI.
+            pattern_id: Identifier of the goal, for violation messages.
+
+        Returns:
+            A consistency violation if the AI differs from the key's first
+            AI and the key was consistent until now, else an empty list.
+
+        Raises:
+            KeyError: If key was never added.
+        """
+        known = self._ai_by_key[key]
+        self.goals_added += 1
+        self._record_level(task_level, assembly_index - self._dependencies_by_key[key])
+        if known == assembly_index or key in self._inconsistent:
+            return []
+        self._inconsistent.add(key)
+        violation = APSValidationViolation(
+            violation_type="consistency",
+            description="Same context produced different AI values across goals",
+            task_level=task_level,
+            expected=f"AI={known}",
+            actual=f"AI={assembly_index} for {pattern_id}",
+        )
+        self._violations.append(violation)
+        return [violation]
+
+    def _record_level(self, task_level: str, body_ai: int) -> None:
+        """Widen the level's body AI range to include body_ai."""
+        low, high = self._body_ai_range.get(task_level, (body_ai, body_ai))
+        self._body_ai_range[task_level] = (min(low, body_ai), max(high, body_ai))
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a result with this key has been added."""
+        return key in self._ai_by_key
+
+    def report(self) -> APSValidationReport:
+        """Build the report for all results added so far.
+
+        Monotonicity compares the largest body AI of each level with the
+        smallest body AI of the next level.
+
+        Returns:
+            APSValidationReport with total_tasks_checked = goals added.
+        """
+        mono_violations: list[APSValidationViolation] = []
+        for lower, upper in [("T0", "T1"), ("T1", "T2"), ("T2", "T3")]:
+            if lower in self._body_ai_range and upper in self._body_ai_range:
+                mono_violations.extend(
+                    self.validator.validate_monotonicity(
+                        {
+                            lower: self._body_ai_range[lower][1],
+                            upper: self._body_ai_range[upper][0],
+                        }
+                    )
+                )
+
+        violations = mono_violations + self._violations
+        return APSValidationReport(
+            total_tasks_checked=self.goals_added,
+            violations=violations,
+            monotonicity_valid=not mono_violations,
+            bounds_valid=not any(v.violation_type == "bound" for v in violations),
+            consistency_valid=not self._inconsistent,
+        )
+
+
 def validate_aps_assembly_indices(
     decomposer: Decomposer | None = None,
     contexts: list[dict[str, Any]] | None = None,
@@ -0,0 +1,418 @@
+"""Memoized goal decomposition over a shared sub-assembly DAG.
+
+GoalDecomposer derives a goal's AssemblyStep list from a slice of its
+context only: the task level, the count that level caps (T1: codimension
+up to 3, T2: agents up to 4, T3: agents up to 6) and the dependency list.
+The goal ID merely names the steps.  ``context_key`` hashes that slice
+canonically, so goals with equal slices share one decomposition template,
+built once and instantiated per goal ID only when its steps are read.
+
+Each template splits into content-addressed sub-assemblies: one per
+resolved dependency, shared by every goal depending on it, and one for
+the body of the decomposition, shared by every goal of the same shape.
+AssemblyDAG stores each sub-assembly once and tracks the joint assembly
+index of all goals added (distinct build steps when shared
+sub-assemblies are built once).  AssemblyIndexEngine feeds results to an
+IncrementalAPSValidator, so keeping a validation report costs O(1) per
+goal instead of re-decomposing and re-validating every goal.
+
+References:
+  - Monograph Glossary §12 (Assembly Index definition)
+  - Goal Hierarchy Formal Spec §4.3 (Goal decomposition strategy)
+  - ICD-011 (APS Controller response includes assembly_index)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from holly.goals.aps_validator import APSValidationReport, IncrementalAPSValidator
+from holly.goals.assembly_index import (
+    AssemblyIndexResult,
+    AssemblyStep,
+    GoalDecomposer,
+    classify_complexity,
+    compute_assembly_index,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Goal ID used to build templates; cannot occur in real goal or dependency IDs.
+_PLACEHOLDER = "\x00goal\x00"
+
+# Context field each task level reads, and the cap GoalDecomposer applies.
+_LEVEL_PARAMETERS: dict[str, tuple[str, int]] = {
+    "T1": ("codimension", 3),
+    "T2": ("num_agents", 4),
+    "T3": ("num_agents", 6),
+}
+
+_REQUIRED_KEYS = frozenset({"task_level", "num_agents", "codimension"})
+
+
+def _digest(*parts: Any) -> str:
+    """Content hash of a tuple of plain values."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _context_slice(context: dict[str, Any]) -> tuple[Any, int | None, tuple[Any, ...]]:
+    """Return (task_level, capped count, dependencies) for a context."""
+    if not _REQUIRED_KEYS.issubset(context.keys()):
+        missing = _REQUIRED_KEYS - set(context.keys())
+        raise ValueError(f"Missing required context keys: {missing}")
+    level = context["task_level"]
+    parameter = _LEVEL_PARAMETERS.get(level)
+    size = None if parameter is None else max(0, min(context[parameter[0]], parameter[1]))
+    return level, size, tuple(context.get("dependencies", []))
+
+
+def context_key(context: dict[str, Any]) -> str:
+    """Return the canonical hash of the context slice a decomposition reads.
+
+    Args:
+        context: Goal context (see GoalDecomposer.decompose()).
+
+    Returns:
+        Hex digest; contexts with equal keys decompose identically up to
+        the goal ID.
+
+    Raises:
+        ValueError: If context is missing required keys.
+    """
+    return _digest(*_context_slice(context))
+
+
+def _instantiate(template: tuple[AssemblyStep, ...], goal_id: str) -> list[AssemblyStep]:
+    """Substitute a goal ID into template steps."""
+    return [
+        AssemblyStep(
+            step_id=step.step_id.replace(_PLACEHOLDER, goal_id),
+            description=step.description.replace(_PLACEHOLDER, goal_id),
+            inputs=tuple(i.replace(_PLACEHOLDER, goal_id) for i in step.inputs),
+            output=step.output.replace(_PLACEHOLDER, goal_id),
+        )
+        for step in template
+    ]
+
+
+@dataclass(slots=True, frozen=True)
+class _Template:
+    """Decomposition shared by all contexts with one key.
+
+    Attributes:
+        key: context_key of the contexts using the template.
+        steps: Steps with the placeholder goal ID.
+        assembly_index: AI of every goal using the template.
+        complexity_class: Complexity class of that AI.
+        parts: (sub-assembly key, steps) pairs: one per dependency, then the body.
+    """
+
+    key: str
+    steps: tuple[AssemblyStep, ...]
+    assembly_index: int
+    complexity_class: str
+    parts: tuple[tuple[str, tuple[AssemblyStep, ...]], ...]
+
+    @property
+    def shape(self) -> str:
+        """Key of the body sub-assembly, shared by templates with equal structure."""
+        return self.parts[-1][0]
+
+
+class MemoizedGoalDecomposer(GoalDecomposer):
+    """GoalDecomposer that memoizes decompositions by context content.
+
+    A template is composed from the body of the decomposition, built once
+    per (task level, capped count, dependency count), and one resolve
+    step per dependency.  Templates are cached per ``context_key`` and
+    instantiated step lists per (goal_id, key), each in an LRU.  Results
+    equal GoalDecomposer's for every context.
+
+    Attributes:
+        max_templates: Templates kept (0 disables that cache).
+        max_goals: Instantiated step lists kept (0 disables that cache).
+    """
+
+    def __init__(self, max_templates: int = 4096, max_goals: int = 4096) -> None:
+        """Initialize the MemoizedGoalDecomposer.
+
+        Raises:
+            ValueError: If max_templates or max_goals is negative.
+        """
+        super().__init__()
+        if max_templates < 0:
+            raise ValueError(f"max_templates must be >= 0, got {max_templates}")
+        if max_goals < 0:
+            raise ValueError(f"max_goals must be >= 0, got {max_goals}")
+        self.max_templates = max_templates
+        self.max_goals = max_goals
+        self._bodies: dict[tuple[Any, int | None, int], tuple[AssemblyStep, ...]] = {}
+        self._templates: OrderedDict[tuple[Any, ...], _Template] = OrderedDict()
+        self._goals: OrderedDict[tuple[str, str], list[AssemblyStep]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _body(
+        self, level: Any, size: int | None, n: int, context: dict[str, Any]
+    ) -> tuple[AssemblyStep, ...]:
+        """Return the steps following n dependency steps, with the placeholder ID."""
+        body = self._bodies.get((level, size, n))
+        if body is None:
+            steps = super().decompose(_PLACEHOLDER, {**context, "dependencies": [""] * n})
+            body = self._bodies[level, size, n] = tuple(steps[n:])
+        return body
+
+    def _template(self, context: dict[str, Any]) -> tuple[str, _Template]:
+        """Return the key and (cached or new) template for a context."""
+        context_slice = _context_slice(context)
+        template = self._templates.get(context_slice)
+        if template is not None:
+            self._hits += 1
+            self._templates.move_to_end(context_slice)
+            return template.key, template
+
+        self._misses += 1
+        level, size, dependencies = context_slice
+        n = len(dependencies)
+        body = self._body(level, size, n, context)
+        # Same resolve steps as GoalDecomposer.decompose.
+        resolve = tuple(
+            AssemblyStep(
+                step_id=f"{_PLACEHOLDER}_dep_{i}",
+                description=f"Resolve dependency: {dependency}",
+                inputs=(),
+                output=f"{_PLACEHOLDER}_resolved_dep_{i}",
+            )
+            for i, dependency in enumerate(dependencies)
+        )
+        steps = resolve + body
+        assembly_index = compute_assembly_index(list(steps))
+        parts = (
+            *(
+                (_digest("dependency", dependency), (step,))
+                for dependency, step in zip(dependencies, resolve, strict=True)
+            ),
+            (_digest("body", level, size, n), body),
+        )
+        key = _digest(*context_slice)
+        template = _Template(
+            key, steps, assembly_index, classify_complexity(assembly_index), parts
+        )
+        if self.max_templates:
+            self._templates[context_slice] = template
+            if len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return key, template
+
+    def _steps(self, goal_id: str, key: str, template: _Template) -> list[AssemblyStep]:
+        """Return the goal's instantiated steps, from the LRU when present."""
+        cached = self._goals.get((goal_id, key))
+        if cached is not None:
+            self._goals.move_to_end((goal_id, key))
+            return list(cached)
+        steps = _instantiate(template.steps, goal_id)
+        if self.max_goals:
+            self._goals[goal_id, key] = steps
+            if len(self._goals) > self.max_goals:
+                self._goals.popitem(last=False)
+        return list(steps)
+
+    def decompose(self, goal_id: str, context: dict[str, Any]) -> list[AssemblyStep]:
+        """Decompose a goal, reusing the template of contexts with its key.
+
+        Args:
+            goal_id: Identifier of the goal to decompose.
+            context: Goal context (see GoalDecomposer.decompose()).
+
+        Returns:
+            List of AssemblyStep objects in dependency order.
+
+        Raises:
+            ValueError: If context is missing required keys or has an
+                unknown task_level.
+        """
+        key, template = self._template(context)
+        return self._steps(goal_id, key, template)
+
+    def compute_goal_assembly_index(
+        self, goal_id: str, context: dict[str, Any]
+    ) -> AssemblyIndexResult:
+        """Compute Assembly Index for a goal without recounting its steps.
+
+        Args:
+            goal_id: Identifier of the goal.
+            context: Goal context (see GoalDecomposer.decompose()).
+
+        Returns:
+            AssemblyIndexResult with AI, steps, and complexity class.
+        """
+        key, template = self._template(context)
+        return AssemblyIndexResult(
+            pattern_id=goal_id,
+            assembly_index=template.assembly_index,
+            steps=self._steps(goal_id, key, template),
+            complexity_class=template.complexity_class,
+        )
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return template cache hits and misses and cache sizes."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "bodies": len(self._bodies),
+            "templates": len(self._templates),
+            "goals": len(self._goals),
+        }
+
+
+class AssemblyDAG:
+    """Content-addressed sub-assemblies shared across goals.
+
+    Each sub-assembly is stored once however many goals use it, and is
+    dropped when the last goal using it is removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty DAG."""
+        self._nodes: dict[str, tuple[AssemblyStep, ...]] = {}
+        self._uses: Counter[str] = Counter()
+        self._goals: dict[str, tuple[str, ...]] = {}
+        self._joint_steps = 0
+
+    def add_goal(
+        self, goal_id: str, parts: Iterable[tuple[str, tuple[AssemblyStep, ...]]]
+    ) -> None:
+        """Link a goal to its sub-assemblies, replacing an earlier entry.
+
+        Args:
+            goal_id: Identifier of the goal.
+            parts: (content key, template steps) of each sub-assembly.
+        """
+        if goal_id in self._goals:
+            self.remove_goal(goal_id)
+        keys: list[str] = []
+        for key, steps in parts:
+            if key not in self._nodes:
+                self._nodes[key] = steps
+                self._joint_steps += len(steps)
+            self._uses[key] += 1
+            keys.append(key)
+        self._goals[goal_id] = tuple(keys)
+
+    def remove_goal(self, goal_id: str) -> None:
+        """Unlink a goal, dropping sub-assemblies no other goal uses.
+
+        Raises:
+            KeyError: If the goal was never added.
+        """
+        for key in self._goals.pop(goal_id):
+            self._uses[key] -= 1
+            if not self._uses[key]:
+                del self._uses[key]
+                self._joint_steps -= len(self._nodes.pop(key))
+
+    def sub_assemblies(self, goal_id: str) -> tuple[str, ...]:
+        """Return the content keys of a goal's sub-assemblies."""
+        return self._goals[goal_id]
+
+    def uses(self, key: str) -> int:
+        """Return how many goal references a sub-assembly has."""
+        return self._uses.get(key, 0)
+
+    @property
+    def goal_count(self) -> int:
+        """Number of goals in the DAG."""
+        return len(self._goals)
+
+    @property
+    def sub_assembly_count(self) -> int:
+        """Number of distinct sub-assemblies."""
+        return len(self._nodes)
+
+    @property
+    def joint_assembly_index(self) -> int:
+        """Distinct build steps for all goals, shared sub-assemblies counted once."""
+        return self._joint_steps
+
+
+class AssemblyIndexEngine:
+    """Decomposes goals into one shared DAG and validates them incrementally.
+
+    Adding a goal touches only its template and sub-assembly keys; the
+    validator sees the first goal of each template shape in full and the
+    rest by AI alone.  Per-goal step lists are instantiated on demand by
+    result().
+
+    Attributes:
+        decomposer: MemoizedGoalDecomposer producing the templates.
+        dag: AssemblyDAG of every goal added.
+        validator: IncrementalAPSValidator holding the running report.
+    """
+
+    def __init__(
+        self,
+        decomposer: MemoizedGoalDecomposer | None = None,
+        validator: IncrementalAPSValidator | None = None,
+    ) -> None:
+        """Initialize with optional decomposer and validator."""
+        self.decomposer = decomposer or MemoizedGoalDecomposer()
+        self.dag = AssemblyDAG()
+        self.validator = validator or IncrementalAPSValidator()
+        self._templates: dict[str, tuple[str, _Template]] = {}
+
+    def add_goal(self, goal_id: str, context: dict[str, Any]) -> int:
+        """Decompose a goal, link it into the DAG and validate it.
+
+        Adding a goal ID again replaces its DAG entry; the validator
+        counts every add.
+
+        Args:
+            goal_id: Identifier of the goal.
+            context: Goal context (see GoalDecomposer.decompose()).
+
+        Returns:
+            The goal's assembly index.
+
+        Raises:
+            ValueError: If context is missing required keys or has an
+                unknown task_level.
+        """
+        key, template = self.decomposer._template(context)
+        self.dag.add_goal(goal_id, template.parts)
+        self._templates[goal_id] = (key, template)
+        # Templates of one shape differ only in dependency descriptions, so
+        # bounds, completeness and consistency are checked per shape.
+        if template.shape in self.validator:
+            self.validator.add_known(
+                template.shape, context["task_level"], template.assembly_index, goal_id
+            )
+        else:
+            self.validator.add(
+                template.shape,
+                context["task_level"],
+                self.result(goal_id),
+                dependencies=len(context.get("dependencies", [])),
+            )
+        return template.assembly_index
+
+    def result(self, goal_id: str) -> AssemblyIndexResult:
+        """Return the AssemblyIndexResult of a goal added earlier.
+
+        Raises:
+            KeyError: If the goal was never added.
+        """
+        key, template = self._templates[goal_id]
+        return AssemblyIndexResult(
+            pattern_id=goal_id,
+            assembly_index=template.assembly_index,
+            steps=self.decomposer._steps(goal_id, key, template),
+            complexity_class=template.complexity_class,
+        )
+
+    def report(self) -> APSValidationReport:
+        """Return the validation report over all goals added."""
+        return self.validator.report()
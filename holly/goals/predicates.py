@@ -11,15 +11,20 @@ The module provides:
 - CelestialPredicateProtocol: runtime_checkable Protocol for all predicates
 - L0SafetyPredicate through L4ConstitutionalPredicate: level-specific implementations
 - evaluate_celestial_chain(): evaluate all predicates L0→L4 with short-circuit
+- evaluate_celestial_batch(): the same chain over many states, level by level
 - check_celestial_compliance(): full chain pass/fail check
 - DEFAULT_PREDICATES: list of all five predicates in order
 """
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
 
 @dataclass(slots=True, frozen=True)
@@ -151,6 +156,55 @@ class GoalPredicateProtocol(Protocol):
         ...
 
 
+# Text markers tested by L0–L2.  L3/L4 only inspect structured context flags.
+_INTENT_HARM_MARKERS = ("harm", "injure", "kill", "weapon")
+_PAYLOAD_HARM_MARKERS = ("weapon", "exploit", "malware", "virus")
+_DMCA_MARKERS = ("bypass_drm", "circumvent_protection", "crack", "keygen")
+_DECEPTION_MARKERS = ("mislead", "deceive", "manipulate", "fake", "impersonate")
+
+# Every marker matched against the payload / action text, across all levels.
+_PAYLOAD_MARKERS = tuple(
+    dict.fromkeys((*_PAYLOAD_HARM_MARKERS, *_DMCA_MARKERS, *_DECEPTION_MARKERS))
+)
+_ACTION_MARKERS = (*_DMCA_MARKERS, *_DECEPTION_MARKERS)
+
+
+class _MarkerScan:
+    """Marker hits for one state, each text field normalized and scanned once.
+
+    L0, L1 and L2 all substring-match markers against the lowercased payload
+    values (and L1/L2 against the lowercased action).  The scan lowercases
+    each field once and tests the markers of every level in a single pass,
+    lazily, so a field is only touched if a predicate that reads it runs.
+    Payload values are joined with NUL, which no marker contains, so a
+    marker can never match across two values.
+    """
+
+    __slots__ = ("_action", "_payload", "_state")
+
+    def __init__(self, state: CelestialState) -> None:
+        self._state = state
+        self._payload: frozenset[str] | None = None
+        self._action: frozenset[str] | None = None
+
+    @property
+    def payload(self) -> frozenset[str]:
+        """Markers found in any non-None payload value."""
+        if self._payload is None:
+            text = "\x00".join(
+                str(v).lower() for v in self._state.payload.values() if v is not None
+            )
+            self._payload = frozenset(m for m in _PAYLOAD_MARKERS if m in text)
+        return self._payload
+
+    @property
+    def action(self) -> frozenset[str]:
+        """Markers found in the action name."""
+        if self._action is None:
+            text = self._state.action.lower()
+            self._action = frozenset(m for m in _ACTION_MARKERS if m in text)
+        return self._action
+
 
 class L0SafetyPredicate:
     """L0: Physical safety — no harm to humans (highest priority, immutable).
@@ -182,12 +236,16 @@ class L0SafetyPredicate:
         Returns:
             PredicateResult with safety evaluation.
         """
+        return self._evaluate(state, _MarkerScan(state))
+
+    def _evaluate(self, state: CelestialState, scan: _MarkerScan) -> PredicateResult:
+        """Evaluate L0 using payload marker hits from ``scan``."""
         violations = []
         confidence = 1.0
 
         # Check for explicit harm intent in context
         intent = state.context.get("intent", "").lower()
-        if any(harm_marker in intent for harm_marker in ["harm", "injure", "kill", "weapon"]):
+        if any(harm_marker in intent for harm_marker in _INTENT_HARM_MARKERS):
             violations.append("Intent marked as harmful or violent")
             confidence = 0.95
 
@@ -203,13 +261,9 @@ class L0SafetyPredicate:
             confidence = min(confidence, 0.90)
 
         # Check payload for harm indicators
-        payload_markers = ["weapon", "exploit", "malware", "virus"]
-        for marker in payload_markers:
-            if any(
-                marker in str(v).lower()
-                for v in state.payload.values()
-                if v is not None
-            ):
+        payload_hits = scan.payload
+        for marker in _PAYLOAD_HARM_MARKERS:
+            if marker in payload_hits:
                 violations.append(f"Payload contains harm marker: '{marker}'")
                 confidence = min(confidence, 0.85)
 
@@ -275,6 +329,10 @@ class L1LegalPredicate:
         Returns:
             PredicateResult with legal compliance evaluation.
         """
+        return self._evaluate(state, _MarkerScan(state))
+
+    def _evaluate(self, state: CelestialState, scan: _MarkerScan) -> PredicateResult:
+        """Evaluate L1 using action/payload marker hits from ``scan``."""
         violations = []
         confidence = 1.0
 
@@ -299,15 +357,8 @@ class L1LegalPredicate:
             confidence = min(confidence, 0.90)
 
         # Check for copyright/DMCA circumvention assistance
-        dmca_markers = ["bypass_drm", "circumvent_protection", "crack", "keygen"]
-        if any(
-            marker in state.action.lower() or any(
-                marker in str(v).lower()
-                for v in state.payload.values()
-                if v is not None
-            )
-            for marker in dmca_markers
-        ):
+        hits = scan.action | scan.payload
+        if any(marker in hits for marker in _DMCA_MARKERS):
             violations.append("Action assists with copyright circumvention (DMCA)")
             confidence = min(confidence, 0.85)
 
@@ -383,26 +434,16 @@ class L2EthicalPredicate:
         Returns:
             PredicateResult with ethical evaluation.
         """
+        return self._evaluate(state, _MarkerScan(state))
+
+    def _evaluate(self, state: CelestialState, scan: _MarkerScan) -> PredicateResult:
+        """Evaluate L2 using action/payload marker hits from ``scan``."""
         violations = []
         confidence = 1.0
 
         # Check for manipulation/deception
-        deception_markers = [
-            "mislead",
-            "deceive",
-            "manipulate",
-            "fake",
-            "impersonate",
-        ]
-        if any(
-            marker in state.action.lower()
-            or any(
-                marker in str(v).lower()
-                for v in state.payload.values()
-                if v is not None
-            )
-            for marker in deception_markers
-        ):
+        hits = scan.action | scan.payload
+        if any(marker in hits for marker in _DECEPTION_MARKERS):
             violations.append("Action exhibits manipulation or deception pattern")
             confidence = min(confidence, 0.85)
 
@@ -684,6 +725,82 @@ def evaluate_celestial_chain(
     return results
 
 
+def _evaluate_unscanned(
+    predicate: CelestialPredicateProtocol, state: CelestialState, scan: _MarkerScan
+) -> PredicateResult:
+    """Evaluate a predicate that cannot use a shared _MarkerScan."""
+    return predicate.evaluate(state)
+
+
+def _scanning_evaluator(
+    predicate: CelestialPredicateProtocol,
+) -> Callable[[CelestialState, _MarkerScan], PredicateResult] | None:
+    """Return ``predicate._evaluate`` if its evaluate() is the built-in one.
+
+    A subclass overriding evaluate() may decide differently from
+    ``_evaluate``, so it gets None and is evaluated through evaluate().
+    """
+    for base in _SCANNING_PREDICATES:
+        if isinstance(predicate, base) and type(predicate).evaluate is base.evaluate:
+            return predicate._evaluate
+    return None
+
+
+def evaluate_celestial_batch(
+    states: Iterable[CelestialState],
+    predicates: list[CelestialPredicateProtocol] | None = None,
+) -> list[list[PredicateResult]]:
+    """Evaluate the L0→L4 chain for many states. Same results as the sequential chain.
+
+    Intended for screening goal backlogs and replaying audit traffic.  Each
+    state's payload and action text is lowercased once and every L0–L2
+    marker is tested in one pass over it, instead of once per marker per
+    predicate; a state object appearing several times is scanned once.
+    Evaluation proceeds level by level over the states still passing, so
+    short-circuit semantics match evaluate_celestial_chain().
+    Other predicates, including L0–L2 subclasses that override evaluate(),
+    are called via evaluate().
+
+    Args:
+        states: System state snapshots to evaluate.
+        predicates: List of predicates in L0→L4 order (uses DEFAULT_PREDICATES
+            if None).
+
+    Returns:
+        One list of PredicateResults per state, in input order, each equal to
+        evaluate_celestial_chain(state, predicates).
+    """
+    if predicates is None:
+        predicates = DEFAULT_PREDICATES
+
+    batch = list(states)
+    shared: dict[int, _MarkerScan] = {}
+    scans = []
+    for state in batch:
+        scan = shared.get(id(state))
+        if scan is None:
+            scan = shared[id(state)] = _MarkerScan(state)
+        scans.append(scan)
+    results: list[list[PredicateResult]] = [[] for _ in batch]
+    pending = list(range(len(batch)))
+
+    for predicate in predicates:
+        if not pending:
+            break
+        evaluate = _scanning_evaluator(predicate)
+        if evaluate is None:
+            evaluate = functools.partial(_evaluate_unscanned, predicate)
+        still_passing = []
+        for i in pending:
+            result = evaluate(batch[i], scans[i])
+            results[i].append(result)
+            if result.passed:
+                still_passing.append(i)
+        pending = still_passing
+
+    return results
+
+
 def check_celestial_compliance(
     state: CelestialState,
     predicates: list[CelestialPredicateProtocol] | None = None,
@@ -710,7 +827,7 @@ def check_celestial_compliance(
 
 
 # Default predicate instances in L0→L4 order
-DEFAULT_PREDICATES = [
+DEFAULT_PREDICATES: list[CelestialPredicateProtocol] = [
     L0SafetyPredicate(),
     L1LegalPredicate(),
     L2EthicalPredicate(),
@@ -718,6 +835,9 @@ DEFAULT_PREDICATES = [
     L4ConstitutionalPredicate(),
 ]
 
+# Predicates whose marker checks can reuse a shared _MarkerScan
+_SCANNING_PREDICATES = (L0SafetyPredicate, L1LegalPredicate, L2EthicalPredicate)
+
 
 # ============================================================================
 # Celestial Goal-Level Predicates (36.5)
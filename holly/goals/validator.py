@@ -13,15 +13,24 @@ Key classes:
 - PredicateValidationReport: metrics (TP/TN/FP/FN, accuracy, precision, recall)
 - PredicateValidator: validation harness for single and multiple predicates
 
+Generation is reproducible and parallel: each generator owns a
+``random.Random`` stream (the global ``random`` module is never seeded), and
+the validator splits every level into fixed-size shards whose streams are
+derived from one seed.  Shards run in-process or on a process pool and
+their counts are merged into the report as they complete, so the result
+does not depend on the number of workers.
+
 Main entry point: validate_celestial_predicates(count_per_level: int = 1000)
 """
 
 from __future__ import annotations
 
+import os
 import random
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, NamedTuple, Protocol, runtime_checkable
 
 from holly.goals.predicates import (
     CelestialPredicateProtocol,
@@ -40,17 +49,34 @@ class StateGenerator:
 
     Attributes:
         random_seed: Optional seed for reproducible state generation.
+        rng: This generator's private random stream (seeded from random_seed).
     """
 
     random_seed: int | None = None
+    rng: random.Random = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Initialize random seed if provided."""
-        if self.random_seed is not None:
-            random.seed(self.random_seed)
+        """Create the generator's own random stream from the seed."""
+        self.rng = random.Random(self.random_seed)
+
+    def spawn(self, stream: int) -> StateGenerator:
+        """Return a generator with an independent stream derived from this one.
+
+        The child's seed depends only on this generator's seed and `stream`,
+        so shards generated in different processes are reproducible.  An
+        unseeded generator derives from its own (unseeded) stream.
+
+        Args:
+            stream: Stream identifier (e.g. a shard number).
+
+        Returns:
+            A copy of this generator with a derived random_seed.
+        """
+        base = self.random_seed if self.random_seed is not None else self.rng.getrandbits(64)
+        return replace(self, random_seed=random.Random(f"{base}/{stream}").getrandbits(64))
 
     def generate_satisfying_states(
-        self, level: int, count: int = 100
+        self, level: int, count: int = 100, start: int = 0
     ) -> list[CelestialState]:
         """Generate states that SHOULD satisfy level `level` predicate.
 
@@ -60,6 +86,7 @@ class StateGenerator:
         Args:
             level: Celestial level (0–4) for which to generate states.
             count: Number of states to generate (default 100).
+            start: Index of the first state (shards use disjoint ranges).
 
         Returns:
             List of CelestialState instances that should satisfy the predicate.
@@ -71,9 +98,9 @@ class StateGenerator:
             raise ValueError(f"Level must be 0–4, got {level}")
 
         states = []
+        timestamp = datetime.now(timezone.utc)
 
-        for i in range(count):
-            timestamp = datetime.now(timezone.utc)
+        for i in range(start, start + count):
             actor_id = f"actor_{level}_{i}"
             action = f"safe_action_{i}"
 
@@ -114,7 +141,7 @@ class StateGenerator:
                     "privilege_escalation_attempt": False,
                     "actor_role": "user",
                     "required_roles": ["user", "admin"],
-                    "resource_usage": 50,
+                    "resource_usage": self.rng.randint(0, 100),
                     "resource_quota": 100,
                 }
                 payload = {"resource": "file_data"}
@@ -142,7 +169,7 @@ class StateGenerator:
         return states
 
     def generate_violating_states(
-        self, level: int, count: int = 100
+        self, level: int, count: int = 100, start: int = 0
     ) -> list[CelestialState]:
         """Generate states that SHOULD violate level `level` predicate.
 
@@ -152,6 +179,7 @@ class StateGenerator:
         Args:
             level: Celestial level (0–4) for which to generate states.
             count: Number of states to generate (default 100).
+            start: Index of the first state (shards use disjoint ranges).
 
         Returns:
             List of CelestialState instances that should violate the predicate.
@@ -163,9 +191,9 @@ class StateGenerator:
             raise ValueError(f"Level must be 0–4, got {level}")
 
         states = []
+        timestamp = datetime.now(timezone.utc)
 
-        for i in range(count):
-            timestamp = datetime.now(timezone.utc)
+        for i in range(start, start + count):
             actor_id = f"bad_actor_{level}_{i}"
 
             if level == 0:
@@ -247,7 +275,7 @@ class StateGenerator:
                     "privilege_escalation_attempt": i % 3 == 0,
                     "actor_role": "guest",
                     "required_roles": ["admin"],
-                    "resource_usage": 150,
+                    "resource_usage": self.rng.randint(101, 1000),
                     "resource_quota": 100,
                 }
                 payload = {"resource": "sensitive_file"}
@@ -365,6 +393,8 @@ class PredicateValidationReport:
         accuracy: (TP + TN) / Total (0.0–1.0).
         precision: TP / (TP + FP) (0.0–1.0, or NaN if TP + FP == 0).
         recall: TP / (TP + FN) (0.0–1.0, or NaN if TP + FN == 0).
+        stopped_early: Whether validation stopped at the first FP/FN, so the
+            counts cover only part of the requested states.
     """
 
     level: int
@@ -376,6 +406,64 @@ class PredicateValidationReport:
     accuracy: float
     precision: float
     recall: float
+    stopped_early: bool = False
+
+    @classmethod
+    def empty(cls, level: int) -> PredicateValidationReport:
+        """Create a report with no states counted, to be filled incrementally.
+
+        Args:
+            level: Celestial level being validated.
+
+        Returns:
+            A zeroed report (accuracy 0.0, precision and recall 1.0).
+        """
+        return cls(
+            level=level,
+            total_states=0,
+            true_positives=0,
+            true_negatives=0,
+            false_positives=0,
+            false_negatives=0,
+            accuracy=0.0,
+            precision=1.0,
+            recall=1.0,
+        )
+
+    def add(
+        self,
+        true_positives: int = 0,
+        true_negatives: int = 0,
+        false_positives: int = 0,
+        false_negatives: int = 0,
+    ) -> None:
+        """Accumulate classification counts and recompute the metrics.
+
+        Args:
+            true_positives: Additional correctly accepted states.
+            true_negatives: Additional correctly rejected states.
+            false_positives: Additional incorrectly accepted states.
+            false_negatives: Additional incorrectly rejected states.
+        """
+        self.true_positives += true_positives
+        self.true_negatives += true_negatives
+        self.false_positives += false_positives
+        self.false_negatives += false_negatives
+        tp, tn = self.true_positives, self.true_negatives
+        fp, fn = self.false_positives, self.false_negatives
+        self.total_states = tp + tn + fp + fn
+
+        self.accuracy = (tp + tn) / self.total_states if self.total_states > 0 else 0.0
+
+        if tp + fp > 0:
+            self.precision = tp / (tp + fp)
+        else:
+            self.precision = 1.0 if tp == 0 else 0.0
+
+        if tp + fn > 0:
+            self.recall = tp / (tp + fn)
+        else:
+            self.recall = 1.0 if tp == 0 else 0.0
 
     @property
     def is_valid(self) -> bool:
@@ -390,6 +478,69 @@ class PredicateValidationReport:
         return self.false_positives == 0 and self.false_negatives == 0
 
 
+class _Shard(NamedTuple):
+    """A contiguous run of generated states for one level and expectation."""
+
+    level: int
+    should_pass: bool
+    start: int
+    size: int
+    stream: int
+
+
+class _ShardCounts(NamedTuple):
+    """Classification counts for one evaluated shard."""
+
+    true_positives: int
+    true_negatives: int
+    false_positives: int
+    false_negatives: int
+    stopped_early: bool
+
+
+def _validate_shard(
+    predicate: CelestialPredicateProtocol,
+    generator: StateGenerator,
+    shard: _Shard,
+    stop_on_failure: bool,
+) -> _ShardCounts:
+    """Generate and evaluate one shard (runs in a worker process or inline).
+
+    Args:
+        predicate: Predicate under validation.
+        generator: Root generator; the shard uses its own derived stream.
+        shard: Which states to generate.
+        stop_on_failure: Stop at the first false positive or negative.
+
+    Returns:
+        Counts for the states evaluated.
+    """
+    shard_generator = generator.spawn(shard.stream)
+    if shard.should_pass:
+        states = shard_generator.generate_satisfying_states(
+            shard.level, shard.size, start=shard.start
+        )
+    else:
+        states = shard_generator.generate_violating_states(
+            shard.level, shard.size, start=shard.start
+        )
+
+    correct = 0
+    wrong = 0
+    for state in states:
+        if predicate.evaluate(state).passed is shard.should_pass:
+            correct += 1
+        else:
+            wrong += 1
+            if stop_on_failure:
+                break
+
+    stopped = wrong > 0 and stop_on_failure and correct + wrong < shard.size
+    if shard.should_pass:
+        return _ShardCounts(correct, 0, 0, wrong, stopped)
+    return _ShardCounts(0, correct, wrong, 0, stopped)
+
+
 class PredicateValidator:
     """Validates predicate implementations against generated state sets.
 
@@ -397,116 +548,172 @@ class PredicateValidator:
     large sets of states that should satisfy and violate each predicate,
     then checking if the predicate correctly classifies them.
 
+    Each level's states are split into shards of `shard_size`.  Shard k's
+    random stream is derived from the generator's seed and k, so a seeded
+    run produces the same report whether shards are evaluated inline
+    (`workers=1`) or on a process pool.  Predicates and generators must be
+    picklable when `workers > 1`.
+
     Attributes:
         generator: StateGenerator instance for creating test states.
+        workers: Worker processes (1 evaluates inline; None uses all CPUs).
+        shard_size: States generated and evaluated per shard.
     """
 
-    def __init__(self, generator: StateGenerator | None = None) -> None:
+    def __init__(
+        self,
+        generator: StateGenerator | None = None,
+        workers: int | None = 1,
+        shard_size: int = 10_000,
+    ) -> None:
         """Initialize validator with optional custom generator.
 
         Args:
             generator: Optional StateGenerator. Creates new one if None.
+            workers: Worker processes for validation (default 1, inline;
+                None uses os.cpu_count()).
+            shard_size: States per shard (default 10,000).
+
+        Raises:
+            ValueError: If workers or shard_size is less than 1.
         """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if shard_size < 1:
+            raise ValueError(f"shard_size must be >= 1, got {shard_size}")
         self.generator = generator or StateGenerator()
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.shard_size = shard_size
+
+    def _shards(self, level: int, count: int) -> list[_Shard]:
+        """Split `count` states for `level` into satisfying/violating shards."""
+        shards = []
+        violating = count // 2
+        for should_pass, total in ((True, count - violating), (False, violating)):
+            for number, start in enumerate(range(0, total, self.shard_size)):
+                stream = ((level * 2 + should_pass) << 32) | number
+                shards.append(
+                    _Shard(level, should_pass, start, min(self.shard_size, total - start), stream)
+                )
+        return shards
+
+    def _run(
+        self,
+        jobs: list[tuple[CelestialPredicateProtocol, int]],
+        stop_on_failure: bool,
+    ) -> list[PredicateValidationReport]:
+        """Validate (predicate, count) jobs, merging shard counts as they finish.
+
+        Args:
+            jobs: Predicates with the number of states to test for each.
+            stop_on_failure: Stop at the first false positive or negative.
+
+        Returns:
+            One report per job, in job order.  After a stop, every report
+            whose shards did not all finish has stopped_early set.
+        """
+        # Fix the root stream once so every shard derives from the same seed.
+        root = self.generator
+        if root.random_seed is None:
+            root = root.spawn(0)
+
+        reports = [PredicateValidationReport.empty(p.level) for p, _ in jobs]
+        work = [
+            (index, predicate, shard)
+            for index, (predicate, count) in enumerate(jobs)
+            for shard in self._shards(predicate.level, count)
+        ]
+        unfinished = [0] * len(jobs)
+        for index, _, _ in work:
+            unfinished[index] += 1
+
+        def merge(index: int, counts: _ShardCounts) -> bool:
+            report = reports[index]
+            report.add(*counts[:4])
+            unfinished[index] -= 1
+            failed = counts.false_positives + counts.false_negatives > 0
+            if failed and stop_on_failure:
+                report.stopped_early = True
+                for other, left in zip(reports, unfinished, strict=True):
+                    if left:
+                        other.stopped_early = True
+                return True
+            return False
+
+        if self.workers == 1 or len(work) <= 1:
+            for index, predicate, shard in work:
+                counts = _validate_shard(predicate, root, shard, stop_on_failure)
+                if merge(index, counts):
+                    break
+            return reports
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(work))) as pool:
+            pending = {
+                pool.submit(_validate_shard, predicate, root, shard, stop_on_failure): index
+                for index, predicate, shard in work
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if merge(pending.pop(future), future.result()):
+                        for other in pending:
+                            other.cancel()
+                        return reports
+        return reports
 
     def validate_predicate(
         self,
         predicate: CelestialPredicateProtocol,
         count: int = 200,
+        stop_on_failure: bool = False,
     ) -> PredicateValidationReport:
         """Run validation: generate satisfying and violating states.
 
         Tests the predicate against:
-        - count/2 states that should satisfy (pass)
-        - count/2 states that should violate (fail)
+        - count - count//2 states that should satisfy (pass)
+        - count//2 states that should violate (fail)
 
         Calculates TP/TN/FP/FN metrics and accuracy/precision/recall.
 
         Args:
             predicate: Predicate to validate (must implement CelestialPredicateProtocol).
             count: Total states to test (half satisfying, half violating).
+            stop_on_failure: Stop at the first false positive or negative
+                (the report then has stopped_early set and partial counts).
 
         Returns:
             PredicateValidationReport with complete metrics.
         """
-        level = predicate.level
-        half_count = count // 2
-
-        # Generate test states
-        satisfying_states = self.generator.generate_satisfying_states(
-            level, half_count
-        )
-        violating_states = self.generator.generate_violating_states(
-            level, half_count
-        )
-
-        # Count correct and incorrect classifications
-        true_positives = 0
-        true_negatives = 0
-        false_positives = 0
-        false_negatives = 0
-
-        # Test satisfying states (should pass)
-        for state in satisfying_states:
-            result = predicate.evaluate(state)
-            if result.passed:
-                true_positives += 1
-            else:
-                false_negatives += 1
-
-        # Test violating states (should fail)
-        for state in violating_states:
-            result = predicate.evaluate(state)
-            if not result.passed:
-                true_negatives += 1
-            else:
-                false_positives += 1
-
-        # Calculate metrics
-        total = count
-        accuracy = (true_positives + true_negatives) / total if total > 0 else 0.0
-
-        if true_positives + false_positives > 0:
-            precision = true_positives / (true_positives + false_positives)
-        else:
-            precision = 1.0 if true_positives == 0 else 0.0
-
-        if true_positives + false_negatives > 0:
-            recall = true_positives / (true_positives + false_negatives)
-        else:
-            recall = 1.0 if true_positives == 0 else 0.0
-
-        return PredicateValidationReport(
-            level=level,
-            total_states=total,
-            true_positives=true_positives,
-            true_negatives=true_negatives,
-            false_positives=false_positives,
-            false_negatives=false_negatives,
-            accuracy=accuracy,
-            precision=precision,
-            recall=recall,
-        )
+        return self._run([(predicate, count)], stop_on_failure)[0]
 
     def validate_all_levels(
-        self, predicates: list[CelestialPredicateProtocol], count_per_level: int = 200
+        self,
+        predicates: list[CelestialPredicateProtocol],
+        count_per_level: int = 200,
+        stop_on_failure: bool = False,
     ) -> dict[int, PredicateValidationReport]:
         """Validate all predicates across all levels.
 
         Tests each predicate in the list independently and returns a
-        mapping from level to validation report.
+        mapping from level to validation report.  With several workers the
+        shards of all levels share one process pool.
 
         Args:
             predicates: List of predicates to validate.
             count_per_level: Total states to test per level (default 200).
+            stop_on_failure: Stop everything at the first false positive or
+                negative at any level; levels not fully evaluated then
+                have stopped_early set.
 
         Returns:
             Dictionary mapping Celestial level → PredicateValidationReport.
         """
         reports: dict[int, PredicateValidationReport] = {}
 
-        for predicate in predicates:
-            report = self.validate_predicate(predicate, count_per_level)
+        jobs = [(predicate, count_per_level) for predicate in predicates]
+        for predicate, report in zip(
+            predicates, self._run(jobs, stop_on_failure), strict=True
+        ):
             reports[predicate.level] = report
 
         return reports
@@ -538,6 +745,8 @@ class PredicateValidator:
 
 def validate_celestial_predicates(
     count_per_level: int = 1000,
+    workers: int | None = 1,
+    random_seed: int | None = None,
 ) -> dict[int, PredicateValidationReport]:
     """Main entry point: validate all 5 predicates with generated states.
 
@@ -551,6 +760,8 @@ def validate_celestial_predicates(
 
     Args:
         count_per_level: States to test per level (default 1000 per task spec).
+        workers: Worker processes (default 1; None uses all CPUs).
+        random_seed: Seed for reproducible state generation.
 
     Returns:
         Dictionary mapping Celestial level (0–4) → PredicateValidationReport.
@@ -565,8 +776,8 @@ def validate_celestial_predicates(
         ...     print(f"  Accuracy: {report.accuracy:.2%}")
         ...     print(f"  Zero FP/FN: {report.is_valid}")
     """
-    generator = StateGenerator()
-    validator = PredicateValidator(generator)
+    generator = StateGenerator(random_seed)
+    validator = PredicateValidator(generator, workers=workers)
 
     # Validate all five predicates
     reports = validator.validate_all_levels(DEFAULT_PREDICATES, count_per_level)
@@ -19,13 +19,24 @@ Design principles
   matching ICD-032 auth: "Connection pooling (asyncpg pool, 10 connections
   per tenant)".
 - Application-enforced RLS: every acquired connection executes
-  ``SET LOCAL app.current_tenant = '<tenant_id>'`` before any query,
-  matching the RLS policy ``USING (tenant_id =
-  current_setting('app.current_tenant')::uuid)``.
+  ``SELECT set_config('app.current_tenant', '<tenant_id>', false)`` before
+  any query, matching the RLS policy ``USING (tenant_id =
+  current_setting('app.current_tenant')::uuid)``.  With
+  ``session_binding=True`` the per-tenant pool instead binds each
+  connection once at startup, so repository calls cost a single round
+  trip; ``TenantIsolatedPool.transaction()`` sends ``BEGIN`` and the
+  binding together for multi-statement operations, whose statements are
+  pipelined (``executemany``) where they share a shape.
 - Deadlock retry: exponential back-off (1 ms → 2 ms → 4 ms → max 100 ms),
   per ICD-032 error contract.
 - 30 s query timeout, 30 s connection-acquisition timeout (ICD-032 / ICD-039).
 - Audit writes non-blocking (ICD-038): failure logged but does not raise.
+- Bulk ingest: ``append_many`` / ``insert_many`` / ``upsert_many`` write a
+  batch in one round trip.  ``kernel_audit_log`` has no RLS, so it is
+  loaded with binary ``COPY ... FROM STDIN`` when the connection supports
+  it (COPY FROM is not allowed on RLS tables); other tables use one
+  ``INSERT ... SELECT * FROM unnest(...)``.  ``BatchingWriter`` coalesces
+  single-row submissions into such batches, with backpressure.
 
 Usage
 -----
@@ -36,23 +47,31 @@ Usage
         user="holly_core_tenant_a", password="...",
         database="holly", tenant_id=uuid.UUID("..."),
     )
-    backend = PostgresBackend.from_credentials(creds)
-    await backend.open()
+    backend = await PostgresBackend.from_credentials(creds, session_binding=True)
     await backend.goals.insert(goal_row)
+
+    audit = BatchingWriter(backend.audit.append_many)
+    await audit.start()
+    await audit.submit(audit_row)   # written within max_latency seconds
+    await audit.stop()              # flushes what is still buffered
     await backend.close()
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+import functools
 import logging
+import time
 import uuid
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
 
 log = logging.getLogger(__name__)
 
@@ -64,10 +83,21 @@ _POOL_MIN_SIZE: int = 2
 _POOL_MAX_SIZE: int = 10  # ICD-032: 10 connections per tenant
 _ACQUIRE_TIMEOUT_S: float = 30.0
 _QUERY_TIMEOUT_S: float = 30.0
+_AUDIT_TIMEOUT_S: float = 1.0  # ICD-038: audit writes must not block the Kernel
+
+# Per-checkout RLS binding; session-scoped (is_local=false) so it holds
+# outside a transaction too
+_BIND_TENANT: str = "SELECT set_config('app.current_tenant', $1, false)"
 
 # Deadlock retry schedule (milliseconds): ICD-032 error contract
 _DEADLOCK_DELAYS_MS: tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64, 100)
 
+# BatchingWriter defaults: rows per batch, max age of a buffered row,
+# rows buffered or in flight before submit() blocks
+_BATCH_SIZE: int = 500
+_BATCH_MAX_LATENCY_S: float = 0.05
+_BATCH_MAX_PENDING: int = 10_000
+
 
 # ---------------------------------------------------------------------------
 # Protocol: asyncpg-compatible connection / pool
@@ -90,6 +120,29 @@ class ConnectionProto(Protocol):
     async def fetchval(self, query: str, *args: Any, timeout: float | None = None) -> Any:
         ...
 
+    async def executemany(
+        self, command: str, args: Iterable[Sequence[Any]], *, timeout: float | None = None
+    ) -> None:
+        ...
+
+
+@runtime_checkable
+class CopyConnectionProto(ConnectionProto, Protocol):
+    """Connection that can bulk-load rows with binary ``COPY ... FROM STDIN``.
+
+    Matches ``asyncpg.Connection.copy_records_to_table``.
+    """
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str] | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        ...
+
 
 @runtime_checkable
 class PoolProto(Protocol):
@@ -105,7 +158,12 @@ class PoolProto(Protocol):
 
 @runtime_checkable
 class PoolFactory(Protocol):
-    """Factory that creates a PoolProto for given DSN + pool settings."""
+    """Factory that creates a PoolProto for given DSN + pool settings.
+
+    ``options`` carries optional ``asyncpg.create_pool`` keywords
+    (``server_settings``, ``statement_cache_size``); they are only passed
+    when the caller asks for them.
+    """
 
     async def create(
         self,
@@ -114,6 +172,7 @@ class PoolFactory(Protocol):
         min_size: int,
         max_size: int,
         timeout: float,
+        **options: Any,
     ) -> PoolProto:
         ...
 
@@ -148,16 +207,73 @@ class TenantCredentials:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class PoolStats:
+    """Checkout counters for a ``TenantIsolatedPool``.
+
+    Attributes
+    ----------
+    acquired : int
+        Connections handed out by ``acquire()`` or ``transaction()``.
+    setup_statements : int
+        Statements the pool issued itself before yielding (tenant binding,
+        ``BEGIN``).
+    total_wait_seconds : float
+        Time spent waiting for the underlying pool to hand out a connection.
+    max_wait_seconds : float
+        Longest such wait.
+    total_acquire_seconds : float
+        Time from request to a tenant-bound connection (wait plus setup).
+    max_acquire_seconds : float
+        Longest such acquire latency.
+    total_held_seconds : float
+        Time connections were held by callers.
+    """
+
+    acquired: int = 0
+    setup_statements: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    total_acquire_seconds: float = 0.0
+    max_acquire_seconds: float = 0.0
+    total_held_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Mean pool wait per checkout."""
+        return self.total_wait_seconds / self.acquired if self.acquired else 0.0
+
+    @property
+    def mean_acquire_seconds(self) -> float:
+        """Mean acquire latency per checkout."""
+        return self.total_acquire_seconds / self.acquired if self.acquired else 0.0
+
+
 class TenantIsolatedPool:
     """Async connection pool with per-connection RLS context injection.
 
-    On every ``acquire()`` the pool executes::
+    By default, on every ``acquire()`` the pool executes::
 
-        SET LOCAL app.current_tenant = '<tenant_id>';
+        SELECT set_config('app.current_tenant', '<tenant_id>', false);
 
     before yielding the connection.  This activates the PostgreSQL RLS
     policy ``USING (tenant_id = current_setting('app.current_tenant')::uuid)``
-    that must be defined on every tenant-scoped table.
+    that must be defined on every tenant-scoped table.  The setting is
+    session-scoped, so it covers every statement of the checkout whether
+    or not it runs in a transaction (``SET LOCAL`` outside a transaction
+    has no effect); asyncpg's ``RESET ALL`` on release clears it again.
+
+    That costs a round trip per checkout.  Two cheaper bindings exist:
+
+    - ``session_bound=True``: the pool belongs to this tenant alone and its
+      connections already carry ``app.current_tenant`` as a session
+      default (``PostgresBackend.from_credentials(..., session_binding=True)``
+      sets it in every connection's startup ``server_settings``, which
+      asyncpg's ``RESET ALL`` on release restores rather than clears).
+      ``acquire()`` then issues no statement of its own.  Never use it on a
+      pool shared between tenants.
+    - ``transaction()``: for multi-statement operations; ``BEGIN`` and the
+      ``SET LOCAL`` binding go to the server in one round trip.
 
     Parameters
     ----------
@@ -165,30 +281,83 @@ class TenantIsolatedPool:
         Underlying connection pool (asyncpg.Pool in production, mock in tests).
     tenant_id:
         UUID that identifies this tenant context.
+    session_bound:
+        Whether ``pool`` binds every connection to ``tenant_id`` itself.
     """
 
-    __slots__ = ("_pool", "_tenant_id", "_tenant_str")
+    __slots__ = ("_begin", "_pool", "_session_bound", "_tenant_id", "_tenant_str", "stats")
 
-    def __init__(self, pool: PoolProto, tenant_id: uuid.UUID) -> None:
+    def __init__(
+        self, pool: PoolProto, tenant_id: uuid.UUID, *, session_bound: bool = False
+    ) -> None:
         self._pool = pool
         self._tenant_id = tenant_id
         self._tenant_str = str(tenant_id)
+        self._session_bound = session_bound
+        # Simple-query protocol (no parameters) allows several statements per
+        # round trip; the literal is a canonical UUID string, safe to inline.
+        self._begin = (
+            "BEGIN"
+            if session_bound
+            else f"BEGIN; SET LOCAL app.current_tenant = '{self._tenant_str}'"
+        )
+        self.stats = PoolStats()
 
     @property
     def tenant_id(self) -> uuid.UUID:
         return self._tenant_id
 
+    @property
+    def session_bound(self) -> bool:
+        return self._session_bound
+
     @asynccontextmanager
     async def acquire(self) -> AsyncIterator[ConnectionProto]:
         """Yield a connection with RLS tenant context set."""
+        if self._session_bound:
+            async with self._checkout() as conn:
+                yield conn
+        else:
+            # RLS activation for the whole checkout, reset on release
+            async with self._checkout(_BIND_TENANT, self._tenant_str) as conn:
+                yield conn
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[ConnectionProto]:
+        """Yield a tenant-bound connection inside a transaction.
+
+        Commits when the block exits normally, rolls back if it raises.
+        """
+        async with self._checkout(self._begin) as conn:
+            try:
+                yield conn
+            except BaseException:
+                await conn.execute("ROLLBACK", timeout=_QUERY_TIMEOUT_S)
+                raise
+            await conn.execute("COMMIT", timeout=_QUERY_TIMEOUT_S)
+
+    @asynccontextmanager
+    async def _checkout(
+        self, setup: str | None = None, *args: Any
+    ) -> AsyncIterator[ConnectionProto]:
+        """Check a connection out, run ``setup`` on it, record timings."""
+        stats = self.stats
+        requested = time.perf_counter()
         async with self._pool.acquire() as conn:  # type: ignore[attr-defined]
-            # RLS activation: atomic within connection transaction
-            await conn.execute(
-                "SET LOCAL app.current_tenant = $1",
-                self._tenant_str,
-                timeout=_QUERY_TIMEOUT_S,
-            )
-            yield conn
+            checked_out = time.perf_counter()
+            if setup is not None:
+                await conn.execute(setup, *args, timeout=_QUERY_TIMEOUT_S)
+                stats.setup_statements += 1
+            ready = time.perf_counter()
+            stats.acquired += 1
+            stats.total_wait_seconds += checked_out - requested
+            stats.max_wait_seconds = max(stats.max_wait_seconds, checked_out - requested)
+            stats.total_acquire_seconds += ready - requested
+            stats.max_acquire_seconds = max(stats.max_acquire_seconds, ready - requested)
+            try:
+                yield conn
+            finally:
+                stats.total_held_seconds += time.perf_counter() - ready
 
     async def close(self) -> None:
         await self._pool.close()
@@ -205,23 +374,32 @@ class _DeadlockError(Exception):
     """
 
 
-async def _with_deadlock_retry(coro_fn: Any, *args: Any, **kwargs: Any) -> Any:
-    """Execute ``coro_fn(*args, **kwargs)``, retrying on asyncpg deadlock.
+@functools.cache
+def _deadlock_exception() -> type[BaseException]:
+    """Exception class that triggers a retry, resolved once per process.
 
-    Retry schedule: 1 ms, 2 ms, 4 ms, 8 ms, 16 ms, 32 ms, 64 ms, 100 ms.
-    After all retries exhausted, re-raises the last exception.
+    ``asyncpg.DeadlockDetectedError`` when asyncpg is installed, else
+    ``_DeadlockError``.
     """
     try:
         import asyncpg  # local import — not required at module level
-        _deadlock_exc = asyncpg.DeadlockDetectedError
     except ImportError:
-        _deadlock_exc = _DeadlockError  # type: ignore[assignment]
+        return _DeadlockError
+    return cast("type[BaseException]", asyncpg.DeadlockDetectedError)
+
+
+async def _with_deadlock_retry(coro_fn: Any, *args: Any, **kwargs: Any) -> Any:
+    """Execute ``coro_fn(*args, **kwargs)``, retrying on asyncpg deadlock.
 
+    Retry schedule: 1 ms, 2 ms, 4 ms, 8 ms, 16 ms, 32 ms, 64 ms, 100 ms.
+    After all retries exhausted, re-raises the last exception.
+    """
+    deadlock_exc = _deadlock_exception()
     last_exc: BaseException | None = None
     for delay_ms in _DEADLOCK_DELAYS_MS:
         try:
             return await coro_fn(*args, **kwargs)
-        except _deadlock_exc as exc:  # type: ignore[misc]
+        except deadlock_exc as exc:
             last_exc = exc
             await asyncio.sleep(delay_ms / 1000.0)
     raise last_exc  # type: ignore[misc]
@@ -573,6 +751,113 @@ class MemoryRow:
     retention_days: int = 30
 
 
+# ---------------------------------------------------------------------------
+# Bulk row encoding (column order of COPY / unnest statements)
+# ---------------------------------------------------------------------------
+
+_AUDIT_COLUMNS: tuple[str, ...] = (
+    "tenant_id",
+    "boundary_id",
+    "operation",
+    "input_hash",
+    "output_hash",
+    "violations",
+    "timestamp",
+    "trace_id",
+    "user_id",
+    "permission_mask",
+)
+
+
+def _audit_record(row: AuditRow) -> tuple[Any, ...]:
+    return (
+        row.tenant_id,
+        row.boundary_id,
+        row.operation,
+        row.input_hash,
+        row.output_hash,
+        row.violations,
+        row.timestamp,
+        row.trace_id,
+        row.user_id,
+        row.permission_mask,
+    )
+
+
+def _task_state_record(row: TaskStateRow) -> tuple[Any, ...]:
+    return (
+        row.task_id,
+        row.execution_id,
+        row.status,
+        row.started_at,
+        row.completed_at,
+        row.result,
+        row.error,
+        row.retries_attempted,
+        row.next_retry_time,
+        row.lane_type,
+        row.tenant_id,
+        row.user_id,
+        row.trace_id,
+    )
+
+
+def _memory_record(row: MemoryRow) -> tuple[Any, ...]:
+    return (
+        row.id,
+        row.conversation_id,
+        row.agent_id,
+        row.memory_type,
+        row.content,
+        row.embedding_id,
+        row.timestamp,
+        row.tenant_id,
+        row.retention_days,
+    )
+
+
+def _checkpoint_record(row: CheckpointRow) -> tuple[Any, ...]:
+    return (
+        row.workflow_id,
+        row.node_id,
+        row.output_state,
+        row.checkpoint_timestamp,
+        row.idempotency_key,
+        row.output_hash,
+        row.execution_time_ms,
+        row.parent_node_ids,
+        row.tenant_id,
+        row.user_id,
+        row.trace_id,
+    )
+
+
+def _unnest_args(records: list[tuple[Any, ...]]) -> list[list[Any]]:
+    """Transpose row tuples into one array argument per column."""
+    return [list(column) for column in zip(*records, strict=True)]
+
+
+def _merge_task_states(rows: Iterable[TaskStateRow]) -> list[TaskStateRow]:
+    """Collapse repeated task_ids into the row sequential upserts would leave.
+
+    ``ON CONFLICT DO UPDATE`` cannot affect one row twice in a statement.
+    The first row of a task_id supplies the inserted columns and the last
+    supplies the columns the upsert updates.
+    """
+    merged: dict[uuid.UUID, TaskStateRow] = {}
+    for row in rows:
+        first = merged.get(row.task_id)
+        merged[row.task_id] = row if first is None else dataclasses.replace(
+            first,
+            status=row.status,
+            completed_at=row.completed_at,
+            result=row.result,
+            error=row.error,
+            retries_attempted=row.retries_attempted,
+        )
+    return list(merged.values())
+
+
 # ---------------------------------------------------------------------------
 # Table-specific repositories
 # ---------------------------------------------------------------------------
@@ -676,17 +961,73 @@ class AuditRepo:
                     row.trace_id,
                     row.user_id,
                     row.permission_mask,
-                    timeout=1.0,  # ICD-038: 1s timeout, non-blocking
+                    timeout=_AUDIT_TIMEOUT_S,  # ICD-038: 1s timeout, non-blocking
                 )
         except Exception:
             log.exception("kernel_audit_log write failed (non-fatal)")
 
+    async def append_many(self, rows: Sequence[AuditRow]) -> None:
+        """Append a batch of audit entries in one round trip.
+
+        Uses binary COPY when the connection supports it, else one
+        ``INSERT ... SELECT * FROM unnest(...)``.  Failure is non-fatal
+        (ICD-038); no row of a failed batch is written.
+        """
+        if not rows:
+            return
+        records = [_audit_record(row) for row in rows]
+        try:
+            async with self._pool.acquire() as conn:
+                if isinstance(conn, CopyConnectionProto):
+                    await conn.copy_records_to_table(
+                        "kernel_audit_log",
+                        records=records,
+                        columns=_AUDIT_COLUMNS,
+                        timeout=_AUDIT_TIMEOUT_S,
+                    )
+                else:
+                    await conn.execute(
+                        """
+                        INSERT INTO kernel_audit_log (
+                            tenant_id, boundary_id, operation,
+                            input_hash, output_hash, violations,
+                            timestamp, trace_id, user_id, permission_mask
+                        )
+                        SELECT * FROM unnest(
+                            $1::uuid[], $2::varchar[], $3::varchar[],
+                            $4::varchar[], $5::varchar[], $6::jsonb[],
+                            $7::bigint[], $8::uuid[], $9::uuid[], $10::varchar[]
+                        )
+                        """,
+                        *_unnest_args(records),
+                        timeout=_AUDIT_TIMEOUT_S,
+                    )
+        except Exception:
+            log.exception(
+                "kernel_audit_log bulk write of %d rows failed (non-fatal)", len(rows)
+            )
+
 
 class CheckpointsRepo:
     """UPSERT/SELECT for ``workflow_checkpoints`` (ICD-039)."""
 
     __slots__ = ("_pool",)
 
+    _UPSERT = """
+        INSERT INTO workflow_checkpoints (
+            workflow_id, node_id, output_state,
+            checkpoint_timestamp, idempotency_key, output_hash,
+            execution_time_ms, parent_node_ids,
+            tenant_id, user_id, trace_id
+        ) VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11)
+        ON CONFLICT (workflow_id, node_id)
+        DO UPDATE SET
+            output_state         = EXCLUDED.output_state,
+            checkpoint_timestamp = EXCLUDED.checkpoint_timestamp,
+            output_hash          = EXCLUDED.output_hash,
+            execution_time_ms    = EXCLUDED.execution_time_ms
+        """
+
     def __init__(self, pool: TenantIsolatedPool) -> None:
         self._pool = pool
 
@@ -695,34 +1036,29 @@ class CheckpointsRepo:
         async with self._pool.acquire() as conn:
             await _with_deadlock_retry(
                 conn.execute,
-                """
-                INSERT INTO workflow_checkpoints (
-                    workflow_id, node_id, output_state,
-                    checkpoint_timestamp, idempotency_key, output_hash,
-                    execution_time_ms, parent_node_ids,
-                    tenant_id, user_id, trace_id
-                ) VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11)
-                ON CONFLICT (workflow_id, node_id)
-                DO UPDATE SET
-                    output_state         = EXCLUDED.output_state,
-                    checkpoint_timestamp = EXCLUDED.checkpoint_timestamp,
-                    output_hash          = EXCLUDED.output_hash,
-                    execution_time_ms    = EXCLUDED.execution_time_ms
-                """,
-                row.workflow_id,
-                row.node_id,
-                row.output_state,
-                row.checkpoint_timestamp,
-                row.idempotency_key,
-                row.output_hash,
-                row.execution_time_ms,
-                row.parent_node_ids,
-                row.tenant_id,
-                row.user_id,
-                row.trace_id,
+                self._UPSERT,
+                *_checkpoint_record(row),
                 timeout=_QUERY_TIMEOUT_S,
             )
 
+    async def upsert_many(self, rows: Sequence[CheckpointRow]) -> None:
+        """UPSERT a batch of checkpoints in one transaction.
+
+        Equivalent to calling ``upsert`` for each row in order, but atomic:
+        the statements are pipelined with ``executemany`` (one round trip
+        for the whole batch) between ``BEGIN`` and ``COMMIT``.  A deadlock
+        retries the whole transaction.
+        """
+        if not rows:
+            return
+        records = [_checkpoint_record(row) for row in rows]
+
+        async def _write() -> None:
+            async with self._pool.transaction() as conn:
+                await conn.executemany(self._UPSERT, records, timeout=_QUERY_TIMEOUT_S)
+
+        await _with_deadlock_retry(_write)
+
     async def get(self, workflow_id: uuid.UUID, node_id: uuid.UUID) -> Any | None:
         """Fetch checkpoint; returns None if not found or cross-tenant."""
         async with self._pool.acquire() as conn:
@@ -789,6 +1125,43 @@ class TaskStateRepo:
             # ICD-040: task_state is monitoring projection; failure is non-fatal
             log.exception("task_state upsert failed (non-fatal)")
 
+    async def upsert_many(self, rows: Sequence[TaskStateRow]) -> None:
+        """Insert or update a batch of task states in one statement.
+
+        Equivalent to calling ``upsert`` for each row in order.  Failure is
+        non-fatal (ICD-040); no row of a failed batch is written.
+        """
+        if not rows:
+            return
+        records = [_task_state_record(row) for row in _merge_task_states(rows)]
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO task_state (
+                        task_id, execution_id, status, started_at,
+                        completed_at, result, error, retries_attempted,
+                        next_retry_time, lane_type, tenant_id, user_id, trace_id
+                    )
+                    SELECT * FROM unnest(
+                        $1::uuid[], $2::uuid[], $3::varchar[], $4::bigint[],
+                        $5::bigint[], $6::jsonb[], $7::jsonb[], $8::int[],
+                        $9::bigint[], $10::varchar[], $11::uuid[], $12::uuid[],
+                        $13::uuid[]
+                    )
+                    ON CONFLICT (task_id) DO UPDATE SET
+                        status            = EXCLUDED.status,
+                        completed_at      = EXCLUDED.completed_at,
+                        result            = EXCLUDED.result,
+                        error             = EXCLUDED.error,
+                        retries_attempted = EXCLUDED.retries_attempted
+                    """,
+                    *_unnest_args(records),
+                    timeout=_QUERY_TIMEOUT_S,
+                )
+        except Exception:
+            log.exception("task_state bulk upsert of %d rows failed (non-fatal)", len(rows))
+
     async def get(self, task_id: uuid.UUID) -> Any | None:
         async with self._pool.acquire() as conn:
             return await conn.fetchrow(
@@ -831,6 +1204,35 @@ class MemoryRepo:
                 timeout=_QUERY_TIMEOUT_S,
             )
 
+    async def insert_many(self, rows: Sequence[MemoryRow]) -> list[uuid.UUID]:
+        """Insert a batch of memory entries in one statement.
+
+        Returns the ids actually inserted; ids that already exist (or repeat
+        within the batch) are skipped, as with ``insert``.
+        """
+        if not rows:
+            return []
+        records = [_memory_record(row) for row in rows]
+        async with self._pool.acquire() as conn:
+            inserted = await _with_deadlock_retry(
+                conn.fetch,
+                """
+                INSERT INTO memory_store (
+                    id, conversation_id, agent_id, memory_type,
+                    content, embedding_id, timestamp, tenant_id, retention_days
+                )
+                SELECT * FROM unnest(
+                    $1::uuid[], $2::uuid[], $3::uuid[], $4::varchar[],
+                    $5::text[], $6::uuid[], $7::bigint[], $8::uuid[], $9::int[]
+                )
+                ON CONFLICT (id) DO NOTHING
+                RETURNING id
+                """,
+                *_unnest_args(records),
+                timeout=_QUERY_TIMEOUT_S,
+            )
+        return [record["id"] for record in inserted]
+
     async def list_for_agent(self, agent_id: uuid.UUID) -> list[Any]:
         """Return all memories for a given agent (scoped by RLS to tenant)."""
         async with self._pool.acquire() as conn:
@@ -842,6 +1244,213 @@ class MemoryRepo:
             )
 
 
+# ---------------------------------------------------------------------------
+# Batching writer
+# ---------------------------------------------------------------------------
+
+
+class WriterFullError(Exception):
+    """Raised when a BatchingWriter stays full for ``backpressure_timeout``."""
+
+
+class BatchingWriter[RowT]:
+    """Coalesces single-row submissions into bulk writes.
+
+    One flusher task writes rows in submission order.  A batch is written
+    as soon as ``max_batch_size`` rows are buffered or the oldest buffered
+    row is ``max_latency`` seconds old.  While ``max_pending`` rows are
+    buffered or being written, ``submit`` waits for a batch to complete,
+    for at most ``backpressure_timeout`` seconds, then raises
+    ``WriterFullError``: a writer that falls behind slows its producers
+    instead of growing without bound.
+
+    A batch whose ``write_many`` raises is logged and counted in
+    ``failed``; the non-fatal repository methods (``append_many``,
+    ``upsert_many``) log their own failures and never raise.
+
+    Parameters
+    ----------
+    write_many:
+        Bulk write coroutine, e.g. ``AuditRepo.append_many``.
+    max_batch_size:
+        Rows per batch (size trigger).
+    max_latency:
+        Seconds a row may wait in the buffer (latency trigger).
+    max_pending:
+        Rows buffered or in flight before ``submit`` blocks.
+    backpressure_timeout:
+        Seconds ``submit`` waits for space before raising.
+
+    Raises
+    ------
+    ValueError
+        If ``max_batch_size`` < 1, ``max_pending`` < ``max_batch_size``,
+        or ``max_latency`` or ``backpressure_timeout`` is negative.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_flush_requested",
+        "_idle",
+        "_oldest",
+        "_pending",
+        "_rows_ready",
+        "_space",
+        "_task",
+        "_write_many",
+        "backpressure_timeout",
+        "batches",
+        "failed",
+        "max_batch_size",
+        "max_latency",
+        "max_pending",
+        "rejected",
+        "written",
+    )
+
+    def __init__(
+        self,
+        write_many: Callable[[list[RowT]], Awaitable[Any]],
+        *,
+        max_batch_size: int = _BATCH_SIZE,
+        max_latency: float = _BATCH_MAX_LATENCY_S,
+        max_pending: int = _BATCH_MAX_PENDING,
+        backpressure_timeout: float = _QUERY_TIMEOUT_S,
+    ) -> None:
+        if max_batch_size < 1 or max_pending < max_batch_size:
+            raise ValueError(
+                f"need 1 <= max_batch_size <= max_pending, got "
+                f"{max_batch_size} and {max_pending}"
+            )
+        if max_latency < 0 or backpressure_timeout < 0:
+            raise ValueError("max_latency and backpressure_timeout must be >= 0")
+        self._write_many = write_many
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_pending = max_pending
+        self.backpressure_timeout = backpressure_timeout
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.rejected = 0
+        self._buffer: list[RowT] = []
+        self._oldest = 0.0
+        self._pending = 0
+        self._flush_requested = False
+        self._rows_ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        """Rows submitted but not yet written."""
+        return self._pending
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the flusher task (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write every buffered row, then stop the flusher."""
+        if self._task is None:
+            return
+        await self.flush()
+        task, self._task = self._task, None
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    # -- submission -------------------------------------------------------
+
+    async def submit(self, row: RowT) -> None:
+        """Buffer one row for the next batch.
+
+        Raises
+        ------
+        RuntimeError
+            If the writer is not running.
+        WriterFullError
+            If ``max_pending`` rows stay pending for
+            ``backpressure_timeout`` seconds.
+        """
+        if self._task is None:
+            raise RuntimeError("BatchingWriter is not running; call start() first")
+        if self._pending >= self.max_pending:
+            await self._wait_for_space()
+        buffer = self._buffer
+        if not buffer:
+            self._oldest = asyncio.get_running_loop().time()
+        buffer.append(row)
+        self._pending += 1
+        self._idle.clear()
+        # Wake the flusher to start the latency clock or to cut a full batch.
+        if len(buffer) == 1 or len(buffer) >= self.max_batch_size:
+            self._rows_ready.set()
+
+    async def flush(self) -> None:
+        """Write buffered rows now and wait until every pending row is written."""
+        if self._pending and self._task is not None:
+            self._flush_requested = True
+            self._rows_ready.set()
+            await self._idle.wait()
+
+    async def _wait_for_space(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.backpressure_timeout
+        while self._pending >= self.max_pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self.rejected += 1
+                raise WriterFullError(
+                    f"{self._pending} rows pending (max_pending={self.max_pending})"
+                )
+            self._space.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._space.wait(), remaining)
+
+    # -- flushing ---------------------------------------------------------
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._rows_ready.wait()
+            self._rows_ready.clear()
+            buffer = self._buffer
+            if not buffer:
+                continue
+            while len(buffer) < self.max_batch_size and not self._flush_requested:
+                remaining = self._oldest + self.max_latency - loop.time()
+                if remaining <= 0:
+                    break
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._rows_ready.wait(), remaining)
+                self._rows_ready.clear()
+
+            # Rows left over after this batch keep the old timestamp, so
+            # they are written early rather than late.
+            batch = buffer[: self.max_batch_size]
+            del buffer[: self.max_batch_size]
+            try:
+                await self._write_many(batch)
+                self.written += len(batch)
+            except Exception:
+                self.failed += len(batch)
+                log.exception("bulk write of %d rows failed", len(batch))
+            self.batches += 1
+            self._pending -= len(batch)
+            self._space.set()
+            if buffer:
+                self._rows_ready.set()
+            else:
+                self._flush_requested = False
+                self._idle.set()
+
+
 # ---------------------------------------------------------------------------
 # High-level backend
 # ---------------------------------------------------------------------------
@@ -859,6 +1468,9 @@ class PostgresBackend:
         Underlying asyncpg pool (injected for testability).
     tenant_id:
         The tenant this backend serves.
+    session_bound:
+        Whether ``pool`` binds every connection to ``tenant_id`` itself
+        (see ``TenantIsolatedPool``).
     """
 
     __slots__ = (
@@ -871,9 +1483,11 @@ class PostgresBackend:
         "task_state",
     )
 
-    def __init__(self, pool: PoolProto, tenant_id: uuid.UUID) -> None:
+    def __init__(
+        self, pool: PoolProto, tenant_id: uuid.UUID, *, session_bound: bool = False
+    ) -> None:
         self._raw_pool = pool
-        self._tenant_pool = TenantIsolatedPool(pool, tenant_id)
+        self._tenant_pool = TenantIsolatedPool(pool, tenant_id, session_bound=session_bound)
         self.goals = GoalsRepo(self._tenant_pool)
         self.audit = AuditRepo(self._tenant_pool)
         self.checkpoints = CheckpointsRepo(self._tenant_pool)
@@ -884,6 +1498,11 @@ class PostgresBackend:
     def tenant_id(self) -> uuid.UUID:
         return self._tenant_pool.tenant_id
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Checkout counters of the tenant pool."""
+        return self._tenant_pool.stats
+
     async def close(self) -> None:
         """Close the underlying connection pool."""
         await self._raw_pool.close()
@@ -894,6 +1513,8 @@ class PostgresBackend:
         creds: TenantCredentials,
         *,
         pool_factory: PoolFactory | None = None,
+        session_binding: bool = False,
+        statement_cache_size: int | None = None,
     ) -> PostgresBackend:
         """Create and open a PostgresBackend from TenantCredentials.
 
@@ -904,6 +1525,17 @@ class PostgresBackend:
         pool_factory:
             Optional pool factory for dependency injection in tests.
             If None, uses the real asyncpg.create_pool.
+        session_binding:
+            Bind ``app.current_tenant`` once per connection through the
+            startup ``server_settings`` instead of once per checkout.  The
+            pool is created for this tenant only, so this is safe; it saves
+            one round trip per repository call.
+        statement_cache_size:
+            Size of asyncpg's per-connection prepared-statement cache.  The
+            repository queries are fixed strings, so after the first call on
+            a connection each is bound and executed without a re-prepare
+            round trip.  Set 0 behind a transaction-mode pgbouncer; None
+            keeps asyncpg's default (100, well above the repo query count).
         """
         if pool_factory is None:
             import asyncpg  # deferred import
@@ -916,20 +1548,28 @@ class PostgresBackend:
                     min_size: int,
                     max_size: int,
                     timeout: float,
+                    **options: Any,
                 ) -> PoolProto:
                     return await asyncpg.create_pool(  # type: ignore[return-value]
                         dsn,
                         min_size=min_size,
                         max_size=max_size,
                         timeout=timeout,
+                        **options,
                     )
 
             pool_factory = _AsyncpgFactory()
 
+        options: dict[str, Any] = {}
+        if session_binding:
+            options["server_settings"] = {"app.current_tenant": str(creds.tenant_id)}
+        if statement_cache_size is not None:
+            options["statement_cache_size"] = statement_cache_size
         pool = await pool_factory.create(
             creds.dsn,
             min_size=_POOL_MIN_SIZE,
             max_size=_POOL_MAX_SIZE,
             timeout=_ACQUIRE_TIMEOUT_S,
+            **options,
         )
-        return cls(pool, creds.tenant_id)
+        return cls(pool, creds.tenant_id, session_bound=session_binding)
@@ -0,0 +1,276 @@
+"""In-process PostgreSQL stand-in satisfying ``PoolProto`` and ``CopyConnectionProto``.
+
+Interprets the statement shapes issued by :mod:`holly.storage.postgres`:
+
+- ``INSERT INTO t (cols) VALUES ($1, ...)`` and
+  ``INSERT INTO t (cols) SELECT * FROM unnest($1::type[], ...)``, each with
+  an optional ``ON CONFLICT (key) DO NOTHING | DO UPDATE SET c = EXCLUDED.c``
+  and ``RETURNING col``;
+- ``UPDATE t SET a = $1 [, ...] WHERE b = $2 [AND ...]``;
+- ``SELECT * FROM t WHERE a = $1 [AND b = $2 ...] [ORDER BY c [DESC]]``;
+- ``executemany`` of any of these (one pipelined round trip);
+- ``copy_records_to_table`` (binary COPY);
+- ``SET LOCAL``, ``set_config``, transaction control and DDL, which are
+  accepted and ignored (statements are applied immediately; ``ROLLBACK`` undoes nothing).
+
+Rows are dicts keyed by primary key.  RLS is not enforced.  Each statement
+awaits ``latency`` seconds to model a network round trip plus
+``row_latency`` seconds per row written to model server-side insert cost,
+so single-row and bulk paths can be compared.
+
+This module provides:
+- InMemoryPostgres: single-process Postgres stand-in for tests and benchmarks
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import re
+import uuid
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+__all__ = [
+    "CardinalityViolationError",
+    "InMemoryPostgres",
+    "UniqueViolationError",
+]
+
+# Primary keys from postgres.DDL_TABLES; ``id`` defaults are generated.
+_PRIMARY_KEYS: dict[str, tuple[str, ...]] = {
+    "agents": ("id",),
+    "goals": ("id",),
+    "topologies": ("id",),
+    "conversations": ("id",),
+    "goals_history": ("id",),
+    "idempotency_keys": ("key",),
+    "logs": ("id",),
+    "kernel_audit_log": ("id",),
+    "workflow_checkpoints": ("workflow_id", "node_id"),
+    "task_state": ("task_id",),
+    "memory_store": ("id",),
+}
+_SERIAL_TABLES = frozenset({"logs", "kernel_audit_log"})
+
+_INSERT = re.compile(
+    r"INSERT INTO (\w+) \(([^)]*)\) (VALUES|SELECT \* FROM unnest) ?\([^)]*\)"
+    r"(?: ON CONFLICT \(([^)]*)\) DO (NOTHING|UPDATE SET (.*?)))?"
+    r"(?: RETURNING (\w+))?$"
+)
+_SELECT = re.compile(
+    r"SELECT \* FROM (\w+) WHERE (.*?)(?: ORDER BY (\w+)( DESC| ASC)?)?$"
+)
+_UPDATE = re.compile(r"UPDATE (\w+) SET (.*?) WHERE (.*)$")
+_CONDITION = re.compile(r"(\w+) = \$(\d+)")
+_EXCLUDED = re.compile(r"(\w+) = EXCLUDED\.(\w+)")
+_IGNORED = (
+    "SET",
+    "SELECT set_config",
+    "BEGIN",
+    "COMMIT",
+    "ROLLBACK",
+    "CREATE",
+    "ALTER",
+    "DROP",
+)
+
+
+class UniqueViolationError(Exception):
+    """Duplicate primary key inserted without ``ON CONFLICT``."""
+
+
+class CardinalityViolationError(Exception):
+    """``ON CONFLICT DO UPDATE`` would update one row twice in a statement."""
+
+
+class InMemoryPostgres:
+    """Single-process stand-in for a Postgres pool and its connections.
+
+    ``acquire()`` yields the instance itself, so every connection shares
+    one table store.
+
+    Parameters
+    ----------
+    latency : float
+        Seconds each statement waits before executing (simulated RTT).
+    row_latency : float
+        Additional seconds per row written.
+    """
+
+    def __init__(self, latency: float = 0.0, row_latency: float = 0.0) -> None:
+        self.latency = latency
+        self.row_latency = row_latency
+        self.statements = 0
+        self.closed = False
+        self.tables: dict[str, dict[tuple[Any, ...], dict[str, Any]]] = {}
+        self._serial = itertools.count(1)
+
+    async def _round_trip(self, rows: int = 0) -> None:
+        self.statements += 1
+        await asyncio.sleep(self.latency + rows * self.row_latency)
+
+    # -- PoolProto ---------------------------------------------------------
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[InMemoryPostgres]:
+        """Yield a connection (this instance)."""
+        if self.closed:
+            raise RuntimeError("pool is closed")
+        yield self
+
+    async def close(self) -> None:
+        """Close the pool."""
+        self.closed = True
+
+    # -- ConnectionProto ---------------------------------------------------
+
+    async def execute(self, query: str, *args: Any, timeout: float | None = None) -> str:
+        """Run a statement; return its command tag."""
+        sql = " ".join(query.split())
+        if sql.startswith(_IGNORED):
+            await self._round_trip()
+            return sql.split(" ", 1)[0]
+        count, _ = await self._run(sql, args)
+        verb = sql.split(" ", 1)[0]
+        return f"INSERT 0 {count}" if verb == "INSERT" else f"{verb} {count}"
+
+    async def fetch(self, query: str, *args: Any, timeout: float | None = None) -> list[Any]:
+        """Run a statement; return its result rows."""
+        _, rows = await self._run(" ".join(query.split()), args)
+        return rows
+
+    async def fetchrow(self, query: str, *args: Any, timeout: float | None = None) -> Any | None:
+        """Run a statement; return its first row or None."""
+        rows = await self.fetch(query, *args, timeout=timeout)
+        return rows[0] if rows else None
+
+    async def fetchval(self, query: str, *args: Any, timeout: float | None = None) -> Any:
+        """Run a statement; return the first column of its first row or None."""
+        row = await self.fetchrow(query, *args, timeout=timeout)
+        return None if row is None else next(iter(row.values()))
+
+    async def executemany(
+        self, command: str, args: Iterable[Sequence[Any]], *, timeout: float | None = None
+    ) -> None:
+        """Run a statement once per argument tuple in one round trip."""
+        sql = " ".join(command.split())
+        batch = list(args)
+        await self._round_trip(len(batch))
+        for arguments in batch:
+            await self._run(sql, arguments, timed=False)
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str] | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """Bulk-load records; all or none are written."""
+        if columns is None:
+            raise ValueError("columns are required")
+        rows = [dict(zip(columns, record, strict=True)) for record in records]
+        await self._round_trip(len(rows))
+        self._insert(table_name, rows, None, None, ())
+        return f"COPY {len(rows)}"
+
+    # -- interpreter -------------------------------------------------------
+
+    async def _run(
+        self, sql: str, args: Sequence[Any], *, timed: bool = True
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Execute an INSERT, UPDATE or SELECT; return (rows affected, result rows).
+
+        ``timed=False`` skips the round trip (the caller has paid it).
+        """
+        match = _INSERT.match(sql)
+        if match is not None:
+            table, column_list, source, conflict, action, updates, returning = match.groups()
+            columns = [c.strip() for c in column_list.split(",")]
+            if source == "VALUES":
+                values: list[Sequence[Any]] = [args]
+            else:
+                values = list(zip(*args, strict=True))
+            rows = [dict(zip(columns, value, strict=True)) for value in values]
+            if timed:
+                await self._round_trip(len(rows))
+            written = self._insert(
+                table,
+                rows,
+                tuple(c.strip() for c in conflict.split(",")) if conflict else None,
+                action,
+                [target for target, _ in _EXCLUDED.findall(updates or "")],
+            )
+            result = [{returning: row[returning]} for row in written] if returning else []
+            return len(written), result
+
+        match = _UPDATE.match(sql)
+        if match is not None:
+            table, assignments, where = match.groups()
+            if timed:
+                await self._round_trip()
+            matched = self._where(table, where, args)
+            for row in matched:
+                row.update((c, args[int(n) - 1]) for c, n in _CONDITION.findall(assignments))
+            return len(matched), []
+
+        match = _SELECT.match(sql)
+        if match is not None:
+            table, where, order_by, direction = match.groups()
+            if timed:
+                await self._round_trip()
+            found = [dict(row) for row in self._where(table, where, args)]
+            if order_by:
+                found.sort(key=lambda row: row[order_by], reverse=direction == " DESC")
+            return len(found), found
+
+        raise NotImplementedError(f"unsupported statement: {sql[:80]}")
+
+    def _where(self, table: str, where: str, args: Sequence[Any]) -> list[dict[str, Any]]:
+        """Stored rows matching ``a = $1 AND b = $2 ...``."""
+        conditions = [(column, args[int(n) - 1]) for column, n in _CONDITION.findall(where)]
+        return [
+            row
+            for row in self.tables.get(table, {}).values()
+            if all(row.get(column) == value for column, value in conditions)
+        ]
+
+    def _insert(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict: tuple[str, ...] | None,
+        action: str | None,
+        updates: Sequence[str],
+    ) -> list[dict[str, Any]]:
+        """Apply an insert atomically; return the rows inserted or updated."""
+        key_columns = _PRIMARY_KEYS.get(table, ("id",))
+        stored = self.tables.get(table, {})
+        staged: dict[tuple[Any, ...], dict[str, Any]] = {}
+        written: list[dict[str, Any]] = []
+        for row in rows:
+            if "id" in key_columns and "id" not in row:
+                row["id"] = next(self._serial) if table in _SERIAL_TABLES else uuid.uuid4()
+            key = tuple(row[c] for c in key_columns)
+            existing = staged.get(key, stored.get(key))
+            if existing is None:
+                staged[key] = row
+                written.append(row)
+            elif conflict is None:
+                raise UniqueViolationError(f"duplicate key {key} in {table}")
+            elif action == "NOTHING":
+                continue
+            elif key in staged:
+                raise CardinalityViolationError(
+                    "ON CONFLICT DO UPDATE command cannot affect row a second time"
+                )
+            else:
+                staged[key] = {**existing, **{c: row[c] for c in updates}}
+                written.append(staged[key])
+        self.tables.setdefault(table, {}).update(staged)
+        return written
@@ -14,6 +14,8 @@ from holly.storage.redis.client import (
     CacheClient,
     CircuitBreaker,
     CircuitState,
+    LeasedItem,
+    LeaseQueueClient,
     PubSubClient,
     QueueClient,
     QueueFull,
@@ -21,6 +23,7 @@ from holly.storage.redis.client import (
     RedisClientProto,
     RevocationCache,
     StreamClient,
+    lease_queue_key,
     queue_key,
     revocation_key,
     stream_key,
@@ -39,6 +42,8 @@ __all__ = [
     "CacheClient",
     "CircuitBreaker",
     "CircuitState",
+    "LeaseQueueClient",
+    "LeasedItem",
     "PubSubClient",
     "QueueClient",
     "QueueFull",
@@ -46,6 +51,7 @@ __all__ = [
     "RedisClientProto",
     "RevocationCache",
     "StreamClient",
+    "lease_queue_key",
     "queue_key",
     "revocation_key",
     "stream_key",
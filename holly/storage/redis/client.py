@@ -2,7 +2,7 @@
 
 Implements tenant-scoped Redis operations per ICDs:
   ICD-033: Core ↔ Redis (short-term memory, goal cache, idempotency)
-  ICD-035: Engine ↔ Redis (task queues, pub/sub, cron queues)
+  ICD-035: Engine ↔ Redis (task queues, leased work queues, pub/sub, cron queues)
   ICD-037: Observability ↔ Redis (real-time metrics streams)
   ICD-041: Memory System ↔ Redis (conversation context, agent memory)
   ICD-049: JWT Middleware ↔ Redis (token revocation cache)
@@ -18,6 +18,7 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol
+from uuid import uuid4
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -55,7 +56,7 @@ def tenant_key(tenant_id: UUID, key: str) -> str:
     return f"tenant:{tenant_id}:{key}"
 
 
-def queue_key(tenant_id: UUID, queue_name: str) -> str:
+def queue_key(tenant_id: UUID | str, queue_name: str) -> str:
     """Build a tenant-scoped queue key: ``{queue_name}_{tenant_id}``.
 
     Per ICD-035: e.g. ``main_queue_{tenant_id}``, ``cron_queue_{tenant_id}``.
@@ -63,6 +64,15 @@ def queue_key(tenant_id: UUID, queue_name: str) -> str:
     return f"{queue_name}_{tenant_id}"
 
 
+def lease_queue_key(tenant_id: UUID | str, queue_name: str) -> str:
+    """Build a leased queue key: ``<queue_name>_{<tenant_id>}``.
+
+    As :func:`queue_key`, with the tenant id in braces as a Redis Cluster
+    hash tag so every key of one leased queue maps to the same slot.
+    """
+    return f"{queue_name}_{{{tenant_id}}}"
+
+
 def stream_key(tenant_id: UUID, stream_name: str) -> str:
     """Build a tenant-scoped stream key: ``{stream_name}_{tenant_id}``.
 
@@ -172,6 +182,16 @@ class RedisClientProto(Protocol):
         """Return ``True`` if the connection is alive."""
         ...
 
+    async def zcard(self, key: str) -> int:
+        """Return the cardinality of sorted set *key* (0 if absent)."""
+        ...
+
+    async def eval(
+        self, script: str, numkeys: int, *keys_and_args: str | bytes | float
+    ) -> object:
+        """Run Lua *script* atomically with *numkeys* keys followed by args."""
+        ...
+
 
 # ---------------------------------------------------------------------------
 # CircuitBreaker — HA failover (ICD-033 / ICD-035 error contracts)
@@ -433,6 +453,223 @@ class QueueClient:
         return await self.client.llen(queue_key(tenant_id, queue_name))
 
 
+# ---------------------------------------------------------------------------
+# LeaseQueueClient — ICD-035 durable work queues
+# ---------------------------------------------------------------------------
+
+# Each leased queue uses four keys derived from ``lease_queue_key``:
+#   {q}          ZSET ready items, score = priority rank (lower = sooner)
+#   {q}:leased   ZSET claimed items, score = lease deadline (unix seconds)
+#   {q}:payload  HASH item_id -> payload
+#   {q}:meta     HASH item_id -> rank, item_id#n -> delivery count,
+#                item_id#lease -> lease id of the latest claim
+# ack and nack are fenced by the lease id, so a consumer whose lease
+# expired cannot settle the claim of the item's next holder.  Every operation is one Lua script, so it is atomic on the server and
+# costs one round trip.  The tenant id is a Redis Cluster hash tag, so a
+# script's keys always share a slot.
+
+LEASE_PUSH_SCRIPT = """
+local limit = tonumber(ARGV[4])
+if redis.call('HEXISTS', KEYS[3], ARGV[1]) == 1 then return 0 end
+if redis.call('ZCARD', KEYS[1]) + redis.call('ZCARD', KEYS[2]) >= limit then return -1 end
+redis.call('HSET', KEYS[3], ARGV[1], ARGV[2])
+redis.call('HSET', KEYS[4], ARGV[1], ARGV[3])
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+return 1
+"""
+
+LEASE_CLAIM_SCRIPT = """
+local now = tonumber(ARGV[1])
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)
+for _, id in ipairs(expired) do
+  redis.call('ZREM', KEYS[2], id)
+  redis.call('ZADD', KEYS[1], redis.call('HGET', KEYS[4], id), id)
+end
+local ids = redis.call('ZRANGE', KEYS[1], 0, tonumber(ARGV[3]) - 1)
+local out = {}
+for _, id in ipairs(ids) do
+  redis.call('ZREM', KEYS[1], id)
+  redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), id)
+  redis.call('HSET', KEYS[4], id .. '#lease', ARGV[4])
+  local n = redis.call('HINCRBY', KEYS[4], id .. '#n', 1)
+  table.insert(out, id)
+  table.insert(out, redis.call('HGET', KEYS[3], id))
+  table.insert(out, n)
+end
+return out
+"""
+
+LEASE_ACK_SCRIPT = """
+local n = 0
+for i = 1, #ARGV, 2 do
+  local id = ARGV[i]
+  if redis.call('HGET', KEYS[4], id .. '#lease') == ARGV[i + 1] then
+    redis.call('ZREM', KEYS[1], id)
+    redis.call('ZREM', KEYS[2], id)
+    n = n + redis.call('HDEL', KEYS[3], id)
+    redis.call('HDEL', KEYS[4], id, id .. '#n', id .. '#lease')
+  end
+end
+return n
+"""
+
+LEASE_NACK_SCRIPT = """
+if redis.call('HGET', KEYS[4], ARGV[1] .. '#lease') ~= ARGV[2] then return 0 end
+if redis.call('ZREM', KEYS[2], ARGV[1]) == 0 then return 0 end
+redis.call('ZADD', KEYS[1], redis.call('HGET', KEYS[4], ARGV[1]), ARGV[1])
+return 1
+"""
+
+
+def _text(value: str | bytes) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+@dataclass(frozen=True)
+class LeasedItem:
+    """An item claimed from a :class:`LeaseQueueClient` queue.
+
+    Attributes:
+        item_id:  Queue-unique identifier.
+        payload:  Stored payload.
+        attempts: Delivery count, including this one (> 1 means redelivery).
+        lease_id: Identifier of the claim; ``ack`` and ``nack`` must
+                  present it.
+    """
+
+    item_id: str
+    payload: bytes
+    attempts: int
+    lease_id: str
+
+
+@dataclass
+class LeaseQueueClient:
+    """Priority work queues with claim-with-lease semantics (ICD-035).
+
+    ``claim`` moves up to *count* of the best-ranked items into a lease
+    set with a visibility deadline; ``ack`` deletes them and ``nack``
+    returns them to the ready set at their original rank.  Leases that
+    expire before an ack (consumer crash, stall) are returned to the
+    ready set by the next ``claim`` on the queue, so items are delivered
+    at least once.  ``ack`` and ``nack`` take the lease id returned by
+    ``claim`` and only settle an item while that lease is its latest.
+    Each call is a single atomic script round trip.
+
+    Attributes:
+        client:      Redis client.
+        depth_limit: Default maximum ready + leased items per tenant queue
+                     (``push`` accepts a per-call limit).
+    """
+
+    client: RedisClientProto
+    depth_limit: int = QUEUE_DEPTH_LIMIT
+
+    @staticmethod
+    def _keys(tenant_id: UUID | str, queue_name: str) -> tuple[str, str, str, str]:
+        base = lease_queue_key(tenant_id, queue_name)
+        return base, f"{base}:leased", f"{base}:payload", f"{base}:meta"
+
+    async def push(
+        self,
+        tenant_id: UUID | str,
+        queue_name: str,
+        item_id: str,
+        payload: bytes | str,
+        rank: float,
+        *,
+        depth_limit: int | None = None,
+    ) -> bool:
+        """Add *item_id* with *payload*, ordered by ascending *rank*.
+
+        *depth_limit* overrides the client's ``depth_limit`` for this call.
+        Returns ``False`` if *item_id* is already queued or leased.
+
+        Raises:
+            QueueFull: If ready + leased items reach the depth limit.
+        """
+        limit = self.depth_limit if depth_limit is None else depth_limit
+        keys = self._keys(tenant_id, queue_name)
+        result = await self.client.eval(
+            LEASE_PUSH_SCRIPT, 4, *keys, item_id, payload, rank, limit
+        )
+        if result == -1:
+            raise QueueFull(keys[0], limit, limit)
+        return result == 1
+
+    async def claim(
+        self,
+        tenant_id: UUID | str,
+        queue_name: str,
+        count: int,
+        lease_seconds: float,
+        now: float | None = None,
+    ) -> list[LeasedItem]:
+        """Lease up to *count* items for *lease_seconds*.
+
+        Expired leases are requeued first, in the same round trip.  The
+        items share a new lease id.
+        """
+        now = time.time() if now is None else now
+        lease_id = uuid4().hex
+        raw = await self.client.eval(
+            LEASE_CLAIM_SCRIPT,
+            4,
+            *self._keys(tenant_id, queue_name),
+            now,
+            lease_seconds,
+            count,
+            lease_id,
+        )
+        flat = list(raw) if isinstance(raw, list) else []
+        return [
+            LeasedItem(
+                item_id=_text(flat[i]),
+                payload=flat[i + 1].encode() if isinstance(flat[i + 1], str) else flat[i + 1],
+                attempts=int(flat[i + 2]),
+                lease_id=lease_id,
+            )
+            for i in range(0, len(flat), 3)
+        ]
+
+    async def ack(
+        self, tenant_id: UUID | str, queue_name: str, *leases: tuple[str, str]
+    ) -> int:
+        """Delete completed items given as ``(item_id, lease_id)`` pairs.
+
+        Returns the number removed; items claimed again since (expired
+        lease) are left alone.
+        """
+        if not leases:
+            return 0
+        args = [arg for lease in leases for arg in lease]
+        result = await self.client.eval(
+            LEASE_ACK_SCRIPT, 4, *self._keys(tenant_id, queue_name), *args
+        )
+        return result if isinstance(result, int) else 0
+
+    async def nack(
+        self, tenant_id: UUID | str, queue_name: str, item_id: str, lease_id: str
+    ) -> bool:
+        """Release lease *lease_id* on *item_id* for immediate redelivery.
+
+        Returns ``False`` if the item is no longer leased under *lease_id*.
+        """
+        result = await self.client.eval(
+            LEASE_NACK_SCRIPT,
+            4,
+            *self._keys(tenant_id, queue_name),
+            item_id,
+            lease_id,
+        )
+        return result == 1
+
+    async def depth(self, tenant_id: UUID | str, queue_name: str) -> tuple[int, int]:
+        """Return ``(ready, leased)`` item counts."""
+        ready, leased, _, _ = self._keys(tenant_id, queue_name)
+        return await self.client.zcard(ready), await self.client.zcard(leased)
+
+
 # ---------------------------------------------------------------------------
 # PubSubClient — ICD-035
 # ---------------------------------------------------------------------------
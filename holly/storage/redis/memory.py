@@ -0,0 +1,364 @@
+"""In-process Redis stand-in satisfying ``RedisClientProto``.
+
+Implements the string, list, sorted-set, hash, stream and pub/sub
+commands used by :mod:`holly.storage.redis.client`.  ``eval`` does not
+interpret Lua; it runs Python equivalents of the scripts shipped in
+``client`` (the ``LEASE_*_SCRIPT`` constants).  Each command awaits
+``latency`` seconds to model a network round trip, and scripts run
+without yielding, so they are atomic with respect to other coroutines
+just as on a real server.
+
+This module provides:
+- InMemoryRedis: single-process Redis stand-in for tests and benchmarks
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from holly.storage.redis.client import (
+    LEASE_ACK_SCRIPT,
+    LEASE_CLAIM_SCRIPT,
+    LEASE_NACK_SCRIPT,
+    LEASE_PUSH_SCRIPT,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = [
+    "InMemoryRedis",
+]
+
+
+def _bytes(value: str | bytes | float) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+def _str(value: str | bytes | float) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+class _SortedSet:
+    """Member -> score map with a lazily-pruned heap for min extraction."""
+
+    __slots__ = ("_heap", "scores")
+
+    def __init__(self) -> None:
+        self.scores: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def add(self, member: str, score: float) -> bool:
+        added = member not in self.scores
+        self.scores[member] = score
+        heapq.heappush(self._heap, (score, member))
+        if len(self._heap) > 2 * len(self.scores) + 64:
+            self._heap = [(s, m) for m, s in self.scores.items()]
+            heapq.heapify(self._heap)
+        return added
+
+    def remove(self, member: str) -> bool:
+        return self.scores.pop(member, None) is not None
+
+    def pop_min(self, max_score: float = math.inf) -> str | None:
+        heap = self._heap
+        while heap:
+            score, member = heap[0]
+            if self.scores.get(member) != score:
+                heapq.heappop(heap)
+                continue
+            if score > max_score:
+                return None
+            heapq.heappop(heap)
+            del self.scores[member]
+            return member
+        return None
+
+    def range_by_score(self, min_score: float, max_score: float) -> list[str]:
+        return [
+            m
+            for m, s in sorted(self.scores.items(), key=lambda kv: (kv[1], kv[0]))
+            if min_score <= s <= max_score
+        ]
+
+
+class InMemoryRedis:
+    """Single-process stand-in for a Redis server.
+
+    Parameters
+    ----------
+    latency : float
+        Seconds each command waits before executing (simulated RTT).
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.commands = 0
+        self._strings: dict[str, tuple[bytes, float | None]] = {}
+        self._lists: dict[str, deque[bytes]] = {}
+        self._zsets: dict[str, _SortedSet] = {}
+        self._hashes: dict[str, dict[str, bytes]] = {}
+        self._streams: dict[str, list[tuple[str, dict[str, bytes]]]] = {}
+        self._stream_seq = itertools.count()
+        self._channels: dict[str, list[asyncio.Queue[dict[str, object]]]] = {}
+        self._inbox: asyncio.Queue[dict[str, object]] = asyncio.Queue()
+        self._scripts: dict[str, Callable[[list[str], list[str | bytes | float]], object]] = {
+            LEASE_PUSH_SCRIPT: self._lease_push,
+            LEASE_CLAIM_SCRIPT: self._lease_claim,
+            LEASE_ACK_SCRIPT: self._lease_ack,
+            LEASE_NACK_SCRIPT: self._lease_nack,
+        }
+
+    async def _round_trip(self) -> None:
+        self.commands += 1
+        await asyncio.sleep(self.latency)
+
+    # -- strings ---------------------------------------------------------
+
+    async def get(self, key: str) -> bytes | None:
+        """GET."""
+        await self._round_trip()
+        entry = self._strings.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and time.monotonic() >= expires:
+            del self._strings[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes | str, ex: int | None = None) -> None:
+        """SET with optional EX."""
+        await self._round_trip()
+        expires = time.monotonic() + ex if ex is not None else None
+        self._strings[key] = (_bytes(value), expires)
+
+    async def delete(self, *keys: str) -> int:
+        """DEL."""
+        await self._round_trip()
+        count = 0
+        for key in keys:
+            for store in (self._strings, self._lists, self._zsets, self._hashes, self._streams):
+                if store.pop(key, None) is not None:
+                    count += 1
+        return count
+
+    async def exists(self, *keys: str) -> int:
+        """EXISTS."""
+        await self._round_trip()
+        count = 0
+        for key in keys:
+            entry = self._strings.get(key)
+            live = entry is not None and (entry[1] is None or time.monotonic() < entry[1])
+            if live or key in self._lists or key in self._zsets or key in self._hashes:
+                count += 1
+        return count
+
+    # -- lists -----------------------------------------------------------
+
+    async def lpush(self, key: str, *values: str | bytes) -> int:
+        """LPUSH."""
+        await self._round_trip()
+        items = self._lists.setdefault(key, deque())
+        for value in values:
+            items.appendleft(_bytes(value))
+        return len(items)
+
+    async def rpop(self, key: str) -> bytes | None:
+        """RPOP."""
+        await self._round_trip()
+        items = self._lists.get(key)
+        if not items:
+            return None
+        value = items.pop()
+        if not items:
+            del self._lists[key]
+        return value
+
+    async def llen(self, key: str) -> int:
+        """LLEN."""
+        await self._round_trip()
+        return len(self._lists.get(key, ()))
+
+    # -- sorted sets -----------------------------------------------------
+
+    def _zset(self, key: str) -> _SortedSet:
+        zset = self._zsets.get(key)
+        if zset is None:
+            zset = self._zsets[key] = _SortedSet()
+        return zset
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        """ZADD."""
+        await self._round_trip()
+        zset = self._zset(key)
+        return sum(zset.add(member, float(score)) for member, score in mapping.items())
+
+    async def zrangebyscore(
+        self, key: str, min_score: float, max_score: float
+    ) -> list[bytes]:
+        """ZRANGEBYSCORE."""
+        await self._round_trip()
+        zset = self._zsets.get(key)
+        if zset is None:
+            return []
+        return [_bytes(m) for m in zset.range_by_score(min_score, max_score)]
+
+    async def zcard(self, key: str) -> int:
+        """ZCARD."""
+        await self._round_trip()
+        return len(self._zsets.get(key, ()))
+
+    # -- pub/sub ---------------------------------------------------------
+
+    async def publish(self, channel: str, message: str | bytes) -> int:
+        """PUBLISH."""
+        await self._round_trip()
+        subscribers = self._channels.get(channel, [])
+        for inbox in subscribers:
+            inbox.put_nowait(
+                {"type": "message", "channel": channel.encode(), "data": _bytes(message)}
+            )
+        return len(subscribers)
+
+    async def subscribe(self, *channels: str) -> None:
+        """SUBSCRIBE this connection to *channels*."""
+        await self._round_trip()
+        for channel in channels:
+            subscribers = self._channels.setdefault(channel, [])
+            if self._inbox not in subscribers:
+                subscribers.append(self._inbox)
+
+    async def get_message(self, timeout: float = 0.1) -> dict[str, object] | None:
+        """Wait up to *timeout* for a subscribed message."""
+        try:
+            return await asyncio.wait_for(self._inbox.get(), timeout)
+        except TimeoutError:
+            return None
+
+    # -- streams ---------------------------------------------------------
+
+    async def xadd(
+        self,
+        name: str,
+        fields: dict[str, str | bytes],
+        maxlen: int | None = None,
+    ) -> str:
+        """XADD with optional MAXLEN trimming."""
+        await self._round_trip()
+        entries = self._streams.setdefault(name, [])
+        entry_id = f"{int(time.time() * 1000)}-{next(self._stream_seq)}"
+        entries.append((entry_id, {k: _bytes(v) for k, v in fields.items()}))
+        if maxlen is not None and len(entries) > maxlen:
+            del entries[: len(entries) - maxlen]
+        return entry_id
+
+    async def xrange(
+        self,
+        name: str,
+        min_id: str = "-",
+        max_id: str = "+",
+        count: int | None = None,
+    ) -> list[tuple[str, dict[str, bytes]]]:
+        """XRANGE (full-range bounds only)."""
+        await self._round_trip()
+        entries = list(self._streams.get(name, []))
+        return entries if count is None else entries[:count]
+
+    async def ping(self) -> bool:
+        """PING."""
+        await self._round_trip()
+        return True
+
+    # -- scripting -------------------------------------------------------
+
+    async def eval(
+        self, script: str, numkeys: int, *keys_and_args: str | bytes | float
+    ) -> object:
+        """EVAL one of the scripts shipped in ``holly.storage.redis.client``.
+
+        Raises
+        ------
+        NotImplementedError
+            If *script* has no Python equivalent here.
+        """
+        await self._round_trip()
+        handler = self._scripts.get(script)
+        if handler is None:
+            raise NotImplementedError("InMemoryRedis cannot run arbitrary Lua")
+        keys = [str(k) for k in keys_and_args[:numkeys]]
+        return handler(keys, list(keys_and_args[numkeys:]))
+
+    def _lease_push(self, keys: list[str], args: list[str | bytes | float]) -> int:
+        ready, leased, payloads, meta = keys
+        item_id, payload, rank, limit = _str(args[0]), args[1], float(args[2]), int(args[3])
+        payload_map = self._hashes.setdefault(payloads, {})
+        if item_id in payload_map:
+            return 0
+        if len(self._zsets.get(ready, ())) + len(self._zsets.get(leased, ())) >= limit:
+            return -1
+        payload_map[item_id] = _bytes(payload)
+        self._hashes.setdefault(meta, {})[item_id] = _bytes(rank)
+        self._zset(ready).add(item_id, rank)
+        return 1
+
+    def _lease_claim(self, keys: list[str], args: list[str | bytes | float]) -> list[object]:
+        ready_key, leased_key, payloads, meta_key = keys
+        now, lease, count = float(args[0]), float(args[1]), int(args[2])
+        lease_id = _bytes(args[3])
+        ready, leased = self._zset(ready_key), self._zset(leased_key)
+        meta = self._hashes.setdefault(meta_key, {})
+        while (expired := leased.pop_min(now)) is not None:
+            ready.add(expired, float(meta[expired]))
+        out: list[object] = []
+        for _ in range(count):
+            item_id = ready.pop_min()
+            if item_id is None:
+                break
+            leased.add(item_id, now + lease)
+            meta[f"{item_id}#lease"] = lease_id
+            attempts = int(meta.get(f"{item_id}#n", b"0")) + 1
+            meta[f"{item_id}#n"] = _bytes(attempts)
+            out += [_bytes(item_id), self._hashes[payloads][item_id], attempts]
+        return out
+
+    def _lease_ack(self, keys: list[str], args: list[str | bytes | float]) -> int:
+        ready_key, leased_key, payloads, meta_key = keys
+        payload_map = self._hashes.get(payloads, {})
+        meta = self._hashes.get(meta_key, {})
+        removed = 0
+        for raw_id, lease_id in zip(args[::2], args[1::2], strict=True):
+            item_id = _str(raw_id)
+            if meta.get(f"{item_id}#lease") != _bytes(lease_id):
+                continue
+            self._zset(ready_key).remove(item_id)
+            self._zset(leased_key).remove(item_id)
+            removed += payload_map.pop(item_id, None) is not None
+            meta.pop(item_id, None)
+            meta.pop(f"{item_id}#n", None)
+            meta.pop(f"{item_id}#lease", None)
+        return removed
+
+    def _lease_nack(self, keys: list[str], args: list[str | bytes | float]) -> int:
+        ready_key, leased_key, _, meta_key = keys
+        item_id = _str(args[0])
+        meta = self._hashes.get(meta_key, {})
+        if meta.get(f"{item_id}#lease") != _bytes(args[1]):
+            return 0
+        if not self._zset(leased_key).remove(item_id):
+            return 0
+        self._zset(ready_key).add(item_id, float(meta[item_id]))
+        return 1
@@ -0,0 +1,74 @@
+"""Integration tests for holly.goals.assembly_engine module."""
+
+import random
+import time
+
+import pytest
+
+from holly.goals.aps_validator import APSValidator
+from holly.goals.assembly_engine import AssemblyIndexEngine
+from holly.goals.assembly_index import AssemblyIndexResult, GoalDecomposer
+
+
+class _ContextDecomposer:
+    """Decomposer protocol adapter reading the goal ID from the context."""
+
+    def __init__(self) -> None:
+        self.decomposer = GoalDecomposer()
+
+    def decompose(self, context: dict) -> AssemblyIndexResult:
+        return self.decomposer.compute_goal_assembly_index(context["goal_id"], context)
+
+
+def _related_goals(count: int, seed: int = 0) -> list[dict]:
+    """Goals over T0–T3 drawing up to two dependencies from 200 shared goals."""
+    rng = random.Random(seed)
+    pool = [f"goal-{i}" for i in range(200)]
+    return [
+        {
+            "goal_id": f"goal-{i}",
+            "task_level": f"T{i % 4}",
+            "num_agents": rng.randint(1, 8),
+            "codimension": rng.randint(1, 5),
+            "dependencies": rng.sample(pool, rng.randint(0, 2)),
+        }
+        for i in range(count)
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Benchmark: Decompose and Validate 100k Related Goals
+# ─────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.slow
+def test_benchmark_engine_vs_per_goal_validation():
+    """Benchmark goals/sec: per-goal decompose + validate_all vs the engine.
+
+    The baseline decomposes each goal and runs APSValidator.validate_all on
+    its context (10 consistency runs plus completeness), timed on a sample.
+    The engine adds all 100k goals to one shared DAG and builds its report
+    once at the end.  Rates are reported (``pytest -s``), not asserted.
+    """
+    goals = _related_goals(100_000)
+
+    decomposer = _ContextDecomposer()
+    validator = APSValidator()
+    sample = goals[:2_000]
+    start = time.perf_counter()
+    for context in sample:
+        decomposer.decompose(context)
+        validator.validate_all(decomposer=decomposer, test_contexts=[context])
+    baseline_rate = len(sample) / (time.perf_counter() - start)
+
+    engine = AssemblyIndexEngine()
+    start = time.perf_counter()
+    for context in goals:
+        engine.add_goal(context["goal_id"], context)
+    report = engine.report()
+    engine_rate = len(goals) / (time.perf_counter() - start)
+
+    print(f"engine: {engine_rate:,.0f} goals/s, per-goal: {baseline_rate:,.0f} goals/s")
+    assert report.total_tasks_checked == len(goals)
+    assert report.consistency_valid
+    assert engine.dag.sub_assembly_count < 300
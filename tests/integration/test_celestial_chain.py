@@ -9,18 +9,23 @@ Tests the full L0–L4 chain including:
 
 from __future__ import annotations
 
+import random
+import time
 from datetime import datetime, timezone
 
 import pytest
 
 from holly.goals.predicates import (
+    DEFAULT_PREDICATES,
     CelestialState,
     L0SafetyPredicate,
     L1LegalPredicate,
     L2EthicalPredicate,
     L3PermissionsPredicate,
     L4ConstitutionalPredicate,
+    PredicateResult,
     check_celestial_compliance,
+    evaluate_celestial_batch,
     evaluate_celestial_chain,
 )
 
@@ -529,3 +534,173 @@ class TestPerformance:
         )
         result = check_celestial_compliance(state)
         assert isinstance(result, bool)
+
+
+# =============================================================================
+# Batch Evaluation
+# =============================================================================
+
+
+_WORDS = [
+    "read", "report", "Weapon", "EXPLOIT", "malware", "virus", "crack", "keygen",
+    "bypass_drm", "mislead", "Fake", "impersonate", "manipulate", "harmless",
+    "weap", "on", "deceive", "circumvent_protection", "data",
+]
+_ACTIONS = [
+    "read_file", "enable_weapon", "patch_kernel", "fake_login", "KEYGEN_run",
+    "send_email", "disable_override", "write_file",
+]
+
+
+def _random_state(rng: random.Random) -> CelestialState:
+    """Random state drawing markers, flags and odd payload values."""
+    context: dict = {}
+    if rng.random() < 0.2:
+        context["intent"] = rng.choice(["help", "harm user", "research", "KILL"])
+    if rng.random() < 0.1:
+        context["pattern"] = rng.choice(["launder_money", "normal"])
+    for flag in (
+        "bypass_control", "export_controlled", "coercion",
+        "privilege_escalation_attempt", "outside_envelope",
+    ):
+        if rng.random() < 0.03:
+            context[flag] = True
+    if rng.random() < 0.05:
+        context["user_consent"] = False
+    if rng.random() < 0.05:
+        context["required_roles"] = ["admin"]
+        context["actor_role"] = rng.choice(["admin", "viewer"])
+    payload = {
+        f"k{i}": rng.choice([
+            " ".join(rng.choices(_WORDS, k=3)),
+            None,
+            rng.randint(0, 10),
+            [rng.choice(_WORDS)],
+        ])
+        for i in range(rng.randint(0, 4))
+    }
+    return CelestialState(
+        level=0,
+        context=context,
+        timestamp=datetime.now(tz=timezone.utc),
+        actor_id="user",
+        action=rng.choice(_ACTIONS),
+        payload=payload,
+    )
+
+
+class TestBatchEvaluation:
+    """evaluate_celestial_batch must match evaluate_celestial_chain exactly."""
+
+    def test_differential_against_sequential_chain(self, all_predicates):
+        """Test batch and sequential results agree on 5k random states."""
+        rng = random.Random(20240601)
+        states = [_random_state(rng) for _ in range(5_000)]
+
+        batch = evaluate_celestial_batch(states, all_predicates)
+
+        assert len(batch) == len(states)
+        for state, results in zip(states, batch, strict=True):
+            assert results == evaluate_celestial_chain(state, all_predicates)
+        # The sample exercises every level's failure and full passes
+        assert {len(r) for r in batch} == {1, 2, 3, 4, 5}
+        assert any(all(x.passed for x in r) for r in batch)
+
+    def test_differential_with_overridden_evaluate(self, all_predicates):
+        """Test built-in predicate subclasses overriding evaluate() are not bypassed."""
+
+        class StricterSafety(L0SafetyPredicate):
+            def evaluate(self, state):
+                if state.action == "read_file":
+                    return PredicateResult(level=0, passed=False, reason="reads halted")
+                return super().evaluate(state)
+
+        class ScanOnlySubclass(L2EthicalPredicate):
+            """Overrides nothing, so it keeps the shared-scan fast path."""
+
+        predicates = list(all_predicates)
+        predicates[0], predicates[2] = StricterSafety(), ScanOnlySubclass()
+        rng = random.Random(20240602)
+        states = [_random_state(rng) for _ in range(1_000)]
+
+        batch = evaluate_celestial_batch(states, predicates)
+
+        for state, results in zip(states, batch, strict=True):
+            assert results == evaluate_celestial_chain(state, predicates)
+        assert any(r == [PredicateResult(level=0, passed=False, reason="reads halted")]
+                   for r in batch)
+
+    def test_markers_do_not_span_payload_values(self):
+        """Test a marker split across two payload values is not matched."""
+        state = CelestialState(
+            level=0,
+            context={},
+            timestamp=datetime.now(tz=timezone.utc),
+            actor_id="user",
+            action="read",
+            payload={"a": "wea", "b": "pon", "c": None},
+        )
+        [results] = evaluate_celestial_batch([state])
+        assert len(results) == 5
+        assert all(r.passed for r in results)
+
+    def test_defaults_and_empty_input(self, base_safe_state):
+        """Test default predicates are used and empty batches are allowed."""
+        assert evaluate_celestial_batch([]) == []
+        assert evaluate_celestial_batch(iter([base_safe_state])) == [
+            evaluate_celestial_chain(base_safe_state, DEFAULT_PREDICATES)
+        ]
+
+    def test_custom_predicates_use_evaluate(self, base_safe_state):
+        """Test predicates outside L0–L2 are called through evaluate()."""
+
+        class AlwaysFails:
+            level = 5
+
+            def evaluate(self, state):
+                return L4ConstitutionalPredicate().evaluate(
+                    CelestialState(
+                        level=4,
+                        context={"outside_envelope": True},
+                        timestamp=state.timestamp,
+                        actor_id=state.actor_id,
+                        action=state.action,
+                        payload=state.payload,
+                    )
+                )
+
+            def is_satisfied(self, state):
+                return False
+
+        predicates = [L0SafetyPredicate(), AlwaysFails(), L1LegalPredicate()]
+        [results] = evaluate_celestial_batch([base_safe_state], predicates)
+        assert [r.passed for r in results] == [True, False]
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("count", [1_000, 10_000, 100_000, 1_000_000])
+    def test_benchmark_batch_states_per_second(self, count, all_predicates):
+        """Benchmark batch vs sequential throughput (states/sec).
+
+        States are replayed from a pool of 1,000, as in audit replay: the
+        batch scans each distinct state once and hoists per-level dispatch.
+        Rates are reported (``pytest -s``), not asserted.
+        """
+        rng = random.Random(count)
+        pool = [_random_state(rng) for _ in range(1_000)]
+        states = [pool[i % len(pool)] for i in range(count)]
+
+        start = time.perf_counter()
+        batch = evaluate_celestial_batch(states, all_predicates)
+        batch_rate = count / (time.perf_counter() - start)
+
+        sample = states[:1_000]
+        start = time.perf_counter()
+        for state in sample:
+            evaluate_celestial_chain(state, all_predicates)
+        sequential_rate = len(sample) / (time.perf_counter() - start)
+
+        print(
+            f"{count:,} states: batch {batch_rate:,.0f}/s, "
+            f"sequential {sequential_rate:,.0f}/s"
+        )
+        assert len(batch) == count
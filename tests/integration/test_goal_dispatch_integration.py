@@ -0,0 +1,110 @@
+"""Integration tests for holly.engine.goal_dispatch module."""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from holly.engine.goal_dispatch import (
+    CelestialComplianceEvaluator,
+    GoalDispatchContext,
+    GoalDispatcher,
+    K2PermissionGate,
+)
+from holly.goals.predicates import DEFAULT_PREDICATES, CelestialState
+
+
+class _Registry:
+    """Registry granting every agent every tool."""
+
+    def has_permission(self, tool_name: str, agent_id: str) -> bool:
+        return True
+
+
+class _SlowClassifier:
+    """Classifier simulating a remote call of ``delay`` seconds.
+
+    Counts calls in flight so overlap can be asserted without timing.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    def classify(self, task_id: str, context: dict) -> object:
+        async def run() -> object:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await asyncio.sleep(self.delay)
+            finally:
+                self.in_flight -= 1
+            return SimpleNamespace(level=SimpleNamespace(name="T1"))
+
+        return run()
+
+
+def _evaluator(cache_size: int = 1024) -> CelestialComplianceEvaluator:
+    return CelestialComplianceEvaluator(
+        dict(enumerate(DEFAULT_PREDICATES)), cache_size=cache_size
+    )
+
+
+def _contexts(count: int, distinct: int) -> list[GoalDispatchContext]:
+    """Build ``count`` goals cycling over ``distinct`` Celestial states."""
+    return [
+        GoalDispatchContext(
+            goal_id=uuid4(),
+            agent_id="agent-1",
+            task_id=f"task-{i}",
+            celestial_state=CelestialState(
+                level=0,
+                context={"intent": f"summarise report {i % distinct}"},
+                timestamp=datetime.now(timezone.utc),
+                actor_id="agent-1",
+                action="read",
+                payload={"document": f"report-{i % distinct}"},
+            ),
+            requested_tools=["search"],
+        )
+        for i in range(count)
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Benchmark: Batch Dispatch Throughput
+# ─────────────────────────────────────────────────────────────────────────
+
+
+async def test_benchmark_dispatch_many_vs_sequential():
+    """Compare sequential and batched dispatch with a 2ms async classifier.
+
+    Sequential dispatch pays the classifier round-trip per goal; with
+    ``dispatch_many`` up to 64 classifications overlap, and goals that
+    share a Celestial state reuse the cached compliance result.  Overlap
+    is asserted on the classifier's peak in-flight calls, not wall time.
+    """
+    contexts = _contexts(500, distinct=50)
+
+    classifier = _SlowClassifier(delay=0.002)
+    sequential = GoalDispatcher(
+        _evaluator(cache_size=0),
+        K2PermissionGate(_Registry()),
+        classifier=classifier,
+    )
+    for context in contexts[:50]:
+        await sequential.dispatch_many([context])
+    assert classifier.peak == 1
+
+    classifier = _SlowClassifier(delay=0.002)
+    evaluator = _evaluator()
+    batched = GoalDispatcher(
+        evaluator, K2PermissionGate(_Registry()), classifier=classifier
+    )
+    results = await batched.dispatch_many(contexts)
+
+    assert all(r.task_level == "T1" for r in results)
+    assert evaluator.cache_stats()["hits"] == 450
+    assert classifier.peak == 64
+    assert classifier.in_flight == 0
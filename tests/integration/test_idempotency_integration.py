@@ -0,0 +1,90 @@
+"""Integration benchmarks for the sliding-window idempotency cache."""
+
+import time
+import tracemalloc
+from datetime import timedelta
+
+import pytest
+
+from holly.engine.idempotency import IdempotencyCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _churn(cache: IdempotencyCache[int], clock: _Clock, tenant: str, n: int) -> float:
+    """Insert ``n`` fresh keys at 1000 keys/simulated-second; return ops/sec."""
+    start = time.perf_counter()
+    for i in range(n):
+        clock.now = i / 1000
+        key = f"k{i}"
+        if cache.get(tenant, key) is None:
+            cache.put(tenant, key, i)
+    return n / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+def test_memory_is_bounded_by_window_under_sustained_load() -> None:
+    """Test steady-state size tracks the window, not total keys seen.
+
+    With a 10 s window at 1000 keys/s, at most ~11k entries are live
+    however long the tenant keeps submitting.  The rate is reported
+    (``pytest -s``), not asserted.
+    """
+    clock = _Clock()
+    cache: IdempotencyCache[int] = IdempotencyCache(
+        timedelta(seconds=10), buckets=10, clock=clock
+    )
+    rate = _churn(cache, clock, "busy", 100_000)
+
+    assert cache.entry_count("busy") <= 11_000
+    assert cache.stats.expired >= 100_000 - 11_000
+    assert cache.stats.evicted == 0
+    print(f"exact: {rate:,.0f} ops/s")
+
+
+def test_per_tenant_cap_holds_memory_flat() -> None:
+    """Test the per-tenant cap bounds allocated memory for a hot tenant."""
+    clock = _Clock()
+    cache: IdempotencyCache[int] = IdempotencyCache(
+        timedelta(hours=24), max_entries=5_000, clock=clock
+    )
+    tracemalloc.start()
+    _churn(cache, clock, "hot", 10_000)
+    after_warmup, _ = tracemalloc.get_traced_memory()
+    _churn(cache, clock, "hot", 50_000)
+    after_churn, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert cache.entry_count("hot") == 5_000
+    assert after_churn < after_warmup * 1.5
+
+
+@pytest.mark.slow
+def test_approximate_mode_throughput_and_accuracy() -> None:
+    """Benchmark the Bloom-pair mode against exact tracking.
+
+    Rates are reported (``pytest -s``); only accuracy is asserted.
+    """
+    clock = _Clock()
+    exact: IdempotencyCache[int] = IdempotencyCache(timedelta(seconds=60), clock=clock)
+    approx: IdempotencyCache[int] = IdempotencyCache(
+        timedelta(seconds=60),
+        approximate_tenants=["hot"],
+        bloom_capacity=100_000,
+        bloom_error_rate=0.001,
+        clock=clock,
+    )
+    exact_rate = _churn(exact, clock, "hot", 50_000)
+    clock.now = 0.0
+    approx_rate = _churn(approx, clock, "hot", 50_000)
+
+    # Every key is fresh, so each approximate hit is a false positive.
+    assert approx.stats.hits < 50_000 * 0.002
+    assert approx.entry_count("hot") == 0
+    print(f"exact: {exact_rate:,.0f} ops/s, approximate: {approx_rate:,.0f} ops/s")
@@ -0,0 +1,101 @@
+"""Integration tests for holly.engine.lane_dispatch module."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from holly.engine.lane_dispatch import LaneDispatcher
+from holly.engine.lanes import (
+    LaneManager,
+    LanePolicy,
+    LaneType,
+    Task,
+    TaskEnqueueRequest,
+)
+
+
+def _jain_index(values: list[float]) -> float:
+    """Jain's fairness index: 1.0 when equal, 1/n when one party gets all."""
+    total = sum(values)
+    squares = sum(v * v for v in values)
+    return total * total / (len(values) * squares) if squares else 1.0
+
+
+def _p99(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, int(0.99 * len(ordered) + 0.5) - 1)]
+
+
+async def _simulate(shared_queue: bool) -> tuple[dict[str, list[float]], float]:
+    """Run a skewed load; return per-tenant waits and Jain's index.
+
+    A task's wait is the number of dispatches that preceded it, so the
+    comparison does not depend on wall-clock timing.
+
+    One noisy tenant submits 1000 tasks ahead of four quiet tenants with
+    100 each.  With ``shared_queue`` every task goes through one tenant
+    lane, modelling consumers polling a single FIFO; otherwise each
+    tenant has its own lane under DRR.  Fairness is measured over the
+    first 400 dispatches, while every tenant is still backlogged.
+    """
+    policy = LanePolicy(max_queue_depth=2_000, backpressure_timeout=1.0)
+    waits: dict[str, list[float]] = {}
+    served: list[str] = []
+
+    async def handler(task: Task) -> None:
+        origin = task.goal["origin"]
+        waits.setdefault(origin, []).append(float(len(served)))
+        served.append(origin)
+        await asyncio.sleep(0.0002)
+
+    dispatcher = LaneDispatcher(
+        LaneManager(policy),
+        {LaneType.MAIN: handler},
+        workers={LaneType.MAIN: 4},
+    )
+    load = [("noisy", 1000)] + [(f"quiet{i}", 100) for i in range(4)]
+    for origin, count in load:
+        for i in range(count):
+            await dispatcher.enqueue_main_task(
+                TaskEnqueueRequest(
+                    task=Task(
+                        task_id=uuid4(),
+                        goal={"origin": origin},
+                        user_id="user",
+                        tenant_id="shared" if shared_queue else origin,
+                        idempotency_key=f"{origin}-{i}",
+                        resource_budget={},
+                        mcp_tools=[],
+                        context={},
+                    )
+                )
+            )
+
+    await dispatcher.start()
+    try:
+        await asyncio.wait_for(dispatcher.join(), timeout=30.0)
+    finally:
+        await dispatcher.stop()
+
+    window = served[:400]
+    fairness = _jain_index([window.count(origin) for origin, _ in load])
+    return waits, fairness
+
+
+class TestLaneDispatchBenchmark:
+    """Simulation benchmark for weighted-fair dispatch under skewed load."""
+
+    @pytest.mark.asyncio
+    async def test_skewed_load_fairness_and_tail_wait(self) -> None:
+        """Benchmark per-tenant p99 wait (in dispatches) and Jain's index."""
+        fifo_waits, fifo_fairness = await _simulate(shared_queue=True)
+        drr_waits, drr_fairness = await _simulate(shared_queue=False)
+
+        fifo_quiet_p99 = max(_p99(fifo_waits[f"quiet{i}"]) for i in range(4))
+        drr_quiet_p99 = max(_p99(drr_waits[f"quiet{i}"]) for i in range(4))
+
+        assert fifo_fairness < 0.3
+        assert drr_fairness > 0.95
+        assert drr_quiet_p99 < fifo_quiet_p99 / 2
+        assert sum(len(w) for w in drr_waits.values()) == 1400
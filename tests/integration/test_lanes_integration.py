@@ -1,6 +1,7 @@
 """Integration tests for holly.engine.lanes module."""
 
 import asyncio
+import time
 import pytest
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
@@ -18,6 +19,7 @@ from holly.engine.lanes import (
     SubagentLane,
     LaneManager,
     LaneType,
+    PriorityLaneQueue,
 )
 
 
@@ -149,7 +151,7 @@ class TestCronLaneIntegration:
         
         now = datetime.now(timezone.utc)
         
-        # Schedule 10 tasks all due in the past
+        # Schedule 10 tasks all due within the next 10 seconds
         for i in range(10):
             sched_task = ScheduledTask(
                 task=Task(
@@ -162,14 +164,14 @@ class TestCronLaneIntegration:
                     mcp_tools=[],
                     context={},
                 ),
-                scheduled_time=now - timedelta(seconds=i),
+                scheduled_time=now + timedelta(seconds=i + 1),
             )
             await lane.schedule_task(
                 ScheduledTaskRequest(scheduled_task=sched_task)
             )
         
-        # Evaluate
-        due = await lane.evaluate_due_tasks()
+        # Evaluate once all are due
+        due = await lane.evaluate_due_tasks(now + timedelta(minutes=1))
         assert len(due) == 10
 
 
@@ -201,7 +203,8 @@ class TestSubagentLaneIntegration:
         )
         
         assert len(results) == 5
-        assert lane.concurrent_count == 5
+        assert len(lane.active_executions) == 5
+        assert lane.concurrent_count == 0
 
     @pytest.mark.asyncio
     async def test_concurrent_task_lifecycle(self, policy: LanePolicy) -> None:
@@ -223,6 +226,7 @@ class TestSubagentLaneIntegration:
                 SubagentSpawnRequest(subagent_task=subagent_task, priority=5)
             )
             exec_ids.append(exec_id)
+            await lane.mark_started(exec_id)
         
         assert lane.concurrent_count == 3
         
@@ -399,5 +403,155 @@ class TestCrossLaneInteractions:
             )
 
 
+class _ElevenQueueLane:
+    """The previous lane layout: one asyncio.Queue per priority, polled."""
+
+    def __init__(self) -> None:
+        self.priority_queue = {i: asyncio.Queue() for i in range(11)}
+
+    async def put(self, item, priority: int) -> None:
+        await self.priority_queue[priority].put(item)
+
+    async def get(self):
+        for priority in range(10, -1, -1):
+            pq = self.priority_queue[priority]
+            if not pq.empty():
+                return await pq.get()
+        return await self.priority_queue[5].get()
+
+
+class TestPriorityLaneBenchmark:
+    """Throughput and wake-up latency of PriorityLaneQueue vs. the old lanes."""
+
+    @staticmethod
+    async def _throughput(queue, n: int) -> float:
+        start = time.perf_counter()
+        for i in range(n):
+            await queue.put(i, i % 11)
+        for _ in range(n):
+            await queue.get()
+        return n / (time.perf_counter() - start)
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_enqueue_dequeue_throughput(self) -> None:
+        """Benchmark mixed-priority enqueue/dequeue rates.
+
+        With only eleven fixed levels the bucketed queues win on raw
+        throughput (O(1) deque ops vs. O(log n) heap ops); the heap should
+        stay in the same order of magnitude while adding aging, bulk
+        dequeue and correct wake-ups.  Rates are reported (``pytest -s``),
+        not asserted.
+        """
+        n = 20_000
+        heap_rate = await self._throughput(PriorityLaneQueue(), n)
+        legacy_rate = await self._throughput(_ElevenQueueLane(), n)
+
+        print(f"heap: {heap_rate:,.0f} ops/s, eleven queues: {legacy_rate:,.0f} ops/s")
+
+    @pytest.mark.asyncio
+    async def test_wakeup_latency(self) -> None:
+        """Test a blocked consumer wakes on high-priority work.
+
+        The consumer must finish within one event-loop turn of the
+        enqueue.  The old lanes blocked only on priority 5, so a
+        priority-9 enqueue never woke an idle consumer.
+        """
+        queue: PriorityLaneQueue[int] = PriorityLaneQueue()
+        for i in range(200):
+            consumer = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            queue.put_nowait(i, 9)
+            await asyncio.sleep(0)
+            assert consumer.done()
+            assert consumer.result() == i
+
+        legacy = _ElevenQueueLane()
+        consumer = asyncio.create_task(legacy.get())
+        await asyncio.sleep(0)
+        await legacy.put("urgent", 9)
+        done, _ = await asyncio.wait({consumer}, timeout=0.05)
+        consumer.cancel()
+        assert not done
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_dequeue_many_batches(self) -> None:
+        """Benchmark bulk dequeue; the drain time is reported, not asserted."""
+        n = 20_000
+        queue: PriorityLaneQueue[int] = PriorityLaneQueue()
+        for i in range(n):
+            queue.put_nowait(i, i % 11)
+        start = time.perf_counter()
+        drained = 0
+        while drained < n:
+            drained += len(await queue.get_many(256))
+        batch_seconds = time.perf_counter() - start
+
+        print(f"get_many(256): drained {n:,} in {batch_seconds * 1000:.1f} ms")
+        assert drained == n
+        assert queue.empty()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestCronLaneBenchmark:
+    """Scheduling and firing cost of CronLane at 100k registered jobs."""
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_schedule_and_fire_100k_jobs(self) -> None:
+        """Benchmark scheduling 100k jobs and firing a small due slice.
+
+        The old lane re-sorted on every insert and rebuilt the list with
+        an O(n * k) filter on every evaluation; with the heap, a single
+        evaluation costs O(k log n) for k due fires.  Timings are reported
+        (``pytest -s``), not asserted.
+        """
+        n = 100_000
+        lane = CronLane("tenant-bench", LanePolicy(max_queue_depth=n))
+        base = datetime.now(timezone.utc) + timedelta(hours=1)
+        task = Task(
+            task_id=uuid4(),
+            goal={},
+            user_id="user",
+            tenant_id="tenant-bench",
+            idempotency_key="bench",
+            resource_budget={},
+            mcp_tools=[],
+            context={},
+        )
+        jobs = [
+            ScheduledTask(
+                task=task,
+                scheduled_time=base + timedelta(seconds=i),
+                recurrence="*/5 * * * *" if i % 2 else None,
+            )
+            for i in range(n)
+        ]
+
+        start = time.perf_counter()
+        for job in jobs:
+            await lane.schedule_task(ScheduledTaskRequest(scheduled_task=job))
+        schedule_rate = n / (time.perf_counter() - start)
+
+        # 100 due fires, half of them recurring and rescheduled.
+        start = time.perf_counter()
+        due = await lane.evaluate_due_tasks(now=base + timedelta(seconds=99))
+        fire_elapsed = time.perf_counter() - start
+
+        assert len(due) == 100
+        assert len(lane.schedule_map) == n - 50
+
+        # An empty evaluation is O(1) regardless of registered jobs.
+        start = time.perf_counter()
+        for _ in range(1_000):
+            assert await lane.evaluate_due_tasks(now=base) == []
+        empty_elapsed = (time.perf_counter() - start) / 1_000
+        print(
+            f"schedule: {schedule_rate:,.0f} jobs/s, 100 fires: "
+            f"{fire_elapsed * 1000:.2f} ms, empty evaluation: "
+            f"{empty_elapsed * 1e6:.1f} us"
+        )
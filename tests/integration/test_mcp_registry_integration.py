@@ -11,11 +11,14 @@ Tests cover:
 from __future__ import annotations
 
 import asyncio
+import random
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
 
+from holly.engine.latency import LatencyRecorder
 from holly.engine.mcp_registry import (
     MCPRegistry,
     ToolInvocationRequest,
@@ -614,3 +617,185 @@ async def test_end_to_end_tool_invocation_flow():
     assert response.tool_result["avg"] == 3.0
     assert response.execution_time_ms > 0
     assert response.trace_id == "trace-123"
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Benchmark: Backpressure at Saturation (ICD-019/020)
+# ─────────────────────────────────────────────────────────────────────────
+
+
+async def _saturate(queue_timeout: float, callers: int = 200) -> tuple[float, float]:
+    """Fire ``callers`` concurrent invocations at a 10-slot tool.
+
+    Returns (successful invocations/sec, rejection rate).
+    """
+    registry = MCPRegistry(queue_timeout=queue_timeout)
+
+    async def io_tool(input_dict):
+        await asyncio.sleep(0.001)
+        return {"ok": True}
+
+    registry.register_tool("io_tool", io_tool)
+    registry.grant_permission("io_tool", "agent1", "admin")
+    request = ToolInvocationRequest(
+        tool_name="io_tool", agent_id="agent1", tenant_id="tenant1"
+    )
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(registry.invoke(request) for _ in range(callers)))
+    elapsed = time.perf_counter() - start
+    rejected = sum(r.error_code == "concurrency_limit" for r in responses)
+    return (callers - rejected) / elapsed, rejected / callers
+
+
+@pytest.mark.asyncio
+async def test_benchmark_waiting_vs_fail_fast_at_saturation():
+    """Benchmark throughput and rejection rate: waiting queue vs fail-fast.
+
+    ``queue_timeout=0`` reproduces the previous fail-fast admission: with
+    200 callers on 10 slots, 95% are rejected.  With the 30s waiting queue
+    every caller completes and the tool stays saturated.
+    """
+    fail_fast_rate, fail_fast_rejected = await _saturate(queue_timeout=0)
+    waiting_rate, waiting_rejected = await _saturate(queue_timeout=30.0)
+
+    assert fail_fast_rejected >= 0.9
+    assert waiting_rejected == 0.0
+    # Fail-fast completes only the first 10; waiting runs all 200 at ~10-way
+    # parallelism, so useful throughput is far higher.
+    assert waiting_rate > fail_fast_rate
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Benchmark: Permission Lookup Latency (ICD-019/020 p99 < 1ms)
+# ─────────────────────────────────────────────────────────────────────────
+
+
+def _lookup_percentiles(grants: int, lookups: int = 2_000) -> tuple[float, float]:
+    """Return (p50, p99) has_permission latency in µs with ``grants`` agents."""
+    registry = MCPRegistry()
+
+    async def handler(input_dict):
+        return {}
+
+    registry.register_tool("shared_tool", handler)
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    for i in range(grants):
+        # Half the grants expire, so the expiry heap is exercised too.
+        registry.grant_permission(
+            "shared_tool", f"agent-{i}", "admin", expires_at=future if i % 2 else None
+        )
+
+    samples = []
+    for i in range(lookups):
+        agent = f"agent-{(i * 7919) % grants}"
+        start = time.perf_counter_ns()
+        assert registry.has_permission("shared_tool", agent)
+        samples.append((time.perf_counter_ns() - start) / 1_000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+@pytest.mark.slow
+def test_benchmark_permission_lookup_10_to_100k_grants():
+    """Benchmark p50/p99 permission lookup at 10, 1k and 100k grants per tool.
+
+    Lookups hit the (tool_name, agent_id) index, so latency should be flat
+    in the number of grants; percentiles are reported against the 1ms p99
+    budget, not asserted.
+    """
+    results = {n: _lookup_percentiles(n) for n in (10, 1_000, 100_000)}
+    for grants, (p50, p99) in results.items():
+        print(f"{grants:,} grants: p50 {p50:.1f} µs, p99 {p99:.1f} µs")
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Benchmark: Result Cache under a Zipfian Mix
+# ─────────────────────────────────────────────────────────────────────────
+
+
+async def _zipf_run(
+    cache_ttl: float | None, requests: int = 5_000, keys: int = 1_000
+) -> tuple[int, float]:
+    """Replay a Zipf(1.1) key mix in batches of 50 concurrent invocations.
+
+    Returns (handler calls, p50 latency in µs of invocations served from cache,
+    or of all invocations when caching is off).
+    """
+    registry = MCPRegistry()
+    calls = 0
+
+    async def lookup(input_dict):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"id": input_dict["id"]}
+
+    registry.register_tool("lookup", lookup, cache_ttl=cache_ttl)
+    registry.grant_permission("lookup", "agent1", "admin")
+
+    rng = random.Random(42)
+    weights = [1 / (rank ** 1.1) for rank in range(1, keys + 1)]
+    mix = rng.choices(range(keys), weights=weights, k=requests)
+
+    async def timed(key: int) -> tuple[float, bool]:
+        start = time.perf_counter_ns()
+        response = await registry.invoke(
+            ToolInvocationRequest(
+                tool_name="lookup", agent_id="agent1", tenant_id="tenant1",
+                input={"id": key},
+            )
+        )
+        return (time.perf_counter_ns() - start) / 1_000, response.cached
+
+    samples: list[float] = []
+    for i in range(0, requests, 50):
+        results = await asyncio.gather(*(timed(k) for k in mix[i : i + 50]))
+        samples += [us for us, cached in results if cached or cache_ttl is None]
+    samples.sort()
+    return calls, samples[len(samples) // 2]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_result_cache_zipf():
+    """Benchmark handler-call reduction and hit-path latency on a Zipf mix.
+
+    With 1,000 keys at s=1.1, most requests go to a few hot keys: the
+    cache plus single-flight cut handler calls by well over half, and a
+    hit skips the concurrency slot and handler entirely.
+    """
+    uncached_calls, uncached_p50 = await _zipf_run(cache_ttl=None)
+    cached_calls, hit_p50 = await _zipf_run(cache_ttl=60.0)
+
+    assert uncached_calls == 5_000
+    assert cached_calls < uncached_calls * 0.4
+    assert hit_p50 < uncached_p50
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Benchmark: Latency Recorder Overhead
+# ─────────────────────────────────────────────────────────────────────────
+
+
+def test_benchmark_latency_recorder_overhead():
+    """Benchmark the per-call cost of recording into the latency histograms.
+
+    Each invocation records once into its (tool, tenant) and per-tool
+    histograms; across 32 tenants and a 1µs-10s spread that stays in the
+    low microseconds, negligible next to the 1ms lookup budget.
+    """
+    recorder = LatencyRecorder()
+    rng = random.Random(3)
+    samples = [
+        (f"tenant{rng.randrange(32)}", int(rng.lognormvariate(14, 2)))
+        for _ in range(200_000)
+    ]
+
+    start = time.perf_counter_ns()
+    for tenant, elapsed in samples:
+        recorder.record("tool", tenant, elapsed)
+    per_call_us = (time.perf_counter_ns() - start) / len(samples) / 1_000
+
+    stats = recorder.for_tool("tool")
+    assert stats is not None and stats.histogram.count == 200_000
+    assert per_call_us < 10
@@ -0,0 +1,359 @@
+"""Integration tests for bulk ingest in holly/storage/postgres.py.
+
+AC-1: InMemoryPostgres runs the repositories' single-row statements.
+AC-2: AuditRepo.append_many writes the same rows as append, via COPY or
+      unnest; failures are non-fatal.
+AC-3: MemoryRepo.insert_many skips existing and repeated ids and returns
+      the ids inserted.
+AC-4: TaskStateRepo.upsert_many leaves the same state as sequential upserts.
+AC-5: BatchingWriter flushes on size, latency, flush() and stop(), in
+      submission order, and applies backpressure when it falls behind.
+AC-6: Benchmark: rows/sec of batched COPY vs single-row INSERT.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from holly.storage.postgres import (
+    AuditRow,
+    BatchingWriter,
+    CheckpointRow,
+    CopyConnectionProto,
+    GoalRow,
+    MemoryRow,
+    PostgresBackend,
+    TaskStateRow,
+    WriterFullError,
+)
+from holly.storage.postgres_memory import CardinalityViolationError, InMemoryPostgres
+
+# ── Shared fixtures ───────────────────────────────────────────────
+
+
+def _backend(db: InMemoryPostgres | None = None) -> PostgresBackend:
+    return PostgresBackend(db or InMemoryPostgres(), uuid.uuid4())
+
+
+def _audit_rows(n: int, tenant_id: uuid.UUID) -> list[AuditRow]:
+    return [
+        AuditRow(
+            tenant_id=tenant_id,
+            boundary_id=f"k{i % 8}",
+            operation="check",
+            input_hash=f"in-{i}",
+            violations=[{"rule": i}] if i % 5 == 0 else [],
+            timestamp=i,
+        )
+        for i in range(n)
+    ]
+
+
+def _audit_contents(db: InMemoryPostgres) -> list[dict[str, Any]]:
+    """Audit rows in id order, without the generated id."""
+    rows = sorted(db.tables.get("kernel_audit_log", {}).values(), key=lambda r: r["id"])
+    return [{k: v for k, v in row.items() if k != "id"} for row in rows]
+
+
+class _NoCopyPool:
+    """Pool whose connections expose only the ConnectionProto methods."""
+
+    class _Conn:
+        def __init__(self, db: InMemoryPostgres) -> None:
+            self.execute = db.execute
+            self.fetch = db.fetch
+            self.fetchrow = db.fetchrow
+            self.fetchval = db.fetchval
+
+    def __init__(self, db: InMemoryPostgres) -> None:
+        self.db = db
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self._Conn(self.db)
+
+    async def close(self) -> None:
+        await self.db.close()
+
+
+# ── AC-1: single-row statements ───────────────────────────────────
+
+
+class TestInMemoryPostgres:
+    """AC-1: the fake interprets the repositories' statements."""
+
+    async def test_goals_round_trip(self) -> None:
+        backend = _backend()
+        row = GoalRow(tenant_id=backend.tenant_id, level=2, predicate="p")
+        assert await backend.goals.insert(row) == row.id
+        await backend.goals.update_status(row.id, "done")
+
+        fetched = await backend.goals.get(row.id)
+        assert fetched["status"] == "done"
+        assert await backend.goals.list_by_status("done") == [fetched]
+        assert await backend.goals.get(uuid.uuid4()) is None
+
+    async def test_checkpoint_upsert_updates_in_place(self) -> None:
+        backend = _backend()
+        row = CheckpointRow(uuid.uuid4(), uuid.uuid4(), backend.tenant_id, 1, {"a": 1})
+        await backend.checkpoints.upsert(row)
+        row.checkpoint_timestamp = 2
+        await backend.checkpoints.upsert(row)
+
+        rows = await backend.checkpoints.list_workflow(row.workflow_id)
+        assert [r["checkpoint_timestamp"] for r in rows] == [2]
+
+    async def test_fake_supports_copy(self) -> None:
+        db = InMemoryPostgres()
+        assert isinstance(db, CopyConnectionProto)
+        assert not isinstance(_NoCopyPool._Conn(db), CopyConnectionProto)
+
+
+# ── AC-2: AuditRepo.append_many ───────────────────────────────────
+
+
+class TestAuditAppendMany:
+    """AC-2: bulk audit writes match single-row appends."""
+
+    @pytest.mark.parametrize("copy", [True, False])
+    async def test_matches_single_row_appends(self, copy: bool) -> None:
+        single, bulk = InMemoryPostgres(), InMemoryPostgres()
+        tenant = uuid.uuid4()
+        rows = _audit_rows(50, tenant)
+        for row in rows:
+            await PostgresBackend(single, tenant).audit.append(row)
+
+        pool = bulk if copy else _NoCopyPool(bulk)
+        backend = PostgresBackend(pool, tenant)
+        await backend.audit.append_many(rows[:20])
+        await backend.audit.append_many(rows[20:])
+
+        assert _audit_contents(bulk) == _audit_contents(single)
+        # One tenant binding plus one write per batch.
+        assert bulk.statements == 4
+
+    async def test_empty_batch_is_free(self) -> None:
+        db = InMemoryPostgres()
+        await _backend(db).audit.append_many([])
+        assert db.statements == 0
+
+    async def test_failure_is_non_fatal(self) -> None:
+        db = InMemoryPostgres()
+        await db.close()
+        await _backend(db).audit.append_many(_audit_rows(3, uuid.uuid4()))
+        assert _audit_contents(db) == []
+
+
+# ── AC-3: MemoryRepo.insert_many ──────────────────────────────────
+
+
+class TestMemoryInsertMany:
+    """AC-3: bulk memory inserts skip conflicting ids."""
+
+    async def test_returns_inserted_ids(self) -> None:
+        backend = _backend()
+        existing = MemoryRow(content="old", tenant_id=backend.tenant_id)
+        await backend.memory.insert(existing)
+        fresh = [MemoryRow(content=f"m{i}", tenant_id=backend.tenant_id) for i in range(3)]
+
+        inserted = await backend.memory.insert_many([existing, *fresh, fresh[0]])
+
+        assert inserted == [row.id for row in fresh]
+        assert await backend.memory.insert_many([]) == []
+
+
+# ── AC-4: TaskStateRepo.upsert_many ───────────────────────────────
+
+
+class TestTaskStateUpsertMany:
+    """AC-4: bulk upserts leave the state sequential upserts would."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    async def test_matches_sequential_upserts(self, seed: int) -> None:
+        rng = random.Random(seed)
+        tenant = uuid.uuid4()
+        tasks = [uuid.uuid4() for _ in range(6)]
+        rows = [
+            TaskStateRow(
+                task_id=rng.choice(tasks),
+                execution_id=uuid.uuid4(),
+                tenant_id=tenant,
+                status=rng.choice(["enqueued", "running", "done"]),
+                started_at=rng.randint(0, 9),
+                completed_at=rng.randint(10, 19),
+                retries_attempted=rng.randint(0, 3),
+                lane_type=rng.choice(["main", "cron"]),
+            )
+            for _ in range(40)
+        ]
+        sequential, bulk = InMemoryPostgres(), InMemoryPostgres()
+        for row in rows:
+            await PostgresBackend(sequential, tenant).task_state.upsert(row)
+        backend = PostgresBackend(bulk, tenant)
+        await backend.task_state.upsert_many(rows[:15])
+        await backend.task_state.upsert_many(rows[15:])
+
+        assert bulk.tables["task_state"] == sequential.tables["task_state"]
+
+    async def test_fake_rejects_double_update(self) -> None:
+        db = InMemoryPostgres()
+        task_id = uuid.uuid4()
+        with pytest.raises(CardinalityViolationError):
+            await db.execute(
+                "INSERT INTO task_state (task_id, status) "
+                "SELECT * FROM unnest($1::uuid[], $2::varchar[]) "
+                "ON CONFLICT (task_id) DO UPDATE SET status = EXCLUDED.status",
+                [task_id, task_id],
+                ["a", "b"],
+            )
+
+
+# ── AC-5: BatchingWriter ──────────────────────────────────────────
+
+
+class _Sink:
+    """write_many target recording batches; can block or fail on demand."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def write_many(self, rows: list[int]) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("write failed")
+        self.batches.append(rows)
+
+
+class TestBatchingWriter:
+    """AC-5: size / latency triggers, ordering, backpressure, lifecycle."""
+
+    async def test_size_trigger_and_order(self) -> None:
+        sink = _Sink()
+        writer = BatchingWriter(sink.write_many, max_batch_size=10, max_latency=60.0)
+        await writer.start()
+        for i in range(25):
+            await writer.submit(i)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert [len(b) for b in sink.batches] == [10, 10]
+
+        await writer.stop()
+        assert [row for batch in sink.batches for row in batch] == list(range(25))
+        assert (writer.written, writer.batches, writer.pending) == (25, 3, 0)
+
+    async def test_latency_trigger(self) -> None:
+        sink = _Sink()
+        writer = BatchingWriter(sink.write_many, max_batch_size=100, max_latency=0.01)
+        await writer.start()
+        for i in range(3):
+            await writer.submit(i)
+        await asyncio.sleep(0.05)
+        assert sink.batches == [[0, 1, 2]]
+        await writer.stop()
+
+    async def test_backpressure(self) -> None:
+        sink = _Sink()
+        sink.gate.clear()
+        writer = BatchingWriter(
+            sink.write_many,
+            max_batch_size=2,
+            max_latency=0.0,
+            max_pending=4,
+            backpressure_timeout=0.02,
+        )
+        await writer.start()
+        for i in range(4):
+            await writer.submit(i)
+        with pytest.raises(WriterFullError):
+            await writer.submit(4)
+        assert writer.rejected == 1
+
+        blocked = asyncio.create_task(writer.submit(5))
+        await asyncio.sleep(0)
+        sink.gate.set()
+        await asyncio.wait_for(blocked, 1.0)
+        await writer.stop()
+        assert [row for batch in sink.batches for row in batch] == [0, 1, 2, 3, 5]
+
+    async def test_failed_batches_counted(self) -> None:
+        sink = _Sink()
+        sink.fail = True
+        writer = BatchingWriter(sink.write_many, max_batch_size=2)
+        await writer.start()
+        for i in range(3):
+            await writer.submit(i)
+        await writer.flush()
+        sink.fail = False
+        await writer.submit(3)
+        await writer.stop()
+        assert (writer.failed, writer.written, sink.batches) == (3, 1, [[3]])
+
+    async def test_lifecycle_and_validation(self) -> None:
+        writer = BatchingWriter(_Sink().write_many)
+        with pytest.raises(RuntimeError):
+            await writer.submit(1)
+        await writer.stop()
+        with pytest.raises(ValueError):
+            BatchingWriter(_Sink().write_many, max_batch_size=0)
+        with pytest.raises(ValueError):
+            BatchingWriter(_Sink().write_many, max_batch_size=10, max_pending=5)
+        with pytest.raises(ValueError):
+            BatchingWriter(_Sink().write_many, max_latency=-1.0)
+
+    async def test_audit_writer_end_to_end(self) -> None:
+        db = InMemoryPostgres()
+        backend = _backend(db)
+        writer = BatchingWriter(backend.audit.append_many, max_batch_size=64)
+        await writer.start()
+        rows = _audit_rows(200, backend.tenant_id)
+        for row in rows:
+            await writer.submit(row)
+        await writer.stop()
+        assert [r["input_hash"] for r in _audit_contents(db)] == [r.input_hash for r in rows]
+
+
+# ── AC-6: Benchmark ───────────────────────────────────────────────
+
+
+@pytest.mark.slow
+async def test_benchmark_batched_copy_vs_single_row_insert():
+    """Benchmark audit rows/sec with a 0.5ms round trip and 2µs/row server cost.
+
+    Single-row appends pay two round trips per row (tenant binding + INSERT);
+    the BatchingWriter pays two per 500-row COPY batch.  Round trips are
+    asserted; rates are reported (``pytest -s``).
+    """
+    tenant = uuid.uuid4()
+
+    single = InMemoryPostgres(latency=0.0005, row_latency=0.000002)
+    backend = PostgresBackend(single, tenant)
+    rows = _audit_rows(500, tenant)
+    start = time.perf_counter()
+    for row in rows:
+        await backend.audit.append(row)
+    single_rate = len(rows) / (time.perf_counter() - start)
+
+    bulk = InMemoryPostgres(latency=0.0005, row_latency=0.000002)
+    writer = BatchingWriter(PostgresBackend(bulk, tenant).audit.append_many)
+    rows = _audit_rows(50_000, tenant)
+    start = time.perf_counter()
+    await writer.start()
+    for row in rows:
+        await writer.submit(row)
+    await writer.stop()
+    batched_rate = len(rows) / (time.perf_counter() - start)
+
+    print(f"batched: {batched_rate:,.0f} rows/s, single-row: {single_rate:,.0f} rows/s")
+    assert len(bulk.tables["kernel_audit_log"]) == len(rows)
+    assert single.statements == 2 * 500
+    assert bulk.statements / len(rows) < single.statements / 500 / 10
@@ -1,6 +1,6 @@
 """Integration tests for holly/storage/postgres.py — Task 22.5.
 
-AC-1: TenantIsolatedPool.acquire() executes SET LOCAL app.current_tenant
+AC-1: TenantIsolatedPool.acquire() sets app.current_tenant (set_config)
       before yielding the connection (RLS activation invariant).
 AC-2: Cross-tenant query isolation: different tenant_ids get separate pool
       contexts; queries from tenant A cannot see tenant B data via the
@@ -99,7 +99,7 @@ def _make_tenant_pool(
 
 
 class TestTenantIsolatedPoolRLS:
-    """AC-1: SET LOCAL app.current_tenant called on every acquire."""
+    """AC-1: app.current_tenant set on every acquire."""
 
     def test_acquire_sets_rls_context(self) -> None:
         tid = _tenant()
@@ -114,7 +114,7 @@ class TestTenantIsolatedPoolRLS:
 
         # First call to execute must be the RLS setter
         first_call = conn.execute.call_args_list[0]
-        assert "SET LOCAL app.current_tenant" in first_call[0][0]
+        assert "set_config('app.current_tenant'" in first_call[0][0]
         assert first_call[0][1] == str(tid)
 
     def test_rls_context_contains_exact_tenant_string(self) -> None:
@@ -140,10 +140,10 @@ class TestTenantIsolatedPoolRLS:
                 pass
 
         asyncio.get_event_loop().run_until_complete(_run())
-        # Two acquires → two SET LOCAL calls
+        # Two acquires → two tenant bindings
         set_calls = [
             c for c in conn.execute.call_args_list
-            if "SET LOCAL" in c[0][0]
+            if "app.current_tenant" in c[0][0]
         ]
         assert len(set_calls) == 2
 
@@ -204,9 +204,9 @@ class TestCrossTenantIsolation:
 
         asyncio.get_event_loop().run_until_complete(_run())
 
-        # SET LOCAL must precede INSERT call
+        # Tenant binding must precede INSERT call
         calls = conn.execute.call_args_list
-        assert any("SET LOCAL" in c[0][0] for c in calls)
+        assert any("app.current_tenant" in c[0][0] for c in calls)
         conn.fetchval.assert_awaited_once()
 
 
@@ -344,7 +344,7 @@ class TestGoalsRepo:
             await repo.update_status(gid, "done")
 
         asyncio.get_event_loop().run_until_complete(_run())
-        # execute called for: SET LOCAL + UPDATE goals
+        # execute called for: tenant binding + UPDATE goals
         sql_calls = [c[0][0] for c in conn.execute.call_args_list]
         update_sql = [s for s in sql_calls if "UPDATE goals" in s]
         assert len(update_sql) == 1
@@ -738,7 +738,7 @@ class TestPostgresBackendFactory:
 
 
 class TestRLSProperty:
-    """Property: for any tenant_id, SET LOCAL is called with str(tenant_id)."""
+    """Property: for any tenant_id, app.current_tenant is set to str(tenant_id)."""
 
     @given(st.uuids())
     @settings(max_examples=200)
@@ -780,7 +780,7 @@ class TestRLSProperty:
     @given(st.integers(min_value=1, max_value=10))
     @settings(max_examples=50)
     def test_rls_called_once_per_n_acquires(self, n: int) -> None:
-        """N acquire calls → N SET LOCAL calls."""
+        """N acquire calls → N tenant bindings."""
         tid = _tenant()
         conn = _make_conn()
         tp = TenantIsolatedPool(_make_pool(conn), tid)
@@ -791,5 +791,5 @@ class TestRLSProperty:
                     pass
 
         asyncio.get_event_loop().run_until_complete(_run())
-        set_calls = [c for c in conn.execute.call_args_list if "SET LOCAL" in c[0][0]]
+        set_calls = [c for c in conn.execute.call_args_list if "app.current_tenant" in c[0][0]]
         assert len(set_calls) == n
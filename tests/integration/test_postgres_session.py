@@ -0,0 +1,484 @@
+"""Integration tests for tenant binding and round trips in holly/storage/postgres.py.
+
+AC-1: A session-bound TenantIsolatedPool issues no statement on acquire;
+      from_credentials(session_binding=True) binds every connection of the
+      per-tenant pool through its startup server_settings.
+AC-2: TenantIsolatedPool.transaction() sends BEGIN and the tenant binding
+      in one round trip, commits on success and rolls back on error.
+AC-3: CheckpointsRepo.upsert_many leaves the same state as sequential
+      upserts and pipelines the batch in a constant number of round trips.
+AC-4: PoolStats records checkouts, pool wait and acquire latency.
+AC-5: The deadlock exception class is resolved once and retried on.
+AC-6: Benchmark: round trips per repository call, per-checkout vs
+      session binding, with and without the prepared-statement cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from holly.storage.postgres import (
+    CheckpointRow,
+    GoalRow,
+    MemoryRow,
+    PostgresBackend,
+    TenantCredentials,
+    TenantIsolatedPool,
+    _deadlock_exception,
+    _with_deadlock_retry,
+)
+from holly.storage.postgres_memory import InMemoryPostgres
+
+# ── Counting fake ─────────────────────────────────────────────────
+
+
+class _CountingConnection:
+    """Connection counting round trips the way asyncpg spends them.
+
+    A parameterised statement is prepared (one round trip) unless its text
+    is in the connection's statement cache, then bound and executed (one
+    round trip).  A statement without parameters uses the simple query
+    protocol: one round trip, several statements allowed.  ``executemany``
+    pipelines every argument tuple after one prepare.  Statements are
+    applied to a shared InMemoryPostgres.
+
+    ``app.current_tenant`` follows Postgres scoping: ``SET LOCAL`` only
+    takes effect inside a transaction and ends with it; a session-level
+    ``set_config`` lasts until the pool resets the connection on release.
+    """
+
+    def __init__(
+        self,
+        store: InMemoryPostgres,
+        server_settings: dict[str, str] | None,
+        statement_cache_size: int,
+    ) -> None:
+        self.store = store
+        self.settings = dict(server_settings or {})
+        self.cache_size = statement_cache_size
+        self.prepared: OrderedDict[str, None] = OrderedDict()
+        self.round_trips = 0
+        self.in_transaction = False
+        self.local_tenant: str | None = None
+        self.session_tenant: str | None = None
+        # app.current_tenant in effect for each data statement
+        self.tenants: list[str | None] = []
+
+    def _send(self, query: str, args: tuple[Any, ...]) -> None:
+        if args:
+            if query in self.prepared:
+                self.prepared.move_to_end(query)
+            else:
+                self.round_trips += 1
+                if self.cache_size:
+                    self.prepared[query] = None
+                    if len(self.prepared) > self.cache_size:
+                        self.prepared.popitem(last=False)
+        self.round_trips += 1
+        verb = query.split()[0].rstrip(";")
+        if verb == "BEGIN":
+            self.in_transaction = True
+        if "set_config('app.current_tenant'" in query:
+            self.session_tenant = args[0]
+        elif "SET LOCAL app.current_tenant" in query:
+            if self.in_transaction:
+                self.local_tenant = args[0] if args else query.rsplit("'", 2)[1]
+        elif verb in ("COMMIT", "ROLLBACK"):
+            self.in_transaction = False
+            self.local_tenant = None
+        elif verb != "BEGIN":
+            self.tenants.append(self.current_tenant)
+
+    @property
+    def current_tenant(self) -> str | None:
+        """``app.current_tenant`` as the next statement would see it."""
+        return self.local_tenant or self.session_tenant or self.settings.get("app.current_tenant")
+
+    def reset(self) -> None:
+        """Model asyncpg's ``RESET ALL`` on release."""
+        self.session_tenant = None
+
+    async def execute(self, query: str, *args: Any, timeout: float | None = None) -> str:
+        self._send(query, args)
+        return await self.store.execute(query, *args, timeout=timeout)
+
+    async def fetch(self, query: str, *args: Any, timeout: float | None = None) -> list[Any]:
+        self._send(query, args)
+        return await self.store.fetch(query, *args, timeout=timeout)
+
+    async def fetchrow(self, query: str, *args: Any, timeout: float | None = None) -> Any:
+        self._send(query, args)
+        return await self.store.fetchrow(query, *args, timeout=timeout)
+
+    async def fetchval(self, query: str, *args: Any, timeout: float | None = None) -> Any:
+        self._send(query, args)
+        return await self.store.fetchval(query, *args, timeout=timeout)
+
+    async def executemany(
+        self, command: str, args: list[Any], *, timeout: float | None = None
+    ) -> None:
+        self._send(command, tuple(args[:1]))
+        await self.store.executemany(command, args, timeout=timeout)
+
+
+class _CountingPool:
+    """Fixed-size pool of counting connections over one store."""
+
+    def __init__(
+        self,
+        size: int = 1,
+        *,
+        server_settings: dict[str, str] | None = None,
+        statement_cache_size: int = 100,
+    ) -> None:
+        self.store = InMemoryPostgres()
+        self.connections = [
+            _CountingConnection(self.store, server_settings, statement_cache_size)
+            for _ in range(size)
+        ]
+        self._idle: asyncio.Queue[_CountingConnection] = asyncio.Queue()
+        for conn in self.connections:
+            self._idle.put_nowait(conn)
+
+    @property
+    def round_trips(self) -> int:
+        return sum(conn.round_trips for conn in self.connections)
+
+    @property
+    def tenants(self) -> list[str | None]:
+        return [tenant for conn in self.connections for tenant in conn.tenants]
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            conn.reset()
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        pass
+
+
+class _CountingFactory:
+    def __init__(self) -> None:
+        self.options: dict[str, Any] = {}
+        self.pool: _CountingPool | None = None
+
+    async def create(
+        self, dsn: str, *, min_size: int, max_size: int, timeout: float, **options: Any
+    ) -> _CountingPool:
+        self.options = options
+        self.pool = _CountingPool(min_size, **options)
+        return self.pool
+
+
+def _creds(tenant_id: uuid.UUID | None = None) -> TenantCredentials:
+    return TenantCredentials(
+        host="pg", port=5432, user="u", password="p", database="holly",
+        tenant_id=tenant_id or uuid.uuid4(),
+    )
+
+
+def _checkpoint(workflow_id: uuid.UUID, node: int, tenant_id: uuid.UUID, ts: int) -> CheckpointRow:
+    return CheckpointRow(
+        workflow_id=workflow_id,
+        node_id=uuid.UUID(int=node),
+        output_state={"node": node, "ts": ts},
+        checkpoint_timestamp=ts,
+        idempotency_key=f"k-{node}",
+        output_hash=f"h-{node}-{ts}",
+        tenant_id=tenant_id,
+    )
+
+
+# ── AC-1: Session binding ─────────────────────────────────────────
+
+
+class TestSessionBinding:
+    """AC-1: session-bound pools bind once per connection."""
+
+    async def test_session_bound_acquire_issues_no_statement(self) -> None:
+        pool = _CountingPool()
+        tp = TenantIsolatedPool(pool, uuid.uuid4(), session_bound=True)
+        async with tp.acquire() as conn:
+            assert conn is pool.connections[0]
+        assert pool.round_trips == 0
+        assert tp.session_bound
+        assert tp.stats.setup_statements == 0
+
+    async def test_default_acquire_still_binds_per_checkout(self) -> None:
+        tid = uuid.uuid4()
+        pool = _CountingPool()
+        tp = TenantIsolatedPool(pool, tid)
+        async with tp.acquire() as conn:
+            assert conn.current_tenant == str(tid)
+            await conn.fetch("SELECT * FROM goals WHERE status = $1", "pending")
+            await conn.fetch("SELECT * FROM goals WHERE status = $1", "done")
+        assert conn.tenants == [str(tid)] * 2
+        assert conn.current_tenant is None
+        assert tp.stats.setup_statements == 1
+
+    async def test_default_binding_covers_bulk_repo_calls(self) -> None:
+        tid, workflow = uuid.uuid4(), uuid.uuid4()
+        pool = _CountingPool()
+        backend = PostgresBackend(pool, tid)
+        await backend.goals.insert(GoalRow(tenant_id=tid, level=2, predicate="p"))
+        await backend.memory.insert_many(
+            [
+                MemoryRow(
+                    conversation_id=uuid.uuid4(),
+                    agent_id=uuid.uuid4(),
+                    memory_type="episodic",
+                    content=f"m{i}",
+                    tenant_id=tid,
+                )
+                for i in range(3)
+            ]
+        )
+        await backend.checkpoints.upsert_many(
+            [_checkpoint(workflow, i, tid, i) for i in range(3)]
+        )
+        assert pool.tenants
+        assert set(pool.tenants) == {str(tid)}
+
+    async def test_from_credentials_binds_connections_at_startup(self) -> None:
+        creds = _creds()
+        factory = _CountingFactory()
+        backend = await PostgresBackend.from_credentials(
+            creds, pool_factory=factory, session_binding=True
+        )
+        assert factory.options == {
+            "server_settings": {"app.current_tenant": str(creds.tenant_id)}
+        }
+        goal = GoalRow(tenant_id=creds.tenant_id, level=2, predicate="p")
+        await backend.goals.insert(goal)
+        assert (await backend.goals.get(goal.id))["predicate"] == "p"
+        assert factory.pool is not None
+        assert factory.pool.tenants == [str(creds.tenant_id)] * 2
+
+    async def test_from_credentials_defaults_pass_no_options(self) -> None:
+        factory = _CountingFactory()
+        await PostgresBackend.from_credentials(_creds(), pool_factory=factory)
+        assert factory.options == {}
+
+    async def test_from_credentials_forwards_statement_cache_size(self) -> None:
+        factory = _CountingFactory()
+        await PostgresBackend.from_credentials(
+            _creds(), pool_factory=factory, statement_cache_size=0
+        )
+        assert factory.options == {"statement_cache_size": 0}
+
+
+# ── AC-2: transaction() ───────────────────────────────────────────
+
+
+class TestTransaction:
+    """AC-2: BEGIN carries the binding; COMMIT / ROLLBACK on exit."""
+
+    async def test_begin_carries_binding(self) -> None:
+        tid = uuid.uuid4()
+        pool = _CountingPool()
+        tp = TenantIsolatedPool(pool, tid)
+        async with tp.transaction() as conn:
+            assert conn.round_trips == 1
+            assert conn.local_tenant == str(tid)
+            await conn.fetch("SELECT * FROM goals WHERE status = $1", "pending")
+        assert conn.round_trips == 4  # BEGIN+SET, prepare, SELECT, COMMIT
+        assert conn.tenants == [str(tid)]
+        assert conn.local_tenant is None
+
+    async def test_statements_in_order(self) -> None:
+        tid = uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
+        conn = AsyncMock()
+        conn.execute = AsyncMock(return_value="OK")
+
+        @asynccontextmanager
+        async def _acquire():
+            yield conn
+
+        pool = AsyncMock()
+        pool.acquire = _acquire
+        async with TenantIsolatedPool(pool, tid).transaction() as c:
+            await c.execute("UPDATE goals SET status = $1 WHERE id = $2", "done", tid)
+        queries = [call.args[0] for call in conn.execute.call_args_list]
+        assert queries == [
+            f"BEGIN; SET LOCAL app.current_tenant = '{tid}'",
+            "UPDATE goals SET status = $1 WHERE id = $2",
+            "COMMIT",
+        ]
+
+    async def test_rollback_on_error(self) -> None:
+        pool = _CountingPool()
+        tp = TenantIsolatedPool(pool, uuid.uuid4(), session_bound=True)
+        with pytest.raises(RuntimeError):
+            async with tp.transaction() as conn:
+                raise RuntimeError("boom")
+        assert conn.round_trips == 2  # BEGIN, ROLLBACK
+        assert conn.tenants == []
+
+
+# ── AC-3: CheckpointsRepo.upsert_many ─────────────────────────────
+
+
+class TestCheckpointUpsertMany:
+    """AC-3: pipelined checkpoint upserts."""
+
+    async def test_matches_sequential_upserts(self) -> None:
+        tenant, workflow = uuid.uuid4(), uuid.uuid4()
+        rows = [_checkpoint(workflow, i % 7, tenant, i) for i in range(20)]
+
+        sequential = InMemoryPostgres()
+        backend = PostgresBackend(sequential, tenant)
+        for row in rows:
+            await backend.checkpoints.upsert(row)
+        bulk = InMemoryPostgres()
+        await PostgresBackend(bulk, tenant).checkpoints.upsert_many(rows)
+
+        assert bulk.tables["workflow_checkpoints"] == sequential.tables["workflow_checkpoints"]
+
+    async def test_constant_round_trips(self) -> None:
+        tenant, workflow = uuid.uuid4(), uuid.uuid4()
+        pool = _CountingPool(server_settings={"app.current_tenant": str(tenant)})
+        backend = PostgresBackend(pool, tenant, session_bound=True)
+
+        await backend.checkpoints.upsert_many([_checkpoint(workflow, 0, tenant, 0)])
+        before = pool.round_trips
+        await backend.checkpoints.upsert_many(
+            [_checkpoint(workflow, i, tenant, 1) for i in range(200)]
+        )
+        assert pool.round_trips - before == 3  # BEGIN, executemany, COMMIT
+        assert len(pool.store.tables["workflow_checkpoints"]) == 200
+        assert set(pool.tenants) == {str(tenant)}
+
+    async def test_empty_batch_is_noop(self) -> None:
+        pool = _CountingPool()
+        await PostgresBackend(pool, uuid.uuid4()).checkpoints.upsert_many([])
+        assert pool.round_trips == 0
+
+
+# ── AC-4: PoolStats ───────────────────────────────────────────────
+
+
+class TestPoolStats:
+    """AC-4: checkout counters and timings."""
+
+    async def test_counts_checkouts_and_setup(self) -> None:
+        tp = TenantIsolatedPool(_CountingPool(), uuid.uuid4())
+        for _ in range(3):
+            async with tp.acquire():
+                pass
+        async with tp.transaction():
+            pass
+        assert tp.stats.acquired == 4
+        assert tp.stats.setup_statements == 4
+        assert tp.stats.max_acquire_seconds >= tp.stats.max_wait_seconds
+
+    async def test_records_pool_wait(self) -> None:
+        tp = TenantIsolatedPool(_CountingPool(size=1), uuid.uuid4(), session_bound=True)
+
+        async def _hold() -> None:
+            async with tp.acquire():
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(_hold(), _hold())
+        stats = tp.stats
+        assert stats.acquired == 2
+        assert stats.max_wait_seconds >= 0.015
+        assert stats.total_held_seconds >= 0.03
+        assert stats.mean_wait_seconds == stats.total_wait_seconds / 2
+
+    def test_means_default_to_zero(self) -> None:
+        stats = TenantIsolatedPool(_CountingPool(), uuid.uuid4()).stats
+        assert stats.mean_wait_seconds == 0.0
+        assert stats.mean_acquire_seconds == 0.0
+
+
+# ── AC-5: Deadlock exception lookup ───────────────────────────────
+
+
+class TestDeadlockException:
+    """AC-5: resolved once, then retried on."""
+
+    def test_resolved_once(self) -> None:
+        assert _deadlock_exception() is _deadlock_exception()
+        assert _deadlock_exception.cache_info().currsize == 1
+
+    async def test_retries_deadlocks(self) -> None:
+        calls = 0
+
+        async def _flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise _deadlock_exception()("deadlock detected")
+            return "ok"
+
+        with patch("holly.storage.postgres.asyncio.sleep", new=AsyncMock()):
+            assert await _with_deadlock_retry(_flaky) == "ok"
+        assert calls == 3
+
+
+# ── AC-6: Benchmark ───────────────────────────────────────────────
+
+
+async def _repo_calls(backend: PostgresBackend, tenant: uuid.UUID, n: int) -> int:
+    """Run n rounds of a mixed repository workload; return calls made."""
+    workflow = uuid.uuid4()
+    for i in range(n):
+        goal = GoalRow(tenant_id=tenant, level=i % 4, predicate=f"p{i}")
+        await backend.goals.insert(goal)
+        await backend.goals.get(goal.id)
+        await backend.goals.update_status(goal.id, "active")
+        await backend.checkpoints.upsert(_checkpoint(workflow, i, tenant, i))
+        await backend.memory.insert(
+            MemoryRow(
+                conversation_id=uuid.uuid4(),
+                agent_id=uuid.uuid4(),
+                memory_type="episodic",
+                content=f"m{i}",
+                timestamp=i,
+                tenant_id=tenant,
+            )
+        )
+    return 5 * n
+
+
+async def test_benchmark_round_trips_per_repo_call():
+    """Benchmark round trips per call for a mixed single-statement workload.
+
+    Per-checkout binding pays a set_config round trip before every query;
+    session binding pays none.  With asyncpg's statement cache each fixed
+    query is prepared once per connection; with the cache disabled every
+    parameterised statement (set_config included) costs a prepare too.
+    """
+    results: dict[tuple[bool, int], float] = {}
+    for session_binding in (False, True):
+        for cache_size in (100, 0):
+            tenant = uuid.uuid4()
+            factory = _CountingFactory()
+            backend = await PostgresBackend.from_credentials(
+                _creds(tenant),
+                pool_factory=factory,
+                session_binding=session_binding,
+                statement_cache_size=cache_size,
+            )
+            assert factory.pool is not None
+            await _repo_calls(backend, tenant, 5)  # warm the statement caches
+            before = factory.pool.round_trips
+            calls = await _repo_calls(backend, tenant, 200)
+            results[session_binding, cache_size] = (factory.pool.round_trips - before) / calls
+            assert set(factory.pool.tenants) == {str(tenant)}
+
+    assert results[False, 100] == 2.0
+    assert results[True, 100] == 1.0
+    assert results[False, 0] == 4.0
+    assert results[True, 0] == 2.0
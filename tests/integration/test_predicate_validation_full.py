@@ -9,9 +9,11 @@ Tests the complete validation pipeline:
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
-from holly.goals.predicates import DEFAULT_PREDICATES
+from holly.goals.predicates import DEFAULT_PREDICATES, PredicateResult
 from holly.goals.validator import (
     StateGenerator,
     PredicateValidator,
@@ -262,3 +264,52 @@ class TestValidationErrorHandling:
 
         # Should not raise
         validator.assert_zero_false_positives_negatives({})
+
+
+class _AcceptsEverything:
+    """Module-level (picklable) broken L4 predicate for pool tests."""
+
+    level = 4
+
+    def evaluate(self, state):
+        return PredicateResult(level=4, passed=True, reason="accepts all")
+
+    def is_satisfied(self, state):
+        return True
+
+
+class TestParallelValidation:
+    """Test process-pool validation against the inline path."""
+
+    def test_process_pool_matches_inline(self) -> None:
+        """Seeded reports are identical with 1 and 3 worker processes."""
+        inline = validate_celestial_predicates(count_per_level=5_000, random_seed=42)
+        pooled = validate_celestial_predicates(
+            count_per_level=5_000, workers=3, random_seed=42
+        )
+        assert pooled == inline
+
+    def test_process_pool_stops_on_failure(self) -> None:
+        """The pool stops merging shards after the first failure."""
+        validator = PredicateValidator(workers=2, shard_size=100)
+        reports = validator.validate_all_levels(
+            [*DEFAULT_PREDICATES[:4], _AcceptsEverything()],
+            count_per_level=2_000,
+            stop_on_failure=True,
+        )
+        assert reports[4].stopped_early is True
+        assert reports[4].false_positives >= 1
+
+    @pytest.mark.slow
+    def test_benchmark_million_states(self) -> None:
+        """Validate 1M generated states (200k per level) on all CPUs."""
+        start = time.perf_counter()
+        reports = validate_celestial_predicates(
+            count_per_level=200_000, workers=None, random_seed=0
+        )
+        elapsed = time.perf_counter() - start
+
+        assert sum(r.total_states for r in reports.values()) == 1_000_000
+        assert all(r.is_valid for r in reports.values())
+        # ~12s on a single core; scales with the number of workers
+        assert elapsed < 60
@@ -0,0 +1,116 @@
+"""Integration benchmarks for the durable Redis-backed main lane.
+
+Runs against ``InMemoryRedis`` with a simulated round-trip latency so
+consumer scaling reflects network-bound claim/ack traffic.
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from holly.engine.lanes import LanePolicy, Task, TaskEnqueueRequest
+from holly.engine.redis_lanes import RedisMainLane
+from holly.storage.redis import LeaseQueueClient
+from holly.storage.redis.memory import InMemoryRedis
+
+RTT = 0.0005
+
+
+def _task(i: int) -> Task:
+    return Task(
+        task_id=uuid4(),
+        goal={"i": i},
+        user_id="user",
+        tenant_id="tenant-bench",
+        idempotency_key=f"bench-{i}",
+        resource_budget={},
+        mcp_tools=[],
+        context={},
+    )
+
+
+def _lane(redis: InMemoryRedis, **kwargs: object) -> RedisMainLane:
+    client = LeaseQueueClient(client=redis)
+    return RedisMainLane(
+        "tenant-bench", client, LanePolicy(max_queue_depth=100_000), **kwargs
+    )
+
+
+async def _drain(n_tasks: int, consumers: int, batch: int) -> float:
+    redis = InMemoryRedis()
+    producer = _lane(redis)
+    for i in range(n_tasks):
+        await producer.enqueue_task(TaskEnqueueRequest(task=_task(i), priority=i % 11))
+    redis.latency = RTT
+    done: list[int] = []
+
+    async def consume() -> None:
+        lane = _lane(redis)
+        while leased := await lane.claim(batch):
+            await lane.ack(*leased)
+            done.extend(lt.task.goal["i"] for lt in leased)  # type: ignore[misc]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(consume() for _ in range(consumers)))
+    elapsed = time.perf_counter() - start
+    assert sorted(done) == list(range(n_tasks))
+    return n_tasks / elapsed
+
+
+class TestRedisMainLaneBenchmark:
+    """Throughput and redelivery latency with 1-32 consumers."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_consumers(self) -> None:
+        """Benchmark tasks/sec for 1-32 consumers, single and batched claims.
+
+        Each claim and ack is one round trip, so with RTT-bound traffic
+        throughput grows with consumers and with the claim batch size.
+        """
+        rates = {
+            (consumers, batch): await _drain(1_000, consumers, batch)
+            for consumers in (1, 4, 32)
+            for batch in (1, 16)
+        }
+        assert rates[(32, 1)] > rates[(1, 1)] * 4
+        assert rates[(1, 16)] > rates[(1, 1)] * 4
+        assert rates[(32, 16)] > rates[(1, 1)] * 8
+
+    @pytest.mark.asyncio
+    async def test_exactly_once_ack_under_contention(self) -> None:
+        """Test 32 consumers never claim the same unexpired task twice."""
+        assert await _drain(2_000, 32, 4) > 0
+
+    @pytest.mark.asyncio
+    async def test_redelivery_latency(self) -> None:
+        """Benchmark time from lease expiry to redelivery with live consumers.
+
+        Redelivery happens inside the next claim after expiry, so the
+        delay is bounded by the consumers' poll interval plus one RTT.
+        """
+        redis = InMemoryRedis(latency=RTT)
+        lease, poll = 0.05, 0.005
+        crashed = _lane(redis, visibility_timeout=lease)
+        for i in range(32):
+            await crashed.enqueue_task(TaskEnqueueRequest(task=_task(i)))
+        leased_at = time.time()
+        assert len(await crashed.claim(32)) == 32
+        expires_at = leased_at + lease
+
+        delays: list[float] = []
+
+        async def consume() -> None:
+            lane = _lane(redis, poll_interval=poll)
+            while len(delays) < 32:
+                for lt in await lane.claim():
+                    assert lt.attempts == 2
+                    delays.append(time.time() - expires_at)
+                    await lane.ack(lt)
+                await asyncio.sleep(poll)
+
+        await asyncio.wait_for(asyncio.gather(*(consume() for _ in range(8))), 5.0)
+        delays.sort()
+        assert delays[len(delays) // 2] < 0.05
+        assert delays[-1] < 0.25
@@ -14,7 +14,7 @@ AC-6: audit_rls_policies() returns FAIL verdicts for tables missing from
       pg_policies — cross-tenant access would be UNBLOCKED.
 AC-7: audit_rls_policies() detects USING clause mismatch (wrong policy).
 AC-8: Cross-tenant isolation invariant: two TenantIsolatedPool instances with
-      different tenant_ids issue distinct SET LOCAL calls — data cannot leak.
+      different tenant_ids issue distinct tenant bindings — data cannot leak.
 AC-9: ICD_BOUNDARY covers all 7 Postgres ICDs in Task 22.7 manifest
       (ICD-032, 036, 038, 039, 040, 042, 045 handled separately).
 AC-10: render_rls_boundary_report produces valid markdown with headers and
@@ -330,7 +330,7 @@ class TestAuditRLSPoliciesClauseMismatch:
 
 
 class TestCrossTenantIsolationInvariant:
-    """AC-8: two TenantIsolatedPool instances produce distinct SET LOCAL calls."""
+    """AC-8: two TenantIsolatedPool instances produce distinct tenant bindings."""
 
     def test_two_tenants_produce_distinct_set_local(self) -> None:
         tid_a = uuid.UUID("aaaaaaaa-aaaa-4aaa-aaaa-aaaaaaaaaaaa")
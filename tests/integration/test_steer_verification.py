@@ -6,10 +6,15 @@ Tests cover:
 - Capability and obligation verification
 - Real topology structures (from topology_manager)
 - Multiple steer operations with contract chains
+- Benchmark of incremental vs full verification latency
 """
 
 from __future__ import annotations
 
+import itertools
+import statistics
+import time
+
 import pytest
 
 from holly.agents.contract_verifier import (
@@ -17,8 +22,17 @@ from holly.agents.contract_verifier import (
     ContractViolationType,
     ContractVerificationResult,
     ContractVerifier,
+    IncrementalContractVerifier,
     verify_steer_contracts,
 )
+from holly.agents.topology_manager import (
+    AgentCapability,
+    AgentContract,
+    AgentPermissions,
+    SpawnSpec,
+    SteerSpec,
+    TopologyManager,
+)
 
 
 # ──────────────────────────────────────────────────────────
@@ -483,3 +497,94 @@ class TestBroadcastContracts:
 
         result = verify_steer_contracts(old_topo, new_topo, [contract])
         assert len(result.violations) > 0
+
+
+# ──────────────────────────────────────────────────────────
+# § Benchmark: Incremental Verification
+# ──────────────────────────────────────────────────────────
+
+
+def _steer_chain(n: int, steps: int) -> tuple[list, list]:
+    """Spawn an ``n``-agent team and steer it ``steps`` times, two agents at a time."""
+    ids = [f"agent-{i:05d}" for i in range(n)]
+
+    def contract(agent_id: str, peer: str | None, rate: float = 1.0) -> AgentContract:
+        return AgentContract(
+            agent_id=agent_id,
+            peer_agent_id=peer,
+            expected_message_rate=rate,
+            responsibility_domain=frozenset([f"goal-{agent_id}"]),
+            max_response_time_sec=5.0,
+            escalation_threshold=3,
+        )
+
+    configs = []
+    for i, agent_id in enumerate(ids):
+        permissions = AgentPermissions(
+            agent_id=agent_id,
+            can_spawn=False,
+            can_steer=False,
+            can_dissolve=False,
+            capability_level=AgentCapability.STANDARD,
+            max_concurrent_tasks=5,
+            allowed_domains=frozenset(),
+        )
+        peers = frozenset(
+            [contract(agent_id, ids[(i + 1) % n]), contract(agent_id, ids[i // 10 * 10])]
+        )
+        configs.append((agent_id, permissions, peers))
+    manager = TopologyManager()
+    topologies = [
+        manager.spawn(
+            SpawnSpec(
+                parent_agent_id=None,
+                agent_configs=configs,
+                initial_goals=frozenset(f"goal-{i}" for i in range(n)),
+            )
+        )
+    ]
+    for step in range(steps):
+        touched = [ids[(step * 7919) % n], ids[(step * 104729 + 1) % n]]
+        topologies.append(
+            manager.steer(
+                SteerSpec(
+                    topology_id=topologies[-1].topology_id,
+                    agent_reassignments={f"goal-{step}": {touched[0]}},
+                    new_contracts=frozenset(contract(a, ids[0], 2.0) for a in touched),
+                )
+            )
+        )
+    contracts = [c for _, _, peers in configs for c in peers]
+    return topologies, contracts
+
+
+@pytest.mark.parametrize("n", [100, 1_000, 10_000])
+def test_benchmark_incremental_verification_vs_full(n: int) -> None:
+    """Benchmark verify latency against team size for steers touching two agents.
+
+    Full verification makes four passes over every contract per steer;
+    the incremental verifier scans the agent and goal maps by identity and
+    re-checks only contracts naming a changed agent.  Both must return
+    identical results.
+    """
+    topologies, contracts = _steer_chain(n, steps=10)
+    full = ContractVerifier()
+    incremental = IncrementalContractVerifier()
+    incremental.verify_steer_operation(topologies[0], topologies[0], contracts)
+
+    full_s: list[float] = []
+    incremental_s: list[float] = []
+    for old, new in itertools.pairwise(topologies):
+        start = time.perf_counter()
+        expected = full.verify_steer_operation(old, new, contracts)
+        full_s.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        result = incremental.verify_steer_operation(old, new, contracts)
+        incremental_s.append(time.perf_counter() - start)
+
+        assert result.violations == expected.violations
+        assert result.contracts_preserved == expected.contracts_preserved
+
+    assert expected.violations  # every agent owes responsibilities it was never given
+    if n >= 1_000:
+        assert statistics.median(incremental_s) * 5 < statistics.median(full_s)
@@ -1,11 +1,21 @@
 """Integration tests for workflow engine module."""
 
 import asyncio
-from datetime import datetime, timezone
+import json
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from holly.engine.blob_store import LocalBlobStore
+from holly.engine.checkpoint_store import FileCheckpointStore, checkpoint_to_dict
 from holly.engine.workflow_engine import (
+    DeadLetterEvent,
+    DeadLetterQueue,
+    RetentionPolicy,
+    SpilledResult,
     TaskExecutionError,
     WorkflowDAG,
     WorkflowEdge,
@@ -73,6 +83,21 @@ class FlakyExecutor:
         return {"task": self.name, "calls": self.call_count}
 
 
+class ProcessCrash(BaseException):
+    """Stands in for the process dying; the saga does not handle it."""
+
+
+class CrashingExecutor(FlakyExecutor):
+    """Executor that crashes the process on a specific invocation."""
+
+    async def execute(self, task_id: str, payload):
+        """Execute, crashing on the configured call."""
+        if self.call_count + 1 == self.fail_on_count:
+            self.call_count += 1
+            raise ProcessCrash(f"{self.name} crashed on call {self.call_count}")
+        return await super().execute(task_id, payload)
+
+
 # ---------------------------------------------------------------------------
 # Integration Tests
 # ---------------------------------------------------------------------------
@@ -458,3 +483,439 @@ async def test_workflow_engine_failure_injection():
 
     assert state["task1"] == "executed"
     assert state["task2"] == "executed"
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_file_checkpoint_crash_resume(tmp_path):
+    """Test a saga interrupted mid-way resumes from on-disk checkpoints."""
+    results = {}
+    flaky = CrashingExecutor("task3", fail_on_count=1, results=results)
+    executors = [PingPongExecutor(f"task{i}", results) for i in range(6)]
+    executors[3] = flaky
+
+    def build_dag():
+        dag = WorkflowDAG(workflow_id="file_resume_workflow")
+        for i, executor in enumerate(executors):
+            dag.add_task(
+                WorkflowTask(
+                    task_id=f"task{i}",
+                    executor=executor,
+                    payload={"index": i},
+                    idempotency_key=f"file_resume_{i}",
+                )
+            )
+            if i > 0:
+                dag.add_edge(WorkflowEdge(f"task{i-1}", f"task{i}"))
+        return dag
+
+    engine = WorkflowEngine(checkpoint_store=FileCheckpointStore(tmp_path))
+    with pytest.raises(ProcessCrash):
+        await engine.execute(build_dag())
+    execution_id = (await engine.list_executions("file_resume_workflow"))[0].execution_id
+
+    restarted = WorkflowEngine(checkpoint_store=FileCheckpointStore(tmp_path))
+    execution = await restarted.resume(execution_id, build_dag())
+
+    assert flaky.call_count == 2
+    assert len(execution.results) == 6
+    assert all(s == WorkflowTaskState.SUCCEEDED for s in execution.state.values())
+
+
+class _InstantExecutor:
+    """Executor with no latency so checkpoint cost dominates."""
+
+    async def execute(self, task_id: str, payload):
+        return {"task": task_id, "blob": "x" * 64}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_checkpoint_overhead_benchmark():
+    """Benchmark checkpoint volume and overhead vs. workflow size.
+
+    Delta checkpoints must persist each result exactly once, so total
+    checkpoint bytes grow linearly with workflow size (full snapshots grow
+    quadratically).
+    """
+    per_task_bytes = {}
+    for n in (50, 200, 800):
+        engine = WorkflowEngine(checkpoint_interval=1)
+        dag = WorkflowDAG(workflow_id=f"bench_{n}")
+        executor = _InstantExecutor()
+        for i in range(n):
+            dag.add_task(
+                WorkflowTask(
+                    task_id=f"task{i}",
+                    executor=executor,
+                    payload={},
+                    idempotency_key=f"bench_{n}_{i}",
+                )
+            )
+            if i > 0:
+                dag.add_edge(WorkflowEdge(f"task{i-1}", f"task{i}"))
+
+        execution = await engine.execute(dag)
+
+        assert sum(len(c.results) for c in execution.checkpoints) == n
+        total_bytes = sum(
+            len(json.dumps(checkpoint_to_dict(c))) for c in execution.checkpoints
+        )
+        per_task_bytes[n] = total_bytes / n
+
+    # Linear growth: per-task checkpoint volume is flat across sizes.
+    assert per_task_bytes[800] < per_task_bytes[50] * 1.2
+
+
+class _SlowCompensator:
+    """Compensator with fixed latency for rollback benchmarks.
+
+    Shared ``active``/``peak``/``order`` state records how many
+    compensations overlapped and the order they started in.
+    """
+
+    def __init__(self, delay: float, state: dict):
+        self.delay = delay
+        self.state = state
+
+    async def execute(self, task_id: str, payload):
+        return {"task": task_id}
+
+    async def compensate(self, task_id: str, forward_result):
+        self.state["order"].append(task_id)
+        self.state["active"] += 1
+        self.state["peak"] = max(self.state["peak"], self.state["active"])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.state["active"] -= 1
+        return {"task": task_id, "compensated": True}
+
+
+def _rollback_state() -> dict:
+    return {"active": 0, "peak": 0, "order": []}
+
+
+def _wide_rollback_dag(width: int, delay: float, state: dict) -> WorkflowDAG:
+    """``width`` independent branches fanning into one failing task."""
+    wide = WorkflowDAG(workflow_id="wide_rollback")
+    for i in range(width):
+        executor = _SlowCompensator(delay, state)
+        wide.add_task(
+            WorkflowTask(
+                task_id=f"branch{i}",
+                executor=executor,
+                payload={},
+                idempotency_key=f"wide_{i}",
+                compensation_executor=executor,
+            )
+        )
+    wide.add_task(
+        WorkflowTask(
+            task_id="fail",
+            executor=FlakyExecutor("fail"),
+            payload={},
+            idempotency_key="wide_fail",
+        )
+    )
+    for i in range(width):
+        wide.add_edge(WorkflowEdge(f"branch{i}", "fail"))
+    return wide
+
+
+def _deep_rollback_dag(depth: int, delay: float, state: dict) -> WorkflowDAG:
+    """A ``depth``-task chain ending in a failing task."""
+    deep = WorkflowDAG(workflow_id="deep_rollback")
+    for i in range(depth):
+        executor = _SlowCompensator(delay, state)
+        deep.add_task(
+            WorkflowTask(
+                task_id=f"step{i}",
+                executor=executor,
+                payload={},
+                idempotency_key=f"deep_{i}",
+                compensation_executor=executor,
+            )
+        )
+        if i > 0:
+            deep.add_edge(WorkflowEdge(f"step{i-1}", f"step{i}"))
+    deep.add_task(
+        WorkflowTask(
+            task_id="fail",
+            executor=FlakyExecutor("fail"),
+            payload={},
+            idempotency_key="deep_fail",
+        )
+    )
+    deep.add_edge(WorkflowEdge(f"step{depth-1}", "fail"))
+    return deep
+
+
+async def _rollback_seconds(dag: WorkflowDAG, engine: WorkflowEngine) -> float:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+    return loop.time() - start
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_rollback_wide_concurrent_deep_reversed():
+    """Test independent compensations overlap and a chain unwinds in reverse.
+
+    Wide: 40 independent branches must all be compensating at once.
+    Deep: a 10-task chain must roll back one step at a time, in reverse.
+    """
+    width = 40
+    wide_state = _rollback_state()
+    await _rollback_seconds(
+        _wide_rollback_dag(width, 0.01, wide_state),
+        WorkflowEngine(max_concurrent_compensations=width),
+    )
+    assert wide_state["peak"] == width
+
+    depth = 10
+    deep_state = _rollback_state()
+    await _rollback_seconds(
+        _deep_rollback_dag(depth, 0.001, deep_state),
+        WorkflowEngine(max_concurrent_compensations=width),
+    )
+    assert deep_state["peak"] == 1
+    assert deep_state["order"] == [f"step{i}" for i in reversed(range(depth))]
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_workflow_engine_rollback_benchmark_wide_and_deep():
+    """Benchmark rollback time for wide and deep sagas.
+
+    Wide rollback should take roughly one compensation latency, not
+    forty; deep rollback takes one latency per step.
+    """
+    delay = 0.02
+    width = 40
+    depth = 10
+    wide_elapsed = await _rollback_seconds(
+        _wide_rollback_dag(width, delay, _rollback_state()),
+        WorkflowEngine(max_concurrent_compensations=width),
+    )
+    deep_elapsed = await _rollback_seconds(
+        _deep_rollback_dag(depth, delay, _rollback_state()),
+        WorkflowEngine(max_concurrent_compensations=width),
+    )
+
+    print(
+        f"rollback of {delay * 1000:.0f} ms compensations: wide({width}) "
+        f"{wide_elapsed * 1000:.1f} ms, deep({depth}) {deep_elapsed * 1000:.1f} ms"
+    )
+    assert deep_elapsed >= depth * delay
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_dead_letter_queue_index_benchmark():
+    """Benchmark indexed DLQ lookups and heap expiry at 20k events.
+
+    Lookups touch only the k matching events and expiry pops only the
+    expired heap prefix; timings are reported, not asserted.
+    """
+    queue = DeadLetterQueue(max_size=50_000, ttl_hours=1)
+    now = datetime.now(timezone.utc)
+    workflows = 200
+    for i in range(20_000):
+        await queue.enqueue(
+            DeadLetterEvent(
+                event_id=f"e{i}",
+                workflow_id=f"wf{i % workflows}",
+                task_id=f"task{i % 7}",
+                # Every tenth event is past its TTL.
+                timestamp=now - timedelta(hours=2 if i % 10 == 0 else 0),
+                error_message="boom",
+                payload={},
+            )
+        )
+
+    start = time.perf_counter()
+    for w in range(workflows):
+        events = await queue.query_by_workflow(f"wf{w}")
+        assert len(events) == 100
+    per_query_ms = (time.perf_counter() - start) * 1000 / workflows
+
+    start = time.perf_counter()
+    removed = await queue.clear_expired()
+    expiry_ms = (time.perf_counter() - start) * 1000
+
+    print(f"query_by_workflow: {per_query_ms:.3f} ms/query, expiry: {expiry_ms:.1f} ms")
+    assert removed == 2_000
+    assert await queue.size() == 18_000
+    assert len(await queue.query_by_task("wf1", "task1")) > 0
+
+
+async def _soak(engine: WorkflowEngine, executions: int) -> list[int]:
+    """Run single-task executions, sampling traced memory every 10%."""
+    executor = _InstantExecutor()
+    samples = []
+    for i in range(executions):
+        dag = WorkflowDAG(workflow_id=f"soak{i % 16}")
+        dag.add_task(
+            WorkflowTask(
+                task_id="task",
+                executor=executor,
+                payload={},
+                idempotency_key=f"soak_{i}",
+            )
+        )
+        await engine.execute(dag)
+        # Yield so the loop purges cancelled wait_for timers, as it would
+        # between requests in a serving process.
+        await asyncio.sleep(0)
+        if (i + 1) % (executions // 10) == 0:
+            samples.append(tracemalloc.get_traced_memory()[0])
+    return samples
+
+
+async def _assert_flat_memory(executions: int) -> None:
+    engine = WorkflowEngine(
+        checkpoint_interval=1_000,
+        retention=RetentionPolicy(max_executions=500, max_summaries=1_000),
+    )
+    tracemalloc.start()
+    try:
+        samples = await _soak(engine, executions)
+    finally:
+        tracemalloc.stop()
+
+    # Once both bounds saturate (first sample), memory no longer grows.
+    assert max(samples[1:]) < samples[1] * 1.25
+    assert len(engine._executions) == 500
+    assert len(engine._summaries) == 1_000
+    assert sum(len(ids) for ids in engine._by_workflow.values()) == 1_500
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_retention_memory_is_flat():
+    """Benchmark traced memory across 10k executions under retention."""
+    await _assert_flat_memory(10_000)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get("HOLLY_SOAK"), reason="set HOLLY_SOAK=1 to run the 1M soak"
+)
+@pytest.mark.asyncio
+async def test_workflow_engine_retention_soak_1m():
+    """Soak 1M executions; retained state must stay bounded throughout."""
+    await _assert_flat_memory(1_000_000)
+
+
+class _StageExecutor:
+    """Pipeline stage emitting a fresh ``size``-byte result per call."""
+
+    def __init__(self, size: int):
+        self.size = size
+
+    async def execute(self, task_id: str, payload):
+        upstream = getattr(payload, "inputs", {}).get("previous")
+        tail = upstream[-1:] if upstream else "s"
+        return tail * self.size
+
+
+def _pipeline(stages: int, size: int, data_edges: bool) -> WorkflowDAG:
+    dag = WorkflowDAG(workflow_id=f"pipeline_{data_edges}")
+    executor = _StageExecutor(size)
+    for i in range(stages):
+        dag.add_task(
+            WorkflowTask(
+                task_id=f"stage{i}",
+                executor=executor,
+                payload={},
+                idempotency_key=f"stage_{i}",
+            )
+        )
+        if i > 0:
+            dag.add_edge(
+                WorkflowEdge(
+                    f"stage{i-1}",
+                    f"stage{i}",
+                    data_key="previous" if data_edges else None,
+                )
+            )
+    return dag
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_pipeline_peak_memory_benchmark():
+    """Benchmark peak memory of a 200-stage pipeline of 64 KiB results.
+
+    Without data edges every intermediate stays in ``execution.results``
+    until the saga ends; with them each result is released as soon as
+    the next stage succeeds, so peak memory is a couple of results.
+    """
+    stages, size = 200, 64 * 1024
+    peaks = {}
+    for data_edges in (False, True):
+        engine = WorkflowEngine(checkpoint_interval=stages)
+        dag = _pipeline(stages, size, data_edges)
+        tracemalloc.start()
+        try:
+            execution = await engine.execute(dag)
+            peaks[data_edges] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert f"stage{stages - 1}" in execution.results
+
+    assert peaks[False] > stages * size
+    assert peaks[True] < 10 * size
+    assert peaks[True] * 20 < peaks[False]
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_with_spilled_results(tmp_path):
+    """Test spilled results referenced by checkpoints survive a crash."""
+    blobs = LocalBlobStore(tmp_path / "blobs", fsync=True)
+    store = FileCheckpointStore(tmp_path / "checkpoints")
+    first = _pipeline(3, 4096, data_edges=True)
+    first.tasks["stage2"].executor = CrashingExecutor("stage2")
+
+    engine = WorkflowEngine(
+        checkpoint_store=store, blob_store=blobs, spill_threshold_bytes=1024
+    )
+    with pytest.raises(ProcessCrash):
+        await engine.execute(first)
+    (execution_id,) = [p.stem for p in (tmp_path / "checkpoints").iterdir()]
+
+    restarted = WorkflowEngine(
+        checkpoint_store=store, blob_store=blobs, spill_threshold_bytes=1024
+    )
+    execution = await restarted.resume(execution_id, _pipeline(3, 4096, True))
+
+    assert set(execution.results) == {"stage2"}
+    assert isinstance(execution.results["stage2"], SpilledResult)
+    assert await restarted.load_result(execution, "stage2") == "s" * 4096
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_keeps_blobs_of_unflushed_consumers(tmp_path):
+    """Test a spilled input outlives a consumer success not yet checkpointed."""
+    blobs = LocalBlobStore(tmp_path / "blobs", fsync=True)
+    store = FileCheckpointStore(tmp_path / "checkpoints")
+    options = dict(
+        checkpoint_store=store,
+        blob_store=blobs,
+        spill_threshold_bytes=1024,
+        checkpoint_interval=2,
+    )
+    first = _pipeline(4, 4096, data_edges=True)
+    # stage2 consumes stage1's blob, then the crash hits before the
+    # checkpoint recording stage2 is written.
+    first.tasks["stage3"].executor = CrashingExecutor("stage3")
+
+    with pytest.raises(ProcessCrash):
+        await WorkflowEngine(**options).execute(first)
+    (execution_id,) = [p.stem for p in (tmp_path / "checkpoints").iterdir()]
+
+    restarted = WorkflowEngine(**options)
+    execution = await restarted.resume(execution_id, _pipeline(4, 4096, True))
+
+    assert all(
+        state == WorkflowTaskState.SUCCEEDED for state in execution.state.values()
+    )
+    assert await restarted.load_result(execution, "stage3") == "s" * 4096
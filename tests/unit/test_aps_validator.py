@@ -7,6 +7,7 @@ Tests cover:
   - APSValidator_Bounds: ICD-011 bounds checking
   - APSValidator_Consistency: deterministic decomposition
   - APSValidator_Completeness: well-formed decomposition steps
+  - IncrementalAPSValidator: running report over keyed results
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ from holly.goals.aps_validator import (
     APSValidator,
     APSValidationReport,
     APSValidationViolation,
+    IncrementalAPSValidator,
 )
 from holly.goals.assembly_index import AssemblyIndexResult, AssemblyStep
 
@@ -470,3 +472,89 @@ class TestAPSValidator_Integration:
         assert validator.AI_BOUNDS["T1"] == (3, 9)
         assert validator.AI_BOUNDS["T2"] == (5, 19)
         assert validator.AI_BOUNDS["T3"] == (10, 999)
+
+
+def _result(pattern_id: str, ai: int) -> AssemblyIndexResult:
+    """Well-formed result with ai distinct steps."""
+    return AssemblyIndexResult(
+        pattern_id=pattern_id,
+        assembly_index=ai,
+        steps=[
+            AssemblyStep(step_id=f"s{i}", description=f"step {i}", output=f"o{i}")
+            for i in range(ai)
+        ],
+        complexity_class="simple" if ai < 5 else "moderate",
+    )
+
+
+class TestIncrementalAPSValidator:
+    """Test the running report kept by IncrementalAPSValidator."""
+
+    def test_valid_results(self) -> None:
+        """Test in-bounds, monotone, consistent results give a valid report."""
+        validator = IncrementalAPSValidator()
+        for i, (level, ai) in enumerate([("T0", 2), ("T1", 5), ("T2", 8), ("T3", 12)]):
+            assert validator.add(level, level, _result(f"g{i}", ai)) == []
+        assert validator.add_known("T1", "T1", 5, "g4") == []
+
+        report = validator.report()
+        assert report.is_valid
+        assert report.total_tasks_checked == 5
+        assert "T2" in validator
+        assert "T9" not in validator
+
+    def test_bounds_and_completeness_checked_once_per_key(self) -> None:
+        """Test a key's first result is checked in full and later ones are not."""
+        validator = IncrementalAPSValidator()
+        bad = _result("g0", 6)
+        bad.complexity_class = "trivial"
+
+        found = validator.add("k", "T0", bad)
+        assert {v.violation_type for v in found} == {"bound", "completeness"}
+        assert validator.add("k", "T0", bad) == []
+
+        report = validator.report()
+        assert not report.bounds_valid
+        assert len(report.violations) == len(found)
+
+    def test_consistency_violation_reported_once_per_key(self) -> None:
+        """Test a differing AI for a known key is reported the first time only."""
+        validator = IncrementalAPSValidator()
+        validator.add("k", "T1", _result("g0", 5))
+
+        found = validator.add_known("k", "T1", 6, "g1")
+        assert len(found) == 1
+        assert found[0].violation_type == "consistency"
+        assert found[0].actual == "AI=6 for g1"
+        assert validator.add("k", "T1", _result("g2", 7)) == []
+
+        report = validator.report()
+        assert not report.consistency_valid
+        assert report.total_tasks_checked == 3
+
+    def test_monotonicity_uses_level_extremes(self) -> None:
+        """Test the largest body AI of a level is compared with the next level's smallest."""
+        validator = IncrementalAPSValidator()
+        validator.add("a", "T0", _result("g0", 1))
+        validator.add("b", "T0", _result("g1", 4))
+        validator.add("c", "T1", _result("g2", 3))
+        validator.add("d", "T1", _result("g3", 9))
+
+        report = validator.report()
+        expected = APSValidator().validate_monotonicity({"T0": 4, "T1": 3})
+        assert not report.monotonicity_valid
+        assert report.violations[: len(expected)] == expected
+
+    def test_monotonicity_leaves_out_dependency_steps(self) -> None:
+        """Test dependency steps do not count towards a level's body AI."""
+        validator = IncrementalAPSValidator()
+        validator.add("a", "T0", _result("g0", 4), dependencies=3)
+        validator.add("b", "T1", _result("g1", 3))
+        validator.add_known("a", "T0", 4, "g2")
+
+        assert validator.report().monotonicity_valid
+
+    def test_add_known_requires_known_key(self) -> None:
+        """Test add_known() rejects keys never added."""
+        with pytest.raises(KeyError):
+            IncrementalAPSValidator().add_known("k", "T0", 1, "g0")
@@ -0,0 +1,257 @@
+"""Unit tests for memoized goal decomposition and the assembly-index engine.
+
+Tests cover:
+  - context_key(): canonical hash of the decomposition context slice
+  - MemoizedGoalDecomposer: equality with GoalDecomposer, cache behaviour
+  - AssemblyDAG: shared sub-assemblies and joint assembly index
+  - AssemblyIndexEngine: incremental report against batch validation
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from holly.goals.aps_validator import APSValidator
+from holly.goals.assembly_engine import (
+    AssemblyDAG,
+    AssemblyIndexEngine,
+    MemoizedGoalDecomposer,
+    context_key,
+)
+from holly.goals.assembly_index import AssemblyStep, GoalDecomposer
+
+
+def _contexts() -> list[dict]:
+    """Contexts spanning every level, the caps, negatives and dependencies."""
+    return [
+        {
+            "task_level": level,
+            "num_agents": agents,
+            "codimension": codim,
+            "dependencies": deps,
+        }
+        for level, agents, codim, deps in itertools.product(
+            ["T0", "T1", "T2", "T3"],
+            [-1, 0, 1, 3, 4, 5, 6, 9],
+            [-2, 0, 1, 3, 5],
+            [[], ["a"], ["a", "b"], ["b", "a", "a"]],
+        )
+    ]
+
+
+def _step(step_id: str) -> AssemblyStep:
+    return AssemblyStep(step_id=step_id, description=step_id, output=step_id)
+
+
+class TestContextKey:
+    """Tests for context_key()."""
+
+    def test_ignores_fields_decomposition_does_not_read(self) -> None:
+        """Fields outside the slice, and counts past a level's cap, share a key."""
+        base = {"task_level": "T2", "num_agents": 4, "codimension": 1}
+        assert context_key(base) == context_key({**base, "priority": 7, "codimension": 9})
+        assert context_key(base) == context_key({**base, "num_agents": 12})
+        assert context_key(base) == context_key({**base, "dependencies": []})
+
+    def test_distinguishes_fields_decomposition_reads(self) -> None:
+        """Level, capped count and dependency order all change the key."""
+        base = {"task_level": "T1", "num_agents": 1, "codimension": 2}
+        keys = {
+            context_key(base),
+            context_key({**base, "codimension": 3}),
+            context_key({**base, "task_level": "T2"}),
+            context_key({**base, "dependencies": ["a", "b"]}),
+            context_key({**base, "dependencies": ["b", "a"]}),
+        }
+        assert len(keys) == 5
+
+    def test_missing_keys_raise(self) -> None:
+        """Missing required keys raise ValueError like GoalDecomposer."""
+        with pytest.raises(ValueError, match="Missing required context keys"):
+            context_key({"task_level": "T0"})
+
+
+class TestMemoizedGoalDecomposer:
+    """Tests for MemoizedGoalDecomposer."""
+
+    def test_matches_goal_decomposer(self) -> None:
+        """Steps and results equal GoalDecomposer's for every context."""
+        plain = GoalDecomposer()
+        memo = MemoizedGoalDecomposer()
+        for i, context in enumerate(_contexts() * 2):
+            goal_id = f"goal-{i % 7}"
+            assert memo.decompose(goal_id, context) == plain.decompose(goal_id, context)
+            assert memo.compute_goal_assembly_index(
+                goal_id, context
+            ) == plain.compute_goal_assembly_index(goal_id, context)
+
+    def test_matches_goal_decomposer_without_caches(self) -> None:
+        """Disabling both LRUs still gives GoalDecomposer's steps."""
+        plain = GoalDecomposer()
+        memo = MemoizedGoalDecomposer(max_templates=0, max_goals=0)
+        for context in _contexts()[::7]:
+            assert memo.decompose("g", context) == plain.decompose("g", context)
+        assert memo.cache_stats()["templates"] == 0
+
+    def test_errors_match_goal_decomposer(self) -> None:
+        """Missing keys and unknown levels raise the same errors."""
+        memo = MemoizedGoalDecomposer()
+        with pytest.raises(ValueError, match="Missing required context keys"):
+            memo.decompose("g", {"task_level": "T0", "num_agents": 1})
+        with pytest.raises(ValueError, match="Unknown task_level: T7"):
+            memo.decompose("g", {"task_level": "T7", "num_agents": 1, "codimension": 1})
+
+    def test_templates_shared_across_goals(self) -> None:
+        """Goals with equal context slices reuse one template."""
+        memo = MemoizedGoalDecomposer()
+        for i in range(10):
+            memo.decompose(f"goal-{i}", {"task_level": "T3", "num_agents": 6 + i, "codimension": i})
+        stats = memo.cache_stats()
+        assert (stats["hits"], stats["misses"], stats["templates"]) == (9, 1, 1)
+
+    def test_returned_steps_are_copies(self) -> None:
+        """Mutating a returned list does not affect later results."""
+        memo = MemoizedGoalDecomposer()
+        context = {"task_level": "T1", "num_agents": 1, "codimension": 2}
+        memo.decompose("g", context).clear()
+        assert len(memo.decompose("g", context)) == 4
+
+    def test_lru_bounds(self) -> None:
+        """Template and goal caches evict beyond their limits."""
+        memo = MemoizedGoalDecomposer(max_templates=2, max_goals=3)
+        for i in range(5):
+            memo.decompose(f"goal-{i}", {"task_level": "T1", "num_agents": 1, "codimension": i})
+        stats = memo.cache_stats()
+        assert (stats["templates"], stats["goals"]) == (2, 3)
+
+    def test_negative_limits_rejected(self) -> None:
+        """Negative cache limits raise ValueError."""
+        with pytest.raises(ValueError):
+            MemoizedGoalDecomposer(max_templates=-1)
+        with pytest.raises(ValueError):
+            MemoizedGoalDecomposer(max_goals=-1)
+
+
+class TestAssemblyDAG:
+    """Tests for AssemblyDAG."""
+
+    def test_shared_sub_assemblies_counted_once(self) -> None:
+        """A sub-assembly used by several goals is stored once."""
+        dag = AssemblyDAG()
+        dep = ("dep", (_step("d"),))
+        dag.add_goal("g1", [dep, ("body1", (_step("x"), _step("y")))])
+        dag.add_goal("g2", [dep, ("body2", (_step("z"),))])
+
+        assert dag.goal_count == 2
+        assert dag.sub_assembly_count == 3
+        assert dag.uses("dep") == 2
+        assert dag.joint_assembly_index == 4
+        assert dag.sub_assemblies("g2") == ("dep", "body2")
+
+    def test_remove_and_replace(self) -> None:
+        """Removing the last user drops a sub-assembly; re-adding replaces."""
+        dag = AssemblyDAG()
+        dag.add_goal("g1", [("a", (_step("a"),)), ("b", (_step("b"),))])
+        dag.add_goal("g2", [("a", (_step("a"),))])
+        dag.add_goal("g1", [("c", (_step("c"),))])
+
+        assert dag.uses("a") == 1
+        assert dag.uses("b") == 0
+        assert dag.joint_assembly_index == 2
+
+        dag.remove_goal("g2")
+        dag.remove_goal("g1")
+        assert (dag.goal_count, dag.sub_assembly_count, dag.joint_assembly_index) == (0, 0, 0)
+        with pytest.raises(KeyError):
+            dag.remove_goal("g1")
+
+
+class TestAssemblyIndexEngine:
+    """Tests for AssemblyIndexEngine."""
+
+    def test_results_match_goal_decomposer(self) -> None:
+        """AIs and on-demand results equal GoalDecomposer's."""
+        plain = GoalDecomposer()
+        engine = AssemblyIndexEngine()
+        for i, context in enumerate(_contexts()):
+            expected = plain.compute_goal_assembly_index(f"goal-{i}", context)
+            assert engine.add_goal(f"goal-{i}", context) == expected.assembly_index
+            assert engine.result(f"goal-{i}") == expected
+
+    def test_report_matches_batch_validation(self) -> None:
+        """The running report finds the same problems as checking each goal."""
+        rng = random.Random(0)
+        plain = GoalDecomposer()
+        checker = APSValidator()
+        engine = AssemblyIndexEngine()
+        contexts = rng.sample(_contexts(), 200)
+
+        bound_levels: set[str] = set()
+        body_ranges: dict[str, list[int]] = {}
+        for i, context in enumerate(contexts):
+            engine.add_goal(f"goal-{i}", context)
+            result = plain.compute_goal_assembly_index(f"goal-{i}", context)
+            level = context["task_level"]
+            bound_levels.update(
+                v.task_level for v in checker.validate_bounds({level: result.assembly_index})
+            )
+            assert checker.validate_completeness(result) == []
+            body_ai = result.assembly_index - len(context["dependencies"])
+            body_ranges.setdefault(level, []).append(body_ai)
+
+        report = engine.report()
+        assert report.total_tasks_checked == len(contexts)
+        assert report.consistency_valid
+        assert {v.task_level for v in report.violations if v.violation_type == "bound"} == (
+            bound_levels
+        )
+        monotone = all(
+            max(body_ranges[lower]) <= min(body_ranges[upper])
+            for lower, upper in [("T0", "T1"), ("T1", "T2"), ("T2", "T3")]
+        )
+        assert report.monotonicity_valid == monotone
+
+    def test_monotonicity_ignores_dependency_steps(self) -> None:
+        """A T0 goal with dependencies does not outrank a dependency-free T1 goal."""
+        engine = AssemblyIndexEngine()
+        t0 = {"task_level": "T0", "num_agents": 1, "codimension": 1}
+        t1 = {"task_level": "T1", "num_agents": 1, "codimension": 1}
+        assert engine.add_goal("t0", {**t0, "dependencies": ["a", "b", "c"]}) == 4
+        assert engine.add_goal("t1", t1) == 3
+        assert engine.add_goal("t0-again", {**t0, "dependencies": ["d", "e", "f"]}) == 4
+
+        report = engine.report()
+        assert report.monotonicity_valid
+        assert report.is_valid
+
+    def test_shared_dependencies_deduplicated(self) -> None:
+        """Goals sharing dependencies and shape share sub-assemblies."""
+        engine = AssemblyIndexEngine()
+        for i in range(50):
+            engine.add_goal(
+                f"goal-{i}",
+                {
+                    "task_level": "T2",
+                    "num_agents": 4,
+                    "codimension": 1,
+                    "dependencies": ["setup", f"shard-{i % 5}"],
+                },
+            )
+        # 6 dependencies and one body of 4 contract + 3 fixed steps.
+        assert engine.dag.sub_assembly_count == 7
+        assert engine.dag.joint_assembly_index == 6 + 7
+        assert engine.report().total_tasks_checked == 50
+        assert engine.decomposer.cache_stats()["misses"] == 5
+
+    def test_errors_propagate(self) -> None:
+        """Invalid contexts raise without recording the goal."""
+        engine = AssemblyIndexEngine()
+        with pytest.raises(ValueError):
+            engine.add_goal("g", {"task_level": "T5", "num_agents": 1, "codimension": 1})
+        assert engine.dag.goal_count == 0
+        assert engine.report().total_tasks_checked == 0
+        with pytest.raises(KeyError):
+            engine.result("g")
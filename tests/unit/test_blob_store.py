@@ -0,0 +1,44 @@
+"""Unit tests for workflow blob stores."""
+
+import pytest
+
+from holly.engine.blob_store import InMemoryBlobStore, LocalBlobStore
+from holly.engine.workflow_engine import BlobStore
+
+
+@pytest.mark.asyncio
+async def test_in_memory_blob_store_round_trip():
+    """Test put/get/delete on the in-memory store."""
+    store = InMemoryBlobStore()
+    assert isinstance(store, BlobStore)
+    await store.put("k", b"data")
+    assert await store.get("k") == b"data"
+    await store.delete("k")
+    await store.delete("k")
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        await store.get("k")
+
+
+@pytest.mark.asyncio
+async def test_local_blob_store_round_trip(tmp_path):
+    """Test blobs persist across store instances and deletes are idempotent."""
+    store = LocalBlobStore(tmp_path, fsync=True)
+    assert isinstance(store, BlobStore)
+    await store.put("exec-1", b"payload")
+    await store.put("exec-1", b"replaced")
+
+    assert await LocalBlobStore(tmp_path).get("exec-1") == b"replaced"
+    await store.delete("exec-1")
+    await store.delete("exec-1")
+    with pytest.raises(KeyError):
+        await store.get("exec-1")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_local_blob_store_rejects_path_traversal(tmp_path):
+    """Test blob keys cannot escape the store directory."""
+    store = LocalBlobStore(tmp_path)
+    for key in ("", "../x", ".hidden", "a/b"):
+        with pytest.raises(ValueError):
+            store._path(key)
@@ -0,0 +1,182 @@
+"""Unit tests for workflow checkpoint stores."""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from holly.engine.checkpoint_store import (
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    RepoCheckpointStore,
+    checkpoint_from_dict,
+    checkpoint_to_dict,
+)
+from holly.engine.workflow_engine import (
+    CheckpointStore,
+    ExecutionCheckpoint,
+    SagaPhase,
+    SpilledResult,
+    WorkflowTaskState,
+)
+
+# ---------------------------------------------------------------------------
+# Test Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _checkpoint(sequence: int, execution_id: str = "exec1") -> ExecutionCheckpoint:
+    task_id = f"task{sequence}"
+    return ExecutionCheckpoint(
+        workflow_id="workflow1",
+        checkpoint_id=str(uuid.uuid4()),
+        timestamp=datetime.now(timezone.utc),
+        completed_tasks={task_id},
+        results={task_id: {"value": sequence}},
+        phase=SagaPhase.FORWARD,
+        execution_id=execution_id,
+        sequence=sequence,
+        task_states={task_id: WorkflowTaskState.SUCCEEDED},
+    )
+
+
+class FakeCheckpointsRepo:
+    """In-memory stand-in for CheckpointsRepo keyed on (workflow_id, node_id)."""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def upsert(self, row):
+        self.rows[(row.workflow_id, row.node_id)] = {
+            "workflow_id": row.workflow_id,
+            "node_id": row.node_id,
+            "output_state": json.dumps(row.output_state),
+            "parent_node_ids": row.parent_node_ids,
+            "tenant_id": row.tenant_id,
+        }
+
+    async def list_workflow(self, workflow_id):
+        return [r for (wid, _), r in self.rows.items() if wid == workflow_id]
+
+
+# ---------------------------------------------------------------------------
+# Serialisation Tests
+# ---------------------------------------------------------------------------
+
+
+def test_checkpoint_dict_round_trip():
+    """Test checkpoint survives dict/JSON round trip."""
+    checkpoint = _checkpoint(3)
+    restored = checkpoint_from_dict(json.loads(json.dumps(checkpoint_to_dict(checkpoint))))
+    assert restored == checkpoint
+
+
+def test_checkpoint_dict_round_trip_keeps_spilled_references():
+    """Test SpilledResult placeholders survive serialisation as references."""
+    checkpoint = _checkpoint(1)
+    checkpoint.results["task1"] = SpilledResult(key="exec1-abc", size_bytes=4096)
+    restored = checkpoint_from_dict(json.loads(json.dumps(checkpoint_to_dict(checkpoint))))
+    assert restored.results["task1"] == SpilledResult(key="exec1-abc", size_bytes=4096)
+
+
+def test_checkpoint_to_dict_rejects_unserialisable_results():
+    """Test non-JSON results fail loudly instead of being coerced."""
+    checkpoint = _checkpoint(0)
+    checkpoint.results["task0"] = object()
+    with pytest.raises(TypeError):
+        json.dumps(checkpoint_to_dict(checkpoint))
+
+
+# ---------------------------------------------------------------------------
+# Store Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_orders_by_sequence():
+    """Test in-memory store returns chain sorted by sequence."""
+    store = InMemoryCheckpointStore()
+    assert isinstance(store, CheckpointStore)
+    for seq in (2, 0, 1):
+        await store.save(_checkpoint(seq))
+
+    chain = await store.load("exec1")
+    assert [c.sequence for c in chain] == [0, 1, 2]
+    assert await store.load("missing") == []
+
+
+@pytest.mark.asyncio
+async def test_file_store_round_trip(tmp_path):
+    """Test file store persists chain across store instances."""
+    store = FileCheckpointStore(tmp_path)
+    assert isinstance(store, CheckpointStore)
+    for seq in range(3):
+        await store.save(_checkpoint(seq))
+
+    chain = await FileCheckpointStore(tmp_path).load("exec1")
+    assert [c.sequence for c in chain] == [0, 1, 2]
+    assert chain[2].results == {"task2": {"value": 2}}
+
+
+@pytest.mark.asyncio
+async def test_file_store_ignores_torn_final_line(tmp_path):
+    """Test a partially written trailing line is dropped on load."""
+    store = FileCheckpointStore(tmp_path, fsync=False)
+    await store.save(_checkpoint(0))
+    with (tmp_path / "exec1.jsonl").open("a") as fh:
+        fh.write('{"workflow_id": "workf')
+
+    chain = await store.load("exec1")
+    assert [c.sequence for c in chain] == [0]
+
+
+def test_file_store_rejects_path_traversal(tmp_path):
+    """Test execution IDs cannot escape the store directory."""
+    store = FileCheckpointStore(tmp_path)
+    with pytest.raises(ValueError):
+        store._path("../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_repo_store_round_trip():
+    """Test repo store maps checkpoints onto workflow_checkpoints rows."""
+    repo = FakeCheckpointsRepo()
+    tenant_id = uuid.uuid4()
+    execution_id = str(uuid.uuid4())
+    store = RepoCheckpointStore(repo, tenant_id)
+    assert isinstance(store, CheckpointStore)
+
+    for seq in range(3):
+        await store.save(_checkpoint(seq, execution_id))
+
+    assert len(repo.rows) == 3
+    assert all(r["workflow_id"] == uuid.UUID(execution_id) for r in repo.rows.values())
+    chain = await store.load(execution_id)
+    assert [c.sequence for c in chain] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_repo_store_upsert_is_idempotent():
+    """Test re-saving a checkpoint overwrites the same row."""
+    repo = FakeCheckpointsRepo()
+    store = RepoCheckpointStore(repo, uuid.uuid4())
+    checkpoint = _checkpoint(0, "not-a-uuid")
+    await store.save(checkpoint)
+    await store.save(checkpoint)
+
+    assert len(repo.rows) == 1
+    assert len(await store.load("not-a-uuid")) == 1
+
+
+@pytest.mark.asyncio
+async def test_repo_store_links_parent_rows():
+    """Test each row references its predecessor in the chain."""
+    repo = FakeCheckpointsRepo()
+    store = RepoCheckpointStore(repo, uuid.uuid4())
+    await store.save(_checkpoint(0))
+    await store.save(_checkpoint(1))
+
+    rows = sorted(repo.rows.values(), key=lambda r: len(r["parent_node_ids"]))
+    assert rows[0]["parent_node_ids"] == []
+    assert rows[1]["parent_node_ids"] == [rows[0]["node_id"]]
@@ -7,10 +7,14 @@ Tests cover:
 - ContractVerifier.verify_post_steer: contract preservation, obligation fulfillment
 - ContractVerifier.verify_steer_operation: full pipeline
 - Helper methods: _check_topology_validity, _check_communication_patterns, etc.
+- IncrementalContractVerifier: differential checks against full verification
 """
 
 from __future__ import annotations
 
+import random
+from collections import Counter
+
 import pytest
 
 from holly.agents.contract_verifier import (
@@ -18,8 +22,18 @@ from holly.agents.contract_verifier import (
     ContractViolationType,
     ContractVerificationResult,
     ContractVerifier,
+    IncrementalContractVerifier,
     verify_steer_contracts,
 )
+from holly.agents.topology_manager import (
+    AgentCapability,
+    AgentContract,
+    AgentPermissions,
+    SpawnSpec,
+    SteerSpec,
+    TeamTopology,
+    TopologyManager,
+)
 
 
 # ──────────────────────────────────────────────────────────
@@ -601,6 +615,178 @@ class TestCheckCapabilityCoverage:
         assert not any(v.severity == "critical" for v in violations)
 
 
+# ──────────────────────────────────────────────────────────
+# § Test IncrementalContractVerifier
+# ──────────────────────────────────────────────────────────
+
+
+def _permissions(agent_id: str, level: AgentCapability) -> AgentPermissions:
+    return AgentPermissions(
+        agent_id=agent_id,
+        can_spawn=False,
+        can_steer=False,
+        can_dissolve=False,
+        capability_level=level,
+        max_concurrent_tasks=5,
+        allowed_domains=frozenset(),
+    )
+
+
+def _agent_contract(
+    agent_id: str, peer: str | None, domain: frozenset[str] = frozenset()
+) -> AgentContract:
+    return AgentContract(
+        agent_id=agent_id,
+        peer_agent_id=peer,
+        expected_message_rate=1.0,
+        responsibility_domain=domain,
+        max_response_time_sec=5.0,
+        escalation_threshold=3,
+    )
+
+
+def _assert_same(full: ContractVerificationResult, incremental: ContractVerificationResult) -> None:
+    assert incremental.violations == full.violations
+    assert incremental.pre_topology_valid == full.pre_topology_valid
+    assert incremental.post_topology_valid == full.post_topology_valid
+    assert incremental.contracts_preserved == full.contracts_preserved
+
+
+class TestIncrementalContractVerifier:
+    """Test incremental verification against full verification."""
+
+    def _team(self, n: int) -> tuple[TopologyManager, TeamTopology, list[AgentContract]]:
+        """Spawn a ring team and the contracts it must preserve."""
+        ids = [f"agent-{i:02d}" for i in range(n)]
+        levels = list(AgentCapability)
+        configs = [
+            (
+                agent_id,
+                _permissions(agent_id, levels[i % len(levels)]),
+                frozenset([_agent_contract(agent_id, ids[(i + 1) % n])]),
+            )
+            for i, agent_id in enumerate(ids)
+        ]
+        manager = TopologyManager()
+        topology = manager.spawn(
+            SpawnSpec(
+                parent_agent_id=None,
+                agent_configs=configs,
+                initial_goals=frozenset(f"goal-{i}" for i in range(n)),
+            )
+        )
+        contracts = [c for _, _, agent_contracts in configs for c in agent_contracts]
+        contracts += [
+            _agent_contract(ids[0], None, frozenset(["goal-0"])),
+            _agent_contract(ids[1], "ghost"),
+            _agent_contract("ghost", ids[2], frozenset(["goal-1"])),
+        ]
+        return manager, topology, contracts
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_full_verification_over_random_steers(self, seed: int) -> None:
+        """Test every result of a steer chain equals a full verification."""
+        rng = random.Random(seed)
+        manager, topology, contracts = self._team(20)
+        full = ContractVerifier()
+        incremental = IncrementalContractVerifier()
+
+        for _ in range(30):
+            ids = sorted(topology.agents)
+            action = rng.random()
+            preserve = None
+            reassignments: dict[str, set[str]] = {}
+            new_contracts: frozenset[AgentContract] = frozenset()
+            if action < 0.3 and len(ids) > 3:
+                preserve = frozenset(ids) - {rng.choice(ids)}
+            elif action < 0.6:
+                reassignments = {
+                    f"goal-{rng.randrange(20)}": set(rng.sample(ids, rng.randint(0, 2)))
+                }
+            else:
+                new_contracts = frozenset(
+                    _agent_contract(rng.choice(ids), rng.choice([*ids, "ghost"]))
+                    for _ in range(2)
+                )
+            steered = manager.steer(
+                SteerSpec(
+                    topology_id=topology.topology_id,
+                    agent_reassignments=reassignments,
+                    new_contracts=new_contracts,
+                    preserve_agents=preserve,
+                )
+            )
+            _assert_same(
+                full.verify_steer_operation(topology, steered, contracts),
+                incremental.verify_steer_operation(topology, steered, contracts),
+            )
+            topology = steered
+
+    def test_detects_removed_peer_and_orphaned_goal(self) -> None:
+        """Test violations appear and disappear as agents leave and goals move."""
+        manager, topology, contracts = self._team(4)
+        verifier = IncrementalContractVerifier()
+        assert verifier.verify_steer_operation(topology, topology, contracts).violations == (
+            ContractVerifier().verify_steer_operation(topology, topology, contracts).violations
+        )
+
+        steered = manager.steer(
+            SteerSpec(
+                topology_id=topology.topology_id,
+                agent_reassignments={"goal-0": set()},
+                preserve_agents=frozenset(["agent-00", "agent-01", "agent-02"]),
+            )
+        )
+        result = verifier.verify_steer_operation(topology, steered, contracts)
+        assert any("peer agent-03 removed" in v.description for v in result.violations)
+        _assert_same(ContractVerifier().verify_steer_operation(topology, steered, contracts), result)
+
+    def test_handles_topologies_without_agents(self) -> None:
+        """Test empty and attribute-less topologies match full verification."""
+        _, topology, contracts = self._team(3)
+        empty = TeamTopology(topology_id="empty")
+        chained = IncrementalContractVerifier()
+        for old, new in [(None, topology), (topology, empty), (empty, topology), (topology, None)]:
+            full = ContractVerifier().verify_steer_operation(old, new, contracts)
+            _assert_same(full, chained.verify_steer_operation(old, new, contracts))
+            _assert_same(
+                full, IncrementalContractVerifier().verify_steer_operation(old, new, contracts)
+            )
+
+    def test_capability_coverage_counters(self) -> None:
+        """Test per-capability counters follow added and removed agents."""
+        manager, topology, contracts = self._team(4)
+        verifier = IncrementalContractVerifier()
+        verifier.verify_steer_operation(topology, topology, contracts)
+        assert verifier.capability_coverage == dict(
+            Counter(a.permissions.capability_level for a in topology.agents.values())
+        )
+        assert len(verifier.capability_coverage) > 1
+
+        steered = manager.steer(
+            SteerSpec(
+                topology_id=topology.topology_id,
+                agent_reassignments={},
+                preserve_agents=frozenset(["agent-01", "agent-02", "agent-03"]),
+            )
+        )
+        verifier.verify_steer_operation(topology, steered, contracts)
+        assert verifier.capability_coverage == dict(
+            Counter(a.permissions.capability_level for a in steered.agents.values())
+        )
+
+    def test_new_contract_list_reindexes(self) -> None:
+        """Test a different contract list is verified in full."""
+        _, topology, contracts = self._team(3)
+        verifier = IncrementalContractVerifier()
+        verifier.verify_steer_operation(topology, topology, contracts)
+        extra = [*contracts, _agent_contract("agent-00", "missing")]
+        _assert_same(
+            ContractVerifier().verify_steer_operation(topology, topology, extra),
+            verifier.verify_steer_operation(topology, topology, extra),
+        )
+
+
 # ──────────────────────────────────────────────────────────
 # § Test Main Entry Point
 # ──────────────────────────────────────────────────────────
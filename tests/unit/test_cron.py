@@ -0,0 +1,69 @@
+"""Unit tests for cron expression parsing and next-fire computation."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from holly.engine.cron import CronExpression
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("* * * * *", _utc(2026, 1, 1, 0, 0, 30), _utc(2026, 1, 1, 0, 1)),
+        ("*/15 * * * *", _utc(2026, 1, 1, 0, 46), _utc(2026, 1, 1, 1, 0)),
+        ("0 9-17/4 * * *", _utc(2026, 1, 1, 13, 0), _utc(2026, 1, 1, 17, 0)),
+        ("30 2 * * mon", _utc(2026, 1, 1), _utc(2026, 1, 5, 2, 30)),
+        ("0 0 1 jan,jul *", _utc(2026, 1, 1), _utc(2026, 7, 1)),
+        ("0 0 31 * *", _utc(2026, 1, 31), _utc(2026, 3, 31)),
+        ("0 0 29 2 *", _utc(2096, 3, 1), _utc(2104, 2, 29)),
+        ("@hourly", _utc(2026, 12, 31, 23, 30), _utc(2027, 1, 1, 0, 0)),
+        ("0 0 * * 7", _utc(2026, 1, 1), _utc(2026, 1, 4)),
+    ],
+)
+def test_next_after(expression: str, after: datetime, expected: datetime) -> None:
+    """Test next-fire computation across field, month and year rollovers."""
+    assert CronExpression(expression).next_after(after) == expected
+
+
+def test_day_fields_or_when_both_restricted() -> None:
+    """Test Vixie semantics: restricted day-of-month OR day-of-week."""
+    expression = CronExpression("0 0 15 * fri")
+    # 2026-01-02 is a Friday, before the 15th.
+    assert expression.next_after(_utc(2026, 1, 1)) == _utc(2026, 1, 2)
+    assert expression.next_after(_utc(2026, 1, 14)) == _utc(2026, 1, 15)
+
+
+def test_matches_brute_force_minute_scan() -> None:
+    """Test next_after agrees with a minute-by-minute scan."""
+    expression = CronExpression("5,35 */3 1-10 * 1-5")
+    t = _utc(2026, 3, 1)
+    for _ in range(50):
+        fire = expression.next_after(t)
+        probe = t.replace(second=0)
+        while True:
+            probe = datetime.fromtimestamp(probe.timestamp() + 60, tz=timezone.utc)
+            day_ok = probe.day <= 10 or (probe.weekday() < 5)
+            if (
+                probe.minute in (5, 35)
+                and probe.hour % 3 == 0
+                and day_ok
+            ):
+                break
+        assert fire == probe
+        t = fire
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "* * * 13 *", "*/0 * * * *", "5-1 * * * *",
+     "x * * * *", "0 0 30 2 *"],
+)
+def test_rejects_invalid_expressions(expression: str) -> None:
+    """Test malformed or unsatisfiable expressions raise ValueError."""
+    with pytest.raises(ValueError):
+        CronExpression(expression)
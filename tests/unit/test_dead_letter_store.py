@@ -0,0 +1,207 @@
+"""Unit tests for durable dead-letter queue backends."""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from holly.engine.dead_letter_store import (
+    FileDeadLetterBackend,
+    StreamDeadLetterBackend,
+    event_from_dict,
+    event_to_dict,
+)
+from holly.engine.workflow_engine import (
+    DeadLetterBackend,
+    DeadLetterEvent,
+    DeadLetterQueue,
+    TaskExecutionError,
+    WorkflowDAG,
+    WorkflowEdge,
+    WorkflowEngine,
+    WorkflowTask,
+)
+from holly.storage.redis.client import StreamClient
+
+# ---------------------------------------------------------------------------
+# Test Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _event(event_id: str, task_id: str = "task1") -> DeadLetterEvent:
+    return DeadLetterEvent(
+        event_id=event_id,
+        workflow_id="workflow1",
+        task_id=task_id,
+        timestamp=datetime.now(timezone.utc),
+        error_message="boom",
+        payload={"n": 1},
+        execution_context={"phase": "forward"},
+    )
+
+
+class FakeStreamRedis:
+    """Minimal in-process XADD/XRANGE stand-in."""
+
+    def __init__(self):
+        self.streams = {}
+        self.seq = 0
+
+    async def xadd(self, name, fields, maxlen=None):
+        entries = self.streams.setdefault(name, [])
+        self.seq += 1
+        entry_id = f"{self.seq}-0"
+        entries.append(
+            (entry_id, {k: v.encode() if isinstance(v, str) else v for k, v in fields.items()})
+        )
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return entry_id
+
+    async def xrange(self, name, min_id="-", max_id="+", count=None):
+        return list(self.streams.get(name, []))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_event_dict_round_trip():
+    """Test dead-letter events survive dict/JSON round trip."""
+    event = _event("e1")
+    assert event_from_dict(json.loads(json.dumps(event_to_dict(event)))) == event
+
+
+@pytest.mark.asyncio
+async def test_file_backend_replays_puts_and_deletes(tmp_path):
+    """Test file backend load reflects tombstones."""
+    backend = FileDeadLetterBackend(tmp_path / "dlq.jsonl", fsync=False)
+    assert isinstance(backend, DeadLetterBackend)
+    for i in range(3):
+        await backend.put(_event(f"e{i}"))
+    await backend.remove(["e1"])
+
+    reopened = FileDeadLetterBackend(tmp_path / "dlq.jsonl")
+    assert [e.event_id for e in await reopened.load()] == ["e0", "e2"]
+
+
+@pytest.mark.asyncio
+async def test_file_backend_compacts_tombstones(tmp_path):
+    """Test segment is rewritten once dead records dominate."""
+    path = tmp_path / "dlq.jsonl"
+    backend = FileDeadLetterBackend(path, fsync=False, compact_threshold=4)
+    for i in range(6):
+        await backend.put(_event(f"e{i}"))
+    for i in range(5):
+        await backend.remove([f"e{i}"])
+
+    lines = path.read_text().splitlines()
+    assert len(lines) < 6
+    assert [e.event_id for e in await backend.load()] == ["e5"]
+
+
+@pytest.mark.asyncio
+async def test_file_backend_restores_queue(tmp_path):
+    """Test a queue rebuilt from the file backend has working indexes."""
+    path = tmp_path / "dlq.jsonl"
+    queue = DeadLetterQueue(backend=FileDeadLetterBackend(path, fsync=False))
+    await queue.enqueue(_event("e1", task_id="a"))
+    await queue.enqueue(_event("e2", task_id="b"))
+    await queue.dequeue("e1")
+
+    restarted = DeadLetterQueue(backend=FileDeadLetterBackend(path, fsync=False))
+    assert await restarted.restore() == 1
+    assert [e.event_id for e in await restarted.query_by_task("workflow1", "b")] == ["e2"]
+
+
+@pytest.mark.asyncio
+async def test_file_backend_references_unencodable_forward_results(tmp_path):
+    """Test a non-JSON forward result is dead-lettered by reference."""
+    received = []
+
+    class Forward:
+        async def execute(self, task_id, payload):
+            return {1, 2}
+
+    class Fail:
+        async def execute(self, task_id, payload):
+            raise RuntimeError("boom")
+
+    class Compensator:
+        fail = True
+
+        async def compensate(self, task_id, forward_result):
+            if self.fail:
+                raise RuntimeError("undo failed")
+            received.append(forward_result)
+
+    compensator = Compensator()
+    dag = WorkflowDAG(workflow_id="workflow1")
+    dag.add_task(
+        WorkflowTask(
+            task_id="a",
+            executor=Forward(),
+            payload={},
+            idempotency_key="a",
+            compensation_executor=compensator,
+        )
+    )
+    dag.add_task(WorkflowTask(task_id="b", executor=Fail(), payload={}, idempotency_key="b"))
+    dag.add_edge(WorkflowEdge("a", "b"))
+    path = tmp_path / "dlq.jsonl"
+    queue = DeadLetterQueue(backend=FileDeadLetterBackend(path, fsync=False))
+    engine = WorkflowEngine(dead_letter_queue=queue)
+
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+
+    (event,) = [e for e in await FileDeadLetterBackend(path).load() if e.task_id == "a"]
+    assert "forward_result" not in event.execution_context
+    compensator.fail = False
+    report = await engine.redrive_dead_letters(dag, task_id="a")
+    assert report.succeeded == [event.event_id]
+    assert received == [{1, 2}]
+
+
+@pytest.mark.asyncio
+async def test_stream_backend_round_trip():
+    """Test stream backend replays XADD records through StreamClient."""
+    backend = StreamDeadLetterBackend(StreamClient(FakeStreamRedis()), uuid.uuid4())
+    assert isinstance(backend, DeadLetterBackend)
+    await backend.put(_event("e1"))
+    await backend.put(_event("e2"))
+    await backend.remove(["e1"])
+
+    assert [e.event_id for e in await backend.load()] == ["e2"]
+
+
+@pytest.mark.asyncio
+async def test_stream_backend_is_tenant_scoped():
+    """Test two tenants sharing a Redis never see each other's events."""
+    redis = FakeStreamRedis()
+    tenant_a = StreamDeadLetterBackend(StreamClient(redis), uuid.uuid4())
+    tenant_b = StreamDeadLetterBackend(StreamClient(redis), uuid.uuid4())
+    await tenant_a.put(_event("e1"))
+
+    assert await tenant_b.load() == []
+
+
+@pytest.mark.asyncio
+async def test_stream_backend_never_trims_live_events():
+    """Test live events outlast the client's maxlen while tombstones compact."""
+    redis = FakeStreamRedis()
+    backend = StreamDeadLetterBackend(
+        StreamClient(redis, maxlen=4), uuid.uuid4(), compact_threshold=4
+    )
+    for i in range(10):
+        await backend.put(_event(f"live{i}"))
+    for i in range(20):
+        await backend.put(_event(f"dead{i}"))
+        await backend.remove([f"dead{i}"])
+
+    (entries,) = redis.streams.values()
+    assert len(entries) < 30
+    expected = [f"live{i}" for i in range(10)]
+    assert [e.event_id for e in await backend.load()] == expected
@@ -19,6 +19,7 @@ Minimum 40 tests covering:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -36,6 +37,7 @@ from holly.engine.goal_dispatch import (
     K2PermissionGate,
     dispatch_goal,
 )
+from holly.engine.mcp_registry import MCPRegistry, ToolPermission
 from holly.goals.predicates import CelestialState, PredicateResult
 
 # ---------------------------------------------------------------------------
@@ -63,13 +65,20 @@ class MockPredidate:
 
 
 class MockMCPRegistry:
-    """Mock MCP registry for testing K2 gate."""
+    """Mock MCP registry for testing K2 gate.
+
+    ``permissions`` maps tool name to granted agent IDs; lookups return
+    ToolPermission grants, as MCPRegistry.get_tool_permissions() does.
+    """
 
     def __init__(self, permissions: dict[str, frozenset[str]] | None = None):
         self.permissions = permissions or {}
 
-    def get_tool_permissions(self, tool_name: str) -> frozenset[str]:
-        return self.permissions.get(tool_name, frozenset())
+    def get_tool_permissions(self, tool_name: str) -> list[ToolPermission]:
+        return [
+            ToolPermission(tool_id=uuid4(), agent_id=agent_id, granted_by="test")
+            for agent_id in sorted(self.permissions.get(tool_name, frozenset()))
+        ]
 
 
 class MockTaskClassifier:
@@ -289,6 +298,35 @@ def test_k2_gate_filter_tools_empty():
     assert filtered == []
 
 
+def test_k2_gate_uses_mcp_registry_index():
+    """Test K2 gate against a real MCPRegistry (indexed lookups)."""
+    registry = MCPRegistry()
+
+    async def handler(input_dict):
+        return {}
+
+    for tool in ("tool_code", "tool_web", "tool_fs"):
+        registry.register_tool(tool, handler)
+    registry.grant_permission("tool_code", "agent-1", "admin")
+    registry.grant_permission("tool_web", "agent-1", "admin")
+    registry.grant_permission("tool_fs", "agent-2", "admin")
+
+    gate = K2PermissionGate(registry)
+    assert gate.check_permission("agent-1", "tool_code") is True
+    assert gate.check_permission("agent-1", "tool_fs") is False
+    assert gate.filter_tools(
+        "agent-1", ["tool_code", "unknown", "tool_fs", "tool_web"]
+    ) == ["tool_code", "tool_web"]
+
+    registry.revoke_permission("tool_code", "agent-1")
+    with pytest.raises(K2PermissionError) as exc_info:
+        gate.enforce("agent-1", "tool_code")
+    assert exc_info.value.granted == frozenset()
+    with pytest.raises(K2PermissionError) as exc_info:
+        gate.enforce("agent-1", "tool_fs")
+    assert exc_info.value.granted == frozenset({"agent-2"})
+
+
 # ---------------------------------------------------------------------------
 # Tests: Celestial Compliance Evaluator
 # ---------------------------------------------------------------------------
@@ -737,7 +775,7 @@ def test_dispatcher_multiple_l_failures_short_circuits(
 def test_k2_gate_registry_exception_handling():
     """Test K2 gate handles registry exceptions gracefully."""
     class FailingRegistry:
-        def get_tool_permissions(self, tool_name: str) -> frozenset[str]:
+        def get_tool_permissions(self, tool_name: str) -> list[ToolPermission]:
             raise RuntimeError("Registry error")
 
     gate = K2PermissionGate(FailingRegistry())  # type: ignore
@@ -978,3 +1016,191 @@ def test_dispatcher_all_tool_authorization_failures():
     decision = dispatcher.dispatch(ctx)
     # All tools should be denied
     assert len(decision.authorized_tools) == 0
+
+
+# ---------------------------------------------------------------------------
+# Tests: Compliance Memoization
+# ---------------------------------------------------------------------------
+
+
+class CountingPredicate(MockPredidate):
+    """Mock predicate that counts evaluations."""
+
+    def __init__(self, level: int, passed: bool = True):
+        super().__init__(level, passed)
+        self.calls = 0
+
+    def evaluate(self, state: CelestialState) -> PredicateResult:
+        self.calls += 1
+        return super().evaluate(state)
+
+
+def _state(**context) -> CelestialState:
+    return CelestialState(
+        level=0,
+        context=context,
+        timestamp=datetime.now(timezone.utc),
+        actor_id="actor",
+        action="read",
+        payload={"tags": {"a", "b"}},
+    )
+
+
+def test_compliance_cache_reuses_identical_state_content():
+    """Test equal state content (different timestamps) is evaluated once."""
+    predicates = {i: CountingPredicate(i) for i in range(5)}
+    evaluator = CelestialComplianceEvaluator(predicates)
+
+    first = evaluator.evaluate(_state(intent="x"))
+    second = evaluator.evaluate(_state(intent="x"))
+    evaluator.evaluate(_state(intent="y"))
+
+    assert first.status == second.status == CelestialComplianceStatus.PASSED
+    assert predicates[0].calls == 2
+    assert evaluator.cache_stats() == {"entries": 2, "hits": 1, "misses": 2}
+
+
+def test_compliance_cache_distinguishes_value_types():
+    """Test list vs tuple and 1 vs True produce different keys."""
+    predicates = {i: CountingPredicate(i) for i in range(5)}
+    evaluator = CelestialComplianceEvaluator(predicates)
+    for value in ([1], (1,), 1, True, "1", {"k": 1}):
+        evaluator.evaluate(_state(v=value))
+    assert predicates[0].calls == 6
+
+
+def test_compliance_cache_returns_independent_copies():
+    """Test mutating a returned result does not corrupt the cache."""
+    predicates = {i: MockPredidate(i, passed=True) for i in range(5)}
+    evaluator = CelestialComplianceEvaluator(predicates)
+    evaluator.evaluate(_state()).violations.append("tampered")
+    assert evaluator.evaluate(_state()).violations == []
+
+
+def test_set_predicate_invalidates_compliance_cache():
+    """Test replacing a predicate re-evaluates previously cached states."""
+    evaluator = CelestialComplianceEvaluator(
+        {i: MockPredidate(i, passed=True) for i in range(5)}
+    )
+    assert evaluator.evaluate(_state()).status == CelestialComplianceStatus.PASSED
+
+    evaluator.set_predicate(2, MockPredidate(2, passed=False))
+    result = evaluator.evaluate(_state())
+    assert result.status == CelestialComplianceStatus.FAILED
+    assert result.failed_level == 2
+
+
+def test_uncacheable_state_is_always_evaluated():
+    """Test states with non-canonical values bypass the cache."""
+    predicates = {i: CountingPredicate(i) for i in range(5)}
+    evaluator = CelestialComplianceEvaluator(predicates)
+    for _ in range(2):
+        evaluator.evaluate(_state(handle=object()))
+    assert predicates[0].calls == 2
+    assert evaluator.cache_stats()["entries"] == 0
+
+    no_cache = CelestialComplianceEvaluator(predicates, cache_size=0)
+    no_cache.evaluate(_state())
+    no_cache.evaluate(_state())
+    assert predicates[0].calls == 4
+
+
+# ---------------------------------------------------------------------------
+# Tests: Async Batch Dispatch
+# ---------------------------------------------------------------------------
+
+
+class AsyncTaskClassifier(MockTaskClassifier):
+    """Classifier whose classify() returns a coroutine (I/O-backed)."""
+
+    def __init__(self, level: str = "T2", delay: float = 0.0):
+        super().__init__(level)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def classify(self, task_id: str, context: dict) -> object:
+        parent = super().classify
+
+        async def run() -> object:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(self.delay)
+            self.in_flight -= 1
+            return parent(task_id, context)
+
+        return run()
+
+
+def _context(state: CelestialState, task_id: str = "task") -> GoalDispatchContext:
+    return GoalDispatchContext(
+        goal_id=uuid4(),
+        agent_id="agent-1",
+        task_id=task_id,
+        celestial_state=state,
+        requested_tools=["tool_code"],
+    )
+
+
+async def test_dispatch_many_preserves_order_and_returns_errors():
+    """Test results follow input order with compliance errors in place."""
+    class FailsOnIntent(MockPredidate):
+        def evaluate(self, state):
+            self.passed = state.context.get("intent") != "bad"
+            return super().evaluate(state)
+
+    predicates = {i: MockPredidate(i) for i in range(5)}
+    predicates[1] = FailsOnIntent(1)
+    registry = MockMCPRegistry({"tool_code": frozenset(["agent-1"])})
+    dispatcher = GoalDispatcher(
+        CelestialComplianceEvaluator(predicates, cache_size=0),
+        K2PermissionGate(registry),
+        classifier=AsyncTaskClassifier("T3"),
+    )
+    contexts = [
+        _context(_state(intent="ok"), "t0"),
+        _context(_state(intent="bad"), "t1"),
+        _context(_state(intent="ok"), "t2"),
+    ]
+
+    results = await dispatcher.dispatch_many(contexts)
+
+    assert isinstance(results[1], CelestialComplianceError)
+    assert [r.goal_id for r in (results[0], results[2])] == [
+        contexts[0].goal_id,
+        contexts[2].goal_id,
+    ]
+    assert results[0].lane == "subagent"
+    assert results[0].authorized_tools == ["tool_code"]
+
+
+async def test_dispatch_many_bounds_concurrency():
+    """Test no more than max_concurrency classifications run at once."""
+    classifier = AsyncTaskClassifier(delay=0.005)
+    dispatcher = GoalDispatcher(
+        CelestialComplianceEvaluator({i: MockPredidate(i) for i in range(5)}),
+        K2PermissionGate(MockMCPRegistry()),
+        classifier=classifier,
+    )
+    contexts = [_context(_state(), f"t{i}") for i in range(20)]
+
+    results = await dispatcher.dispatch_many(contexts, max_concurrency=4)
+
+    assert len(results) == 20
+    assert classifier.max_in_flight == 4
+    with pytest.raises(ValueError):
+        await dispatcher.dispatch_many(contexts, max_concurrency=0)
+
+
+def test_sync_dispatch_with_async_classifier_defaults_to_t0(
+    default_dispatch_context: GoalDispatchContext,
+    all_pass_predicates: dict[int, MockPredidate],
+):
+    """Test dispatch() does not leak an un-awaited classifier coroutine."""
+    dispatcher = GoalDispatcher(
+        CelestialComplianceEvaluator(all_pass_predicates),
+        K2PermissionGate(MockMCPRegistry()),
+        classifier=AsyncTaskClassifier("T3"),
+    )
+    decision = dispatcher.dispatch(default_dispatch_context)
+    assert decision.task_level == "T0"
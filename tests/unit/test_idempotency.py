@@ -0,0 +1,107 @@
+"""Unit tests for the sliding-window idempotency cache."""
+
+from datetime import timedelta
+
+import pytest
+
+from holly.engine.idempotency import PROBABLE_DUPLICATE, BloomFilter, IdempotencyCache
+from holly.engine.lanes import LanePolicy
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _cache(clock: FakeClock, **kwargs: object) -> IdempotencyCache[str]:
+    return IdempotencyCache(timedelta(seconds=60), buckets=6, clock=clock, **kwargs)
+
+
+def test_rejects_invalid_configuration() -> None:
+    """Test window, buckets and max_entries must be positive."""
+    with pytest.raises(ValueError):
+        IdempotencyCache(timedelta(0))
+    with pytest.raises(ValueError):
+        IdempotencyCache(timedelta(seconds=1), buckets=0)
+    with pytest.raises(ValueError):
+        BloomFilter(0)
+
+
+def test_from_policy_uses_window_and_cap() -> None:
+    """Test from_policy honours idempotency_window and max entries."""
+    policy = LanePolicy(
+        idempotency_window=timedelta(minutes=5), idempotency_max_entries=7
+    )
+    cache: IdempotencyCache[str] = IdempotencyCache.from_policy(policy)
+    assert cache.window == 300.0
+    assert cache.max_entries == 7
+
+
+def test_hit_within_window_and_expiry_after(clock: FakeClock) -> None:
+    """Test keys are remembered for the window, then whole buckets expire."""
+    cache = _cache(clock)
+    cache.put("t1", "k", "v1")
+    assert cache.get("t1", "k") == "v1"
+    assert cache.get("t2", "k") is None
+
+    clock.now += 60.0
+    assert cache.get("t1", "k") == "v1"
+    clock.now += 10.0 + 1e-6
+    assert cache.get("t1", "k") is None
+    assert cache.entry_count("t1") == 0
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+    assert cache.stats.expired == 1
+
+
+def test_per_tenant_cap_evicts_oldest(clock: FakeClock) -> None:
+    """Test the cap evicts oldest entries for that tenant only."""
+    cache = _cache(clock, max_entries=3)
+    for i in range(5):
+        cache.put("big", f"k{i}", str(i))
+        clock.now += 1.0
+    cache.put("small", "only", "x")
+
+    assert cache.entry_count("big") == 3
+    assert cache.get("big", "k0") is None
+    assert cache.get("big", "k4") == "4"
+    assert cache.get("small", "only") == "x"
+    assert cache.stats.evicted == 2
+
+
+def test_approximate_mode_uses_bloom_pair(clock: FakeClock) -> None:
+    """Test approximate tenants dedupe via Bloom filters for the window."""
+    cache = _cache(clock, approximate_tenants=["hot"], bloom_capacity=1_000)
+    assert cache.is_approximate("hot")
+    cache.put("hot", "k", "v")
+    assert cache.entry_count("hot") == 0
+    assert cache.get("hot", "k") is PROBABLE_DUPLICATE
+
+    clock.now += 60.0  # one rotation: key is in the previous filter
+    assert cache.get("hot", "k") is PROBABLE_DUPLICATE
+    clock.now += 60.0  # second rotation: key is gone
+    assert cache.get("hot", "k") is None
+    assert cache.stats.rotations == 2
+
+    cache.set_approximate("hot", False)
+    assert not cache.is_approximate("hot")
+
+
+def test_bloom_filter_false_positive_rate() -> None:
+    """Test the filter stays near its target false-positive rate."""
+    bloom = BloomFilter(10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"in-{i}")
+    assert all(f"in-{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"out-{i}" in bloom for i in range(10_000))
+    assert false_positives < 200
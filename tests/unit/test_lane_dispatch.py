@@ -0,0 +1,426 @@
+"""Unit tests for holly.engine.lane_dispatch module."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from holly.engine.lane_dispatch import LaneDispatcher, TenantDispatchMetrics
+from holly.engine.lanes import (
+    PROBABLE_DUPLICATE_ID,
+    LaneManager,
+    LanePolicy,
+    LaneType,
+    QueueFullError,
+    SubagentSpawnRequest,
+    SubagentTask,
+    Task,
+    TaskEnqueueRequest,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def policy() -> LanePolicy:
+    """Create a test policy."""
+    return LanePolicy(
+        max_queue_depth=100,
+        max_concurrency=2,
+        backpressure_timeout=0.05,
+    )
+
+
+def _request(tenant_id: str, label: str, priority: int = 5) -> TaskEnqueueRequest:
+    return TaskEnqueueRequest(
+        task=Task(
+            task_id=uuid4(),
+            goal={"label": label},
+            user_id="user",
+            tenant_id=tenant_id,
+            idempotency_key=f"{tenant_id}-{label}",
+            resource_budget={},
+            mcp_tools=[],
+            context={},
+        ),
+        priority=priority,
+    )
+
+
+class Recorder:
+    """Handler recording (tenant, label) in dispatch order."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.order: list[tuple[str, str]] = []
+        self.fail_on = fail_on
+
+    async def __call__(self, task) -> None:
+        self.order.append((task.tenant_id, task.goal["label"]))
+        await asyncio.sleep(0)
+        if task.goal["label"] == self.fail_on:
+            raise RuntimeError("handler failed")
+
+
+async def _run_all(dispatcher: LaneDispatcher) -> None:
+    await dispatcher.start()
+    try:
+        await asyncio.wait_for(dispatcher.join(), timeout=2.0)
+    finally:
+        await dispatcher.stop()
+
+
+# ---------------------------------------------------------------------------
+# Configuration Tests
+# ---------------------------------------------------------------------------
+
+
+class TestLaneDispatcherConfiguration:
+    """Tests for LaneDispatcher construction."""
+
+    def test_rejects_cron_handler(self, policy: LanePolicy) -> None:
+        """Test only Main and Subagent lanes can be dispatched."""
+        with pytest.raises(ValueError):
+            LaneDispatcher(LaneManager(policy), {LaneType.CRON: Recorder()})
+
+    def test_rejects_non_positive_settings(self, policy: LanePolicy) -> None:
+        """Test quantum, pool sizes and weights must be positive."""
+        manager = LaneManager(policy)
+        handlers = {LaneType.MAIN: Recorder()}
+        with pytest.raises(ValueError):
+            LaneDispatcher(manager, handlers, quantum=0)
+        with pytest.raises(ValueError):
+            LaneDispatcher(manager, handlers, workers={LaneType.MAIN: 0})
+        with pytest.raises(ValueError):
+            LaneDispatcher(manager, handlers, weights={"t1": 0})
+
+    def test_default_pool_sizes(self, policy: LanePolicy) -> None:
+        """Test Subagent pool defaults to the policy's max_concurrency."""
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: Recorder(), LaneType.SUBAGENT: Recorder()},
+        )
+        assert dispatcher.workers == {LaneType.MAIN: 4, LaneType.SUBAGENT: 2}
+
+
+# ---------------------------------------------------------------------------
+# Scheduling Tests
+# ---------------------------------------------------------------------------
+
+
+class TestLaneDispatcherScheduling:
+    """Tests for deficit round robin across tenants."""
+
+    @pytest.mark.asyncio
+    async def test_noisy_tenant_does_not_monopolise(self, policy: LanePolicy) -> None:
+        """Test a quiet tenant is served within one round of a backlog."""
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: recorder},
+            workers={LaneType.MAIN: 1},
+        )
+        for i in range(20):
+            await dispatcher.enqueue_main_task(_request("noisy", f"n{i}"))
+        await dispatcher.enqueue_main_task(_request("quiet", "q0"))
+
+        await _run_all(dispatcher)
+
+        assert [tenant for tenant, _ in recorder.order[:2]] == ["noisy", "quiet"]
+        assert len(recorder.order) == 21
+
+    @pytest.mark.asyncio
+    async def test_weights_split_service(self, policy: LanePolicy) -> None:
+        """Test a weight-2 tenant gets twice the service while backlogged."""
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: recorder},
+            workers={LaneType.MAIN: 1},
+            weights={"heavy": 2.0},
+        )
+        for i in range(30):
+            await dispatcher.enqueue_main_task(_request("light", f"l{i}"))
+            await dispatcher.enqueue_main_task(_request("heavy", f"h{i}"))
+
+        await _run_all(dispatcher)
+
+        first = [tenant for tenant, _ in recorder.order[:30]]
+        assert first.count("heavy") == 20
+        assert first.count("light") == 10
+
+    @pytest.mark.asyncio
+    async def test_fractional_weights_accumulate(self, policy: LanePolicy) -> None:
+        """Test a weight-0.5 tenant is served every other round."""
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: recorder},
+            workers={LaneType.MAIN: 1},
+            weights={"half": 0.5},
+        )
+        for i in range(10):
+            await dispatcher.enqueue_main_task(_request("full", f"f{i}"))
+            await dispatcher.enqueue_main_task(_request("half", f"h{i}"))
+
+        await _run_all(dispatcher)
+
+        first = [tenant for tenant, _ in recorder.order[:9]]
+        assert first.count("full") == 6
+        assert first.count("half") == 3
+
+    @pytest.mark.asyncio
+    async def test_priority_order_within_tenant(self, policy: LanePolicy) -> None:
+        """Test a tenant's own tasks still leave in priority order."""
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: recorder},
+            workers={LaneType.MAIN: 1},
+        )
+        await dispatcher.enqueue_main_task(_request("t1", "low", priority=1))
+        await dispatcher.enqueue_main_task(_request("t1", "high", priority=9))
+
+        await _run_all(dispatcher)
+
+        assert [label for _, label in recorder.order] == ["high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_notify_picks_up_direct_enqueues(self, policy: LanePolicy) -> None:
+        """Test tasks enqueued on the manager directly run after notify."""
+        recorder = Recorder()
+        manager = LaneManager(policy)
+        dispatcher = LaneDispatcher(manager, {LaneType.MAIN: recorder})
+        await manager.enqueue_main_task(_request("t1", "direct"))
+        await dispatcher.start()
+        try:
+            dispatcher.notify("t1", LaneType.MAIN)
+            for _ in range(10):
+                await asyncio.sleep(0)
+        finally:
+            await dispatcher.stop()
+
+        assert recorder.order == [("t1", "direct")]
+
+
+# ---------------------------------------------------------------------------
+# Admission and Metrics Tests
+# ---------------------------------------------------------------------------
+
+
+class TestLaneDispatcherAdmission:
+    """Tests for admission control and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_above_threshold_after_timeout(self) -> None:
+        """Test submissions fail once the lane stays above the threshold."""
+        policy = LanePolicy(
+            max_queue_depth=4,
+            backpressure_timeout=0.01,
+            admission_threshold_percent=50.0,
+        )
+        dispatcher = LaneDispatcher(LaneManager(policy), {LaneType.MAIN: Recorder()})
+        await dispatcher.enqueue_main_task(_request("t1", "a"))
+        await dispatcher.enqueue_main_task(_request("t1", "b"))
+
+        with pytest.raises(QueueFullError):
+            await dispatcher.enqueue_main_task(_request("t1", "c"))
+        await dispatcher.enqueue_main_task(_request("t2", "a"))
+
+        assert dispatcher.get_tenant_metrics("t1")["rejected"] == 1
+        assert dispatcher.get_tenant_metrics("t1")["submitted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_admission_waits_for_workers_to_drain(self) -> None:
+        """Test a held submission is admitted once workers make room."""
+        policy = LanePolicy(
+            max_queue_depth=2,
+            backpressure_timeout=1.0,
+            admission_threshold_percent=100.0,
+        )
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: recorder},
+            workers={LaneType.MAIN: 1},
+        )
+        await dispatcher.enqueue_main_task(_request("t1", "a"))
+        await dispatcher.enqueue_main_task(_request("t1", "b"))
+        held = asyncio.create_task(dispatcher.enqueue_main_task(_request("t1", "c")))
+        await asyncio.sleep(0)
+        assert not held.done()
+
+        await dispatcher.start()
+        try:
+            await asyncio.wait_for(held, timeout=1.0)
+            await asyncio.wait_for(dispatcher.join(), timeout=1.0)
+        finally:
+            await dispatcher.stop()
+
+        assert [label for _, label in recorder.order] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_wakes_only_its_own_tenant(self) -> None:
+        """Test making room in one tenant's lane leaves other waiters asleep."""
+        policy = LanePolicy(
+            max_queue_depth=2,
+            backpressure_timeout=1.0,
+            admission_threshold_percent=100.0,
+        )
+        gate = asyncio.Event()
+
+        async def handler(task) -> None:
+            await gate.wait()
+
+        dispatcher = LaneDispatcher(
+            LaneManager(policy), {LaneType.MAIN: handler}, workers={LaneType.MAIN: 1}
+        )
+        for tenant_id in ("t1", "t2"):
+            await dispatcher.enqueue_main_task(_request(tenant_id, "a"))
+            await dispatcher.enqueue_main_task(_request(tenant_id, "b"))
+        held1 = asyncio.create_task(dispatcher.enqueue_main_task(_request("t1", "c")))
+        held2 = asyncio.create_task(dispatcher.enqueue_main_task(_request("t2", "c")))
+        await asyncio.sleep(0)
+        t2_space = dispatcher._space_available[("t2", LaneType.MAIN)]
+
+        await dispatcher.start()
+        try:
+            await asyncio.wait_for(held1, timeout=1.0)
+            assert not t2_space.is_set()
+            assert not held2.done()
+            gate.set()
+            await asyncio.wait_for(held2, timeout=1.0)
+            await asyncio.wait_for(dispatcher.join(), timeout=1.0)
+        finally:
+            await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_direct_drain_is_forgotten(self, policy: LanePolicy) -> None:
+        """Test tasks drained from the lane directly do not leak or block join."""
+        manager = LaneManager(policy)
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(manager, {LaneType.MAIN: recorder})
+        await dispatcher.enqueue_main_task(_request("t1", "a"))
+        await dispatcher.enqueue_main_task(_request("t1", "b"))
+        lane = manager.get_lane("t1", LaneType.MAIN)
+        await lane.dequeue_many(2)
+
+        await _run_all(dispatcher)
+
+        assert recorder.order == []
+        assert dispatcher._enqueued_at == {}
+        assert dispatcher.get_tenant_metrics("t1")["submitted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_outcomes_and_times(self, policy: LanePolicy) -> None:
+        """Test per-tenant counters and wait/service samples."""
+        dispatcher = LaneDispatcher(
+            LaneManager(policy),
+            {LaneType.MAIN: Recorder(fail_on="bad")},
+        )
+        await dispatcher.enqueue_main_task(_request("t1", "ok"))
+        await dispatcher.enqueue_main_task(_request("t1", "bad"))
+
+        await _run_all(dispatcher)
+
+        metrics = dispatcher.get_tenant_metrics("t1")
+        assert metrics["dispatched"] == 2
+        assert metrics["completed"] == 1
+        assert metrics["failed"] == 1
+        assert metrics["wait_p99"] >= metrics["wait_p50"] >= 0.0
+        assert set(dispatcher.get_metrics()) == {"t1"}
+
+    @pytest.mark.asyncio
+    async def test_subagent_completion_releases_concurrency(
+        self, policy: LanePolicy
+    ) -> None:
+        """Test finished subagents are marked complete on their lane."""
+        manager = LaneManager(policy)
+        seen = []
+
+        async def handler(task) -> None:
+            seen.append(task.subagent_execution_id)
+
+        dispatcher = LaneDispatcher(manager, {LaneType.SUBAGENT: handler})
+        for _ in range(3):
+            await dispatcher.spawn_subagent(
+                SubagentSpawnRequest(
+                    subagent_task=SubagentTask(
+                        agent_binding={},
+                        goals=[],
+                        parent_execution_id=uuid4(),
+                        user_id="user",
+                        tenant_id="t1",
+                        message_queue="q",
+                    )
+                )
+            )
+
+        await _run_all(dispatcher)
+
+        lane = manager.get_lane("t1", LaneType.SUBAGENT)
+        assert len(seen) == 3
+        assert lane.concurrent_count == 0
+
+
+    @pytest.mark.asyncio
+    async def test_deduped_spawn_is_not_accepted(self, policy: LanePolicy) -> None:
+        """Test a resubmitted spawn does not leave join() waiting on it."""
+        manager = LaneManager(policy)
+        seen = []
+
+        async def handler(task) -> None:
+            seen.append(task.subagent_execution_id)
+
+        dispatcher = LaneDispatcher(manager, {LaneType.SUBAGENT: handler})
+        for _ in range(2):
+            await dispatcher.spawn_subagent(
+                SubagentSpawnRequest(
+                    subagent_task=SubagentTask(
+                        agent_binding={},
+                        goals=[],
+                        parent_execution_id=uuid4(),
+                        user_id="user",
+                        tenant_id="t1",
+                        message_queue="q",
+                    ),
+                    idempotency_key="once",
+                )
+            )
+
+        await _run_all(dispatcher)
+
+        assert len(seen) == 1
+        assert dispatcher.get_tenant_metrics("t1", LaneType.SUBAGENT)["submitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_probable_duplicate_is_not_accepted(self, policy: LanePolicy) -> None:
+        """Test an approximate-mode dedupe hit is not counted as enqueued."""
+        manager = LaneManager(policy)
+        manager.idempotency_cache.set_approximate("t1", True)
+        recorder = Recorder()
+        dispatcher = LaneDispatcher(manager, {LaneType.MAIN: recorder})
+        first = _request("t1", "a")
+        resubmit = _request("t1", "a")
+
+        assert await dispatcher.enqueue_main_task(first) == first.task.task_id
+        assert (
+            await dispatcher.enqueue_main_task(resubmit) == PROBABLE_DUPLICATE_ID
+        )
+
+        await _run_all(dispatcher)
+
+        assert recorder.order == [("t1", "a")]
+        assert dispatcher.get_tenant_metrics("t1")["submitted"] == 1
+
+
+def test_tenant_metrics_reservoir_is_bounded() -> None:
+    """Test wait/service reservoirs keep only the latest samples."""
+    metrics = TenantDispatchMetrics(sample_size=4)
+    for i in range(10):
+        metrics.wait_seconds.append(float(i))
+    snapshot = metrics.snapshot()
+    assert len(metrics.wait_seconds) == 4
+    assert snapshot["wait_p50"] == 7.0
+    assert snapshot["wait_p99"] == 9.0
@@ -5,6 +5,7 @@ import pytest
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4, UUID
 
+from holly.engine.idempotency import IdempotencyCache
 from holly.engine.lanes import (
     Task,
     TaskEnqueueRequest,
@@ -15,6 +16,7 @@ from holly.engine.lanes import (
     LanePolicy,
     Lane,
     MainLane,
+    PriorityLaneQueue,
     CronLane,
     SubagentLane,
     LaneManager,
@@ -208,7 +210,8 @@ class TestMainLane:
         lane = MainLane(tenant_id, policy)
         assert lane.lane_type == LaneType.MAIN
         assert lane.tenant_id == tenant_id
-        assert len(lane.priority_queue) == 11
+        assert lane.priority_queue.levels == 11
+        assert len(lane.priority_queue) == 0
 
     @pytest.mark.asyncio
     async def test_enqueue_task_success(
@@ -245,6 +248,33 @@ class TestMainLane:
         
         assert id1 == id2
 
+    @pytest.mark.asyncio
+    async def test_idempotency_key_expires_after_window(
+        self, tenant_id: str, task: Task, policy: LanePolicy
+    ) -> None:
+        """Test a key is accepted again once idempotency_window has passed."""
+        clock = [0.0]
+        cache: IdempotencyCache[UUID] = IdempotencyCache(
+            timedelta(seconds=60), buckets=4, clock=lambda: clock[0]
+        )
+        lane = MainLane(tenant_id, policy, cache)
+        await lane.enqueue_task(TaskEnqueueRequest(task=task))
+
+        clock[0] += 90.0
+        retry = Task(
+            task_id=uuid4(),
+            goal=task.goal,
+            user_id=task.user_id,
+            tenant_id=task.tenant_id,
+            idempotency_key=task.idempotency_key,
+            resource_budget=task.resource_budget,
+            mcp_tools=task.mcp_tools,
+            context=task.context,
+        )
+        assert await lane.enqueue_task(TaskEnqueueRequest(task=retry)) == retry.task_id
+        assert lane.get_queue_size() == 2
+        assert cache.stats.expired == 1
+
     @pytest.mark.asyncio
     async def test_enqueue_task_queue_full(
         self, tenant_id: str, policy: LanePolicy
@@ -338,6 +368,110 @@ class TestMainLane:
         await lane.enqueue_task(TaskEnqueueRequest(task=task, priority=5))
         assert await lane.is_full()
 
+    @pytest.mark.asyncio
+    async def test_dequeue_many_takes_available_in_priority_order(
+        self, tenant_id: str, policy: LanePolicy
+    ) -> None:
+        """Test dequeue_many returns up to n tasks, highest priority first."""
+        lane = MainLane(tenant_id, policy)
+        for i, priority in enumerate([1, 7, 4]):
+            await lane.enqueue_task(
+                TaskEnqueueRequest(
+                    task=Task(
+                        task_id=uuid4(),
+                        goal={"priority": priority},
+                        user_id=f"user_{i}",
+                        tenant_id=tenant_id,
+                        idempotency_key=f"many_{i}",
+                        resource_budget={},
+                        mcp_tools=[],
+                        context={},
+                    ),
+                    priority=priority,
+                )
+            )
+
+        batch = await lane.dequeue_many(2)
+        assert [t.goal["priority"] for t in batch] == [7, 4]
+        assert lane.get_queue_size() == 1
+        assert [t.goal["priority"] for t in await lane.dequeue_many(5)] == [1]
+
+    @pytest.mark.asyncio
+    async def test_blocked_dequeue_wakes_on_any_priority(
+        self, tenant_id: str, task: Task, policy: LanePolicy
+    ) -> None:
+        """Test a consumer waiting on an empty lane wakes for priority 9."""
+        lane = MainLane(tenant_id, policy)
+        waiter = asyncio.create_task(lane.dequeue_next_task())
+        await asyncio.sleep(0)
+
+        await lane.enqueue_task(TaskEnqueueRequest(task=task, priority=9))
+
+        assert (await asyncio.wait_for(waiter, timeout=1.0)) is task
+
+
+# ---------------------------------------------------------------------------
+# PriorityLaneQueue Tests
+# ---------------------------------------------------------------------------
+
+
+class TestPriorityLaneQueue:
+    """Tests for PriorityLaneQueue class."""
+
+    def test_rejects_invalid_configuration(self) -> None:
+        """Test levels and aging_interval must be positive."""
+        with pytest.raises(ValueError):
+            PriorityLaneQueue(levels=0)
+        with pytest.raises(ValueError):
+            PriorityLaneQueue(aging_interval=0)
+
+    def test_fifo_within_priority(self) -> None:
+        """Test equal priorities dequeue in enqueue order."""
+        queue: PriorityLaneQueue[str] = PriorityLaneQueue()
+        for item in ("a", "b", "c"):
+            queue.put_nowait(item, 5)
+        queue.put_nowait("urgent", 10)
+
+        assert [queue.get_nowait() for _ in range(4)] == ["urgent", "a", "b", "c"]
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    def test_clamps_priority_and_counts_levels(self) -> None:
+        """Test out-of-range priorities are clamped and counted per level."""
+        queue: PriorityLaneQueue[str] = PriorityLaneQueue()
+        queue.put_nowait("low", -3)
+        queue.put_nowait("high", 42)
+
+        counts = queue.qsize_by_priority()
+        assert counts[0] == 1 and counts[10] == 1
+        assert len(queue) == 2
+        assert queue.get_nowait() == "high"
+        assert queue.qsize_by_priority()[10] == 0
+
+    def test_aging_promotes_waiting_items(self, monkeypatch) -> None:
+        """Test an old low-priority item overtakes newer higher-priority ones."""
+        clock = [100.0]
+        monkeypatch.setattr("holly.engine.lanes.time.monotonic", lambda: clock[0])
+        queue: PriorityLaneQueue[str] = PriorityLaneQueue(aging_interval=1.0)
+
+        queue.put_nowait("old_low", 2)
+        clock[0] += 5.0  # worth five levels
+        queue.put_nowait("new_mid", 6)
+        queue.put_nowait("new_high", 8)
+
+        assert [queue.get_nowait() for _ in range(3)] == [
+            "new_high",
+            "old_low",
+            "new_mid",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_many_requires_positive_n(self) -> None:
+        """Test get_many rejects non-positive batch sizes."""
+        queue: PriorityLaneQueue[str] = PriorityLaneQueue()
+        with pytest.raises(ValueError):
+            await queue.get_many(0)
+
 
 # ---------------------------------------------------------------------------
 # CronLane Tests
@@ -460,7 +594,7 @@ class TestCronLane:
                 mcp_tools=[],
                 context={},
             ),
-            scheduled_time=now - timedelta(minutes=1),
+            scheduled_time=now + timedelta(minutes=1),
         )
         future_sched = ScheduledTask(
             task=Task(
@@ -481,7 +615,7 @@ class TestCronLane:
             ScheduledTaskRequest(scheduled_task=future_sched)
         )
         
-        due = await lane.evaluate_due_tasks()
+        due = await lane.evaluate_due_tasks(now + timedelta(minutes=2))
         assert len(due) == 1
         assert due[0].schedule_id == due_sched.schedule_id
 
@@ -500,6 +634,109 @@ class TestCronLane:
         next_time = lane.get_next_execution_time()
         assert next_time == scheduled_task.scheduled_time
 
+    @pytest.mark.asyncio
+    async def test_schedule_rejects_invalid_recurrence(
+        self,
+        tenant_id: str,
+        scheduled_task: ScheduledTask,
+        policy: LanePolicy,
+    ) -> None:
+        """Test a malformed cron recurrence is rejected at schedule time."""
+        lane = CronLane(tenant_id, policy)
+        scheduled_task.recurrence = "every tuesday"
+        with pytest.raises(InvalidScheduleError):
+            await lane.schedule_task(
+                ScheduledTaskRequest(scheduled_task=scheduled_task)
+            )
+        assert len(lane.schedule_map) == 0
+
+    @pytest.mark.asyncio
+    async def test_recurring_task_reschedules_from_cron(
+        self,
+        tenant_id: str,
+        scheduled_task: ScheduledTask,
+        policy: LanePolicy,
+    ) -> None:
+        """Test a recurring task fires and is rescheduled by its expression."""
+        lane = CronLane(tenant_id, policy)
+        scheduled_task.recurrence = "*/10 * * * *"
+        await lane.schedule_task(ScheduledTaskRequest(scheduled_task=scheduled_task))
+
+        fire = scheduled_task.scheduled_time
+        due = await lane.evaluate_due_tasks(now=fire)
+        assert due == [scheduled_task]
+        next_time = lane.get_next_execution_time()
+        assert next_time is not None
+        assert next_time > fire and next_time.minute % 10 == 0
+        assert next_time - fire <= timedelta(minutes=10)
+        assert scheduled_task.next_execution_time == next_time
+        assert lane.coalesced_count == 0
+
+    @pytest.mark.asyncio
+    async def test_missed_fires_are_coalesced(
+        self,
+        tenant_id: str,
+        scheduled_task: ScheduledTask,
+        policy: LanePolicy,
+    ) -> None:
+        """Test fires missed during downtime produce a single fire."""
+        lane = CronLane(tenant_id, policy)
+        scheduled_task.recurrence = "* * * * *"
+        await lane.schedule_task(ScheduledTaskRequest(scheduled_task=scheduled_task))
+
+        later = scheduled_task.scheduled_time + timedelta(hours=3)
+        due = await lane.evaluate_due_tasks(now=later)
+        assert len(due) == 1
+        assert lane.coalesced_count == 1
+        next_time = lane.get_next_execution_time()
+        assert next_time is not None
+        assert later < next_time <= later + timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_cancel_skips_stale_heap_entry(
+        self,
+        tenant_id: str,
+        scheduled_task: ScheduledTask,
+        policy: LanePolicy,
+    ) -> None:
+        """Test a cancelled schedule never fires and leaves no next time."""
+        lane = CronLane(tenant_id, policy)
+        await lane.schedule_task(ScheduledTaskRequest(scheduled_task=scheduled_task))
+
+        assert lane.cancel(scheduled_task.schedule_id)
+        assert not lane.cancel(scheduled_task.schedule_id)
+        assert lane.get_next_execution_time() is None
+        later = scheduled_task.scheduled_time + timedelta(days=1)
+        assert await lane.evaluate_due_tasks(now=later) == []
+
+    @pytest.mark.asyncio
+    async def test_run_sleeps_until_next_fire(
+        self,
+        tenant_id: str,
+        scheduled_task: ScheduledTask,
+        policy: LanePolicy,
+    ) -> None:
+        """Test the run loop wakes for a newly scheduled sooner task."""
+        lane = CronLane(tenant_id, policy)
+        await lane.schedule_task(ScheduledTaskRequest(scheduled_task=scheduled_task))
+        fired: list[ScheduledTask] = []
+
+        async def on_due(batch: list[ScheduledTask]) -> None:
+            fired.extend(batch)
+            lane.stop()
+
+        runner = asyncio.create_task(lane.run(on_due))
+        await asyncio.sleep(0.01)
+        assert fired == []
+
+        soon = ScheduledTask(
+            task=scheduled_task.task,
+            scheduled_time=datetime.now(timezone.utc) + timedelta(milliseconds=50),
+        )
+        await lane.schedule_task(ScheduledTaskRequest(scheduled_task=soon))
+        await asyncio.wait_for(runner, timeout=2.0)
+        assert fired == [soon]
+
 
 # ---------------------------------------------------------------------------
 # SubagentLane Tests
@@ -527,7 +764,8 @@ class TestSubagentLane:
         request = SubagentSpawnRequest(subagent_task=subagent_task, priority=5)
         exec_id = await lane.spawn_subagent(request)
         assert exec_id == subagent_task.subagent_execution_id
-        assert lane.concurrent_count == 1
+        assert exec_id in lane.active_executions
+        assert lane.concurrent_count == 0  # queued, not running
 
     @pytest.mark.asyncio
     async def test_spawn_subagent_expired(
@@ -549,10 +787,35 @@ class TestSubagentLane:
         """Test mark_complete decrements counter."""
         lane = SubagentLane(tenant_id, policy)
         await lane.spawn_subagent(SubagentSpawnRequest(subagent_task=subagent_task))
+        await lane.mark_started(subagent_task.subagent_execution_id)
         assert lane.concurrent_count == 1
         
         await lane.mark_complete(subagent_task.subagent_execution_id)
         assert lane.concurrent_count == 0
+        assert not lane.active_executions
+
+    @pytest.mark.asyncio
+    async def test_mark_complete_of_queued_task_keeps_count(
+        self, tenant_id: str, subagent_task: SubagentTask, policy: LanePolicy
+    ) -> None:
+        """Test discarding a never-started task does not touch the count."""
+        lane = SubagentLane(tenant_id, policy)
+        other = SubagentTask(
+            agent_binding={},
+            goals=[],
+            parent_execution_id=subagent_task.parent_execution_id,
+            user_id="u",
+            tenant_id=tenant_id,
+            message_queue="q",
+        )
+        for t in (subagent_task, other):
+            await lane.spawn_subagent(SubagentSpawnRequest(subagent_task=t))
+        await lane.mark_started(subagent_task.subagent_execution_id)
+        await lane.mark_started(subagent_task.subagent_execution_id)
+
+        await lane.mark_complete(other.subagent_execution_id)
+        assert lane.concurrent_count == 1
+        assert lane.has_capacity()
 
     @pytest.mark.asyncio
     async def test_get_concurrency_percentage(
@@ -563,9 +826,36 @@ class TestSubagentLane:
         assert lane.get_concurrency_percentage() == 0.0
         
         await lane.spawn_subagent(SubagentSpawnRequest(subagent_task=subagent_task))
+        assert lane.get_concurrency_percentage() == 0.0
+        await lane.mark_started(subagent_task.subagent_execution_id)
         percent = lane.get_concurrency_percentage()
         assert 0 < percent < 100
 
+    @pytest.mark.asyncio
+    async def test_spawn_idempotency_key_dedupes(
+        self, tenant_id: str, subagent_task: SubagentTask, policy: LanePolicy
+    ) -> None:
+        """Test repeated spawns with one idempotency_key run once."""
+        lane = SubagentLane(tenant_id, policy)
+        first = await lane.spawn_subagent(
+            SubagentSpawnRequest(subagent_task=subagent_task, idempotency_key="s1")
+        )
+        retry = SubagentTask(
+            agent_binding={},
+            goals=[],
+            parent_execution_id=subagent_task.parent_execution_id,
+            user_id="u",
+            tenant_id=tenant_id,
+            message_queue="q",
+        )
+        second = await lane.spawn_subagent(
+            SubagentSpawnRequest(subagent_task=retry, idempotency_key="s1")
+        )
+
+        assert first == second == subagent_task.subagent_execution_id
+        assert list(lane.active_executions) == [first]
+        assert lane.idempotency_cache.stats.hits == 1
+
 
 # ---------------------------------------------------------------------------
 # LaneManager Tests
@@ -604,6 +894,18 @@ class TestLaneManager:
         schedule_id = await manager.schedule_cron_task(request)
         assert schedule_id == scheduled_task.schedule_id
 
+    @pytest.mark.asyncio
+    async def test_lanes_share_one_idempotency_cache(
+        self, tenant_id: str, task: Task, policy: LanePolicy
+    ) -> None:
+        """Test the manager's main and subagent lanes share its cache."""
+        manager = LaneManager(policy)
+        await manager.enqueue_main_task(TaskEnqueueRequest(task=task))
+        main = manager.get_lane(tenant_id, LaneType.MAIN)
+        assert isinstance(main, MainLane)
+        assert main.idempotency_cache is manager.idempotency_cache
+        assert manager.idempotency_cache.entry_count(tenant_id) == 1
+
     @pytest.mark.asyncio
     async def test_spawn_subagent(
         self, tenant_id: str, subagent_task: SubagentTask, policy: LanePolicy
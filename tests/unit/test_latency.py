@@ -0,0 +1,159 @@
+"""Unit tests for holly.engine.latency module."""
+
+import random
+
+import pytest
+
+from holly.engine.latency import (
+    LatencyHistogram,
+    LatencyRecorder,
+    LatencyStats,
+    TimeoutPolicy,
+)
+
+
+def _stats_with(values: list[int]) -> LatencyStats:
+    stats = LatencyStats()
+    for value in values:
+        stats.calls += 1
+        stats.histogram.record(value)
+    return stats
+
+
+def test_histogram_rejects_invalid_precision() -> None:
+    """Test precision must be within 1..10."""
+    with pytest.raises(ValueError):
+        LatencyHistogram(0)
+    with pytest.raises(ValueError):
+        LatencyHistogram(11)
+
+
+def test_histogram_small_values_are_exact() -> None:
+    """Test values below the linear range are stored exactly."""
+    h = LatencyHistogram()
+    for value in range(1, 11):
+        h.record(value)
+    assert h.percentile(50) == 5
+    assert h.percentile(100) == 10
+    assert h.min == 1
+    assert h.max == 10
+    assert h.mean == 5.5
+
+
+def test_histogram_percentiles_within_relative_error() -> None:
+    """Test percentiles of a wide distribution stay within 2**-precision."""
+    rng = random.Random(7)
+    values = sorted(int(rng.lognormvariate(15, 1.5)) for _ in range(20_000))
+    h = LatencyHistogram(precision=5)
+    for value in values:
+        h.record(value)
+
+    for p in (50, 90, 95, 99, 99.9):
+        exact = values[max(0, round(len(values) * p / 100) - 1)]
+        assert abs(h.percentile(p) - exact) <= exact / 32 + 1
+    assert h.count == len(values)
+    assert h.max == values[-1]
+
+
+def test_histogram_empty_and_negative_values() -> None:
+    """Test an empty histogram reports zeros and negatives clamp to zero."""
+    h = LatencyHistogram()
+    assert h.percentile(99) == 0
+    assert h.mean == 0.0
+    h.record(-5)
+    assert h.min == 0
+    assert h.percentile(50) == 0
+
+
+def test_histogram_merge() -> None:
+    """Test merging adds counts and widens min/max."""
+    a = LatencyHistogram()
+    b = LatencyHistogram()
+    for value in (100, 200):
+        a.record(value)
+    for value in (50, 10_000_000):
+        b.record(value)
+    a.merge(b)
+    assert a.count == 4
+    assert a.min == 50
+    assert a.max == 10_000_000
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(precision=3))
+
+
+def test_policy_validation() -> None:
+    """Test inconsistent bounds are rejected."""
+    with pytest.raises(ValueError):
+        TimeoutPolicy(floor_seconds=0)
+    with pytest.raises(ValueError):
+        TimeoutPolicy(floor_seconds=2.0, ceiling_seconds=1.0)
+    with pytest.raises(ValueError):
+        TimeoutPolicy(min_samples=0)
+
+
+def test_policy_uses_ceiling_until_warm() -> None:
+    """Test the cold-start timeout is the ceiling (or the caller default)."""
+    policy = TimeoutPolicy(min_samples=10)
+    assert policy.timeout(None, 5.0) == 5.0
+    assert policy.timeout(_stats_with([1_000_000] * 9), 5.0) == 5.0
+    assert TimeoutPolicy(ceiling_seconds=2.0).timeout(None, 5.0) == 2.0
+
+
+def test_policy_clamps_percentile_timeout() -> None:
+    """Test the adaptive timeout is percentile x multiplier within bounds."""
+    policy = TimeoutPolicy(percentile=99, multiplier=3, floor_seconds=0.01, min_samples=10)
+    stats = _stats_with([100_000_000] * 100)  # 100ms
+    assert policy.timeout(stats, 5.0) == pytest.approx(0.3, rel=0.05)
+    assert policy.timeout(_stats_with([1_000] * 100), 5.0) == 0.01
+    assert policy.timeout(_stats_with([4_000_000_000] * 100), 5.0) == 5.0
+
+
+def test_policy_hedge_delay() -> None:
+    """Test hedging needs a hedge percentile and enough samples."""
+    stats = _stats_with([20_000_000] * 60)
+    assert TimeoutPolicy().hedge_delay(stats) is None
+    policy = TimeoutPolicy(hedge_percentile=95, min_samples=50)
+    assert policy.hedge_delay(None) is None
+    assert policy.hedge_delay(stats) == pytest.approx(0.02, rel=0.05)
+
+
+def test_recorder_keys_and_outcomes() -> None:
+    """Test runs are recorded per (tool, tenant) and per tool."""
+    recorder = LatencyRecorder()
+    recorder.record("tool", "t1", 1_000)
+    recorder.record("tool", "t1", 2_000, error=True)
+    recorder.record("tool", "t2", 10_000_000_000, timeout=True)
+    recorder.record_hedge("tool", "t2", won=True)
+
+    tool = recorder.for_tool("tool")
+    assert tool is not None
+    assert (tool.calls, tool.errors, tool.timeouts) == (3, 1, 1)
+    assert tool.histogram.count == 3  # timeouts censored at their elapsed time
+    assert tool.error_rate == pytest.approx(2 / 3)
+    assert (tool.hedged, tool.hedge_wins) == (1, 1)
+
+    t2 = recorder.for_key("tool", "t2")
+    assert t2 is not None and t2.timeouts == 1
+    assert sorted(recorder.tenants("tool")) == ["t1", "t2"]
+    assert recorder.for_tool("other") is None
+
+
+def test_timeout_recovers_after_latency_step() -> None:
+    """Test timed-out runs let the adaptive timeout grow past a latency step."""
+    policy = TimeoutPolicy(floor_seconds=0.01, min_samples=20)
+    recorder = LatencyRecorder()
+    for _ in range(30):
+        recorder.record("tool", "t", 5_000_000)  # 5ms
+    assert policy.timeout(recorder.for_tool("tool"), 5.0) < 0.1
+
+    latency = 0.1  # the tool now takes 100ms
+    outcomes = []
+    for _ in range(200):
+        timeout = policy.timeout(recorder.for_tool("tool"), 5.0)
+        timed_out = latency > timeout
+        elapsed = timeout if timed_out else latency
+        recorder.record("tool", "t", int(elapsed * 1e9), timeout=timed_out)
+        outcomes.append(timed_out)
+
+    assert policy.timeout(recorder.for_tool("tool"), 5.0) > latency
+    assert not any(outcomes[-100:])
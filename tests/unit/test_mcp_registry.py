@@ -18,6 +18,7 @@ from uuid import uuid4
 
 import pytest
 
+from holly.engine.latency import TimeoutPolicy
 from holly.engine.mcp_registry import (
     LLMToolError,
     MCPRegistry,
@@ -424,6 +425,366 @@ async def test_concurrent_invocations_tracked(registry_with_tools):
     assert count == 0
 
 
+def _blocking_registry(**kwargs) -> tuple[MCPRegistry, asyncio.Event, list[int]]:
+    """Registry with a 'slow' tool that blocks until the event is set."""
+    registry = MCPRegistry(**kwargs)
+    release = asyncio.Event()
+    order: list[int] = []
+
+    async def slow(input_dict):
+        order.append(input_dict["n"])
+        await release.wait()
+        return {"n": input_dict["n"]}
+
+    registry.register_tool("slow", slow)
+    registry.grant_permission("slow", "agent1", "admin")
+    return registry, release, order
+
+
+def _slow_request(n: int, tenant_id: str = "tenant1", priority: int = 0):
+    return ToolInvocationRequest(
+        tool_name="slow",
+        agent_id="agent1",
+        tenant_id=tenant_id,
+        input={"n": n},
+        priority=priority,
+    )
+
+
+@pytest.mark.asyncio
+async def test_invocations_over_limit_wait_for_slot():
+    """Test excess invocations queue instead of failing (ICD-019/020)."""
+    registry, release, order = _blocking_registry()
+    registry.set_concurrency_limit("slow", "tenant1", 2)
+
+    tasks = [asyncio.create_task(registry.invoke(_slow_request(n))) for n in range(5)]
+    await asyncio.sleep(0.01)
+    stats = registry.get_concurrency_stats("slow")["tenant1"]
+    assert stats["in_flight"] == 2
+    assert stats["queue_depth"] == 3
+    assert registry.get_active_invocation_count("slow", "tenant1", "agent1") == 2
+
+    release.set()
+    responses = await asyncio.gather(*tasks)
+    assert not any(r.is_error() for r in responses)
+    assert order == [0, 1, 2, 3, 4]
+
+    stats = registry.get_concurrency_stats("slow")["tenant1"]
+    assert stats["in_flight"] == 0
+    assert stats["acquired"] == 5
+    assert stats["waited"] == 3
+    assert stats["max_queue_depth"] == 3
+    assert stats["max_wait_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_queued_invocations_served_by_priority():
+    """Test higher-priority invocations leave the queue first."""
+    registry, release, order = _blocking_registry()
+    registry.set_concurrency_limit("slow", "tenant1", 1)
+
+    tasks = [asyncio.create_task(registry.invoke(_slow_request(0)))]
+    await asyncio.sleep(0)
+    for n, priority in ((1, 0), (2, 9), (3, 0)):
+        tasks.append(asyncio.create_task(registry.invoke(_slow_request(n, priority=priority))))
+        await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == [0, 2, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_returns_concurrency_limit_error():
+    """Test waiters still queued at the timeout get a concurrency_limit error."""
+    registry, release, _ = _blocking_registry(queue_timeout=0.02)
+    registry.set_concurrency_limit("slow", "tenant1", 1)
+
+    first = asyncio.create_task(registry.invoke(_slow_request(0)))
+    await asyncio.sleep(0)
+    response = await registry.invoke(_slow_request(1))
+
+    assert response.is_error()
+    assert response.error_code == "concurrency_limit"
+    release.set()
+    assert not (await first).is_error()
+    stats = registry.get_concurrency_stats("slow")["tenant1"]
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
+    assert registry.get_registry_stats()["tools"][0]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_limits_are_per_tool_and_tenant():
+    """Test a saturated (tool, tenant) does not block other tenants or tools."""
+    registry, release, _ = _blocking_registry(queue_timeout=0)
+    registry.set_concurrency_limit("slow", "tenant1", 1)
+
+    async def fast(input_dict):
+        return {"ok": True}
+
+    registry.register_tool("fast", fast)
+    registry.grant_permission("fast", "agent1", "admin")
+
+    blocked = asyncio.create_task(registry.invoke(_slow_request(0)))
+    await asyncio.sleep(0)
+    assert (await registry.invoke(_slow_request(1))).error_code == "concurrency_limit"
+
+    other_tenant = asyncio.create_task(registry.invoke(_slow_request(2, "tenant2")))
+    other_tool = await registry.invoke(
+        ToolInvocationRequest(tool_name="fast", agent_id="agent1", tenant_id="tenant1")
+    )
+    assert not other_tool.is_error()
+    release.set()
+    assert not (await other_tenant).is_error()
+    assert not (await blocked).is_error()
+    assert set(registry.get_concurrency_stats("slow")) == {"tenant1", "tenant2"}
+
+
+class CountingPIIRedactor:
+    """PII redactor counting how often it runs."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def redact_secrets(self, data):
+        return data
+
+    def redact_pii(self, data):
+        self.calls += 1
+        return {**data, "email": "[REDACTED]"}
+
+
+def _cached_registry(**kwargs) -> tuple[MCPRegistry, list[dict], CountingPIIRedactor]:
+    """Registry with a cacheable PII-returning 'lookup' tool."""
+    redactor = CountingPIIRedactor()
+    registry = MCPRegistry(pii_redactor=redactor, **kwargs)
+    calls: list[dict] = []
+
+    async def lookup(input_dict):
+        calls.append(input_dict)
+        await asyncio.sleep(0.01)
+        return {"id": input_dict["id"], "email": "a@example.com"}
+
+    registry.register_tool("lookup", lookup, returns_pii=True, cache_ttl=60.0)
+    registry.grant_permission("lookup", "agent1", "admin")
+    return registry, calls, redactor
+
+
+def _lookup(user_id: int, tenant_id: str = "tenant1", agent_id: str = "agent1"):
+    return ToolInvocationRequest(
+        tool_name="lookup",
+        agent_id=agent_id,
+        tenant_id=tenant_id,
+        input={"id": user_id},
+    )
+
+
+def test_register_tool_rejects_invalid_cache_ttl(registry):
+    """Test cache_ttl must be positive."""
+
+    async def handler(input_dict):
+        return {}
+
+    with pytest.raises(ValueError):
+        registry.register_tool("tool1", handler, cache_ttl=0)
+
+
+@pytest.mark.asyncio
+async def test_cacheable_tool_serves_repeats_from_cache():
+    """Test repeats hit the cache and PII redaction runs once at fill."""
+    registry, calls, redactor = _cached_registry()
+
+    first = await registry.invoke(_lookup(1))
+    second = await registry.invoke(_lookup(1))
+    third = await registry.invoke(_lookup(2))
+
+    assert not first.cached
+    assert second.cached
+    assert not third.cached
+    assert second.tool_result == {"id": 1, "email": "[REDACTED]"}
+    assert len(calls) == 2
+    assert redactor.calls == 2
+    stats = registry.get_registry_stats()["result_cache"]
+    assert stats["hits"] == 1
+    assert stats["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cacheable_tool_coalesces_concurrent_duplicates():
+    """Test concurrent identical invocations share one handler call."""
+    registry, calls, _ = _cached_registry()
+
+    responses = await asyncio.gather(*(registry.invoke(_lookup(1)) for _ in range(10)))
+    assert len(calls) == 1
+    assert sum(r.cached for r in responses) == 9
+    assert registry.get_registry_stats()["result_cache"]["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_result_cache_is_tenant_partitioned():
+    """Test one tenant's cached result is never served to another tenant."""
+    registry, calls, _ = _cached_registry()
+
+    await registry.invoke(_lookup(1, tenant_id="tenant1"))
+    response = await registry.invoke(_lookup(1, tenant_id="tenant2"))
+    assert not response.cached
+    assert len(calls) == 2
+
+    assert registry.clear_result_cache(tenant_id="tenant1") == 1
+    assert not (await registry.invoke(_lookup(1, tenant_id="tenant1"))).cached
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_still_enforces_permission():
+    """Test K2 is checked before the cache: unauthorized agents get no hit."""
+    registry, _, _ = _cached_registry()
+    await registry.invoke(_lookup(1))
+
+    response = await registry.invoke(_lookup(1, agent_id="intruder"))
+    assert response.error_code == "permission_denied"
+
+
+@pytest.mark.asyncio
+async def test_non_cacheable_tool_always_executes(registry_with_tools):
+    """Test tools without cache_ttl run their handler on every call."""
+    request = ToolInvocationRequest(
+        tool_name="simple_tool", agent_id="agent1", tenant_id="tenant1", input={"x": 1}
+    )
+    first = await registry_with_tools.invoke(request)
+    second = await registry_with_tools.invoke(request)
+    assert not first.cached and not second.cached
+    assert registry_with_tools.get_registry_stats()["result_cache"]["misses"] == 0
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Test: Latency Telemetry, Adaptive Timeouts and Hedging
+# ─────────────────────────────────────────────────────────────────────────
+
+
+def _request(tool_name: str, tenant_id: str = "tenant1") -> ToolInvocationRequest:
+    return ToolInvocationRequest(
+        tool_name=tool_name, agent_id="agent1", tenant_id=tenant_id, input={}
+    )
+
+
+@pytest.mark.asyncio
+async def test_invocations_record_latency_per_tenant(registry_with_tools):
+    """Test handler runs feed per-tenant latency and registry SLO stats."""
+    for tenant in ("tenant1", "tenant1", "tenant2"):
+        await registry_with_tools.invoke(_request("simple_tool", tenant))
+
+    per_tenant = registry_with_tools.get_latency_stats("simple_tool")
+    assert per_tenant["tenant1"]["calls"] == 2
+    assert per_tenant["tenant2"]["calls"] == 1
+    assert per_tenant["tenant1"]["latency_ms"]["p99"] > 0
+
+    tool = next(
+        t for t in registry_with_tools.get_registry_stats()["tools"]
+        if t["name"] == "simple_tool"
+    )
+    assert tool["calls"] == 3
+    assert tool["error_rate"] == 0.0
+    assert tool["saturation"] == 0.0
+    assert set(tool["latency_ms"]) == {"p50", "p95", "p99"}
+    assert tool["timeout_s"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_errors_and_timeouts_count_towards_error_rate(registry):
+    """Test failed and timed-out runs raise the error rate."""
+
+    async def failing(input_dict):
+        raise RuntimeError("boom")
+
+    async def slow(input_dict):
+        await asyncio.sleep(1)
+
+    registry.register_tool("failing", failing)
+    registry.register_tool("slow", slow)
+    registry.grant_permission("failing", "agent1", "admin")
+    registry.grant_permission("slow", "agent1", "admin")
+    registry.set_timeout_policy(
+        "slow", TimeoutPolicy(floor_seconds=0.01, ceiling_seconds=0.02)
+    )
+
+    await registry.invoke(_request("failing"))
+    response = await registry.invoke(_request("slow"))
+    assert response.error_code == "tool_execution_error"
+
+    assert registry.get_latency_stats("failing")["tenant1"]["errors"] == 1
+    slow_stats = registry.get_latency_stats("slow")["tenant1"]
+    assert slow_stats["timeouts"] == 1
+    assert slow_stats["error_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeout_follows_observed_latency(registry_with_tools):
+    """Test the timeout drops from the ceiling to percentile x multiplier."""
+    registry_with_tools.set_timeout_policy(
+        "simple_tool", TimeoutPolicy(floor_seconds=0.05, min_samples=5)
+    )
+    assert registry_with_tools.get_timeout("simple_tool") == 5.0
+    assert registry_with_tools.get_timeout("llm_tool") == 30.0
+
+    for _ in range(5):
+        await registry_with_tools.invoke(_request("simple_tool"))
+    assert registry_with_tools.get_timeout("simple_tool") == 0.05  # clamped to floor
+
+    registry_with_tools.set_timeout_policy("simple_tool", None)
+    assert registry_with_tools.get_timeout("simple_tool") == 5.0
+
+
+@pytest.mark.asyncio
+async def test_hedged_attempt_answers_slow_idempotent_call():
+    """Test an idempotent tool stuck past its hedge delay is hedged."""
+    registry = MCPRegistry(
+        timeout_policy=TimeoutPolicy(
+            hedge_percentile=50, min_samples=3, floor_seconds=0.01
+        )
+    )
+    delays = [0.005, 0.005, 0.005, 1.0, 0.005]
+
+    async def flaky(input_dict):
+        await asyncio.sleep(delays.pop(0))
+        return {"ok": True}
+
+    registry.register_tool("flaky", flaky, idempotent=True)
+    registry.grant_permission("flaky", "agent1", "admin")
+    for _ in range(3):
+        await registry.invoke(_request("flaky"))
+
+    response = await registry.invoke(_request("flaky"))
+    assert response.tool_result == {"ok": True}
+    assert response.execution_time_ms < 500
+    stats = registry.get_latency_stats("flaky")["tenant1"]
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    assert delays == []
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_tool_is_never_hedged():
+    """Test hedging requires the tool to be declared idempotent."""
+    registry = MCPRegistry(
+        timeout_policy=TimeoutPolicy(hedge_percentile=50, min_samples=1)
+    )
+    calls = 0
+
+    async def once(input_dict):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01 if calls > 1 else 0.001)
+        return calls
+
+    registry.register_tool("once", once)
+    registry.grant_permission("once", "agent1", "admin")
+    await registry.invoke(_request("once"))
+    await registry.invoke(_request("once"))
+    assert calls == 2
+    assert registry.get_latency_stats("once")["tenant1"]["hedged"] == 0
+
+
 # ─────────────────────────────────────────────────────────────────────────
 # Test: Introspection API
 # ─────────────────────────────────────────────────────────────────────────
@@ -494,6 +855,74 @@ def test_has_permission_false(registry_with_tools):
     assert not registry_with_tools.has_permission("simple_tool", "agent3")
 
 
+def test_permission_index_revoke(registry_with_tools):
+    """Test revocation removes every grant for the pair."""
+    registry_with_tools.grant_permission("simple_tool", "agent1", "admin")
+
+    assert registry_with_tools.revoke_permission("simple_tool", "agent1") == 2
+    assert not registry_with_tools.has_permission("simple_tool", "agent1")
+    assert registry_with_tools.has_permission("simple_tool", "agent2")
+    assert registry_with_tools.revoke_permission("simple_tool", "agent1") == 0
+    with pytest.raises(ToolNotFoundError):
+        registry_with_tools.revoke_permission("missing", "agent1")
+
+
+def test_permission_index_expiry(registry):
+    """Test expired grants are denied and purged from the index."""
+
+    async def handler(input_dict):
+        return {}
+
+    registry.register_tool("tool1", handler)
+    now = datetime.now(timezone.utc)
+    registry.grant_permission(
+        "tool1", "agent1", "admin", expires_at=now - timedelta(seconds=1)
+    )
+    registry.grant_permission(
+        "tool1", "agent2", "admin", expires_at=now + timedelta(hours=1)
+    )
+
+    assert not registry.has_permission("tool1", "agent1")
+    assert registry.has_permission("tool1", "agent2")
+    assert ("tool1", "agent1") not in registry._grant_index
+    with pytest.raises(PermissionDeniedError) as exc_info:
+        registry._check_permission("tool1", "agent1")
+    assert exc_info.value.granted == frozenset({"agent2"})
+
+
+def test_permission_index_overlapping_grants_keep_latest_expiry(registry):
+    """Test a later or permanent grant outlives an earlier expiring one."""
+
+    async def handler(input_dict):
+        return {}
+
+    registry.register_tool("tool1", handler)
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    registry.grant_permission("tool1", "agent1", "admin", expires_at=past)
+    registry.grant_permission("tool1", "agent1", "admin", expires_at=future)
+    registry.grant_permission("tool1", "agent2", "admin")
+    registry.grant_permission("tool1", "agent2", "admin", expires_at=past)
+
+    assert registry.has_permission("tool1", "agent1")
+    assert registry.has_permission("tool1", "agent2")
+    assert registry.get_authorized_agents("tool1") == frozenset({"agent1", "agent2"})
+    assert registry.get_authorized_agents("missing") == frozenset()
+
+
+def test_authorize_many(registry_with_tools):
+    """Test bulk authorization preserves order and denies unknown tools."""
+    flags = registry_with_tools.authorize_many([
+        ("simple_tool", "agent1"),
+        ("simple_tool", "agent3"),
+        ("missing", "agent1"),
+        ("simple_tool", "agent2"),
+    ])
+    assert flags == [True, False, False, True]
+    assert registry_with_tools.authorize_many([]) == []
+
+
 def test_get_registry_stats(registry_with_tools):
     """Test registry statistics."""
     stats = registry_with_tools.get_registry_stats()
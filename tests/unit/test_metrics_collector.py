@@ -0,0 +1,142 @@
+"""Unit tests for holly.agents.metrics_collector — streaming communication metrics."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from holly.agents.metrics_collector import CommunicationCollector
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _dense(collector: CommunicationCollector, agent_ids: list[str]) -> np.ndarray:
+    return collector.snapshot(agent_ids).message_counts.to_dense()
+
+
+class TestCommunicationCollector:
+    """Test windowing, alignment and concurrency."""
+
+    def test_rejects_invalid_buckets(self) -> None:
+        """Test the bucket must be positive and fit in the window."""
+        with pytest.raises(ValueError):
+            CommunicationCollector(window_seconds=10, bucket_seconds=0)
+        with pytest.raises(ValueError):
+            CommunicationCollector(window_seconds=1, bucket_seconds=5)
+
+    def test_counts_and_window_bounds(self, clock: FakeClock) -> None:
+        """Test counts accumulate and the window starts at creation."""
+        collector = CommunicationCollector(window_seconds=10, bucket_seconds=1, clock=clock)
+        collector.record("a", "b")
+        collector.record("a", "b", 4)
+        clock.now += 2.5
+        collector.record("b", "a")
+
+        metrics = collector.snapshot()
+        np.testing.assert_array_equal(metrics.message_counts.to_dense(), [[0, 5], [1, 0]])
+        assert metrics.total_messages == 6
+        assert metrics.window_duration_sec == pytest.approx(2.5)
+
+    def test_window_slides(self, clock: FakeClock) -> None:
+        """Test buckets older than the window stop counting."""
+        collector = CommunicationCollector(window_seconds=10, bucket_seconds=1, clock=clock)
+        collector.record("a", "b", 3)
+        clock.now += 5
+        collector.record("b", "a", 2)
+        assert _dense(collector, ["a", "b"]).tolist() == [[0, 3], [2, 0]]
+
+        clock.now += 6  # first bucket leaves the window
+        assert _dense(collector, ["a", "b"]).tolist() == [[0, 0], [2, 0]]
+        metrics = collector.snapshot()
+        assert metrics.window_duration_sec == pytest.approx(10.0, abs=1.0)
+
+        clock.now += 10
+        assert collector.snapshot().total_messages == 0
+        assert collector.active_edges() == 0
+
+    def test_agent_ids_align_and_filter(self, clock: FakeClock) -> None:
+        """Test explicit agent order is used and unknown agents are dropped."""
+        collector = CommunicationCollector(clock=clock)
+        collector.record("b", "a", 2)
+        collector.record("a", "ghost", 7)
+
+        metrics = collector.snapshot(["b", "a", "c"])
+        assert metrics.message_counts.shape == (3, 3)
+        assert metrics.message_counts.to_dense()[0, 1] == 2
+        assert metrics.total_messages == 2
+
+    def test_concurrent_writers_lose_nothing(self, clock: FakeClock) -> None:
+        """Test per-thread shards add up exactly, and exited threads are reaped."""
+        collector = CommunicationCollector(window_seconds=60, bucket_seconds=1, clock=clock)
+
+        def writer(worker: int) -> None:
+            for i in range(2_000):
+                collector.record(f"w{worker}", f"peer{i % 10}")
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = collector.snapshot()
+        assert metrics.total_messages == 8_000
+        assert metrics.message_counts.nnz == 40
+        assert collector._shards == []
+
+    def test_snapshot_during_bucket_rollover(self, clock: FakeClock) -> None:
+        """Test handed-over and live buckets are both counted, once."""
+        collector = CommunicationCollector(window_seconds=10, bucket_seconds=1, clock=clock)
+        for _ in range(5):
+            collector.record("a", "b")
+            clock.now += 1
+        collector.record("a", "b")  # hands over the previous bucket
+        assert collector.snapshot().total_messages == 6
+        assert collector.snapshot().total_messages == 6
+
+    def test_memory_bounded_under_churn(self, clock: FakeClock) -> None:
+        """Test edges of departed agents are dropped once outside the window."""
+        collector = CommunicationCollector(window_seconds=5, bucket_seconds=1, clock=clock)
+        for generation in range(50):
+            for i in range(20):
+                collector.record(f"g{generation}-{i}", f"g{generation}-{i + 1}")
+            clock.now += 1
+        collector.snapshot()
+        assert collector.active_edges() <= 5 * 20
+        assert len(collector._buckets) <= 5
+
+    def test_handoff_drained_without_snapshots(self, clock: FakeClock) -> None:
+        """Test a writer that never snapshots keeps the handoff within the ring."""
+        collector = CommunicationCollector(window_seconds=5, bucket_seconds=1, clock=clock)
+        for _ in range(1_000):
+            collector.record("a", "b")
+            clock.now += 1
+            assert len(collector._handoff) <= 6
+            assert len(collector._buckets) <= 5
+        # The clock has moved one bucket past the last record.
+        assert collector.snapshot().total_messages == 4
+
+    def test_exited_shards_reaped_without_snapshots(self, clock: FakeClock) -> None:
+        """Test short-lived writer threads do not accumulate shards."""
+        collector = CommunicationCollector(window_seconds=60, bucket_seconds=1, clock=clock)
+        for _ in range(500):
+            thread = threading.Thread(target=collector.record, args=("a", "b"))
+            thread.start()
+            thread.join()
+        assert len(collector._shards) <= 65
+        assert collector.snapshot().total_messages == 500
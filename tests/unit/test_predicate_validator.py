@@ -9,6 +9,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import random
+
 import pytest
 from datetime import datetime, timezone
 
@@ -20,6 +22,7 @@ from holly.goals.predicates import (
     L3PermissionsPredicate,
     L4ConstitutionalPredicate,
     DEFAULT_PREDICATES,
+    PredicateResult,
 )
 from holly.goals.validator import (
     StateGenerator,
@@ -503,3 +506,105 @@ class TestValidationMetrics:
         assert abs(report.precision - (40 / 45)) < 0.01
         assert abs(report.recall - (40 / 45)) < 0.01
         assert report.is_valid is False
+
+    def test_incremental_report_accumulates_counts(self) -> None:
+        """add() merges shard counts and recomputes the metrics."""
+        report = PredicateValidationReport.empty(level=2)
+        assert report.total_states == 0
+        assert report.is_valid is True
+
+        report.add(true_positives=40, false_negatives=5)
+        report.add(true_negatives=50, false_positives=5)
+
+        assert report.total_states == 100
+        assert abs(report.accuracy - 0.90) < 1e-9
+        assert abs(report.precision - 40 / 45) < 1e-9
+        assert abs(report.recall - 40 / 45) < 1e-9
+        assert report.is_valid is False
+
+
+class _AlwaysPasses:
+    """Broken predicate that accepts every state (false positives)."""
+
+    level = 3
+
+    def evaluate(self, state: CelestialState) -> PredicateResult:
+        return PredicateResult(level=3, passed=True, reason="always")
+
+    def is_satisfied(self, state: CelestialState) -> bool:
+        return True
+
+
+class TestReproducibleSharding:
+    """Test per-generator random streams and sharded validation."""
+
+    def test_generator_does_not_touch_global_random(self) -> None:
+        """Seeding a generator leaves the global random module alone."""
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        StateGenerator(random_seed=123).generate_satisfying_states(level=3, count=5)
+        assert random.random() == expected
+
+    def test_spawned_streams_are_reproducible_and_distinct(self) -> None:
+        """Child streams depend only on the parent seed and stream id."""
+        a = StateGenerator(random_seed=1).spawn(5)
+        b = StateGenerator(random_seed=1).spawn(5)
+        c = StateGenerator(random_seed=1).spawn(6)
+        assert a.random_seed == b.random_seed != c.random_seed
+        assert a.rng.random() == b.rng.random()
+
+    def test_start_offsets_give_disjoint_states(self) -> None:
+        """Shards generated with start offsets tile the unsharded range."""
+        gen = StateGenerator(random_seed=3)
+        whole = gen.generate_violating_states(level=4, count=10)
+        parts = gen.generate_violating_states(
+            level=4, count=4
+        ) + gen.generate_violating_states(level=4, count=6, start=4)
+        assert [s.actor_id for s in parts] == [s.actor_id for s in whole]
+        assert [s.action for s in parts] == [s.action for s in whole]
+
+    def test_report_independent_of_shard_size(self) -> None:
+        """A seeded run yields the same report however it is sharded."""
+        reports = [
+            PredicateValidator(
+                StateGenerator(random_seed=11), shard_size=size
+            ).validate_all_levels(DEFAULT_PREDICATES, count_per_level=301)
+            for size in (7, 50, 10_000)
+        ]
+        assert reports[0] == reports[1] == reports[2]
+        assert all(r.total_states == 301 and r.is_valid for r in reports[0].values())
+
+    def test_stop_on_first_failure(self) -> None:
+        """stop_on_failure halts at the first false positive."""
+        validator = PredicateValidator(shard_size=10)
+        report = validator.validate_predicate(
+            _AlwaysPasses(), count=200, stop_on_failure=True
+        )
+        assert report.stopped_early is True
+        assert report.false_positives == 1
+        assert report.total_states < 200
+
+        full = validator.validate_predicate(_AlwaysPasses(), count=200)
+        assert full.stopped_early is False
+        assert full.false_positives == 100
+
+    def test_stop_marks_unevaluated_levels(self) -> None:
+        """Levels skipped after a stop are reported as stopped early."""
+        validator = PredicateValidator(shard_size=10)
+        reports = validator.validate_all_levels(
+            [_AlwaysPasses(), DEFAULT_PREDICATES[4]],
+            count_per_level=200,
+            stop_on_failure=True,
+        )
+        assert reports[3].stopped_early is True
+        assert reports[4].stopped_early is True
+        assert reports[4].total_states == 0
+
+    def test_rejects_invalid_worker_settings(self) -> None:
+        """workers and shard_size must be positive."""
+        with pytest.raises(ValueError):
+            PredicateValidator(workers=0)
+        with pytest.raises(ValueError):
+            PredicateValidator(shard_size=0)
+        assert PredicateValidator(workers=None).workers >= 1
@@ -0,0 +1,255 @@
+"""Unit tests for the durable Redis-backed main lane."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from holly.engine.lanes import (
+    LanePolicy,
+    QueueFullError,
+    Task,
+    TaskEnqueueRequest,
+)
+from holly.engine.redis_lanes import RedisMainLane, task_from_json, task_to_json
+from holly.storage.redis import (
+    QUEUE_DEPTH_LIMIT,
+    LeaseQueueClient,
+    lease_queue_key,
+)
+from holly.storage.redis.memory import InMemoryRedis
+
+
+def _task(key: str = "", **goal: object) -> Task:
+    return Task(
+        task_id=uuid4(),
+        goal=dict(goal),
+        user_id="user-001",
+        tenant_id="tenant-001",
+        idempotency_key=key or str(uuid4()),
+        resource_budget={"cpu": 1},
+        mcp_tools=["search"],
+        context={},
+    )
+
+
+def _lane(redis: InMemoryRedis | None = None, **kwargs: object) -> RedisMainLane:
+    client = LeaseQueueClient(client=redis or InMemoryRedis())
+    return RedisMainLane("tenant-001", client, LanePolicy(max_queue_depth=10), **kwargs)
+
+
+def test_task_json_round_trip() -> None:
+    """Test tasks survive JSON serialisation, including deadlines."""
+    task = _task(n=1)
+    task.deadline = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert task_from_json(task_to_json(task)) == task
+
+
+@pytest.mark.asyncio
+async def test_claim_orders_by_priority_then_fifo() -> None:
+    """Test higher priorities are claimed first, FIFO within a priority."""
+    lane = _lane()
+    for name, priority in [("a", 5), ("b", 5), ("urgent", 9), ("low", 0)]:
+        await lane.enqueue_task(TaskEnqueueRequest(task=_task(name=name), priority=priority))
+
+    leased = await lane.claim(4)
+    assert [lt.task.goal["name"] for lt in leased] == ["urgent", "a", "b", "low"]
+    assert all(lt.attempts == 1 for lt in leased)
+    assert await lane.refresh_depth() == (0, 4)
+
+
+@pytest.mark.asyncio
+async def test_ack_removes_task_for_good() -> None:
+    """Test acked tasks are never redelivered."""
+    lane = _lane(visibility_timeout=0.01)
+    task = _task()
+    await lane.enqueue_task(TaskEnqueueRequest(task=task))
+    [leased] = await lane.claim()
+
+    assert await lane.ack(leased) == 1
+    assert await lane.ack(leased) == 0
+    assert await lane.claim() == []
+    assert await lane.refresh_depth() == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_redelivered() -> None:
+    """Test a task leased by a crashed consumer is redelivered."""
+    redis = InMemoryRedis()
+    crashed = _lane(redis, visibility_timeout=0.01)
+    task = _task()
+    await crashed.enqueue_task(TaskEnqueueRequest(task=task))
+    assert len(await crashed.claim()) == 1
+
+    survivor = _lane(redis)
+    assert await survivor.claim() == []
+    await asyncio.sleep(0.02)
+    [redelivered] = await survivor.claim()
+    assert redelivered.task == task
+    assert redelivered.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_nack_hands_task_back() -> None:
+    """Test nack makes a task claimable again at its original rank."""
+    lane = _lane()
+    first, second = _task(), _task()
+    await lane.enqueue_task(TaskEnqueueRequest(task=first, priority=5))
+    await lane.enqueue_task(TaskEnqueueRequest(task=second, priority=5))
+    [leased] = await lane.claim()
+
+    assert await lane.nack(leased)
+    assert not await lane.nack(leased)
+    assert [lt.task.task_id for lt in await lane.claim(2)] == [
+        first.task_id,
+        second.task_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_depth_limit_counts_leased_tasks() -> None:
+    """Test max_queue_depth covers ready plus leased tasks."""
+    client = LeaseQueueClient(client=InMemoryRedis())
+    lane = RedisMainLane("tenant-001", client, LanePolicy(max_queue_depth=2))
+    await lane.enqueue_task(TaskEnqueueRequest(task=_task()))
+    await lane.enqueue_task(TaskEnqueueRequest(task=_task()))
+    await lane.claim()
+
+    with pytest.raises(QueueFullError):
+        await lane.enqueue_task(TaskEnqueueRequest(task=_task()))
+
+
+@pytest.mark.asyncio
+async def test_idempotent_enqueue_returns_original_id() -> None:
+    """Test resubmitting an idempotency key returns the first task_id."""
+    lane = _lane()
+    first = _task("same")
+    assert await lane.enqueue_task(TaskEnqueueRequest(task=first)) == first.task_id
+    assert await lane.enqueue_task(TaskEnqueueRequest(task=_task("same"))) == first.task_id
+    assert len(await lane.claim(5)) == 1
+
+
+@pytest.mark.asyncio
+async def test_dequeue_next_task_waits_for_work() -> None:
+    """Test the blocking dequeue polls until a task arrives."""
+    lane = _lane(poll_interval=0.005)
+    waiter = asyncio.create_task(lane.dequeue_next_task())
+    await asyncio.sleep(0.01)
+    task = _task()
+    await lane.enqueue_task(TaskEnqueueRequest(task=task))
+    assert await asyncio.wait_for(waiter, timeout=1.0) == task
+
+
+@pytest.mark.asyncio
+async def test_lease_scripts_are_one_round_trip() -> None:
+    """Test claim of a batch costs a single Redis command."""
+    redis = InMemoryRedis()
+    lane = _lane(redis)
+    for _ in range(5):
+        await lane.enqueue_task(TaskEnqueueRequest(task=_task()))
+    before = redis.commands
+    assert len(await lane.claim(5)) == 5
+    assert redis.commands - before == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_client_keeps_each_lane_limit() -> None:
+    """Test lanes sharing a client enforce their own max_queue_depth."""
+    client = LeaseQueueClient(client=InMemoryRedis())
+    small = RedisMainLane("tenant-a", client, LanePolicy(max_queue_depth=1))
+    large = RedisMainLane("tenant-b", client, LanePolicy(max_queue_depth=3))
+
+    await small.enqueue_task(TaskEnqueueRequest(task=_task()))
+    for _ in range(3):
+        await large.enqueue_task(TaskEnqueueRequest(task=_task()))
+    with pytest.raises(QueueFullError):
+        await small.enqueue_task(TaskEnqueueRequest(task=_task()))
+    with pytest.raises(QueueFullError):
+        await large.enqueue_task(TaskEnqueueRequest(task=_task()))
+    assert client.depth_limit == QUEUE_DEPTH_LIMIT
+
+
+@pytest.mark.asyncio
+async def test_already_queued_task_is_not_counted_twice() -> None:
+    """Test a push Redis rejects as a duplicate leaves the ready count alone."""
+    redis = InMemoryRedis()
+    task = _task()
+    await _lane(redis).enqueue_task(TaskEnqueueRequest(task=task))
+
+    restarted = _lane(redis)  # fresh idempotency cache, same Redis queue
+    assert await restarted.enqueue_task(TaskEnqueueRequest(task=task)) == task.task_id
+    assert restarted.get_queue_size() == 0
+    assert await restarted.refresh_depth() == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_lease_script_keys_share_a_cluster_hash_tag() -> None:
+    """Test every key a lease script touches carries the tenant hash tag."""
+
+    class RecordingRedis(InMemoryRedis):
+        def __init__(self) -> None:
+            super().__init__()
+            self.script_keys: list[str] = []
+
+        async def eval(self, script, numkeys, *keys_and_args):
+            self.script_keys.extend(str(k) for k in keys_and_args[:numkeys])
+            return await super().eval(script, numkeys, *keys_and_args)
+
+    redis = RecordingRedis()
+    lane = _lane(redis)
+    await lane.enqueue_task(TaskEnqueueRequest(task=_task()))
+    [leased] = await lane.claim()
+    await lane.nack(leased)
+    await lane.ack(leased)
+
+    assert len(redis.script_keys) == 16
+    assert all("{tenant-001}" in key for key in redis.script_keys)
+    assert lease_queue_key("tenant-001", "main_queue") == "main_queue_{tenant-001}"
+
+
+@pytest.mark.asyncio
+async def test_expired_consumer_cannot_settle_redelivered_task() -> None:
+    """Test ack and nack with a stale lease leave the new holder's claim alone."""
+    redis = InMemoryRedis()
+    stale = _lane(redis, visibility_timeout=0.01)
+    await stale.enqueue_task(TaskEnqueueRequest(task=_task()))
+    [expired] = await stale.claim()
+    await asyncio.sleep(0.02)
+    holder = _lane(redis)
+    [current] = await holder.claim()
+
+    assert not await stale.nack(expired)
+    assert await stale.ack(expired) == 0
+    assert await holder.refresh_depth() == (0, 1)
+    assert await holder.ack(current) == 1
+    assert await holder.refresh_depth() == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_is_full_uses_fresh_depth() -> None:
+    """Test is_full sees tasks pushed by another lane on the same queue."""
+    redis = InMemoryRedis()
+    client = LeaseQueueClient(client=redis)
+    policy = LanePolicy(max_queue_depth=2)
+    observer = RedisMainLane("tenant-001", client, policy)
+    producer = RedisMainLane("tenant-001", client, policy)
+    await producer.enqueue_task(TaskEnqueueRequest(task=_task()))
+    await producer.enqueue_task(TaskEnqueueRequest(task=_task()))
+
+    assert observer.get_queue_size() == 0
+    assert await observer.is_full()
+    await producer.claim()
+    assert await observer.is_full()  # leased tasks still count
+
+
+@pytest.mark.asyncio
+async def test_dequeue_removes_task() -> None:
+    """Test the Lane dequeue methods ack what they claim."""
+    lane = _lane(visibility_timeout=0.01)
+    await lane.enqueue_task(TaskEnqueueRequest(task=_task()))
+    await lane.dequeue_many(1)
+    await asyncio.sleep(0.02)
+
+    assert await lane.claim() == []
+    assert await lane.refresh_depth() == (0, 0)
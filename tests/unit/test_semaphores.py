@@ -0,0 +1,153 @@
+"""Unit tests for holly.engine.semaphores module."""
+
+import asyncio
+
+import pytest
+
+from holly.engine.semaphores import KeyedSemaphores, PrioritySemaphore
+
+
+async def _holder(sem: PrioritySemaphore, log: list[str], name: str, **kwargs) -> None:
+    await sem.acquire(**kwargs)
+    log.append(name)
+
+
+def test_rejects_invalid_limit() -> None:
+    """Test limits must be at least one."""
+    with pytest.raises(ValueError):
+        PrioritySemaphore(0)
+    sem = PrioritySemaphore(1)
+    with pytest.raises(ValueError):
+        sem.limit = 0
+    with pytest.raises(ValueError):
+        KeyedSemaphores(1).set_limit("tool", "tenant", 0)
+
+
+async def test_acquire_within_limit_does_not_wait() -> None:
+    """Test acquisitions below the limit succeed immediately."""
+    sem = PrioritySemaphore(2)
+    await sem.acquire()
+    await sem.acquire()
+    assert sem.active == 2
+    assert sem.locked()
+    sem.release()
+    assert sem.active == 1
+    assert sem.stats.acquired == 2
+    assert sem.stats.waited == 0
+
+
+async def test_waiters_are_fifo_within_priority() -> None:
+    """Test equal-priority waiters are served in arrival order."""
+    sem = PrioritySemaphore(1)
+    await sem.acquire()
+    log: list[str] = []
+    tasks = [asyncio.create_task(_holder(sem, log, str(i))) for i in range(3)]
+    await asyncio.sleep(0)
+    assert sem.queue_depth == 3
+
+    for _ in range(3):
+        sem.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    assert log == ["0", "1", "2"]
+    assert sem.active == 1
+    assert sem.stats.waited == 3
+    assert sem.stats.max_queue_depth == 3
+
+
+async def test_higher_priority_served_first() -> None:
+    """Test a later high-priority waiter overtakes earlier low-priority ones."""
+    sem = PrioritySemaphore(1)
+    await sem.acquire()
+    log: list[str] = []
+    low = asyncio.create_task(_holder(sem, log, "low", priority=0))
+    await asyncio.sleep(0)
+    high = asyncio.create_task(_holder(sem, log, "high", priority=5))
+    await asyncio.sleep(0)
+
+    sem.release()
+    await asyncio.sleep(0)
+    sem.release()
+    await asyncio.gather(low, high)
+    assert log == ["high", "low"]
+
+
+async def test_released_slot_is_not_stolen_by_newcomer() -> None:
+    """Test a slot freed for a waiter cannot be taken by a new arrival."""
+    sem = PrioritySemaphore(1)
+    await sem.acquire()
+    log: list[str] = []
+    waiter = asyncio.create_task(_holder(sem, log, "waiter"))
+    await asyncio.sleep(0)
+    sem.release()
+    newcomer = asyncio.create_task(_holder(sem, log, "newcomer"))
+    await asyncio.sleep(0)
+    await waiter
+    assert log == ["waiter"]
+    sem.release()
+    await newcomer
+    assert log == ["waiter", "newcomer"]
+
+
+async def test_timeout_rejects_and_leaves_queue() -> None:
+    """Test a waiter gives up at its deadline and stops counting as queued."""
+    sem = PrioritySemaphore(1)
+    await sem.acquire()
+    with pytest.raises(TimeoutError):
+        await sem.acquire(timeout=0.01)
+    with pytest.raises(TimeoutError):
+        await sem.acquire(timeout=0)
+    assert sem.queue_depth == 0
+    assert sem.stats.rejected == 2
+    sem.release()
+    assert sem.active == 0
+
+
+async def test_cancelled_waiter_does_not_leak_slot() -> None:
+    """Test cancelling a queued acquire leaves the slot count intact."""
+    sem = PrioritySemaphore(1)
+    await sem.acquire()
+    task = asyncio.create_task(sem.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert sem.queue_depth == 0
+    sem.release()
+    assert sem.active == 0
+    assert not sem.locked()
+
+
+async def test_raising_limit_admits_waiters() -> None:
+    """Test growing the limit grants queued waiters immediately."""
+    sem = PrioritySemaphore(1)
+    await sem.acquire()
+    log: list[str] = []
+    tasks = [asyncio.create_task(_holder(sem, log, str(i))) for i in range(2)]
+    await asyncio.sleep(0)
+    sem.limit = 3
+    await asyncio.gather(*tasks)
+    assert sem.active == 3
+
+    sem.limit = 1
+    sem.release()
+    sem.release()
+    assert sem.active == 1
+
+
+def test_keyed_semaphores_are_lazy_and_sharded() -> None:
+    """Test semaphores are created per (shard, key) with configured limits."""
+    keyed = KeyedSemaphores(default_limit=4)
+    keyed.set_limit("tool-a", "tenant-1", 2)
+    assert keyed.peek("tool-a", "tenant-1") is None
+
+    sem = keyed.get("tool-a", "tenant-1")
+    assert sem.limit == 2
+    assert keyed.get("tool-a", "tenant-1") is sem
+    assert keyed.get("tool-b", "tenant-1").limit == 4
+    assert keyed.get("tool-b", "tenant-1") is not sem
+
+    keyed.set_limit("tool-a", "tenant-1", 5)
+    assert sem.limit == 5
+    assert [k for k, _ in keyed.shard("tool-a")] == ["tenant-1"]
+    assert list(keyed.shard("missing")) == []
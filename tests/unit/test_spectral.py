@@ -0,0 +1,119 @@
+"""Unit tests for holly.agents.spectral — sparse matrices and top-k spectra."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from holly.agents.spectral import SparseCommunicationMatrix, top_singular_values
+
+
+def _random_team(n: int, degree: int = 6, seed: int = 0) -> SparseCommunicationMatrix:
+    rng = np.random.default_rng(seed)
+    m = n * degree
+    return SparseCommunicationMatrix(
+        n, rng.integers(0, n, m), rng.integers(0, n, m), rng.lognormal(0.0, 1.0, m)
+    )
+
+
+def _dense_top(matrix: SparseCommunicationMatrix, k: int) -> np.ndarray:
+    return np.linalg.svd(matrix.to_dense(), compute_uv=False)[:k]
+
+
+# ──────────────────────────────────────────────────────────
+# § SparseCommunicationMatrix
+# ──────────────────────────────────────────────────────────
+
+
+class TestSparseCommunicationMatrix:
+    """Test construction and products."""
+
+    def test_duplicates_summed_and_zeros_dropped(self) -> None:
+        """Test entries are canonicalised on construction."""
+        m = SparseCommunicationMatrix.from_edges(
+            3, [(0, 1, 1.0), (2, 0, 4.0), (0, 1, 2.0), (1, 2, 0.0)]
+        )
+        assert m.nnz == 2
+        np.testing.assert_array_equal(
+            m.to_dense(), [[0.0, 3.0, 0.0], [0.0, 0.0, 0.0], [4.0, 0.0, 0.0]]
+        )
+
+    def test_rejects_invalid_input(self) -> None:
+        """Test out-of-range coordinates and non-square arrays are rejected."""
+        with pytest.raises(ValueError):
+            SparseCommunicationMatrix.from_edges(2, [(0, 2, 1.0)])
+        with pytest.raises(ValueError):
+            SparseCommunicationMatrix(-1, np.empty(0), np.empty(0), np.empty(0))
+        with pytest.raises(ValueError):
+            SparseCommunicationMatrix.from_dense(np.zeros((2, 3)))
+
+    def test_products_match_dense(self) -> None:
+        """Test matmat/rmatmat agree with dense products for vectors and blocks."""
+        m = _random_team(40)
+        dense = m.to_dense()
+        x = np.random.default_rng(1).standard_normal((40, 5))
+        np.testing.assert_allclose(m.matmat(x), dense @ x, atol=1e-12)
+        np.testing.assert_allclose(m.rmatmat(x), dense.T @ x, atol=1e-12)
+        np.testing.assert_allclose(m.matmat(x[:, 0]), dense @ x[:, 0], atol=1e-12)
+
+    def test_resized_and_scaled(self) -> None:
+        """Test zero-padding and scaling keep the entries."""
+        m = SparseCommunicationMatrix.from_dense(np.array([[0.0, 2.0], [1.0, 0.0]]))
+        padded = m.resized(4).scaled(0.5)
+        assert padded.shape == (4, 4)
+        np.testing.assert_array_equal(padded.to_dense()[:2, :2], [[0.0, 1.0], [0.5, 0.0]])
+        assert m.scaled(0.0).nnz == 0
+        with pytest.raises(ValueError):
+            m.resized(1)
+
+
+# ──────────────────────────────────────────────────────────
+# § top_singular_values
+# ──────────────────────────────────────────────────────────
+
+
+class TestTopSingularValues:
+    """Test block Lanczos against dense SVD."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_dense_on_random_directed_team(self, seed: int) -> None:
+        """Test the Krylov path agrees with dense SVD."""
+        m = _random_team(600, seed=seed)
+        result = top_singular_values(m, 16, dense_cutoff=0)
+        np.testing.assert_allclose(result, _dense_top(m, 16), rtol=1e-7)
+
+    def test_repeated_singular_values(self) -> None:
+        """Test multiplicities beyond one are found (many equal-rate pairs)."""
+        n = 400
+        rows = np.arange(n)
+        m = SparseCommunicationMatrix(n, rows, rows ^ 1, np.ones(n))
+        np.testing.assert_allclose(top_singular_values(m, 20, dense_cutoff=0), np.ones(20))
+
+    def test_low_rank_star(self) -> None:
+        """Test a rank-1 lead-to-workers pattern."""
+        n = 300
+        m = SparseCommunicationMatrix(
+            n, np.zeros(n - 1), np.arange(1, n), np.full(n - 1, 2.0)
+        )
+        result = top_singular_values(m, 8, dense_cutoff=0)
+        assert result[0] == pytest.approx(2.0 * np.sqrt(n - 1))
+        np.testing.assert_allclose(result[1:], 0.0, atol=1e-9)
+
+    def test_directed_matrix_uses_both_triangles(self) -> None:
+        """Test a strictly lower-triangular pattern is not read as symmetric."""
+        m = SparseCommunicationMatrix.from_dense(np.array([[0.0, 0.0], [10.0, 0.0]]))
+        np.testing.assert_allclose(top_singular_values(m, 2), [10.0, 0.0])
+
+    def test_edge_cases(self) -> None:
+        """Test empty matrices, k > n and invalid k."""
+        empty = SparseCommunicationMatrix.from_edges(5, [])
+        np.testing.assert_array_equal(top_singular_values(empty, 3), np.zeros(3))
+        assert len(top_singular_values(_random_team(4), 10)) == 4
+        with pytest.raises(ValueError):
+            top_singular_values(_random_team(4), 0)
+
+    def test_deterministic(self) -> None:
+        """Test repeated runs give identical values."""
+        m = _random_team(700)
+        first = top_singular_values(m, 8, dense_cutoff=0)
+        np.testing.assert_array_equal(first, top_singular_values(m, 8, dense_cutoff=0))
@@ -0,0 +1,296 @@
+"""Unit tests for holly.engine.subagent_pool module."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from holly.engine.lanes import (
+    PROBABLE_DUPLICATE_ID,
+    LaneManager,
+    LanePolicy,
+    LaneType,
+    SubagentSpawnRequest,
+    SubagentTask,
+)
+from holly.engine.subagent_pool import SubagentPool
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def manager() -> LaneManager:
+    """Create a lane manager allowing two concurrent subagents per tenant."""
+    return LaneManager(LanePolicy(max_queue_depth=1000, max_concurrency=2))
+
+
+def _spawn(
+    tenant_id: str = "tenant-1",
+    label: str = "",
+    *,
+    priority: int = 5,
+    deadline: datetime | None = None,
+) -> SubagentSpawnRequest:
+    return SubagentSpawnRequest(
+        subagent_task=SubagentTask(
+            agent_binding={"label": label},
+            goals=[],
+            parent_execution_id=uuid4(),
+            user_id="user",
+            tenant_id=tenant_id,
+            message_queue="mq",
+            deadline=deadline,
+        ),
+        priority=priority,
+    )
+
+
+class Gate:
+    """Runner that blocks every run until released, tracking concurrency."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+        self.started: list[str] = []
+
+    async def __call__(self, task, ctx) -> None:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.started.append(task.agent_binding["label"])
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_rejects_invalid_configuration(manager: LaneManager) -> None:
+    """Test workers and task_timeout must be positive."""
+    with pytest.raises(ValueError):
+        SubagentPool(manager, Gate(), workers=0)
+    with pytest.raises(ValueError):
+        SubagentPool(manager, Gate(), task_timeout=0)
+    assert SubagentPool(manager, Gate()).workers == 2
+
+
+async def test_runs_spawned_tasks(manager: LaneManager) -> None:
+    """Test every spawned task runs once and the lane drains."""
+    seen: list[str] = []
+
+    async def runner(task, ctx) -> None:
+        seen.append(task.agent_binding["label"])
+
+    pool = SubagentPool(manager, runner)
+    await pool.start()
+    for i in range(5):
+        await pool.spawn(_spawn(label=str(i)))
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert sorted(seen) == [str(i) for i in range(5)]
+    assert pool.stats.completed == 5
+    lane = manager.get_lane("tenant-1", LaneType.SUBAGENT)
+    assert lane.active_executions == {}
+    assert lane.concurrent_count == 0
+
+
+async def test_probable_duplicate_is_not_tracked(manager: LaneManager) -> None:
+    """Test an approximate-mode dedupe hit is neither tracked nor run."""
+    seen: list[str] = []
+
+    async def runner(task, ctx) -> None:
+        seen.append(task.agent_binding["label"])
+
+    manager.idempotency_cache.set_approximate("tenant-1", True)
+    pool = SubagentPool(manager, runner)
+    first, resubmit = _spawn(label="a"), _spawn(label="a")
+    first.idempotency_key = resubmit.idempotency_key = "once"
+    await pool.start()
+    assert await pool.spawn(first) == first.subagent_task.subagent_execution_id
+    assert await pool.spawn(resubmit) == PROBABLE_DUPLICATE_ID
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert seen == ["a"]
+    assert pool.stats.completed == 1
+
+async def test_concurrency_counts_only_running_tasks(manager: LaneManager) -> None:
+    """Test a tenant runs at most max_concurrency tasks; the rest stay queued."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate, workers=4)
+    await pool.start()
+    for i in range(5):
+        await pool.spawn(_spawn(label=str(i)))
+    await asyncio.sleep(0.01)
+
+    lane = manager.get_lane("tenant-1", LaneType.SUBAGENT)
+    assert gate.running == 2
+    assert lane.concurrent_count == 2
+    assert lane.get_queue_size() == 3
+    assert len(lane.active_executions) == 5
+
+    gate.release.set()
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+    assert gate.peak == 2
+    assert lane.concurrent_count == 0
+
+
+async def test_idle_workers_steal_from_busy_tenant(manager: LaneManager) -> None:
+    """Test workers homed on an idle tenant run another tenant's backlog."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate, workers=2)
+    await pool.start()
+    await pool.spawn(_spawn("quiet"))
+    await pool.spawn(_spawn("busy"))
+    gate.release.set()
+    await asyncio.wait_for(pool.join(), 1.0)
+    gate.release.clear()
+
+    for i in range(2):
+        await pool.spawn(_spawn("busy", label=str(i)))
+    await asyncio.sleep(0.01)
+    assert gate.running == 2
+    assert pool.stats.stolen >= 1
+
+    gate.release.set()
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+
+async def test_without_stealing_workers_stay_home(manager: LaneManager) -> None:
+    """Test steal=False leaves other tenants' tasks to their home workers."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate, workers=2, steal=False)
+    await pool.start()
+    await pool.spawn(_spawn("quiet"))
+    await pool.spawn(_spawn("busy"))
+    gate.release.set()
+    await asyncio.wait_for(pool.join(), 1.0)
+    gate.release.clear()
+
+    for i in range(2):
+        await pool.spawn(_spawn("busy", label=str(i)))
+    await asyncio.sleep(0.01)
+    assert gate.running == 1
+    assert pool.stats.stolen == 0
+
+    gate.release.set()
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+
+async def test_task_timeout(manager: LaneManager) -> None:
+    """Test runs exceeding task_timeout are stopped and counted."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate, task_timeout=0.01)
+    await pool.start()
+    await pool.spawn(_spawn())
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert pool.stats.timed_out == 1
+    assert gate.running == 0
+
+
+async def test_deadline_bounds_run(manager: LaneManager) -> None:
+    """Test the task deadline caps the run even without task_timeout."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate)
+    await pool.start()
+    deadline = datetime.now(timezone.utc) + timedelta(milliseconds=20)
+    await pool.spawn(_spawn(deadline=deadline))
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert pool.stats.timed_out == 1
+
+
+async def test_failures_are_counted(manager: LaneManager) -> None:
+    """Test a raising runner does not kill its worker."""
+
+    async def runner(task, ctx) -> None:
+        if task.agent_binding["label"] == "bad":
+            raise RuntimeError("boom")
+
+    pool = SubagentPool(manager, runner, workers=1)
+    await pool.start()
+    await pool.spawn(_spawn(label="bad"))
+    await pool.spawn(_spawn(label="good"))
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert pool.stats.failed == 1
+    assert pool.stats.completed == 1
+
+
+async def test_cancel_propagates_to_children(manager: LaneManager) -> None:
+    """Test cancelling a parent cancels running and queued descendants."""
+    gate = Gate()
+    children: list = []
+
+    async def runner(task, ctx) -> None:
+        if task.agent_binding["label"] == "parent":
+            for i in range(3):
+                children.append(await ctx.spawn(_spawn(label=f"child-{i}")))
+        await gate(task, ctx)
+
+    pool = SubagentPool(manager, runner)
+    await pool.start()
+    parent = await pool.spawn(_spawn(label="parent"))
+    await asyncio.sleep(0.01)
+    # Parent plus one child run; two children wait in the queue.
+    assert gate.running == 2
+
+    assert pool.cancel(parent) == 4
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert pool.stats.cancelled == 4
+    assert pool.stats.completed == 0
+    assert gate.started == ["parent", "child-0"]
+    assert pool._children == {}
+    assert pool._cancelled == set()
+
+
+async def test_cancel_queued_task_skips_it(manager: LaneManager) -> None:
+    """Test a cancelled queued task is discarded without running."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate, workers=1)
+    await pool.start()
+    await pool.spawn(_spawn(label="first"))
+    queued = await pool.spawn(_spawn(label="second"))
+    await asyncio.sleep(0.01)
+
+    assert pool.cancel(queued) == 1
+    assert pool.cancel(uuid4()) == 0
+    gate.release.set()
+    await asyncio.wait_for(pool.join(), 1.0)
+    await pool.stop()
+
+    assert gate.started == ["first"]
+    assert pool.stats.cancelled == 1
+
+
+async def test_stop_cancels_running_tasks(manager: LaneManager) -> None:
+    """Test stop() cancels in-flight runs and frees lane slots."""
+    gate = Gate()
+    pool = SubagentPool(manager, gate)
+    await pool.start()
+    await pool.spawn(_spawn())
+    await asyncio.sleep(0.01)
+    assert pool.running_count == 1
+
+    await pool.stop()
+    lane = manager.get_lane("tenant-1", LaneType.SUBAGENT)
+    assert pool.running_count == 0
+    assert gate.running == 0
+    assert lane.concurrent_count == 0
@@ -0,0 +1,150 @@
+"""Unit tests for holly.engine.tool_cache module."""
+
+import asyncio
+
+import pytest
+
+from holly.engine.tool_cache import ToolResultCache, canonical_input_hash
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class CountingLoader:
+    """Loader returning a fixed value and counting calls."""
+
+    def __init__(self, value: object = "v", delay: float = 0.0) -> None:
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+def test_canonical_input_hash_ignores_key_order() -> None:
+    """Test logically equal inputs hash equally and different ones do not."""
+    a = canonical_input_hash({"x": 1, "y": {"b": 2, "a": [1, 2]}})
+    b = canonical_input_hash({"y": {"a": [1, 2], "b": 2}, "x": 1})
+    assert a == b
+    assert canonical_input_hash({"x": 2}) != canonical_input_hash({"x": 1})
+    assert canonical_input_hash({"when": object}) == canonical_input_hash({"when": object})
+
+
+def test_rejects_invalid_capacity() -> None:
+    """Test the per-tenant capacity must be positive."""
+    with pytest.raises(ValueError):
+        ToolResultCache(0)
+
+
+async def test_hit_after_load_until_ttl(clock: FakeClock) -> None:
+    """Test a loaded value is served until its TTL elapses."""
+    cache = ToolResultCache(clock=clock)
+    loader = CountingLoader()
+
+    assert await cache.get_or_load("t1", "tool", "h", 10.0, loader) == ("v", False)
+    assert await cache.get_or_load("t1", "tool", "h", 10.0, loader) == ("v", True)
+    clock.now += 10.0
+    assert await cache.get_or_load("t1", "tool", "h", 10.0, loader) == ("v", False)
+
+    assert loader.calls == 2
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+    assert cache.stats.expirations == 1
+
+
+async def test_concurrent_misses_share_one_load() -> None:
+    """Test single-flight: concurrent callers trigger one loader run."""
+    cache = ToolResultCache()
+    loader = CountingLoader(delay=0.01)
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("t1", "tool", "h", 10.0, loader) for _ in range(5))
+    )
+    assert loader.calls == 1
+    assert [r[0] for r in results] == ["v"] * 5
+    assert sorted(r[1] for r in results) == [False, True, True, True, True]
+    assert cache.stats.coalesced == 4
+
+
+async def test_failed_load_propagates_and_is_not_cached() -> None:
+    """Test loader errors reach every coalesced caller and are not stored."""
+    cache = ToolResultCache()
+    calls = 0
+
+    async def failing() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("t1", "tool", "h", 10.0, failing) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(cache) == 0
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("t1", "tool", "h", 10.0, failing)
+    assert calls == 2
+
+
+async def test_cancelled_loader_hands_over_to_waiter() -> None:
+    """Test a waiter retries (and loads) when the loading caller is cancelled."""
+    cache = ToolResultCache()
+    loader = CountingLoader(delay=0.01)
+
+    first = asyncio.create_task(cache.get_or_load("t1", "tool", "h", 10.0, loader))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_or_load("t1", "tool", "h", 10.0, loader))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == ("v", False)
+    assert loader.calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_lru_is_partitioned_by_tenant() -> None:
+    """Test each tenant evicts only its own least recently used entries."""
+    cache = ToolResultCache(max_entries_per_tenant=2)
+    for key in ("a", "b"):
+        await cache.get_or_load("t1", "tool", key, 10.0, CountingLoader(key))
+    await cache.get_or_load("t2", "tool", "a", 10.0, CountingLoader("a"))
+    assert cache.lookup("t1", "tool", "a") == (True, "a")  # refresh "a"
+    await cache.get_or_load("t1", "tool", "c", 10.0, CountingLoader("c"))
+
+    assert cache.lookup("t1", "tool", "b") == (False, None)
+    assert cache.lookup("t1", "tool", "a") == (True, "a")
+    assert cache.lookup("t2", "tool", "a") == (True, "a")
+    assert cache.stats.evictions == 1
+
+
+async def test_invalidate_by_tool_and_tenant() -> None:
+    """Test invalidation scoped by tool, tenant, or everything."""
+    cache = ToolResultCache()
+    for tenant in ("t1", "t2"):
+        for tool in ("x", "y"):
+            cache.store(tenant, tool, "h", 1, 10.0)
+
+    assert cache.invalidate(tool_name="x", tenant_id="t1") == 1
+    assert cache.invalidate(tool_name="x") == 1
+    assert cache.invalidate(tenant_id="t2") == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
@@ -17,6 +17,7 @@ import unittest
 
 import numpy as np
 
+from holly.agents.spectral import SparseCommunicationMatrix
 from holly.agents.topology_manager import (
     Agent,
     AgentCapability,
@@ -416,6 +417,122 @@ class TestEigenspectrumAnalysis(unittest.TestCase):
         self.assertEqual(analysis.divergence, 0.0)
         self.assertFalse(analysis.is_divergent)
 
+    @staticmethod
+    def _contract(agent_id: str, peer: str, rate: float) -> AgentContract:
+        return AgentContract(
+            agent_id=agent_id,
+            peer_agent_id=peer,
+            expected_message_rate=rate,
+            responsibility_domain=frozenset(),
+            max_response_time_sec=5.0,
+            escalation_threshold=3,
+        )
+
+    @staticmethod
+    def _agent(agent_id: str, contracts: frozenset[AgentContract] = frozenset()) -> Agent:
+        perms = AgentPermissions(
+            agent_id=agent_id,
+            can_spawn=False,
+            can_steer=False,
+            can_dissolve=False,
+            capability_level=AgentCapability.STANDARD,
+            max_concurrent_tasks=5,
+            allowed_domains=frozenset(),
+        )
+        return Agent(agent_id=agent_id, permissions=perms, contracts=contracts)
+
+    @staticmethod
+    def _metrics(counts: np.ndarray | SparseCommunicationMatrix) -> CommunicationMetrics:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return CommunicationMetrics(
+            window_start=now - datetime.timedelta(seconds=10),
+            window_end=now,
+            message_counts=counts,
+            total_messages=0,
+        )
+
+    def test_directed_pattern_uses_singular_values(self) -> None:
+        """Test one-way traffic is not mirrored into a symmetric matrix."""
+        topo = TeamTopology(topology_id="topo-1")
+        topo.add_agent(self._agent("agent-1"))
+        topo.add_agent(self._agent("agent-2"))
+
+        analysis = compute_eigenspectrum_divergence(
+            topo, self._metrics(np.array([[0.0, 0.0], [100.0, 0.0]]))
+        )
+        np.testing.assert_allclose(analysis.actual_eigenvalues, [10.0, 0.0])
+        self.assertAlmostEqual(analysis.divergence, 10.0)
+
+    def test_symmetric_pattern_matches_absolute_eigenvalues(self) -> None:
+        """Test undirected teams keep the |eigenvalue| spectrum."""
+        rng = np.random.default_rng(3)
+        upper = np.triu(rng.random((6, 6)), 1)
+        rates = upper + upper.T
+        topo = TeamTopology(topology_id="topo-1")
+
+        analysis = compute_eigenspectrum_divergence(topo, self._metrics(rates * 10))
+        expected = np.sort(np.abs(np.linalg.eigvalsh(rates)))[::-1]
+        np.testing.assert_allclose(analysis.actual_eigenvalues, expected)
+
+    def test_sparse_and_dense_metrics_agree(self) -> None:
+        """Test sparse message counts give the same analysis as dense ones."""
+        topo = TeamTopology(topology_id="topo-1")
+        topo.add_agent(self._agent("a", frozenset([self._contract("a", "b", 1.0)])))
+        topo.add_agent(self._agent("b"))
+        counts = np.array([[0.0, 12.0, 0.0], [3.0, 0.0, 5.0], [0.0, 0.0, 0.0]])
+
+        dense = compute_eigenspectrum_divergence(topo, self._metrics(counts))
+        sparse = compute_eigenspectrum_divergence(
+            topo, self._metrics(SparseCommunicationMatrix.from_dense(counts))
+        )
+        self.assertEqual(len(dense.actual_eigenvalues), 3)
+        np.testing.assert_allclose(dense.actual_eigenvalues, sparse.actual_eigenvalues)
+        self.assertAlmostEqual(dense.divergence, sparse.divergence)
+
+    def test_large_team_compares_top_k(self) -> None:
+        """Test spectra are truncated to top_k for teams larger than k."""
+        topo = TeamTopology(topology_id="topo-1")
+        counts = np.diag(np.arange(50, 0, -1.0)) * 10
+        analysis = compute_eigenspectrum_divergence(topo, self._metrics(counts), top_k=5)
+        np.testing.assert_allclose(analysis.actual_eigenvalues, [50, 49, 48, 47, 46])
+        self.assertEqual(len(analysis.expected_eigenvalues), 5)
+
+    def test_expected_spectrum_cached_until_topology_changes(self) -> None:
+        """Test the expected spectrum is reused and invalidated on change."""
+        topo = TeamTopology(topology_id="topo-1")
+        topo.add_agent(self._agent("a", frozenset([self._contract("a", "b", 2.0)])))
+        topo.add_agent(self._agent("b"))
+
+        first = topo.expected_spectrum(4)
+        self.assertIs(topo.expected_spectrum(4), first)
+        self.assertFalse(first.flags.writeable)
+        np.testing.assert_allclose(first, [2.0, 0.0])
+
+        topo.get_expected_communication_matrix()
+        self.assertIs(topo.expected_spectrum(4), first)
+
+        topo.communication_matrix = np.array([[0.0, 3.0], [0.0, 0.0]])
+        np.testing.assert_allclose(topo.expected_spectrum(4), [3.0, 0.0])
+
+        topo.communication_matrix = None
+        topo.add_agent(self._agent("c", frozenset([self._contract("c", "a", 5.0)])))
+        np.testing.assert_allclose(topo.expected_spectrum(4), [5.0, 2.0, 0.0])
+
+    def test_expected_sparse_matrix_matches_dense(self) -> None:
+        """Test the sparse expected matrix has the dense matrix's entries."""
+        topo = TeamTopology(topology_id="topo-1")
+        topo.add_agent(self._agent("b", frozenset([self._contract("b", "a", 1.5)])))
+        topo.add_agent(
+            self._agent(
+                "a",
+                frozenset([self._contract("a", "b", 2.5), self._contract("a", "ghost", 9.0)]),
+            )
+        )
+        sparse = topo.get_expected_sparse_matrix()
+        np.testing.assert_array_equal(
+            sparse.to_dense(), topo.get_expected_communication_matrix()
+        )
+
 
 class TestTopologyManager(unittest.TestCase):
     """Test TopologyManager spawn/steer/dissolve operations."""
@@ -690,6 +807,166 @@ class TestTopologyManager(unittest.TestCase):
         self.assertIn(topo2, active)
 
 
+class TestTopologyVersions(unittest.TestCase):
+    """Test structural sharing between steered versions and retention."""
+
+    _contract = staticmethod(TestEigenspectrumAnalysis._contract)
+    _agent = staticmethod(TestEigenspectrumAnalysis._agent)
+
+    def _spawn(self, manager: TopologyManager, n: int) -> TeamTopology:
+        """Spawn a ring of ``n`` agents, each contracted to the next."""
+        ids = [f"agent-{i:03d}" for i in range(n)]
+        configs = [
+            (
+                agent_id,
+                self._agent(agent_id).permissions,
+                frozenset([self._contract(agent_id, ids[(i + 1) % n], 1.0 + i)]),
+            )
+            for i, agent_id in enumerate(ids)
+        ]
+        return manager.spawn(
+            SpawnSpec(parent_agent_id=None, agent_configs=configs, initial_goals=frozenset())
+        )
+
+    @staticmethod
+    def _rebuilt(topo: TeamTopology) -> np.ndarray:
+        """Expected matrix built from scratch from ``topo``'s agents."""
+        fresh = TeamTopology(topology_id="fresh", agents=dict(topo.agents))
+        return fresh.get_expected_sparse_matrix().to_dense()
+
+    def test_steer_shares_unchanged_agents(self) -> None:
+        """Test only agents with new contracts are rebuilt."""
+        manager = TopologyManager()
+        topo1 = self._spawn(manager, 5)
+        update = self._contract("agent-001", "agent-004", 7.0)
+        topo2 = manager.steer(
+            SteerSpec(
+                topology_id=topo1.topology_id,
+                agent_reassignments={},
+                new_contracts=frozenset([update]),
+            )
+        )
+
+        for agent_id in ("agent-000", "agent-002", "agent-003", "agent-004"):
+            self.assertIs(topo2.agents[agent_id], topo1.agents[agent_id])
+        changed = topo2.agents["agent-001"]
+        self.assertIsNot(changed, topo1.agents["agent-001"])
+        self.assertEqual(changed.created_at, topo1.agents["agent-001"].created_at)
+        self.assertEqual(
+            {c.peer_agent_id for c in changed.contracts}, {"agent-002", "agent-004"}
+        )
+
+    def test_replacement_contract_overrides_same_peer(self) -> None:
+        """Test a new contract replaces the old one with the same peer."""
+        manager = TopologyManager()
+        topo1 = self._spawn(manager, 3)
+        update = self._contract("agent-000", "agent-001", 9.0)
+        topo2 = manager.steer(
+            SteerSpec(
+                topology_id=topo1.topology_id,
+                agent_reassignments={},
+                new_contracts=frozenset([update]),
+            )
+        )
+        self.assertEqual(topo2.agents["agent-000"].contracts, frozenset([update]))
+
+    def test_incremental_matrix_matches_full_rebuild(self) -> None:
+        """Test derived matrices equal a from-scratch build across many steers."""
+        rng = np.random.default_rng(0)
+        manager = TopologyManager()
+        topo = self._spawn(manager, 12)
+        ids = sorted(topo.agents)
+        topo.get_expected_communication_matrix()
+        for step in range(20):
+            updates = frozenset(
+                self._contract(ids[a], ids[b], float(rng.integers(0, 4)))
+                for a, b in rng.integers(0, len(ids), (3, 2))
+            )
+            topo = manager.steer(
+                SteerSpec(
+                    topology_id=topo.topology_id,
+                    agent_reassignments={},
+                    new_contracts=updates,
+                )
+            )
+            if step % 3 == 0:  # also exercise versions that were never materialised
+                np.testing.assert_array_equal(
+                    topo.get_expected_communication_matrix(), self._rebuilt(topo)
+                )
+        np.testing.assert_array_equal(
+            topo.get_expected_sparse_matrix().to_dense(), self._rebuilt(topo)
+        )
+
+    def test_unchanged_steer_reuses_matrix_and_spectra(self) -> None:
+        """Test a steer that changes no contracts shares the cached results."""
+        manager = TopologyManager()
+        topo1 = self._spawn(manager, 4)
+        spectrum = topo1.expected_spectrum(2)
+        topo2 = manager.steer(SteerSpec(topology_id=topo1.topology_id, agent_reassignments={}))
+        self.assertIs(topo2.get_expected_sparse_matrix(), topo1.get_expected_sparse_matrix())
+        self.assertIs(topo2.expected_spectrum(2), spectrum)
+
+    def test_dropped_agents_rebuild_matrix_and_assignments(self) -> None:
+        """Test dropping agents removes their rows, columns and assignments."""
+        manager = TopologyManager()
+        topo1 = self._spawn(manager, 4)
+        topo1.assign_goal("goal-1", "agent-000")
+        topo1.assign_goal("goal-1", "agent-003")
+        topo1.assign_goal("goal-2", "agent-003")
+        topo1.get_expected_sparse_matrix()
+
+        topo2 = manager.steer(
+            SteerSpec(
+                topology_id=topo1.topology_id,
+                agent_reassignments={},
+                preserve_agents=frozenset(["agent-000", "agent-001", "agent-002"]),
+            )
+        )
+        self.assertEqual(topo2.goal_assignments, {"goal-1": {"agent-000"}})
+        self.assertEqual(topo1.goal_assignments["goal-1"], {"agent-000", "agent-003"})
+        np.testing.assert_array_equal(
+            topo2.get_expected_communication_matrix(), self._rebuilt(topo2)
+        )
+        self.assertEqual(topo2.get_expected_communication_matrix().shape, (3, 3))
+
+    def test_assign_goal_does_not_leak_into_previous_version(self) -> None:
+        """Test shared assignment sets are copied on write."""
+        manager = TopologyManager()
+        topo1 = self._spawn(manager, 2)
+        topo1.assign_goal("goal-1", "agent-000")
+        topo2 = manager.steer(SteerSpec(topology_id=topo1.topology_id, agent_reassignments={}))
+        topo2.assign_goal("goal-1", "agent-001")
+        self.assertEqual(topo1.goal_assignments["goal-1"], {"agent-000"})
+        self.assertEqual(topo2.goal_assignments["goal-1"], {"agent-000", "agent-001"})
+
+    def test_retention_limit_evicts_oldest_versions(self) -> None:
+        """Test only the newest inactive versions stay retrievable."""
+        manager = TopologyManager(max_retained_versions=2)
+        versions = [self._spawn(manager, 2)]
+        for _ in range(4):
+            versions.append(
+                manager.steer(
+                    SteerSpec(topology_id=versions[-1].topology_id, agent_reassignments={})
+                )
+            )
+        retained = [manager.get_topology(t.topology_id) for t in versions]
+        self.assertEqual(retained, [None, None, versions[2], versions[3], versions[4]])
+        self.assertEqual(manager.list_active_topologies(), [versions[4]])
+        with self.assertRaises(TopologyOperationError):
+            manager.steer(SteerSpec(topology_id=versions[0].topology_id, agent_reassignments={}))
+
+    def test_retention_unbounded_and_validation(self) -> None:
+        """Test None keeps every version and negative limits are rejected."""
+        manager = TopologyManager(max_retained_versions=None)
+        topo = self._spawn(manager, 2)
+        first = topo.topology_id
+        for _ in range(50):
+            topo = manager.steer(SteerSpec(topology_id=topo.topology_id, agent_reassignments={}))
+        self.assertIsNotNone(manager.get_topology(first))
+        with self.assertRaises(ValueError):
+            TopologyManager(max_retained_versions=-1)
+
+
 class TestCommunicationMetrics(unittest.TestCase):
     """Test communication metrics and rates."""
 
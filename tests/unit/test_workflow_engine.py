@@ -2,11 +2,13 @@
 
 import asyncio
 import contextlib
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 
+from holly.engine.blob_store import InMemoryBlobStore
+from holly.engine.checkpoint_store import InMemoryCheckpointStore
 from holly.engine.workflow_engine import (
     CompensationAction,
     CompensationExecutor,
@@ -18,13 +20,19 @@ from holly.engine.workflow_engine import (
     DeadLetterQueue,
     DeadLetterQueueFullError,
     ExecutionCheckpoint,
+    ExecutionSummary,
+    RedriveReport,
+    RetentionPolicy,
     SagaPhase,
     SagaStep,
+    SpilledResult,
     TaskExecutor,
     TaskExecutionError,
+    TaskInput,
     WorkflowDAG,
     WorkflowEdge,
     WorkflowEngine,
+    WorkflowError,
     WorkflowExecution,
     WorkflowTask,
     WorkflowTaskState,
@@ -122,6 +130,23 @@ def test_workflow_task_requires_positive_timeout(mock_executor):
         )
 
 
+def test_workflow_task_validates_compensation_settings(mock_executor):
+    """Test that WorkflowTask rejects invalid compensation settings."""
+    for kwargs in (
+        {"compensation_timeout_ms": 0},
+        {"compensation_retries": -1},
+        {"compensation_backoff_ms": -1},
+    ):
+        with pytest.raises(ValueError):
+            WorkflowTask(
+                task_id="task1",
+                executor=mock_executor,
+                payload={},
+                idempotency_key="key",
+                **kwargs,
+            )
+
+
 def test_workflow_task_requires_idempotency_key(mock_executor):
     """Test that WorkflowTask requires idempotency_key."""
     with pytest.raises(ValueError):
@@ -559,6 +584,222 @@ async def test_dead_letter_queue_query_by_task():
     assert len(events) == 3
 
 
+def _dlq_event(event_id, workflow_id="workflow1", task_id="task1", age_hours=0.0):
+    return DeadLetterEvent(
+        event_id=event_id,
+        workflow_id=workflow_id,
+        task_id=task_id,
+        timestamp=datetime.now(timezone.utc) - timedelta(hours=age_hours),
+        error_message="test error",
+        payload={"event": event_id},
+    )
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_indexes_track_dequeue():
+    """Test secondary indexes drop events removed via dequeue."""
+    queue = DeadLetterQueue()
+    await queue.enqueue(_dlq_event("e1", task_id="task1"))
+    await queue.enqueue(_dlq_event("e2", task_id="task2"))
+    await queue.enqueue(_dlq_event("e3", workflow_id="workflow2"))
+
+    await queue.dequeue("e1")
+
+    assert [e.event_id for e in await queue.query_by_workflow("workflow1")] == ["e2"]
+    assert await queue.query_by_task("workflow1", "task1") == []
+    assert [e.event_id for e in await queue.query_by_workflow("workflow2")] == ["e3"]
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_clear_expired():
+    """Test clear_expired removes only events past their TTL."""
+    queue = DeadLetterQueue(ttl_hours=1)
+    await queue.enqueue(_dlq_event("old1", age_hours=3))
+    await queue.enqueue(_dlq_event("fresh"))
+    await queue.enqueue(_dlq_event("old2", age_hours=2))
+    await queue.dequeue("old2")
+
+    assert await queue.clear_expired() == 1
+    assert await queue.size() == 1
+    assert await queue.peek("fresh") is not None
+    assert await queue.query_by_task("workflow1", "task1") == [await queue.peek("fresh")]
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_full_purges_expired_first():
+    """Test a full queue makes room by dropping expired events."""
+    queue = DeadLetterQueue(max_size=2, ttl_hours=1)
+    await queue.enqueue(_dlq_event("old", age_hours=2))
+    await queue.enqueue(_dlq_event("fresh1"))
+
+    await queue.enqueue(_dlq_event("fresh2"))
+
+    assert await queue.size() == 2
+    assert await queue.peek("old") is None
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_redrive_removes_successes():
+    """Test redrive removes replayed events and keeps failures."""
+    queue = DeadLetterQueue()
+    for i in range(4):
+        await queue.enqueue(_dlq_event(f"e{i}", task_id=f"task{i}"))
+
+    async def handler(event):
+        if event.event_id == "e2":
+            raise RuntimeError("still broken")
+
+    report = await queue.redrive(handler, workflow_id="workflow1", max_concurrency=2)
+
+    assert isinstance(report, RedriveReport)
+    assert report.attempted == 4
+    assert sorted(report.succeeded) == ["e0", "e1", "e3"]
+    assert report.failed == {"e2": "still broken"}
+    assert [e.event_id for e in await queue.query_by_workflow("workflow1")] == ["e2"]
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_redrive_bounds_concurrency():
+    """Test redrive never exceeds max_concurrency handlers."""
+    queue = DeadLetterQueue()
+    for i in range(10):
+        await queue.enqueue(_dlq_event(f"e{i}"))
+    in_flight = 0
+    peak = 0
+
+    async def handler(event):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+
+    report = await queue.redrive(handler, limit=8, max_concurrency=3)
+
+    assert report.attempted == 8
+    assert peak == 3
+    assert await queue.size() == 2
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_redrive_validates_filters():
+    """Test redrive rejects a task filter without a workflow."""
+    queue = DeadLetterQueue()
+
+    async def handler(event):
+        return None
+
+    with pytest.raises(ValueError):
+        await queue.redrive(handler, task_id="task1")
+    with pytest.raises(ValueError):
+        await queue.redrive(handler, max_concurrency=0)
+
+
+class RecordingDeadLetterBackend:
+    """In-memory DeadLetterBackend recording write-through calls."""
+
+    def __init__(self):
+        self.events = {}
+
+    async def put(self, event):
+        self.events[event.event_id] = event
+
+    async def remove(self, event_ids):
+        for event_id in event_ids:
+            self.events.pop(event_id, None)
+
+    async def load(self):
+        return list(self.events.values())
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_writes_through_and_restores():
+    """Test mutations reach the backend and restore rebuilds indexes."""
+    backend = RecordingDeadLetterBackend()
+    queue = DeadLetterQueue(backend=backend)
+    await queue.enqueue(_dlq_event("e1"))
+    await queue.enqueue(_dlq_event("e2", task_id="task2"))
+    await queue.dequeue("e1")
+    assert set(backend.events) == {"e2"}
+
+    restored = DeadLetterQueue(backend=backend)
+    assert await restored.restore() == 1
+    assert [e.event_id for e in await restored.query_by_task("workflow1", "task2")] == ["e2"]
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_queue_failed_backend_write_is_not_indexed():
+    """Test an event the backend rejects is not left in memory."""
+
+    class FailingBackend(RecordingDeadLetterBackend):
+        async def put(self, event):
+            raise OSError("disk full")
+
+    queue = DeadLetterQueue(backend=FailingBackend())
+    with pytest.raises(OSError):
+        await queue.enqueue(_dlq_event("e1"))
+
+    assert await queue.size() == 0
+    assert await queue.query_by_workflow("workflow1") == []
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_redrive_dead_letters():
+    """Test engine redrive re-executes dead-lettered forward tasks."""
+    engine = WorkflowEngine()
+    executor = MockTaskExecutor(should_fail=True, delay=0)
+    dag = WorkflowDAG(workflow_id="workflow1")
+    dag.add_task(
+        WorkflowTask(task_id="task1", executor=executor, payload={"p": 1}, idempotency_key="k1")
+    )
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+    event = (await engine.dead_letter_queue.query_by_task("workflow1", "task1"))[0]
+    assert event.execution_context["execution_id"]
+
+    executor.should_fail = False
+    report = await engine.redrive_dead_letters(dag)
+
+    assert report.succeeded == [event.event_id]
+    assert executor.call_count == 2
+    assert await engine.dead_letter_queue.size() == 0
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_redrive_compensation_failure():
+    """Test redrive replays failed compensations with the forward result."""
+    compensator = MockCompensationExecutor(should_fail=True)
+    dag = WorkflowDAG(workflow_id="workflow1")
+    dag.add_task(
+        WorkflowTask(
+            task_id="task1",
+            executor=MockTaskExecutor(delay=0),
+            payload={},
+            idempotency_key="k1",
+            compensation_executor=compensator,
+        )
+    )
+    dag.add_task(
+        WorkflowTask(
+            task_id="task2",
+            executor=MockTaskExecutor(should_fail=True, delay=0),
+            payload={},
+            idempotency_key="k2",
+        )
+    )
+    dag.add_edge(WorkflowEdge("task1", "task2"))
+    engine = WorkflowEngine()
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+
+    compensator.should_fail = False
+    report = await engine.redrive_dead_letters(dag, task_id="task1")
+
+    assert len(report.succeeded) == 1
+    assert compensator.call_count == 2
+    assert await engine.dead_letter_queue.query_by_task("workflow1", "task1") == []
+
+
 # ---------------------------------------------------------------------------
 # WorkflowEngine Tests
 # ---------------------------------------------------------------------------
@@ -867,3 +1108,837 @@ async def test_workflow_engine_execution_results():
     execution = await engine.execute(dag)
     assert "task1" in execution.results
     assert execution.results["task1"]["task_id"] == "task1"
+
+
+# ---------------------------------------------------------------------------
+# Delta Checkpoint / Resume Tests
+# ---------------------------------------------------------------------------
+
+
+def _chain_dag(workflow_id, executors):
+    dag = WorkflowDAG(workflow_id=workflow_id)
+    for i, executor in enumerate(executors):
+        dag.add_task(
+            WorkflowTask(
+                task_id=f"task{i}",
+                executor=executor,
+                payload={"index": i},
+                idempotency_key=f"key{i}",
+            )
+        )
+        if i > 0:
+            dag.add_edge(WorkflowEdge(f"task{i-1}", f"task{i}"))
+    return dag
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_checkpoints_are_deltas():
+    """Test each checkpoint only carries tasks finished since the last one."""
+    engine = WorkflowEngine(checkpoint_interval=1)
+    dag = _chain_dag("workflow1", [MockTaskExecutor(delay=0) for _ in range(4)])
+
+    execution = await engine.execute(dag)
+
+    assert [c.sequence for c in execution.checkpoints] == [0, 1, 2, 3, 4]
+    for i, checkpoint in enumerate(execution.checkpoints[:4]):
+        assert checkpoint.completed_tasks == {f"task{i}"}
+        assert set(checkpoint.results) == {f"task{i}"}
+        assert checkpoint.task_states == {f"task{i}": WorkflowTaskState.SUCCEEDED}
+        assert checkpoint.execution_id == execution.execution_id
+    # The final phase is recorded with an empty delta.
+    final = execution.checkpoints[4]
+    assert final.phase == SagaPhase.COMPLETE
+    assert (final.completed_tasks, final.results, final.task_states) == (set(), {}, {})
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_flushes_trailing_delta():
+    """Test tasks after the last interval boundary are still checkpointed."""
+    engine = WorkflowEngine(checkpoint_interval=2)
+    dag = _chain_dag("workflow1", [MockTaskExecutor(delay=0) for _ in range(3)])
+
+    execution = await engine.execute(dag)
+
+    covered = set().union(*(c.completed_tasks for c in execution.checkpoints))
+    assert covered == {"task0", "task1", "task2"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_persists_checkpoints_to_store():
+    """Test checkpoints are written through the configured store."""
+    store = InMemoryCheckpointStore()
+    engine = WorkflowEngine(checkpoint_store=store)
+    dag = _chain_dag("workflow1", [MockTaskExecutor(delay=0) for _ in range(3)])
+
+    execution = await engine.execute(dag)
+
+    chain = await store.load(execution.execution_id)
+    assert chain == execution.checkpoints
+
+
+class _ProcessCrash(BaseException):
+    """Stands in for the process dying; the saga does not handle it."""
+
+
+class CrashingExecutor(MockTaskExecutor):
+    """Task executor that crashes the process on its first call."""
+
+    async def execute(self, task_id: str, payload):
+        self.call_count += 1
+        if self.call_count == 1:
+            raise _ProcessCrash(task_id)
+        return {"task_id": task_id, "result": f"executed {payload}"}
+
+
+class CrashingCompensationExecutor(MockCompensationExecutor):
+    """Compensation executor that crashes the process on its first call."""
+
+    async def compensate(self, task_id: str, forward_result):
+        self.call_count += 1
+        if self.call_count == 1:
+            raise _ProcessCrash(task_id)
+        return {"task_id": task_id, "compensated": True}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_runs_only_unfinished_tasks():
+    """Test resume skips tasks recorded as succeeded in the chain."""
+    store = InMemoryCheckpointStore()
+    executors = [MockTaskExecutor(delay=0) for _ in range(4)]
+    executors[2] = CrashingExecutor()
+    engine = WorkflowEngine(checkpoint_store=store)
+
+    with pytest.raises(_ProcessCrash):
+        await engine.execute(_chain_dag("workflow1", executors))
+    execution_id = (await engine.list_executions("workflow1"))[0].execution_id
+
+    # Simulate a fresh process: new engine, DAG rebuilt by the caller.
+    resumed = await WorkflowEngine(checkpoint_store=store).resume(
+        execution_id, _chain_dag("workflow1", executors)
+    )
+
+    assert [e.call_count for e in executors] == [1, 1, 2, 1]
+    assert all(s == WorkflowTaskState.SUCCEEDED for s in resumed.state.values())
+    assert set(resumed.results) == {"task0", "task1", "task2", "task3"}
+    chain = await store.load(execution_id)
+    assert [c.sequence for c in chain] == [0, 1, 2, 3, 4]
+    assert chain[-1].phase == SagaPhase.COMPLETE
+
+
+def _saga_dag(executors, compensators, fail_executor):
+    """Independent compensable tasks all feeding one final task."""
+    dag = WorkflowDAG(workflow_id="saga")
+    dag.add_task(_compensating_task("fail", None, fail_executor))
+    for i, (executor, compensator) in enumerate(zip(executors, compensators, strict=True)):
+        dag.add_task(_compensating_task(f"task{i}", compensator, executor))
+        dag.add_edge(WorkflowEdge(f"task{i}", "fail"))
+    return dag
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_compensated_execution_is_noop():
+    """Test resuming a rolled-back saga neither re-runs nor re-compensates."""
+    store = InMemoryCheckpointStore()
+    executors = [MockTaskExecutor(delay=0) for _ in range(2)]
+    compensators = [MockCompensationExecutor() for _ in range(2)]
+    failing = MockTaskExecutor(should_fail=True, delay=0)
+    engine = WorkflowEngine(checkpoint_store=store)
+
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(_saga_dag(executors, compensators, failing))
+    execution_id = (await engine.list_executions("saga"))[0].execution_id
+    assert (await store.load(execution_id))[-1].phase == SagaPhase.COMPLETE
+
+    resumed = await WorkflowEngine(checkpoint_store=store).resume(
+        execution_id, _saga_dag(executors, compensators, failing)
+    )
+
+    assert [e.call_count for e in executors] == [1, 1]
+    assert failing.call_count == 1
+    assert [c.call_count for c in compensators] == [1, 1]
+    assert resumed.phase == SagaPhase.COMPLETE
+    assert resumed.failed_task == "fail"
+    assert resumed.state["fail"] == WorkflowTaskState.FAILED
+    assert resumed.state["task0"] == resumed.state["task1"] == WorkflowTaskState.COMPENSATED
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_continues_interrupted_compensation():
+    """Test resume finishes a rollback cut short without re-running forward."""
+    store = InMemoryCheckpointStore()
+    executors = [MockTaskExecutor(delay=0) for _ in range(2)]
+    compensators = [CrashingCompensationExecutor(), MockCompensationExecutor()]
+    failing = MockTaskExecutor(should_fail=True, delay=0)
+    engine = WorkflowEngine(checkpoint_store=store)
+
+    with pytest.raises(_ProcessCrash):
+        await engine.execute(_saga_dag(executors, compensators, failing))
+    execution_id = (await engine.list_executions("saga"))[0].execution_id
+    assert (await store.load(execution_id))[-1].phase == SagaPhase.COMPENSATION
+
+    dlq = DeadLetterQueue()
+    resumed = await WorkflowEngine(checkpoint_store=store, dead_letter_queue=dlq).resume(
+        execution_id, _saga_dag(executors, compensators, failing)
+    )
+
+    assert [e.call_count for e in executors] == [1, 1]
+    assert failing.call_count == 1
+    assert [c.call_count for c in compensators] == [2, 1]
+    assert resumed.phase == SagaPhase.COMPLETE
+    assert resumed.state["task0"] == resumed.state["task1"] == WorkflowTaskState.COMPENSATED
+    assert [e.task_id for e in await dlq.query_by_workflow("saga")] == ["fail"]
+    assert (await store.load(execution_id))[-1].phase == SagaPhase.COMPLETE
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_completed_execution_is_noop():
+    """Test resuming a finished execution re-runs nothing."""
+    store = InMemoryCheckpointStore()
+    executors = [MockTaskExecutor(delay=0) for _ in range(2)]
+    engine = WorkflowEngine(checkpoint_store=store)
+    execution = await engine.execute(_chain_dag("workflow1", executors))
+
+    resumed = await engine.resume(execution.execution_id)
+
+    assert [e.call_count for e in executors] == [1, 1]
+    assert resumed.results == execution.results
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_requires_store():
+    """Test resume without a checkpoint store is rejected."""
+    with pytest.raises(WorkflowError):
+        await WorkflowEngine().resume("exec1")
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_unknown_execution():
+    """Test resume of an execution with no checkpoints is rejected."""
+    engine = WorkflowEngine(checkpoint_store=InMemoryCheckpointStore())
+    with pytest.raises(WorkflowError):
+        await engine.resume("missing")
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_resume_rejects_mismatched_dag():
+    """Test resume refuses a DAG for a different workflow."""
+    store = InMemoryCheckpointStore()
+    engine = WorkflowEngine(checkpoint_store=store)
+    execution = await engine.execute(_chain_dag("workflow1", [MockTaskExecutor(delay=0)]))
+
+    with pytest.raises(WorkflowError):
+        await engine.resume(
+            execution.execution_id, _chain_dag("workflow2", [MockTaskExecutor(delay=0)])
+        )
+
+
+# ---------------------------------------------------------------------------
+# Parallel Compensation Tests
+# ---------------------------------------------------------------------------
+
+
+class RecordingCompensationExecutor:
+    """Compensation executor that records completion order."""
+
+    def __init__(self, order, delay=0.0, fail_times=0):
+        self.order = order
+        self.delay = delay
+        self.fail_times = fail_times
+        self.call_count = 0
+
+    async def compensate(self, task_id: str, forward_result):
+        self.call_count += 1
+        await asyncio.sleep(self.delay)
+        if self.call_count <= self.fail_times:
+            raise RuntimeError(f"compensation for {task_id} failed")
+        self.order.append(task_id)
+        return {"task_id": task_id, "compensated": True}
+
+
+def _compensating_task(task_id, compensator, executor=None, **kwargs):
+    return WorkflowTask(
+        task_id=task_id,
+        executor=executor or MockTaskExecutor(delay=0),
+        payload={},
+        idempotency_key=f"key_{task_id}",
+        compensation_executor=compensator,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_compensation_respects_reverse_dependencies():
+    """Test dependents are compensated before the tasks they depend on."""
+    order = []
+    dag = WorkflowDAG(workflow_id="workflow1")
+    dag.add_task(_compensating_task("root", RecordingCompensationExecutor(order)))
+    dag.add_task(_compensating_task("left", RecordingCompensationExecutor(order, delay=0.02)))
+    dag.add_task(_compensating_task("right", RecordingCompensationExecutor(order)))
+    dag.add_task(_compensating_task("sink", RecordingCompensationExecutor(order)))
+    dag.add_task(_compensating_task("fail", None, MockTaskExecutor(should_fail=True, delay=0)))
+    for src, dst in (("root", "left"), ("root", "right"), ("left", "sink"),
+                     ("right", "sink"), ("sink", "fail")):
+        dag.add_edge(WorkflowEdge(src, dst))
+
+    with pytest.raises(TaskExecutionError):
+        await WorkflowEngine().execute(dag)
+
+    assert order[0] == "sink"
+    assert set(order[1:3]) == {"left", "right"}
+    assert order[3] == "root"
+
+
+@pytest.mark.asyncio
+async def test_compensation_runs_independent_branches_concurrently():
+    """Test independent compensations overlap rather than run serially."""
+    order = []
+    dag = WorkflowDAG(workflow_id="workflow1")
+    for i in range(5):
+        dag.add_task(
+            _compensating_task(f"task{i}", RecordingCompensationExecutor(order, delay=0.05))
+        )
+    dag.add_task(_compensating_task("fail", None, MockTaskExecutor(should_fail=True, delay=0)))
+    for i in range(5):
+        dag.add_edge(WorkflowEdge(f"task{i}", "fail"))
+
+    loop = asyncio.get_running_loop()
+    with pytest.raises(TaskExecutionError):
+        start = loop.time()
+        await WorkflowEngine().execute(dag)
+    elapsed = loop.time() - start
+
+    assert len(order) == 5
+    assert elapsed < 0.2
+
+
+@pytest.mark.asyncio
+async def test_compensation_concurrency_bound():
+    """Test max_concurrent_compensations caps in-flight compensations."""
+    in_flight = 0
+    peak = 0
+
+    class PeakTracker:
+        async def compensate(self, task_id, forward_result):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    dag = WorkflowDAG(workflow_id="workflow1")
+    for i in range(6):
+        dag.add_task(_compensating_task(f"task{i}", PeakTracker()))
+    dag.add_task(_compensating_task("fail", None, MockTaskExecutor(should_fail=True, delay=0)))
+    for i in range(6):
+        dag.add_edge(WorkflowEdge(f"task{i}", "fail"))
+
+    with pytest.raises(TaskExecutionError):
+        await WorkflowEngine(max_concurrent_compensations=2).execute(dag)
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_compensation_retries_before_dead_letter():
+    """Test compensation is retried with backoff before succeeding."""
+    order = []
+    compensator = RecordingCompensationExecutor(order, fail_times=2)
+    dag = WorkflowDAG(workflow_id="workflow1")
+    dag.add_task(
+        _compensating_task(
+            "task1", compensator, compensation_retries=2, compensation_backoff_ms=1
+        )
+    )
+    dag.add_task(_compensating_task("fail", None, MockTaskExecutor(should_fail=True, delay=0)))
+    dag.add_edge(WorkflowEdge("task1", "fail"))
+
+    engine = WorkflowEngine()
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+
+    execution = (await engine.list_executions("workflow1"))[0]
+    assert compensator.call_count == 3
+    assert execution.state["task1"] == WorkflowTaskState.COMPENSATED
+    events = await engine.dead_letter_queue.query_by_task("workflow1", "task1")
+    assert events == []
+
+
+@pytest.mark.asyncio
+async def test_compensation_timeout_dead_letters_after_retries():
+    """Test per-task compensation timeout exhausts retries into the DLQ."""
+    compensator = RecordingCompensationExecutor([], delay=0.5)
+    dag = WorkflowDAG(workflow_id="workflow1")
+    dag.add_task(
+        _compensating_task(
+            "task1",
+            compensator,
+            compensation_timeout_ms=10,
+            compensation_retries=1,
+            compensation_backoff_ms=1,
+        )
+    )
+    dag.add_task(_compensating_task("fail", None, MockTaskExecutor(should_fail=True, delay=0)))
+    dag.add_edge(WorkflowEdge("task1", "fail"))
+
+    engine = WorkflowEngine()
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+
+    execution = (await engine.list_executions("workflow1"))[0]
+    assert compensator.call_count == 2
+    assert execution.state["task1"] == WorkflowTaskState.FAILED
+    events = await engine.dead_letter_queue.query_by_task("workflow1", "task1")
+    assert len(events) == 1
+    assert events[0].execution_context["attempts"] == 2
+    assert "timeout" in events[0].error_message
+
+
+def test_workflow_engine_rejects_nonpositive_compensation_bound():
+    """Test max_concurrent_compensations must be positive."""
+    with pytest.raises(ValueError):
+        WorkflowEngine(max_concurrent_compensations=0)
+
+
+# ---------------------------------------------------------------------------
+# Execution Retention / Listing Tests
+# ---------------------------------------------------------------------------
+
+
+async def _run_single(engine, workflow_id, fail=False):
+    dag = WorkflowDAG(workflow_id=workflow_id)
+    dag.add_task(
+        WorkflowTask(
+            task_id="task1",
+            executor=MockTaskExecutor(should_fail=fail, delay=0),
+            payload={},
+            idempotency_key="key1",
+        )
+    )
+    if fail:
+        with pytest.raises(TaskExecutionError):
+            await engine.execute(dag)
+        return None
+    return await engine.execute(dag)
+
+
+def test_retention_policy_validation():
+    """Test RetentionPolicy rejects negative bounds."""
+    for kwargs in (
+        {"max_executions": -1},
+        {"max_age_seconds": -1},
+        {"max_bytes": -1},
+        {"max_summaries": -1},
+    ):
+        with pytest.raises(ValueError):
+            RetentionPolicy(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_marks_completed_executions():
+    """Test finished executions carry a completion time and COMPLETE phase."""
+    engine = WorkflowEngine()
+    execution = await _run_single(engine, "workflow1")
+    assert execution.phase == SagaPhase.COMPLETE
+    assert execution.completed_at is not None
+    assert execution.completed_at >= execution.started_at
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_evicts_beyond_max_executions():
+    """Test oldest completed executions are evicted to summaries."""
+    engine = WorkflowEngine(retention=RetentionPolicy(max_executions=2))
+    executions = [await _run_single(engine, "workflow1") for _ in range(4)]
+
+    retained = await engine.list_executions("workflow1")
+    assert [e.execution_id for e in retained] == [e.execution_id for e in executions[2:]]
+    assert await engine.get_execution(executions[0].execution_id) is None
+    summary = await engine.get_execution_summary(executions[0].execution_id)
+    assert isinstance(summary, ExecutionSummary)
+    assert summary.succeeded_count == 1
+    assert summary.phase == SagaPhase.COMPLETE
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_evicts_by_age_and_bytes():
+    """Test max_age_seconds and max_bytes bounds both evict."""
+    engine = WorkflowEngine(retention=RetentionPolicy(max_executions=None, max_age_seconds=0))
+    first = await _run_single(engine, "workflow1")
+    await asyncio.sleep(0.01)
+    assert await engine.enforce_retention() >= 0
+    assert await engine.get_execution(first.execution_id) is None
+
+    engine = WorkflowEngine(retention=RetentionPolicy(max_executions=None, max_bytes=1))
+    execution = await _run_single(engine, "workflow1")
+    assert await engine.get_execution(execution.execution_id) is None
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_byte_bound_counts_nested_results():
+    """Test max_bytes sizes task results deeply, not just their containers."""
+
+    class NestedExecutor:
+        async def execute(self, task_id, payload):
+            return {"rows": [f"{i:04d}" * 256 for i in range(256)]}  # ~256 KiB
+
+    dag = WorkflowDAG(workflow_id="nested")
+    dag.add_task(
+        WorkflowTask(
+            task_id="task1",
+            executor=NestedExecutor(),
+            payload={},
+            idempotency_key="key1",
+        )
+    )
+    engine = WorkflowEngine(
+        retention=RetentionPolicy(max_executions=None, max_bytes=64 * 1024)
+    )
+    execution = await engine.execute(dag)
+
+    assert await engine.get_execution(execution.execution_id) is None
+    assert engine._completed_bytes == 0
+
+@pytest.mark.asyncio
+async def test_workflow_engine_summaries_are_bounded():
+    """Test summaries of evicted executions are capped too."""
+    engine = WorkflowEngine(
+        retention=RetentionPolicy(max_executions=0, max_summaries=3)
+    )
+    executions = [await _run_single(engine, f"workflow{i}") for i in range(5)]
+
+    assert await engine.get_execution_summary(executions[0].execution_id) is None
+    assert await engine.get_execution_summary(executions[4].execution_id) is not None
+    records = [r async for r in engine.iter_executions(include_evicted=True)]
+    assert len(records) == 3
+    assert "workflow0" not in engine._by_workflow
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_archives_evicted_executions():
+    """Test evicted executions are handed to the archive in full."""
+    archived = []
+
+    class ListArchive:
+        async def archive(self, execution):
+            archived.append(execution)
+
+    engine = WorkflowEngine(
+        retention=RetentionPolicy(max_executions=1), archive=ListArchive()
+    )
+    first = await _run_single(engine, "workflow1")
+    await _run_single(engine, "workflow1")
+
+    assert archived == [first]
+    assert "task1" in archived[0].results
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_iter_executions_filters_and_pages():
+    """Test iter_executions filters by workflow and phase across pages."""
+    engine = WorkflowEngine()
+    for i in range(7):
+        await _run_single(engine, f"workflow{i % 2}")
+    await _run_single(engine, "workflow0", fail=True)
+
+    by_workflow = [e async for e in engine.iter_executions("workflow0", page_size=2)]
+    assert len(by_workflow) == 5
+    assert all(e.workflow_id == "workflow0" for e in by_workflow)
+
+    complete = [e async for e in engine.iter_executions(phase=SagaPhase.COMPLETE, page_size=3)]
+    assert len(complete) == 8
+    failed = [e for e in complete if e.failed_task is not None]
+    assert len(failed) == 1
+
+    assert [e async for e in engine.iter_executions(phase=SagaPhase.FORWARD)] == []
+    with pytest.raises(ValueError):
+        [e async for e in engine.iter_executions(page_size=0)]
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_iter_executions_yields_summaries():
+    """Test include_evicted yields summaries for evicted executions."""
+    engine = WorkflowEngine(retention=RetentionPolicy(max_executions=1))
+    for _ in range(3):
+        await _run_single(engine, "workflow1")
+
+    live = [r async for r in engine.iter_executions("workflow1")]
+    everything = [r async for r in engine.iter_executions("workflow1", include_evicted=True)]
+    assert len(live) == 1
+    assert len(everything) == 3
+    assert sum(isinstance(r, ExecutionSummary) for r in everything) == 2
+
+
+# ---------------------------------------------------------------------------
+# Data Edge / Result Passing Tests
+# ---------------------------------------------------------------------------
+
+
+class RecordingExecutor:
+    """Executor recording the payload it receives and returning a fixed value."""
+
+    def __init__(self, result, order=None):
+        self.result = result
+        self.order = order
+        self.payloads = []
+
+    async def execute(self, task_id: str, payload):
+        self.payloads.append(payload)
+        if self.order is not None:
+            self.order.append(task_id)
+        return self.result
+
+
+def _data_dag(executors, edges, compensable=()):
+    dag = WorkflowDAG(workflow_id="dataflow")
+    for task_id, executor in executors.items():
+        dag.add_task(
+            WorkflowTask(
+                task_id=task_id,
+                executor=executor,
+                payload={"id": task_id},
+                idempotency_key=f"key_{task_id}",
+                compensation_executor=(
+                    MockCompensationExecutor() if task_id in compensable else None
+                ),
+            )
+        )
+    for source, target, data_key in edges:
+        dag.add_edge(WorkflowEdge(source, target, data_key=data_key))
+    return dag
+
+
+def test_workflow_edge_rejects_empty_data_key():
+    """Test data_key must be a non-empty name when given."""
+    with pytest.raises(ValueError):
+        WorkflowEdge("a", "b", data_key="")
+
+
+def test_dag_compiler_rejects_duplicate_data_key():
+    """Test a task cannot bind two producers to the same data key."""
+    dag = _data_dag(
+        {t: RecordingExecutor(t) for t in ("a", "b", "c")},
+        [("a", "c", "x"), ("b", "c", "x")],
+    )
+    with pytest.raises(DAGValidationError):
+        DAGCompiler.validate(dag)
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_passes_upstream_results():
+    """Test consumers receive TaskInput with upstream results by data key."""
+    executors = {
+        "a": RecordingExecutor({"rows": 3}),
+        "b": RecordingExecutor("b-out"),
+        "c": RecordingExecutor("done"),
+    }
+    dag = _data_dag(executors, [("a", "c", "left"), ("b", "c", "right")])
+
+    execution = await WorkflowEngine().execute(dag)
+
+    assert executors["a"].payloads == [{"id": "a"}]
+    assert executors["c"].payloads == [
+        TaskInput(payload={"id": "c"}, inputs={"left": {"rows": 3}, "right": "b-out"})
+    ]
+    assert execution.results == {"c": "done"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_releases_after_last_consumer():
+    """Test a result is kept until every data consumer has succeeded."""
+    engine = WorkflowEngine()
+    seen = {}
+
+    class Snapshot:
+        async def execute(self, task_id, payload):
+            (execution,) = engine._executions.values()
+            seen[task_id] = set(execution.results)
+            return task_id
+
+    executors = {t: Snapshot() for t in ("a", "b", "c")}
+    dag = _data_dag(executors, [("a", "b", "x"), ("a", "c", "x"), ("b", "c", "y")])
+    execution = await engine.execute(dag)
+
+    assert seen["b"] == {"a"}
+    assert seen["c"] == {"a", "b"}
+    assert execution.results == {"c": "c"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_keeps_results_needed_for_compensation():
+    """Test compensable producers and control-only tasks keep results."""
+    executors = {t: RecordingExecutor(t) for t in ("a", "b", "c", "d")}
+    dag = _data_dag(
+        executors,
+        [("a", "c", "x"), ("b", "c", "y"), ("c", "d", None)],
+        compensable={"a"},
+    )
+
+    execution = await WorkflowEngine().execute(dag)
+
+    assert set(execution.results) == {"a", "c", "d"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_prefers_tasks_that_release_memory():
+    """Test the scheduler runs the consumer freeing the largest result first."""
+    order = []
+    executors = {
+        "small": RecordingExecutor("x", order),
+        "large": RecordingExecutor("x" * 100_000, order),
+        "use_small": RecordingExecutor(1, order),
+        "use_large": RecordingExecutor(2, order),
+    }
+    dag = _data_dag(
+        executors,
+        [
+            ("small", "use_small", "v"),
+            ("large", "use_large", "v"),
+            # Both consumers become ready together, after both producers.
+            ("small", "use_large", None),
+            ("large", "use_small", None),
+        ],
+    )
+
+    await WorkflowEngine().execute(dag)
+
+    assert order.index("use_large") < order.index("use_small")
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_sizes_cyclic_and_deep_results():
+    """Test result sizing stops at cycles and deep nesting."""
+    cyclic: list = ["x" * 1000]
+    cyclic.append(cyclic)
+    deep: list = []
+    for _ in range(10_000):
+        deep = [deep]
+    executors = {
+        "cyclic": RecordingExecutor(cyclic),
+        "deep": RecordingExecutor(deep),
+        "use": RecordingExecutor("done"),
+    }
+    dag = _data_dag(executors, [("cyclic", "use", "c"), ("deep", "use", "d")])
+    engine = WorkflowEngine(
+        retention=RetentionPolicy(max_executions=None, max_bytes=1 << 30)
+    )
+
+    execution = await engine.execute(dag)
+
+    assert execution.results == {"use": "done"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_without_data_edges_keeps_topological_order():
+    """Test plain DAGs still run exactly in topological order."""
+    order = []
+    executors = {t: RecordingExecutor(t, order) for t in ("a", "b", "c", "d")}
+    dag = _data_dag(executors, [("a", "c", None), ("b", "d", None)])
+
+    await WorkflowEngine().execute(dag)
+
+    assert order == dag.topological_sort()
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_spills_large_results():
+    """Test large results spill to the blob store and are freed on release."""
+    blobs = InMemoryBlobStore()
+    executors = {
+        "big": RecordingExecutor({"data": "x" * 5000}),
+        "use": RecordingExecutor("small"),
+        "sink": RecordingExecutor({"data": "y" * 5000}),
+    }
+    dag = _data_dag(executors, [("big", "use", "blob"), ("use", "sink", None)])
+    engine = WorkflowEngine(blob_store=blobs, spill_threshold_bytes=1024)
+
+    execution = await engine.execute(dag)
+
+    assert executors["use"].payloads[0].inputs == {"blob": {"data": "x" * 5000}}
+    assert "big" not in execution.results
+    assert execution.results["use"] == "small"
+    assert isinstance(execution.results["sink"], SpilledResult)
+    assert len(blobs) == 1
+    assert await engine.load_result(execution, "sink") == {"data": "y" * 5000}
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_spilled_result_reaches_compensation():
+    """Test compensation receives the loaded value of a spilled result."""
+    received = []
+
+    class Compensator:
+        async def compensate(self, task_id, forward_result):
+            received.append(forward_result)
+
+    dag = WorkflowDAG(workflow_id="spill_comp")
+    dag.add_task(
+        WorkflowTask(
+            task_id="big",
+            executor=RecordingExecutor(["z" * 4000]),
+            payload={},
+            idempotency_key="big",
+            compensation_executor=Compensator(),
+        )
+    )
+    dag.add_task(
+        WorkflowTask(
+            task_id="fail",
+            executor=MockTaskExecutor(should_fail=True, delay=0),
+            payload={},
+            idempotency_key="fail",
+        )
+    )
+    dag.add_edge(WorkflowEdge("big", "fail"))
+    engine = WorkflowEngine(blob_store=InMemoryBlobStore(), spill_threshold_bytes=1024)
+
+    with pytest.raises(TaskExecutionError):
+        await engine.execute(dag)
+
+    assert received == [["z" * 4000]]
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_evicted_spills_are_deleted():
+    """Test blobs of evicted executions are removed from the blob store."""
+    blobs = InMemoryBlobStore()
+    engine = WorkflowEngine(
+        blob_store=blobs,
+        spill_threshold_bytes=1024,
+        retention=RetentionPolicy(max_executions=0),
+    )
+    dag = _data_dag({"big": RecordingExecutor("q" * 5000)}, [])
+
+    await engine.execute(dag)
+
+    assert len(blobs) == 0
+
+
+def test_workflow_engine_rejects_non_positive_spill_threshold():
+    """Test spill_threshold_bytes must be positive."""
+    with pytest.raises(ValueError):
+        WorkflowEngine(spill_threshold_bytes=0)
+
+
+@pytest.mark.asyncio
+async def test_redrive_rejects_data_consumers():
+    """Test forward redrive refuses tasks that need upstream results."""
+    dag = _data_dag(
+        {"a": RecordingExecutor(1), "b": RecordingExecutor(2)},
+        [("a", "b", "x")],
+    )
+    engine = WorkflowEngine()
+    await engine.dead_letter_queue.enqueue(
+        DeadLetterEvent(
+            event_id="e1",
+            workflow_id="dataflow",
+            task_id="b",
+            timestamp=datetime.now(timezone.utc),
+            error_message="boom",
+            payload={"id": "b"},
+            execution_context={"phase": "forward"},
+        )
+    )
+
+    report = await engine.redrive_dead_letters(dag)
+
+    assert report.succeeded == []
+    assert "e1" in report.failed